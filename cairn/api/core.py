@@ -14,6 +14,7 @@ from cairn.config import (
     config_to_flat,
     env_values,
 )
+from cairn.core.constants import ENRICHMENT_MODES
 from cairn.core.services import Services
 from cairn.storage import settings_store
 
@@ -105,7 +106,10 @@ def register_routes(router: APIRouter, svc: Services, **kw):
 
     @router.get("/status")
     def api_status():
-        return get_status(db, config, graph_provider=svc.graph_provider)
+        return get_status(
+            db, config, graph_provider=svc.graph_provider,
+            router=svc.router, llm_cache=svc.llm_cache,
+        )
 
     @router.get("/settings")
     def api_settings():
@@ -148,6 +152,9 @@ def register_routes(router: APIRouter, svc: Services, **kw):
             if key == "terminal.backend" and str_value not in _VALID_TERMINAL_BACKENDS:
                 errors.append(f"terminal.backend must be one of: {', '.join(sorted(_VALID_TERMINAL_BACKENDS))}")
                 continue
+            if key == "enrichment_mode" and str_value not in ENRICHMENT_MODES:
+                errors.append(f"enrichment_mode must be one of: {', '.join(ENRICHMENT_MODES)}")
+                continue
 
             if key in ("reranker.candidates", "analytics.retention_days",
                        "terminal.max_sessions", "terminal.connect_timeout",
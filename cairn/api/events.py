@@ -3,27 +3,67 @@
 from __future__ import annotations
 
 import asyncio
-import fnmatch
 import json
 import logging
 import time
 
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import StreamingResponse
 
 from cairn.core import stats
 from cairn.core.constants import EVENT_STREAM_HEARTBEAT_INTERVAL
+from cairn.core.event_stream import Subscription
 from cairn.core.services import Services
+from cairn.core.utils import get_project
 
 logger = logging.getLogger(__name__)
 
 
+async def _stream_frames(sub: Subscription, with_ids: bool = False):
+    """SSE frames for a hub subscription, with heartbeats while idle."""
+    event_counter = 0
+    try:
+        while True:
+            try:
+                item = await sub.get(EVENT_STREAM_HEARTBEAT_INTERVAL)
+            except TimeoutError:
+                yield f"event: heartbeat\ndata: {json.dumps({'ts': int(time.monotonic())})}\n\n"
+                continue
+
+            if item is None:
+                # Shed for falling behind; the client reconnects and resumes
+                yield f"event: error\ndata: {json.dumps({'message': 'Stream fell behind, reconnect'})}\n\n"
+                return
+
+            data, body = item
+            if with_ids:
+                event_counter += 1
+                yield f"id: {data.get('event_id', event_counter)}\nevent: event\ndata: {body}\n\n"
+            else:
+                yield f"event: event\ndata: {body}\n\n"
+            if stats.event_bus_stats:
+                stats.event_bus_stats.record_sse_event()
+    except asyncio.CancelledError:
+        pass
+
+
 def register_routes(router: APIRouter, svc: Services, **kw):
     event_bus = svc.event_bus
     event_dispatcher = svc.event_dispatcher
+    event_stream_hub = svc.event_stream_hub
     db = svc.db
 
+    def _resolve_project(name: str) -> int:
+        """Project id for a stream filter, -1 if unknown. Run off the event loop."""
+        try:
+            project_id = get_project(db, name) or -1
+            db.commit()
+            return project_id
+        finally:
+            db.release_if_held()
+
     @router.get("/event-bus/health")
     def api_event_bus_health():
         """Event bus + dispatcher health: handler metrics, circuit breakers."""
@@ -32,6 +72,10 @@ def register_routes(router: APIRouter, svc: Services, **kw):
             result["bus"] = stats.event_bus_stats.to_dict()
         if event_dispatcher:
             result["dispatcher"] = event_dispatcher.health()
+        if svc.event_writer:
+            result["writer"] = svc.event_writer.health()
+        if event_stream_hub:
+            result["stream"] = event_stream_hub.health()
         return result
 
     @router.post("/events", status_code=201)
@@ -84,73 +128,19 @@ def register_routes(router: APIRouter, svc: Services, **kw):
         session_name: str | None = Query(None),
         event_type: str | None = Query(None),
     ):
-        """SSE endpoint using Postgres LISTEN on cairn_events channel."""
+        """SSE endpoint fed by the shared cairn_events listener."""
 
         async def event_generator():
-            import psycopg
-
-            # Get a raw connection for LISTEN (can't use pooled connections)
-            dsn = db.config.dsn
-            try:
-                conn = await psycopg.AsyncConnection.connect(
-                    dsn, autocommit=True,
-                )
-            except Exception as e:
-                logger.error("SSE: failed to connect for LISTEN: %s", e)
-                if stats.event_bus_stats:
-                    stats.event_bus_stats.record_error(f"SSE connect: {e}")
-                yield f"event: error\ndata: {json.dumps({'message': 'Internal server error'})}\n\n"
-                return
-
+            sub = event_stream_hub.subscribe(session_name=session_name, event_type=event_type)
             if stats.event_bus_stats:
                 stats.event_bus_stats.record_sse_connect()
             try:
-                await conn.execute("LISTEN cairn_events")
-
-                last_heartbeat = time.monotonic()
-
-                while True:
-                    # Wait for notification with timeout for heartbeat
-                    try:
-                        async for notify in conn.notifies(
-                            timeout=EVENT_STREAM_HEARTBEAT_INTERVAL,
-                        ):
-                            try:
-                                data = json.loads(notify.payload)
-                            except (json.JSONDecodeError, TypeError):
-                                continue
-
-                            # Apply filters
-                            if session_name and data.get("session_name") != session_name:
-                                continue
-                            if event_type and data.get("event_type") != event_type:
-                                continue
-
-                            yield f"event: event\ndata: {json.dumps(data, default=str)}\n\n"
-                            if stats.event_bus_stats:
-                                stats.event_bus_stats.record_sse_event()
-                            last_heartbeat = time.monotonic()
-                            break  # Process one at a time to check heartbeat
-                    except TimeoutError:
-                        pass
-
-                    # Send heartbeat if needed
-                    now = time.monotonic()
-                    if now - last_heartbeat >= EVENT_STREAM_HEARTBEAT_INTERVAL:
-                        yield f"event: heartbeat\ndata: {json.dumps({'ts': int(now)})}\n\n"
-                        last_heartbeat = now
-
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                logger.error("SSE stream error: %s", e, exc_info=True)
-                if stats.event_bus_stats:
-                    stats.event_bus_stats.record_error(f"SSE stream: {e}")
-                yield f"event: error\ndata: {json.dumps({'message': 'Internal server error'})}\n\n"
+                async for frame in _stream_frames(sub):
+                    yield frame
             finally:
+                sub.close()
                 if stats.event_bus_stats:
                     stats.event_bus_stats.record_sse_disconnect()
-                await conn.close()
 
         return StreamingResponse(
             event_generator(),
@@ -197,85 +187,28 @@ def register_routes(router: APIRouter, svc: Services, **kw):
         if not pattern_list:
             pattern_list = ["*"]
 
-        def _matches(event_type: str) -> bool:
-            return any(fnmatch.fnmatch(event_type, p) for p in pattern_list)
+        # NOTIFY payloads carry project_id; resolve once. An unknown project matches nothing.
+        # The lookup runs in the threadpool, so the loop thread never holds a pooled connection.
+        project_id = None
+        if project:
+            project_id = await run_in_threadpool(_resolve_project, project)
 
         async def event_generator():
-            import psycopg
-
-            dsn = db.config.dsn
-            try:
-                conn = await psycopg.AsyncConnection.connect(
-                    dsn, autocommit=True,
-                )
-            except Exception as e:
-                logger.error("SSE subscribe: failed to connect: %s", e)
-                yield f"event: error\ndata: {json.dumps({'message': 'Internal server error'})}\n\n"
-                return
-
+            sub = event_stream_hub.subscribe(patterns=pattern_list, project_id=project_id)
             if stats.event_bus_stats:
                 stats.event_bus_stats.record_sse_connect()
             try:
-                await conn.execute("LISTEN cairn_events")
-
                 # Send initial connected event with subscription info
                 yield (
                     f"event: connected\n"
                     f"data: {json.dumps({'patterns': pattern_list, 'project': project})}\n\n"
                 )
-
-                last_heartbeat = time.monotonic()
-                event_counter = 0
-
-                while True:
-                    try:
-                        async for notify in conn.notifies(
-                            timeout=EVENT_STREAM_HEARTBEAT_INTERVAL,
-                        ):
-                            try:
-                                data = json.loads(notify.payload)
-                            except (json.JSONDecodeError, TypeError):
-                                continue
-
-                            evt_type = data.get("event_type", "")
-
-                            # Pattern filter
-                            if not _matches(evt_type):
-                                continue
-
-                            # Project filter
-                            if project and data.get("project") != project:
-                                continue
-
-                            event_counter += 1
-                            event_id = data.get("event_id", event_counter)
-
-                            yield (
-                                f"id: {event_id}\n"
-                                f"event: event\n"
-                                f"data: {json.dumps(data, default=str)}\n\n"
-                            )
-                            if stats.event_bus_stats:
-                                stats.event_bus_stats.record_sse_event()
-                            last_heartbeat = time.monotonic()
-                            break
-                    except TimeoutError:
-                        pass
-
-                    now = time.monotonic()
-                    if now - last_heartbeat >= EVENT_STREAM_HEARTBEAT_INTERVAL:
-                        yield f"event: heartbeat\ndata: {json.dumps({'ts': int(now)})}\n\n"
-                        last_heartbeat = now
-
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                logger.error("SSE subscribe error: %s", e, exc_info=True)
-                yield f"event: error\ndata: {json.dumps({'message': 'Internal server error'})}\n\n"
+                async for frame in _stream_frames(sub, with_ids=True):
+                    yield frame
             finally:
+                sub.close()
                 if stats.event_bus_stats:
                     stats.event_bus_stats.record_sse_disconnect()
-                await conn.close()
 
         return StreamingResponse(
             event_generator(),
@@ -156,6 +156,13 @@ def register_routes(router: APIRouter, svc: Services, **kw):
             return JSONResponse(content=result, status_code=200)
         return result
 
+    @router.get("/ingest/status/{ingestion_id}")
+    def api_ingest_status(ingestion_id: int):
+        status = ingest_pipeline.status(ingestion_id)
+        if status is None:
+            raise HTTPException(status_code=404, detail=f"Ingestion {ingestion_id} not found")
+        return status
+
     @router.get("/bookmarklet.js")
     def api_bookmarklet(request: Request):
         scheme = request.headers.get("x-forwarded-proto", request.url.scheme)
@@ -34,6 +34,10 @@ class UpdatePrefixBody(BaseModel):
     prefix: str
 
 
+class UpdateEnrichmentModeBody(BaseModel):
+    enrichment_mode: str | None = None  # None = inherit the server default
+
+
 class UpdateDocBody(BaseModel):
     content: str
     title: str | None = None
@@ -538,6 +542,13 @@ def register_routes(router: APIRouter, svc: Services, **kw):
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e)) from e
 
+    @router.patch("/projects/{name}/enrichment-mode")
+    def api_update_enrichment_mode(name: str = Path(...), body: UpdateEnrichmentModeBody = Body(...)):
+        try:
+            return project_manager.update_enrichment_mode(name, body.enrichment_mode)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
     @router.patch("/docs/{doc_id}")
     def api_update_doc(doc_id: int = Path(...), body: UpdateDocBody = Body(...)):
         doc = project_manager.get_doc(doc_id)
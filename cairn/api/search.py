@@ -8,6 +8,7 @@ from fastapi import APIRouter, Body, HTTPException, Path, Query
 from pydantic import BaseModel
 
 from cairn.api.utils import parse_multi
+from cairn.core.constants import MAX_STORE_MANY, VALID_MEMORY_TYPES
 from cairn.core.services import Services
 
 
@@ -24,6 +25,17 @@ class StoreMemoryBody(BaseModel):
     author: str | None = None
 
 
+class StoreManyMemoryBody(StoreMemoryBody):
+    event_at: str | None = None
+    valid_until: str | None = None
+    salience: float | None = None
+
+
+class StoreManyBody(BaseModel):
+    memories: list[StoreManyMemoryBody]
+    enrich: bool = True
+
+
 class UpdateMemoryBody(BaseModel):
     content: str | None = None
     memory_type: str | None = None
@@ -268,6 +280,22 @@ def register_routes(router: APIRouter, svc: Services, **kw):
             author=body.author,
         )
 
+    @router.post("/memories/batch", status_code=201)
+    def api_store_memories(body: StoreManyBody = Body(...)):
+        if not body.memories:
+            raise HTTPException(status_code=400, detail="memories must be a non-empty array")
+        if len(body.memories) > MAX_STORE_MANY:
+            raise HTTPException(status_code=400, detail=f"Maximum {MAX_STORE_MANY} memories per request")
+        for i, m in enumerate(body.memories):
+            if m.memory_type not in VALID_MEMORY_TYPES:
+                raise HTTPException(status_code=400, detail=f"memories[{i}]: invalid memory_type: {m.memory_type}")
+            if not 0.0 <= m.importance <= 1.0:
+                raise HTTPException(status_code=400, detail=f"memories[{i}]: importance must be between 0.0 and 1.0")
+        stored = memory_store.store_many(
+            [m.model_dump(exclude_none=True) for m in body.memories], enrich=body.enrich,
+        )
+        return {"stored": len(stored), "memories": stored}
+
     @router.patch("/memories/{memory_id}")
     def api_update_memory(memory_id: int = Path(...), body: UpdateMemoryBody = Body(...)):
         fields = body.model_dump(exclude_none=True)
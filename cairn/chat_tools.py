@@ -525,7 +525,10 @@ class ChatToolExecutor:
     # ------------------------------------------------------------------
 
     def _tool_system_status(self) -> dict:
-        return get_status(self.svc.db, self.svc.config)
+        return get_status(
+            self.svc.db, self.svc.config,
+            router=self.svc.router, llm_cache=self.svc.llm_cache,
+        )
 
     # ------------------------------------------------------------------
     # get_rules — delegates to svc.memory_store.get_rules
@@ -1,20 +1,34 @@
 """Code indexer: parse source files and store results in the code graph.
 
 Connects the CodeParser (tree-sitter) to the GraphProvider (Neo4j).
-Content-hash dedup ensures unchanged files are never re-processed.
-
-Performance: uses batch_upsert_code_graph to collapse all Neo4j writes into
-a single transaction (typically 6 Cypher statements instead of hundreds).
+A (mtime, size, content-hash) pre-filter against the stored graph ensures
+unchanged files are never re-written, and a no-op reindex never parses.
+
+index_paths is the watcher's entry point: it reparses only the paths that
+changed and recomputes edges only for them and their dependents, using the
+edge state the last full resolution left behind.
+
+Performance: writes are pipelined. Parsed files stream to a writer thread
+in chunks (upsert_code_files, one UNWIND round trip per chunk) while parsing
+continues; edges are linked once every file is in, in chunks of their own.
+A file stays edges_pending in the graph until its edges are linked, so a run
+that dies mid-way is finished by the next one instead of leaving files
+without edges.
 """
 
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+import queue
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
-from cairn.code.parser import CodeParser, ParseResult
-from cairn.code.utils import path_to_module, path_to_module_ts, resolve_ts_import
+from cairn.code.parser import CodeParser, ParseResult, file_content_hash
+from cairn.code.resolution import ModuleIndex
 from cairn.graph.interface import GraphProvider
 
 logger = logging.getLogger(__name__)
@@ -31,6 +45,7 @@ class IndexResult:
     files_deleted: int = 0       # Removed from graph (file no longer exists)
     symbols_created: int = 0
     imports_created: int = 0
+    files_relinked: int = 0      # Unchanged dependents whose edges were recomputed
     errors: list[str] = field(default_factory=list)
 
     @property
@@ -48,6 +63,128 @@ class IndexResult:
         return " ".join(parts)
 
 
+@dataclass
+class IndexProgress:
+    """Progress of one indexing run, reported after every written chunk."""
+    project: str
+    project_id: int
+    phase: str = "write"         # write -> link -> done
+    files_total: int = 0         # Files to write this run
+    files_written: int = 0
+    symbols_written: int = 0
+    edges_written: int = 0
+    elapsed: float = 0.0         # Seconds since the run started
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        elapsed = max(self.elapsed, 1e-9)
+        d["elapsed"] = round(self.elapsed, 3)
+        d["files_per_sec"] = round(self.files_written / elapsed, 1)
+        d["symbols_per_sec"] = round(self.symbols_written / elapsed, 1)
+        d["edges_per_sec"] = round(self.edges_written / elapsed, 1)
+        return d
+
+
+ProgressCallback = Callable[[IndexProgress], None]
+
+
+class _ProgressTracker:
+    """Counts what a run has written and hands snapshots to the callback.
+
+    Advanced from the writer thread during the write phase and from the
+    indexing thread afterwards. Callback errors are logged, never raised.
+    """
+
+    def __init__(self, callback: ProgressCallback | None, project: str, project_id: int):
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._progress = IndexProgress(project=project, project_id=project_id)
+
+    def advance(self, phase: str, files_total: int | None = None, files: int = 0,
+                symbols: int = 0, edges: int = 0) -> None:
+        with self._lock:
+            p = self._progress
+            p.phase = phase
+            if files_total is not None:
+                p.files_total = files_total
+            p.files_written += files
+            p.symbols_written += symbols
+            p.edges_written += edges
+            p.elapsed = time.monotonic() - self._start
+            snapshot = IndexProgress(**asdict(p))
+        if self._callback is None:
+            return
+        try:
+            self._callback(snapshot)
+        except Exception:
+            logger.warning("Code index progress callback failed", exc_info=True)
+
+
+class _CodeGraphWriter:
+    """Consumer thread writing chunks of file dicts while the caller parses on.
+
+    The queue is bounded, so parsing runs at most max_chunks chunks ahead of
+    the graph. A failed write is re-raised to the producer by the next
+    submit() or by close(); later chunks are drained unwritten.
+    """
+
+    def __init__(self, graph: GraphProvider, project_id: int, max_chunks: int, tracker: _ProgressTracker):
+        self._graph = graph
+        self._project_id = project_id
+        self._tracker = tracker
+        self._queue: queue.Queue[list[dict] | None] = queue.Queue(maxsize=max_chunks)
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True, name="code-graph-writer")
+        self._thread.start()
+
+    def submit(self, files: list[dict]) -> None:
+        self._raise_if_failed()
+        if files:
+            self._queue.put(files)
+
+    def close(self) -> None:
+        """Wait for every submitted chunk to be written."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_if_failed()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while True:
+            files = self._queue.get()
+            if files is None:
+                return
+            if self._error is not None:
+                continue
+            try:
+                self._graph.upsert_code_files(self._project_id, files)
+            except Exception as e:
+                self._error = e
+                continue
+            self._tracker.advance("write", files=len(files), symbols=sum(len(f["symbols"]) for f in files))
+
+
+_CALLABLE_KINDS = ("function", "method", "class")
+_IMPORT_TOKEN = re.compile(r"[A-Za-z_][\w-]*")
+
+
+@dataclass
+class _EdgeState:
+    """The last resolved code graph of a project, kept for index_paths."""
+    root: Path
+    known_paths: set[str]                 # Every indexable file, parsed or not
+    files: dict[str, ParseResult]         # Parsed ok, in walk order
+    imports: dict[str, set[str]]          # importer path -> imported paths
+    root_prefix: str
+
+
 class CodeIndexer:
     """Parse source files and store the code graph in Neo4j.
 
@@ -57,9 +194,16 @@ class CodeIndexer:
                                           root=Path("cairn"))
     """
 
-    def __init__(self, parser: CodeParser, graph: GraphProvider):
+    WRITE_CHUNK = 100       # Files per upsert_code_files call
+    EDGE_CHUNK = 2000       # Import or call edges per link_code_edges call
+    QUEUE_CHUNKS = 4        # Parsed chunks allowed to wait for the writer
+
+    def __init__(self, parser: CodeParser, graph: GraphProvider, progress: ProgressCallback | None = None):
         self.parser = parser
         self.graph = graph
+        self.progress = progress
+        # project_id -> edge state from the last run that resolved edges
+        self._states: dict[int, _EdgeState] = {}
 
     def index_file(
         self,
@@ -111,70 +255,278 @@ class CodeIndexer:
     ) -> IndexResult:
         """Index all supported files under a directory.
 
-        Respects .gitignore if present. Phase 1: Parse all files (CPU-only,
-        no I/O to Neo4j). Phase 2: Diff against existing graph to find
-        changed files. Phase 3: Batch-upsert in chunked Neo4j transactions.
+        Respects .gitignore if present. Phase 1: Walk the tree and pre-filter
+        against the stored graph — a file whose (mtime, size), or failing
+        that content hash, matches its CodeFile node is unchanged and is not
+        parsed. A reindex with no changes ends here. Phase 2: Stream changed
+        files through the parser to the graph writer, chunk by chunk. Phase
+        3: Parse unchanged files too (import/call resolution needs them; the
+        parser serves them from its cache when warm), then link edges.
+
+        Unchanged files still marked edges_pending — written by a run that
+        died before linking — are relinked rather than skipped.
         """
         result = IndexResult(project=project, project_id=project_id)
+        tracker = _ProgressTracker(self.progress, project, project_id)
 
-        # Phase 1: Parse all files (CPU-bound, no graph I/O)
-        parsed_files = self.parser.parse_directory(root, exclude=exclude)
-        result.files_scanned = len(parsed_files)
+        # Phase 1: Walk + pre-filter (stat/hash only, no parsing)
+        paths = self.parser.scan_directory(root, exclude=exclude)
+        result.files_scanned = len(paths)
+        current_paths: set[str] = {str(p) for p in paths}
 
-        # Phase 2: Diff — fetch existing file hashes in one query
         existing_files = self.graph.get_code_files(project_id)
         existing_by_path: dict[str, dict] = {ef["path"]: ef for ef in existing_files}
 
-        current_paths: set[str] = set()
-        changed_files: list[ParseResult] = []
-        all_ok_files: list[ParseResult] = []  # For import resolution (includes skipped)
-
-        for parsed in parsed_files:
-            current_paths.add(parsed.file_path)
-
-            if not parsed.ok:
-                result.errors.append(f"{parsed.file_path}: {parsed.error}")
-                continue
-
-            all_ok_files.append(parsed)
-            existing = existing_by_path.get(parsed.file_path)
-
-            if not force and existing and existing.get("content_hash") == parsed.content_hash:
-                result.files_skipped += 1
-                continue
-
-            changed_files.append(parsed)
-            result.files_indexed += 1
-            result.symbols_created += len(parsed.symbols)
-            result.imports_created += len(parsed.imports)
+        relink: list[str] = []
+        changed_paths: list[Path]
+        unchanged_paths: list[Path]
+        if force:
+            changed_paths, unchanged_paths = paths, []
+        else:
+            changed_paths, unchanged_paths = [], []
+            refreshed: list[dict] = []
+            for path in paths:
+                stored = existing_by_path.get(str(path))
+                if _is_unchanged(path, stored, refreshed):
+                    unchanged_paths.append(path)
+                    if stored is not None and stored.get("edges_pending"):
+                        relink.append(str(path))
+                else:
+                    changed_paths.append(path)
+            self._refresh_stats(project_id, refreshed)
+        result.files_skipped = len(unchanged_paths)
 
         # Detect stale files
         stale_uuids = []
+        stale_paths = []
         for ef in existing_files:
             if ef["path"] not in current_paths:
                 stale_uuids.append(ef["uuid"])
+                stale_paths.append(ef["path"])
                 result.files_deleted += 1
+        self.parser.forget(stale_paths)
 
-        # Phase 3: Resolve imports and calls, then batch-upsert
-        import_edges = _resolve_all_imports(all_ok_files, current_paths)
-        call_edges = _resolve_all_calls(all_ok_files, current_paths)
-        file_dicts = [_parsed_to_dict(p) for p in changed_files]
-
-        if file_dicts or stale_uuids or import_edges or call_edges:
-            self.graph.batch_upsert_code_graph(
-                project_id=project_id,
-                files=file_dicts,
-                import_edges=import_edges,
-                stale_file_uuids=stale_uuids,
-                call_edges=call_edges,
-            )
+        if not changed_paths and not stale_uuids and not relink:
+            logger.info("Code index complete for %s: %s", project, result.summary())
+            return result
+
+        # Phase 2: Parse what changed, writing each chunk as it fills
+        if stale_uuids:
+            self.graph.delete_code_files(project_id, stale_uuids)
+        tracker.advance("write", files_total=len(changed_paths))
+        changed_files = self._write_parsed(project_id, self.parser.iter_files(changed_paths), result, tracker)
+
+        # Edges are resolved over the whole tree (in walk order), unchanged files included
+        ok_by_path = {p.file_path: p for p in changed_files}
+        for parsed in self.parser.iter_files(unchanged_paths):
+            if parsed.ok:
+                ok_by_path[parsed.file_path] = parsed
+        all_ok_files = [ok_by_path[str(p)] for p in paths if str(p) in ok_by_path]
+
+        # Phase 3: Resolve imports and calls, then link
+        index = ModuleIndex(all_ok_files, current_paths)
+        import_edges = _resolve_all_imports(all_ok_files, current_paths, index=index)
+        call_edges = _resolve_all_calls(all_ok_files, current_paths, index=index)
+        replace = [p.file_path for p in changed_files] + [p for p in relink if p in ok_by_path]
+        self._link_edges(project_id, import_edges, call_edges, replace, tracker)
+        result.files_relinked = len(relink)
+
+        imports: dict[str, set[str]] = {}
+        for src, dst in import_edges:
+            imports.setdefault(src, set()).add(dst)
+        self._states[project_id] = _EdgeState(
+            root=root,
+            known_paths=current_paths,
+            files={p.file_path: p for p in all_ok_files},
+            imports=imports,
+            root_prefix=index.root_prefix,
+        )
 
+        tracker.advance("done")
         logger.info("Code index complete for %s: %s", project, result.summary())
         return result
 
+    def index_paths(
+        self,
+        root: Path,
+        paths: Iterable[Path],
+        project: str,
+        project_id: int,
+        exclude: set[str] | None = None,
+    ) -> IndexResult:
+        """Reindex only the given paths under root — created, modified, deleted or moved.
+
+        Reparses the paths whose content changed, then recomputes import and
+        call edges for them and their dependents: files that imported or
+        called into them before, or whose imports or calls name them now.
+        Writes that delta like index_directory does. Without edge
+        state for the project (first change after a restart), falls back
+        to index_directory, which records it.
+        """
+        state = self._states.get(project_id)
+        if state is None or state.root != root:
+            return self.index_directory(root, project, project_id, exclude=exclude)
+
+        result = IndexResult(project=project, project_id=project_id)
+        tracker = _ProgressTracker(self.progress, project, project_id)
+        touched = {str(p) for p in paths}
+        present = {str(p) for p in self.parser.filter_indexable(root, map(Path, touched), exclude=exclude)}
+        removed = sorted(p for p in touched - present if p in state.known_paths)
+        result.files_scanned = len(present)
+
+        refreshed: list[dict] = []
+        changed_paths = [
+            Path(p) for p in sorted(present)
+            if not _is_unchanged(Path(p), _stored(state.files.get(p)), refreshed)
+        ]
+        result.files_skipped = len(present) - len(changed_paths)
+        self._refresh_stats(project_id, refreshed)
+        # Same content, so the parse stays valid (for the parser cache too)
+        for stat in refreshed:
+            parsed = state.files[stat["path"]]
+            parsed.mtime_ns, parsed.size = stat["mtime_ns"], stat["size"]
+
+        stale_uuids = []
+        for path in removed:
+            existing = self.graph.get_code_file(path, project_id)
+            if existing:
+                stale_uuids.append(existing["uuid"])
+                result.files_deleted += 1
+        self.parser.forget(removed)
+
+        # A file that no longer parses drops out of resolution, like in index_directory
+        dirty = {str(p) for p in changed_paths} | set(removed)
+        if not dirty:
+            return result
+
+        try:
+            if stale_uuids:
+                self.graph.delete_code_files(project_id, stale_uuids)
+            tracker.advance("write", files_total=len(changed_paths))
+            changed_files = self._write_parsed(project_id, self.parser.iter_files(changed_paths), result, tracker)
+
+            # Names and modules the touched files provided before and after the change
+            versions = [state.files[p] for p in dirty if p in state.files] + changed_files
+
+            state.known_paths.difference_update(removed)
+            state.known_paths |= present
+            for path in dirty:
+                state.files.pop(path, None)
+                state.imports.pop(path, None)
+            for parsed in changed_files:
+                state.files[parsed.file_path] = parsed
+            state.files = {p: state.files[p] for p in sorted(state.files, key=lambda p: Path(p).parts)}
+            all_ok_files = list(state.files.values())
+
+            index = ModuleIndex(all_ok_files, state.known_paths)
+            if index.root_prefix != state.root_prefix:
+                # Every module name moved: nothing short of a full resolution is right
+                state.root_prefix = index.root_prefix
+                dependents = set(state.files)
+            else:
+                dependents = _dependents(state, dirty, versions)
+            changed_set = {p.file_path for p in changed_files}
+            sources = [p for p in all_ok_files if p.file_path in changed_set or p.file_path in dependents]
+            result.files_relinked = sum(1 for p in sources if p.file_path not in changed_set)
+
+            import_edges = _resolve_all_imports(all_ok_files, state.known_paths, sources=sources, index=index)
+            call_edges = _resolve_all_calls(all_ok_files, state.known_paths, sources=sources, index=index)
+            for parsed in sources:
+                state.imports[parsed.file_path] = set()
+            for src, dst in import_edges:
+                state.imports[src].add(dst)
+
+            self._link_edges(project_id, import_edges, call_edges, [p.file_path for p in sources], tracker)
+        except BaseException:
+            # The edge state already counts these files as current. Drop it so the
+            # next change falls back to index_directory, which relinks edges_pending files.
+            self._states.pop(project_id, None)
+            raise
+
+        tracker.advance("done")
+        logger.info(
+            "Code index (incremental) for %s: %s, %d dependents relinked",
+            project, result.summary(), result.files_relinked,
+        )
+        return result
+
+    def _refresh_stats(self, project_id: int, refreshed: list[dict]) -> None:
+        """Store the new stat of touched files whose content hash still matched."""
+        if not refreshed:
+            return
+        try:
+            self.graph.update_code_file_stats(project_id, refreshed)
+        except Exception:
+            logger.warning("Code index: could not store refreshed file stats", exc_info=True)
+
+    def _write_parsed(
+        self,
+        project_id: int,
+        parsed_files: Iterable[ParseResult],
+        result: IndexResult,
+        tracker: _ProgressTracker,
+    ) -> list[ParseResult]:
+        """Hand parsed files to a writer thread, WRITE_CHUNK at a time, as they arrive.
+
+        Returns the files that parsed ok, once all of them are written.
+        Parse failures are recorded in result and not written.
+        """
+        writer = _CodeGraphWriter(self.graph, project_id, self.QUEUE_CHUNKS, tracker)
+        ok_files: list[ParseResult] = []
+        chunk: list[dict] = []
+        try:
+            for parsed in parsed_files:
+                if not parsed.ok:
+                    result.errors.append(f"{parsed.file_path}: {parsed.error}")
+                    continue
+                ok_files.append(parsed)
+                result.files_indexed += 1
+                result.symbols_created += len(parsed.symbols)
+                result.imports_created += len(parsed.imports)
+                chunk.append(_parsed_to_dict(parsed))
+                if len(chunk) >= self.WRITE_CHUNK:
+                    writer.submit(chunk)
+                    chunk = []
+            writer.submit(chunk)
+        finally:
+            writer.close()
+        return ok_files
+
+    def _link_edges(
+        self,
+        project_id: int,
+        import_edges: list[tuple[str, str]],
+        call_edges: list[dict],
+        replace: list[str],
+        tracker: _ProgressTracker,
+    ) -> None:
+        """Link edges in EDGE_CHUNK slices.
+
+        The first slice drops the outgoing edges of replace; the last one
+        settles them, clearing edges_pending once every edge is in.
+        """
+        step = self.EDGE_CHUNK
+        slices: list[tuple[list[tuple[str, str]], list[dict]]] = [
+            (import_edges[i : i + step], []) for i in range(0, len(import_edges), step)
+        ]
+        slices += [([], call_edges[i : i + step]) for i in range(0, len(call_edges), step)]
+        if not slices:
+            if not replace:
+                return
+            slices = [([], [])]
+        for i, (imports, calls) in enumerate(slices):
+            self.graph.link_code_edges(
+                project_id,
+                imports,
+                calls,
+                replace_edges_from=replace if i == 0 else None,
+                settled_paths=replace if i == len(slices) - 1 else None,
+            )
+            tracker.advance("link", edges=len(imports) + len(calls))
+
 
 def _parsed_to_dict(parsed: ParseResult) -> dict:
-    """Convert a ParseResult into the dict format expected by batch_upsert_code_graph."""
+    """Convert a ParseResult into the file dict format of upsert_code_files."""
     symbols = []
     for sym in parsed.all_symbols:
         d: dict = {
@@ -194,146 +546,140 @@ def _parsed_to_dict(parsed: ParseResult) -> dict:
         "path": parsed.file_path,
         "language": parsed.language,
         "content_hash": parsed.content_hash,
+        "mtime_ns": parsed.mtime_ns,
+        "size": parsed.size,
         "symbols": symbols,
     }
 
 
+def _is_unchanged(path: Path, stored: dict | None, refreshed: list[dict] | None = None) -> bool:
+    """Pre-filter: does the file on disk still match its stored CodeFile node?
+
+    Compares (mtime, size) first — a stat, no read. On a mismatch (touched,
+    checked out again, or indexed before stats were stored) falls back to
+    the content hash, which costs a read but no parse. When the hash
+    matches, the new stat is appended to ``refreshed`` so the caller can
+    store it and the next run skips the read.
+    """
+    if not stored or not stored.get("content_hash"):
+        return False
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    if stored.get("mtime_ns") == st.st_mtime_ns and stored.get("size") == st.st_size:
+        return True
+    if file_content_hash(path) != stored["content_hash"]:
+        return False
+    if refreshed is not None:
+        refreshed.append({"path": str(path), "mtime_ns": st.st_mtime_ns, "size": st.st_size})
+    return True
+
+
+def _stored(parsed: ParseResult | None) -> dict | None:
+    """The fields _is_unchanged compares, from an in-memory parse."""
+    if parsed is None:
+        return None
+    return {"content_hash": parsed.content_hash, "mtime_ns": parsed.mtime_ns, "size": parsed.size}
+
+
+def _dependents(state: _EdgeState, dirty: set[str], versions: list[ParseResult]) -> set[str]:
+    """Unchanged files whose import or call edges may resolve differently now.
+
+    A file depends on the dirty ones if it imported one of them before, if
+    it calls a name one of them defined before or defines now, or if an
+    import names one of them (by file stem or package directory) — the
+    latter catching imports that newly resolve to a created file.
+    """
+    names = {sym.name for v in versions for sym in v.symbols if sym.kind in _CALLABLE_KINDS}
+    tokens: set[str] = set()
+    for path in dirty:
+        p = Path(path)
+        tokens.add(p.stem)
+        tokens.add(p.parent.name)
+
+    dependents: set[str] = set()
+    for path, parsed in state.files.items():
+        if path in dirty:
+            continue
+        if not state.imports.get(path, set()).isdisjoint(dirty):
+            dependents.add(path)
+        elif any(call.callee_name in names for call in parsed.calls):
+            dependents.add(path)
+        elif any(not tokens.isdisjoint(_IMPORT_TOKEN.findall(imp.name)) for imp in parsed.imports):
+            dependents.add(path)
+    return dependents
+
+
 def _resolve_all_imports(
     parsed_files: list[ParseResult],
     known_paths: set[str],
+    sources: list[ParseResult] | None = None,
+    index: ModuleIndex | None = None,
 ) -> list[tuple[str, str]]:
-    """Resolve import statements to (importer_path, imported_path) edges."""
-    # Detect common root prefix so absolute paths resolve to proper module names.
-    # e.g. "/home/user/project/cairn/core/services.py" with root "/home/user/project/"
-    #       -> "cairn.core.services" instead of "/.home.user.project.cairn.core.services"
-    root_prefix = ""
-    if parsed_files:
-        sample = parsed_files[0].file_path
-        if sample.startswith("/"):
-            # Find the common prefix of all file paths
-            common = Path(sample).parent
-            for p in parsed_files[1:]:
-                while not p.file_path.startswith(str(common) + "/") and str(common) != "/":
-                    common = common.parent
-            # Walk up until we find a directory that isn't a Python package
-            # (i.e. has no __init__.py among our known files)
-            while str(common) != "/":
-                init_path = str(common / "__init__.py")
-                if init_path not in known_paths:
-                    break
-                common = common.parent
-            root_prefix = str(common).rstrip("/") + "/"
-
-    def _rel(file_path: str) -> str:
-        """Strip root prefix for module resolution."""
-        if root_prefix and file_path.startswith(root_prefix):
-            return file_path[len(root_prefix):]
-        return file_path
-
-    # Build module -> file path mapping (using relative paths for module names)
-    module_to_path: dict[str, str] = {}
-    for parsed in parsed_files:
-        rel = _rel(parsed.file_path)
-        mod = path_to_module(rel)
-        if mod:
-            module_to_path[mod] = parsed.file_path  # Value stays absolute
-        ts_mod = path_to_module_ts(rel)
-        if ts_mod:
-            module_to_path[ts_mod] = parsed.file_path
+    """Resolve import statements to (importer_path, imported_path) edges.
 
+    Module tables (a ModuleIndex, built here unless passed in) cover all
+    parsed_files; edges are resolved for sources only (default: all of them).
+    """
+    if index is None:
+        index = ModuleIndex(parsed_files, known_paths)
     edges: list[tuple[str, str]] = []
-    seen: set[tuple[str, str]] = set()
-
-    # Build Go directory -> file paths mapping for package resolution.
-    # Go packages are directories — all .go files in a directory share a package.
-    go_dir_to_files: dict[str, list[str]] = {}
-    for parsed in parsed_files:
-        if parsed.language == "golang":
-            dir_path = str(Path(parsed.file_path).parent)
-            go_dir_to_files.setdefault(dir_path, []).append(parsed.file_path)
-
-    for parsed in parsed_files:
-        is_ts = parsed.language in ("typescript", "typescript_tsx")
-        is_go = parsed.language == "golang"
-
-        for imp in parsed.imports:
-            target_path = None
-
-            if is_ts:
-                import_source = _extract_ts_import_source(imp.name)
-                if import_source:
-                    importer_dir = str(Path(parsed.file_path).parent)
-                    target_path = resolve_ts_import(import_source, importer_dir, known_paths)
-            elif is_go:
-                target_path = _resolve_go_import(
-                    imp.name, parsed.file_path, go_dir_to_files, root_prefix,
-                )
-            else:
-                imported_module = imp.name
-                if imported_module.startswith("from "):
-                    parts = imported_module.split()
-                    if len(parts) >= 2:
-                        imported_module = parts[1]
-                elif imported_module.startswith("import "):
-                    imported_module = imported_module[7:].split(",")[0].strip()
-
-                target_path = module_to_path.get(imported_module)
-                if not target_path:
-                    for mod, path in module_to_path.items():
-                        if imported_module.startswith(mod + ".") or mod.startswith(imported_module + "."):
-                            target_path = path
-                            break
-
-            if target_path and target_path in known_paths and target_path != parsed.file_path:
-                edge = (parsed.file_path, target_path)
-                if edge not in seen:
-                    seen.add(edge)
-                    edges.append(edge)
-
+    for parsed in parsed_files if sources is None else sources:
+        for target in index.imports_of(parsed):
+            edges.append((parsed.file_path, target))
     return edges
 
 
 def _resolve_all_calls(
     parsed_files: list[ParseResult],
     known_paths: set[str],
+    sources: list[ParseResult] | None = None,
+    index: ModuleIndex | None = None,
 ) -> list[dict]:
     """Resolve calls to (caller_qname, caller_file, callee_qname, callee_file, line) edges.
 
     Two-pass resolution:
     1. Build a global symbol table: {short_name: [(qualified_name, file_path), ...]}
     2. For each call, resolve the callee to a known symbol via local-first lookup.
+
+    The symbol table covers all parsed_files; calls are resolved for sources
+    only (default: all of them).
     """
+    if sources is None:
+        sources = parsed_files
+    if index is None:
+        index = ModuleIndex(parsed_files, known_paths)
     # Pass 1: Build symbol table from all parsed files
     symbol_table: dict[str, list[tuple[str, str]]] = {}
+    # (short_name, file_path) -> position of that file's first candidate
+    first_in_file: dict[tuple[str, str], int] = {}
     for parsed in parsed_files:
         for sym in parsed.symbols:
-            if sym.kind in ("function", "method", "class"):
-                symbol_table.setdefault(sym.name, []).append(
-                    (sym.qualified_name, parsed.file_path)
-                )
+            if sym.kind in _CALLABLE_KINDS:
+                candidates = symbol_table.setdefault(sym.name, [])
+                first_in_file.setdefault((sym.name, parsed.file_path), len(candidates))
+                candidates.append((sym.qualified_name, parsed.file_path))
 
     # Per-file symbol index for local resolution
     file_symbols: dict[str, dict[str, str]] = {}
-    for parsed in parsed_files:
+    for parsed in sources:
         local: dict[str, str] = {}
         for sym in parsed.symbols:
-            if sym.kind in ("function", "method", "class"):
+            if sym.kind in _CALLABLE_KINDS:
                 local[sym.name] = sym.qualified_name
         file_symbols[parsed.file_path] = local
 
     # Pre-compute imported paths per file (once, not per call)
     file_imported_paths: dict[str, set[str]] = {}
-    for parsed in parsed_files:
-        imported = set()
-        for edge in _resolve_all_imports([parsed], known_paths):
-            imported.add(edge[1])
-        file_imported_paths[parsed.file_path] = imported
+    for parsed in sources:
+        file_imported_paths[parsed.file_path] = index.call_imports(parsed)
 
     # Pass 2: Resolve each call
     edges: list[dict] = []
     seen: set[tuple[str, str, str, str]] = set()
 
-    for parsed in parsed_files:
+    for parsed in sources:
         local = file_symbols.get(parsed.file_path, {})
 
         for call in parsed.calls:
@@ -353,10 +699,13 @@ def _resolve_all_calls(
                 elif len(candidates) > 1:
                     # Disambiguate: prefer symbol in a file we import
                     imported_paths = file_imported_paths.get(parsed.file_path, set())
-                    for qn, fp in candidates:
-                        if fp in imported_paths:
-                            callee_qname, callee_file = qn, fp
-                            break
+                    hits = [
+                        first_in_file[(call.callee_name, fp)]
+                        for fp in imported_paths
+                        if (call.callee_name, fp) in first_in_file
+                    ]
+                    if hits:
+                        callee_qname, callee_file = candidates[min(hits)]
                     # Fallback: just take the first candidate
                     if not callee_qname:
                         callee_qname, callee_file = candidates[0]
@@ -380,67 +729,3 @@ def _resolve_all_calls(
             })
 
     return edges
-
-
-def _extract_ts_import_source(import_text: str) -> str | None:
-    """Extract the module specifier from a TS import statement text.
-
-    e.g. "import { foo } from './utils'" -> "./utils"
-         "import React from 'react'" -> "react"
-    """
-    for quote in ("'", '"'):
-        idx = import_text.rfind(f"from {quote}")
-        if idx == -1:
-            idx = import_text.rfind(f"from{quote}")
-        if idx != -1:
-            start = import_text.index(quote, idx) + 1
-            end = import_text.index(quote, start)
-            return import_text[start:end]
-    for quote in ("'", '"'):
-        if f"import {quote}" in import_text or f"import{quote}" in import_text:
-            try:
-                start = import_text.index(quote) + 1
-                end = import_text.index(quote, start)
-                return import_text[start:end]
-            except ValueError:
-                pass
-    return None
-
-
-def _resolve_go_import(
-    import_text: str,
-    importer_path: str,
-    go_dir_to_files: dict[str, list[str]],
-    root_prefix: str,
-) -> str | None:
-    """Resolve a Go import to a file in the project.
-
-    Go imports are quoted package paths like "fmt" or "github.com/user/repo/pkg".
-    We match the import path suffix against known directory paths within the project.
-    Returns the first .go file in the matched directory (representing the package).
-    """
-    # Strip quotes and optional alias prefix (e.g. `mypkg "github.com/..."`)
-    text = import_text.strip()
-    # Handle aliased imports: `alias "path/to/pkg"`
-    if " " in text:
-        text = text.split()[-1]
-    # Strip quotes
-    text = text.strip('"').strip("'")
-    if not text:
-        return None
-
-    # Try to match the import path suffix against known Go directories
-    for dir_path, files in go_dir_to_files.items():
-        rel_dir = dir_path
-        if root_prefix and dir_path.startswith(root_prefix):
-            rel_dir = dir_path[len(root_prefix):]
-
-        # Check if the directory path ends with the import path
-        # e.g. import "myproject/pkg/utils" matches dir ".../myproject/pkg/utils"
-        if rel_dir == text or rel_dir.endswith("/" + text):
-            # Don't resolve to files in the same directory (same package)
-            if dir_path == str(Path(importer_path).parent):
-                continue
-            return files[0] if files else None
-
-    return None
@@ -2,14 +2,27 @@
 
 Parses source files into structured CodeSymbol objects. Delegates to
 language-specific modules in cairn.code.languages for AST extraction.
+
+Directory parsing is built for repeated reindexes of large trees:
+  - scan_directory prunes excluded and gitignored directories during the walk;
+    filter_indexable applies the same rules to individual paths (watchers)
+  - parse_files reuses results for files whose (mtime, size) is unchanged
+  - cache misses fan out over a process pool; each worker keeps its own
+    per-language ts.Parser instances for the life of the pool
 """
 
 from __future__ import annotations
 
 import hashlib
 import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 import tree_sitter as ts
 
@@ -57,6 +70,8 @@ class ParseResult:
     imports: list[CodeSymbol] = field(default_factory=list)  # Subset: kind == "import"
     calls: list[CallInfo] = field(default_factory=list)
     error: str | None = None
+    mtime_ns: int = 0               # File stat at parse time (0 for parse_source)
+    size: int = 0
 
     @property
     def ok(self) -> bool:
@@ -68,6 +83,56 @@ class ParseResult:
         return self.symbols + self.imports
 
 
+def file_content_hash(filepath: Path) -> str | None:
+    """SHA-256 of a file as parse_file hashes it, without parsing. None if unreadable."""
+    try:
+        source = filepath.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _is_supported_name(name: str) -> bool:
+    return (
+        language_for_extension(os.path.splitext(name)[1]) is not None
+        or language_for_filename(name) is not None
+    )
+
+
+def _load_gitignore(dirpath: str) -> list[tuple[str, Any]]:
+    """The .gitignore in dirpath as a [(dirpath, PathSpec)] entry, or [] if unreadable."""
+    import pathspec
+
+    try:
+        with open(os.path.join(dirpath, ".gitignore")) as f:
+            return [(dirpath, pathspec.PathSpec.from_lines("gitwildmatch", f))]
+    except OSError:
+        logger.debug("Unreadable .gitignore in %s", dirpath)
+        return []
+
+
+def _gitignored(path: str, specs: list[tuple[str, Any]], is_dir: bool) -> bool:
+    for gi_dir, spec in specs:
+        rel = os.path.relpath(path, gi_dir)
+        if spec.match_file(rel + "/" if is_dir else rel):
+            return True
+    return False
+
+
+# Per-process parser for pool workers, created once by _init_worker
+_worker_parser: CodeParser | None = None
+
+
+def _init_worker() -> None:
+    global _worker_parser
+    _worker_parser = CodeParser(workers=1)
+
+
+def _parse_in_worker(path: str) -> ParseResult | None:
+    assert _worker_parser is not None
+    return _worker_parser.parse_file(Path(path))
+
+
 class CodeParser:
     """Parse source files using tree-sitter.
 
@@ -76,10 +141,20 @@ class CodeParser:
         result = parser.parse_file(Path("cairn/core/search.py"))
         for sym in result.symbols:
             print(sym.qualified_name, sym.kind, sym.start_line)
+
+    Args:
+        workers: Processes for parse_files; None = CPU count, 1 = in-process.
     """
 
-    def __init__(self):
+    # Below this many cache misses, process startup costs more than it saves
+    PARALLEL_MIN_FILES = 64
+
+    def __init__(self, workers: int | None = None):
         self._parsers: dict[str, ts.Parser] = {}
+        self.workers = workers or os.cpu_count() or 1
+        # path -> last ParseResult; valid while the file's (mtime, size) holds
+        self._cache: dict[str, ParseResult] = {}
+        self._cache_lock = threading.Lock()
 
     def _get_parser(self, language: str) -> ts.Parser:
         """Get or create a tree-sitter parser for a language."""
@@ -154,6 +229,7 @@ class CodeParser:
             return None
 
         try:
+            st = filepath.stat()
             source = filepath.read_text(encoding="utf-8")
         except (OSError, UnicodeDecodeError) as e:
             return ParseResult(
@@ -163,69 +239,195 @@ class CodeParser:
                 error=str(e),
             )
 
-        return self.parse_source(source, language, str(filepath))
+        result = self.parse_source(source, language, str(filepath))
+        result.mtime_ns = st.st_mtime_ns
+        result.size = st.st_size
+        return result
 
-    def parse_directory(
+    def parse_files(self, paths: Iterable[Path]) -> list[ParseResult]:
+        """Parse many files, reusing cached results for unchanged ones.
+
+        A file is unchanged while its (mtime, size) matches the cached parse.
+        Misses are parsed in a process pool when there are enough of them.
+        Results keep input order; unsupported files are dropped.
+        """
+        return list(self.iter_files(paths))
+
+    def iter_files(self, paths: Iterable[Path]) -> Iterator[ParseResult]:
+        """parse_files as a stream: yields each result, in input order, as soon as it's ready.
+
+        The pool parses ahead of the consumer, so a caller writing results
+        out as they arrive overlaps its I/O with the parsing.
+        """
+        paths = list(paths)
+        hits: dict[str, ParseResult] = {}
+        misses: list[str] = []
+        with self._cache_lock:
+            for path in paths:
+                key = str(path)
+                cached = self._cache.get(key)
+                if cached is not None:
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        st = None
+                    if st and (st.st_mtime_ns, st.st_size) == (cached.mtime_ns, cached.size):
+                        hits[key] = cached
+                        continue
+                misses.append(key)
+
+        if len(misses) >= self.PARALLEL_MIN_FILES and self.workers > 1:
+            parsed = self._parse_parallel(misses)
+        else:
+            parsed = (self.parse_file(Path(p)) for p in misses)
+
+        for path in paths:
+            key = str(path)
+            result = hits.get(key)
+            if result is None:
+                result = next(parsed)
+                # Unreadable files have no stat to validate against
+                if result is not None and result.mtime_ns:
+                    with self._cache_lock:
+                        self._cache[key] = result
+            if result is not None:
+                yield result
+        # Like zip(strict=True): every miss must have produced exactly one result
+        end = object()
+        if next(parsed, end) is not end:
+            raise RuntimeError("Parser returned more results than files")
+
+    def _parse_parallel(self, paths: list[str]) -> Iterator[ParseResult | None]:
+        workers = min(self.workers, max(1, len(paths) // (self.PARALLEL_MIN_FILES // 4)))
+        # spawn: the caller may hold threads (watcher, Neo4j driver) that fork would copy
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        try:
+            chunksize = max(1, len(paths) // (workers * 8))
+            yield from pool.map(_parse_in_worker, paths, chunksize=chunksize)
+        finally:
+            # Also reached when the consumer stops early: drop the unstarted work
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def forget(self, paths: Iterable[str]) -> None:
+        """Drop cached results, e.g. for files deleted from disk."""
+        with self._cache_lock:
+            for path in paths:
+                self._cache.pop(path, None)
+
+    def scan_directory(
         self,
         root: Path,
         exclude: set[str] | None = None,
-    ) -> list[ParseResult]:
-        """Parse all supported files under a directory.
+    ) -> list[Path]:
+        """List supported files under a directory, sorted.
 
-        Respects all .gitignore files in the tree (root and nested). The .git
-        directory is always excluded regardless of .gitignore contents.
+        Respects all .gitignore files in the tree (root and nested), each
+        loaded when the walk reaches its directory. Excluded and ignored
+        directories are pruned, never descended into. The .git directory is
+        always excluded regardless of .gitignore contents.
 
         Args:
             root: Directory to scan.
             exclude: Additional directory names to skip (on top of .gitignore).
-
-        Returns:
-            List of ParseResult, one per supported file found.
         """
-        import pathspec
+        # .git is always excluded — it's not source code
+        excluded = set(exclude or ()) | {".git"}
 
-        from cairn.code.languages import supported_extensions
+        # dirpath -> .gitignore specs in effect there (own + ancestors)
+        specs_by_dir: dict[str, list[tuple[str, Any]]] = {}
+        found: list[Path] = []
 
-        exclude = exclude or set()
-        # .git is always excluded — it's not source code
-        exclude.add(".git")
+        for dirpath, dirnames, filenames in os.walk(str(root)):
+            specs = specs_by_dir.pop(dirpath, [])
+            if ".gitignore" in filenames:
+                specs = specs + _load_gitignore(dirpath)
 
-        # Collect all .gitignore files: (directory, PathSpec) pairs
-        gitignore_specs: list[tuple[Path, pathspec.PathSpec]] = []
-        for gi_path in root.rglob(".gitignore"):
-            if any(part in exclude for part in gi_path.parts):
-                continue
-            with open(gi_path) as f:
-                spec = pathspec.PathSpec.from_lines("gitwildmatch", f)
-            gitignore_specs.append((gi_path.parent, spec))
-
-        def _is_ignored(filepath: Path) -> bool:
-            for gi_dir, spec in gitignore_specs:
-                try:
-                    rel = filepath.relative_to(gi_dir)
-                except ValueError:
+            kept = []
+            for name in dirnames:
+                sub = os.path.join(dirpath, name)
+                if name in excluded or _gitignored(sub, specs, is_dir=True):
                     continue
-                if spec.match_file(str(rel)):
-                    return True
-            return False
+                kept.append(name)
+                specs_by_dir[sub] = specs
+            dirnames[:] = kept  # prune in place: os.walk skips the rest
 
-        from cairn.code.languages import language_for_filename as _lang_for_name
+            for name in filenames:
+                if name in excluded or not _is_supported_name(name):
+                    continue
+                path = os.path.join(dirpath, name)
+                if _gitignored(path, specs, is_dir=False) or not os.path.isfile(path):
+                    continue
+                found.append(Path(path))
 
-        exts = supported_extensions()
-        results: list[ParseResult] = []
+        return sorted(found)
 
-        for filepath in sorted(root.rglob("*")):
-            if not filepath.is_file():
-                continue
-            if filepath.suffix not in exts and _lang_for_name(filepath.name) is None:
+    def filter_indexable(
+        self,
+        root: Path,
+        paths: Iterable[Path],
+        exclude: set[str] | None = None,
+    ) -> list[Path]:
+        """Keep the paths scan_directory(root) would list, without walking.
+
+        For watchers that learn about individual files: checks each existing
+        path against its ancestors' names and .gitignore files up to root.
+        """
+        excluded = set(exclude or ()) | {".git"}
+        root_str = str(root)
+        # None marks a pruned directory
+        specs_by_dir: dict[str, list[tuple[str, Any]] | None] = {}
+
+        def _specs(dirpath: str) -> list[tuple[str, Any]] | None:
+            """Specs in effect inside dirpath, or None if dirpath itself is pruned."""
+            if dirpath in specs_by_dir:
+                return specs_by_dir[dirpath]
+            if dirpath == root_str:
+                specs: list[tuple[str, Any]] | None = []
+            else:
+                parent = _specs(os.path.dirname(dirpath))
+                if parent is None or os.path.basename(dirpath) in excluded \
+                        or _gitignored(dirpath, parent, is_dir=True):
+                    specs = None
+                else:
+                    specs = parent
+            if specs is not None and os.path.isfile(os.path.join(dirpath, ".gitignore")):
+                specs = specs + _load_gitignore(dirpath)
+            specs_by_dir[dirpath] = specs
+            return specs
+
+        kept: list[Path] = []
+        for path in paths:
+            path_str = str(path)
+            name = os.path.basename(path_str)
+            if not path_str.startswith(root_str.rstrip("/") + "/"):
                 continue
-            if any(part in exclude for part in filepath.parts):
+            if name in excluded or not _is_supported_name(name) or not os.path.isfile(path_str):
                 continue
-            if _is_ignored(filepath):
+            specs = _specs(os.path.dirname(path_str))
+            if specs is None or _gitignored(path_str, specs, is_dir=False):
                 continue
+            kept.append(Path(path_str))
+        return kept
 
-            result = self.parse_file(filepath)
-            if result is not None:
-                results.append(result)
+    def parse_directory(
+        self,
+        root: Path,
+        exclude: set[str] | None = None,
+    ) -> list[ParseResult]:
+        """Parse all supported files under a directory.
+
+        Combines scan_directory (pruned, .gitignore-aware walk) with
+        parse_files (cached, parallel parse).
 
-        return results
+        Args:
+            root: Directory to scan.
+            exclude: Additional directory names to skip (on top of .gitignore).
+
+        Returns:
+            List of ParseResult, one per supported file found.
+        """
+        return self.parse_files(self.scan_directory(root, exclude=exclude))
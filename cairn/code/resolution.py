@@ -0,0 +1,274 @@
+"""Module-resolution index shared by import and call resolution.
+
+Built once per indexing run from every parsed file, then queried per import:
+
+  - dotted module names (Python modules, TS module identifiers) live in a
+    prefix trie, so the "nearest module" fallback for an import that names
+    a symbol (``cairn.core.search.SearchV2``) or a namespace package
+    (``cairn``) is a walk down one branch instead of a scan of every module
+  - Go package directories are keyed by every path suffix, so an import
+    path finds its directory with one dict lookup
+  - each language dispatches through a resolver table; languages without an
+    entry use dotted-module resolution
+
+Resolution results match the historical linear-scan resolver exactly,
+including its tie-break: among several candidate modules, the one whose
+file was seen first wins.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+from cairn.code.parser import ParseResult
+from cairn.code.utils import path_to_module, path_to_module_ts, resolve_ts_import
+
+# Imports these languages make resolve relative to the importing file.
+# Only they disambiguate calls — see ModuleIndex.call_imports.
+_RELATIVE_IMPORT_LANGUAGES = frozenset({"typescript", "typescript_tsx"})
+
+
+class _TrieNode:
+    __slots__ = ("children", "order", "desc_order")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.order: int | None = None       # Insertion order of the module ending here
+        self.desc_order: int | None = None  # Earliest insertion order strictly below
+
+
+class ModuleTrie:
+    """Dotted module names -> file path, with first-inserted nearest lookup.
+
+    Re-inserting a module updates its path but keeps its original position,
+    as assigning to an existing dict key does.
+    """
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        self._paths: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def insert(self, module: str, path: str) -> None:
+        node = self._root
+        ancestors = []
+        for part in module.split("."):
+            ancestors.append(node)
+            node = node.children.setdefault(part, _TrieNode())
+        if node.order is not None:
+            self._paths[node.order] = path
+            return
+        node.order = len(self._paths)
+        self._paths.append(path)
+        for ancestor in ancestors[1:]:
+            if ancestor.desc_order is None:
+                ancestor.desc_order = node.order
+
+    def get(self, module: str) -> str | None:
+        node = self._find(module)
+        return self._paths[node.order] if node and node.order is not None else None
+
+    def nearest(self, module: str) -> str | None:
+        """First-inserted module that is a dotted ancestor or descendant of module.
+
+        Equivalent to scanning modules in insertion order for the first ``mod``
+        with ``module.startswith(mod + ".")`` or ``mod.startswith(module + ".")``.
+        """
+        best: int | None = None
+        node = self._root
+        parts = module.split(".")
+        for i, part in enumerate(parts):
+            child = node.children.get(part)
+            if child is None:
+                break
+            node = child
+            if i == len(parts) - 1:
+                if node.desc_order is not None:
+                    best = node.desc_order if best is None else min(best, node.desc_order)
+            elif node.order is not None:
+                best = node.order if best is None else min(best, node.order)
+        return self._paths[best] if best is not None else None
+
+    def _find(self, module: str) -> _TrieNode | None:
+        node = self._root
+        for part in module.split("."):
+            child = node.children.get(part)
+            if child is None:
+                return None
+            node = child
+        return node
+
+
+def root_prefix(parsed_files: list[ParseResult], known_paths: set[str]) -> str:
+    """Common directory above the top-level packages, for module naming.
+
+    e.g. "/home/user/project/cairn/core/services.py" with root "/home/user/project/"
+    -> "cairn.core.services" instead of "/.home.user.project.cairn.core.services"
+    """
+    if not parsed_files:
+        return ""
+    sample = parsed_files[0].file_path
+    if not sample.startswith("/"):
+        return ""
+    # Find the common prefix of all file paths
+    common = Path(sample).parent
+    for p in parsed_files[1:]:
+        while not p.file_path.startswith(str(common) + "/") and str(common) != "/":
+            common = common.parent
+    # Walk up until we find a directory that isn't a Python package
+    # (i.e. has no __init__.py among our known files)
+    while str(common) != "/":
+        init_path = str(common / "__init__.py")
+        if init_path not in known_paths:
+            break
+        common = common.parent
+    return str(common).rstrip("/") + "/"
+
+
+class ModuleIndex:
+    """Import targets for a set of parsed files, resolved against each other.
+
+    Usage:
+        index = ModuleIndex(parsed_files, known_paths)
+        for parsed in parsed_files:
+            targets = index.imports_of(parsed)   # imported file paths, in order
+    """
+
+    def __init__(self, parsed_files: list[ParseResult], known_paths: set[str]):
+        self.known_paths = known_paths
+        self.root_prefix = root_prefix(parsed_files, known_paths)
+        self.modules = ModuleTrie()
+        # Go packages are directories — all .go files in a directory share a package
+        self._go_dirs: dict[str, list[str]] = {}
+        # Every "/"-suffix of a Go directory (relative to root_prefix) -> directories
+        self._go_suffixes: dict[str, list[str]] = {}
+        self._imports: dict[str, list[str]] = {}
+
+        for parsed in parsed_files:
+            rel = self._rel(parsed.file_path)
+            mod = path_to_module(rel)
+            if mod:
+                self.modules.insert(mod, parsed.file_path)  # Value stays absolute
+            ts_mod = path_to_module_ts(rel)
+            if ts_mod:
+                self.modules.insert(ts_mod, parsed.file_path)
+            if parsed.language == "golang":
+                dir_path = str(Path(parsed.file_path).parent)
+                if dir_path not in self._go_dirs:
+                    self._go_dirs[dir_path] = []
+                    parts = self._rel(dir_path).split("/")
+                    for i in range(len(parts)):
+                        self._go_suffixes.setdefault("/".join(parts[i:]), []).append(dir_path)
+                self._go_dirs[dir_path].append(parsed.file_path)
+
+        self._resolvers: dict[str, Callable[[ParseResult, str], str | None]] = {
+            "typescript": self._resolve_ts,
+            "typescript_tsx": self._resolve_ts,
+            "golang": self._resolve_go,
+        }
+
+    def _rel(self, file_path: str) -> str:
+        """Strip root prefix for module resolution."""
+        if self.root_prefix and file_path.startswith(self.root_prefix):
+            return file_path[len(self.root_prefix):]
+        return file_path
+
+    def resolve(self, parsed: ParseResult, import_text: str) -> str | None:
+        """Resolve one import statement of parsed to a file path, or None."""
+        resolver = self._resolvers.get(parsed.language, self._resolve_dotted)
+        return resolver(parsed, import_text)
+
+    def imports_of(self, parsed: ParseResult) -> list[str]:
+        """Distinct project files parsed imports, in import order. Cached per file."""
+        cached = self._imports.get(parsed.file_path)
+        if cached is not None:
+            return cached
+        targets: list[str] = []
+        for imp in parsed.imports:
+            target = self.resolve(parsed, imp.name)
+            if target and target in self.known_paths and target != parsed.file_path and target not in targets:
+                targets.append(target)
+        self._imports[parsed.file_path] = targets
+        return targets
+
+    def call_imports(self, parsed: ParseResult) -> set[str]:
+        """Imported files that disambiguate parsed's calls between same-named symbols.
+
+        Only relative (TypeScript) imports count. Call resolution used to
+        resolve each file's imports against a module table holding that file
+        alone, where dotted-module and Go package imports can only find the
+        file itself; keeping that scope keeps call edges unchanged.
+        """
+        if parsed.language not in _RELATIVE_IMPORT_LANGUAGES:
+            return set()
+        return set(self.imports_of(parsed))
+
+    # -- Per-language resolvers --
+
+    def _resolve_dotted(self, parsed: ParseResult, import_text: str) -> str | None:
+        imported_module = import_text
+        if imported_module.startswith("from "):
+            parts = imported_module.split()
+            if len(parts) >= 2:
+                imported_module = parts[1]
+        elif imported_module.startswith("import "):
+            imported_module = imported_module[7:].split(",")[0].strip()
+        return self.modules.get(imported_module) or self.modules.nearest(imported_module)
+
+    def _resolve_ts(self, parsed: ParseResult, import_text: str) -> str | None:
+        import_source = extract_ts_import_source(import_text)
+        if not import_source:
+            return None
+        importer_dir = str(Path(parsed.file_path).parent)
+        return resolve_ts_import(import_source, importer_dir, self.known_paths)
+
+    def _resolve_go(self, parsed: ParseResult, import_text: str) -> str | None:
+        """Resolve a Go import to a file in the project.
+
+        Go imports are quoted package paths like "fmt" or "github.com/user/repo/pkg".
+        Matches the import path against suffixes of known package directories
+        and returns the first .go file of the first match (representing the
+        package), skipping the importer's own directory.
+        """
+        # Strip quotes and optional alias prefix (e.g. `mypkg "github.com/..."`)
+        text = import_text.strip()
+        if " " in text:
+            text = text.split()[-1]
+        text = text.strip('"').strip("'")
+        if not text:
+            return None
+
+        importer_dir = str(Path(parsed.file_path).parent)
+        for dir_path in self._go_suffixes.get(text, ()):
+            # Don't resolve to files in the same directory (same package)
+            if dir_path != importer_dir:
+                return self._go_dirs[dir_path][0]
+        return None
+
+
+def extract_ts_import_source(import_text: str) -> str | None:
+    """Extract the module specifier from a TS import statement text.
+
+    e.g. "import { foo } from './utils'" -> "./utils"
+         "import React from 'react'" -> "react"
+    """
+    for quote in ("'", '"'):
+        idx = import_text.rfind(f"from {quote}")
+        if idx == -1:
+            idx = import_text.rfind(f"from{quote}")
+        if idx != -1:
+            start = import_text.index(quote, idx) + 1
+            end = import_text.index(quote, start)
+            return import_text[start:end]
+    for quote in ("'", '"'):
+        if f"import {quote}" in import_text or f"import{quote}" in import_text:
+            try:
+                start = import_text.index(quote) + 1
+                end = import_text.index(quote, start)
+                return import_text[start:end]
+            except ValueError:
+                pass
+    return None
@@ -1,8 +1,11 @@
 """Filesystem watcher for automatic code re-indexing.
 
 Monitors directories under CAIRN_CODE_DIR for changes and triggers
-incremental re-indexing. Uses per-path debouncing to coalesce rapid
-filesystem events (IDE saves, git operations).
+incremental re-indexing. Uses per-project debouncing to coalesce rapid
+filesystem events (IDE saves, git operations): the paths touched during
+the window are collected and handed to CodeIndexer.index_paths, which
+reparses only those files and relinks only their dependents. Directory
+moves and deletes fall back to a full index_directory.
 
 Thread safety: all indexing runs on a single dedicated worker thread
 via a queue, preventing concurrent graph writes.
@@ -12,6 +15,8 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
+from collections import deque
 from pathlib import Path
 from queue import Empty, Queue
 from typing import Any
@@ -26,21 +31,121 @@ _DEBOUNCE_SECONDS = 3.0
 
 
 class _IndexRequest:
-    """A request to re-index a project after filesystem changes."""
+    """A request to re-index a project after filesystem changes.
 
-    __slots__ = ("project", "project_id", "root")
+    paths is None for a full rescan (a directory moved or vanished).
+    """
+
+    __slots__ = ("project", "project_id", "root", "paths", "first_event_at", "enqueued_at")
 
-    def __init__(self, project: str, project_id: int, root: Path) -> None:
+    def __init__(
+        self,
+        project: str,
+        project_id: int,
+        root: Path,
+        paths: set[str] | None = None,
+        first_event_at: float | None = None,
+    ) -> None:
         self.project = project
         self.project_id = project_id
         self.root = root
+        self.paths = paths
+        self.enqueued_at = time.monotonic()
+        self.first_event_at = first_event_at or self.enqueued_at
+
+
+class ReindexMetrics:
+    """Thread-safe per-project reindex latency, one sample per change burst.
+
+    latency_ms runs from the first filesystem event of a burst to the graph
+    write finishing (debounce and queueing included); reindex_ms is the
+    indexing work alone. In-memory only — resets on restart.
+    """
+
+    WINDOW = 200  # Bursts kept per project for percentiles
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._projects: dict[str, dict] = {}
+
+    def record(
+        self,
+        project: str,
+        latency_ms: float,
+        reindex_ms: float,
+        paths: int | None,
+        files_indexed: int = 0,
+        files_relinked: int = 0,
+        ok: bool = True,
+    ) -> None:
+        with self._lock:
+            m = self._projects.setdefault(project, {
+                "bursts": 0,
+                "failures": 0,
+                "full_rescans": 0,
+                "files_indexed": 0,
+                "files_relinked": 0,
+                "latency_ms": deque(maxlen=self.WINDOW),
+                "reindex_ms": deque(maxlen=self.WINDOW),
+                "last": None,
+            })
+            m["bursts"] += 1
+            m["failures"] += 0 if ok else 1
+            m["full_rescans"] += 1 if paths is None else 0
+            m["files_indexed"] += files_indexed
+            m["files_relinked"] += files_relinked
+            m["latency_ms"].append(latency_ms)
+            m["reindex_ms"].append(reindex_ms)
+            m["last"] = {
+                "paths": paths,
+                "latency_ms": round(latency_ms, 1),
+                "reindex_ms": round(reindex_ms, 1),
+                "ok": ok,
+            }
+
+    def to_dict(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                project: {
+                    **{k: v for k, v in m.items() if k not in ("latency_ms", "reindex_ms")},
+                    "latency_ms": _percentiles(m["latency_ms"]),
+                    "reindex_ms": _percentiles(m["reindex_ms"]),
+                }
+                for project, m in self._projects.items()
+            }
+
+    def summary(self, project: str) -> str:
+        """One-line rolling summary for a project, for per-burst logging."""
+        with self._lock:
+            m = self._projects.get(project)
+            if m is None:
+                return "no bursts"
+            latency = _percentiles(m["latency_ms"])
+            reindex = _percentiles(m["reindex_ms"])
+            return (
+                f"{m['bursts']} bursts, {m['failures']} failed, "
+                f"latency p50/p95 {latency['p50']:.0f}/{latency['p95']:.0f} ms, "
+                f"reindex p50/p95 {reindex['p50']:.0f}/{reindex['p95']:.0f} ms"
+            )
+
+
+def _percentiles(samples: deque[float]) -> dict:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))], 1)
+
+    return {"p50": pct(50), "p95": pct(95), "max": round(ordered[-1], 1)}
 
 
 class _ProjectEventHandler(FileSystemEventHandler):
     """Handles filesystem events for a single watched project.
 
     Debounces events per project — a burst of saves within the debounce
-    window collapses into a single re-index request.
+    window collapses into a single re-index request carrying every path
+    the burst touched.
     """
 
     def __init__(
@@ -59,10 +164,19 @@ class _ProjectEventHandler(FileSystemEventHandler):
         self._extensions = supported_extensions
         self._timer: threading.Timer | None = None
         self._lock = threading.Lock()
+        # Accumulated during the debounce window; None = full rescan
+        self._pending: set[str] | None = set()
+        self._first_event_at: float | None = None
 
-    def _schedule_reindex(self) -> None:
-        """Schedule a re-index after the debounce window."""
+    def _schedule_reindex(self, *paths: str, full: bool = False) -> None:
+        """Record the touched paths and (re)start the debounce window."""
         with self._lock:
+            if full:
+                self._pending = None
+            elif self._pending is not None:
+                self._pending.update(paths)
+            if self._first_event_at is None:
+                self._first_event_at = time.monotonic()
             if self._timer is not None:
                 self._timer.cancel()
             self._timer = threading.Timer(
@@ -73,9 +187,16 @@ class _ProjectEventHandler(FileSystemEventHandler):
             self._timer.start()
 
     def _enqueue(self) -> None:
-        """Put a re-index request on the worker queue."""
-        logger.info("Watcher: queueing re-index for %s", self.project)
-        self._queue.put(_IndexRequest(self.project, self.project_id, self.root))
+        """Put a re-index request for the accumulated paths on the worker queue."""
+        with self._lock:
+            paths, self._pending = self._pending, set()
+            first_event_at, self._first_event_at = self._first_event_at, None
+            self._timer = None
+        logger.info(
+            "Watcher: queueing re-index for %s (%s)",
+            self.project, "full rescan" if paths is None else f"{len(paths)} paths",
+        )
+        self._queue.put(_IndexRequest(self.project, self.project_id, self.root, paths, first_event_at))
 
     def _is_relevant(self, path: str) -> bool:
         """Check if the event path is a supported source file."""
@@ -83,20 +204,23 @@ class _ProjectEventHandler(FileSystemEventHandler):
 
     def on_created(self, event: Any) -> None:
         if not event.is_directory and self._is_relevant(event.src_path):
-            self._schedule_reindex()
+            self._schedule_reindex(event.src_path)
 
     def on_modified(self, event: Any) -> None:
         if not event.is_directory and self._is_relevant(event.src_path):
-            self._schedule_reindex()
+            self._schedule_reindex(event.src_path)
 
     def on_deleted(self, event: Any) -> None:
-        if not event.is_directory and self._is_relevant(event.src_path):
-            self._schedule_reindex()
+        if event.is_directory:
+            self._schedule_reindex(full=True)
+        elif self._is_relevant(event.src_path):
+            self._schedule_reindex(event.src_path)
 
     def on_moved(self, event: Any) -> None:
-        if not event.is_directory:
-            if self._is_relevant(event.src_path) or self._is_relevant(event.dest_path):
-                self._schedule_reindex()
+        if event.is_directory:
+            self._schedule_reindex(full=True)
+        elif self._is_relevant(event.src_path) or self._is_relevant(event.dest_path):
+            self._schedule_reindex(event.src_path, event.dest_path)
 
 
 class CodeWatcher:
@@ -110,10 +234,12 @@ class CodeWatcher:
         watcher.stop()
     """
 
-    def __init__(self, parser: Any, graph: Any) -> None:
+    def __init__(self, parser: Any, graph: Any, indexer: Any = None) -> None:
         from cairn.code.indexer import CodeIndexer
 
-        self._indexer = CodeIndexer(parser, graph)
+        # Share the initial indexer to inherit its edge state and parse cache
+        self._indexer = indexer or CodeIndexer(parser, graph)
+        self.metrics = ReindexMetrics()
         self._observer = Observer()
         self._observer.daemon = True
         self._queue: Queue[_IndexRequest] = Queue()
@@ -157,6 +283,10 @@ class CodeWatcher:
         """Return list of currently watched paths."""
         return list(self._watches.keys())
 
+    def stats(self) -> dict[str, dict]:
+        """Per-project reindex latency and volume over recent change bursts."""
+        return self.metrics.to_dict()
+
     def start(self) -> None:
         """Start the observer and worker threads."""
         if self._observer.is_alive():
@@ -184,14 +314,49 @@ class CodeWatcher:
                 req = self._queue.get(timeout=1.0)
             except Empty:
                 continue
-
-            try:
+            self._process(req)
+
+    def _process(self, req: _IndexRequest) -> None:
+        """Run one re-index request and record its burst latency."""
+        started = time.monotonic()
+        result = None
+        try:
+            if req.paths is None:
                 logger.info("Watcher: re-indexing %s at %s", req.project, req.root)
                 result = self._indexer.index_directory(
                     root=req.root,
                     project=req.project,
                     project_id=req.project_id,
                 )
-                logger.info("Watcher: %s — %s", req.project, result.summary())
-            except Exception:
-                logger.exception("Watcher: re-index failed for %s", req.project)
+            else:
+                result = self._indexer.index_paths(
+                    root=req.root,
+                    paths=[Path(p) for p in sorted(req.paths)],
+                    project=req.project,
+                    project_id=req.project_id,
+                )
+        except Exception:
+            logger.exception("Watcher: re-index failed for %s", req.project)
+        finished = time.monotonic()
+
+        self.metrics.record(
+            req.project,
+            latency_ms=(finished - req.first_event_at) * 1000,
+            reindex_ms=(finished - started) * 1000,
+            paths=None if req.paths is None else len(req.paths),
+            files_indexed=result.files_indexed if result else 0,
+            files_relinked=result.files_relinked if result else 0,
+            ok=result is not None,
+        )
+        # Rolling stats after every burst, so they are visible while the
+        # watcher runs rather than only at shutdown
+        rolling = self.metrics.summary(req.project)
+        if result is not None:
+            logger.info(
+                "Watcher: %s — %s (reindex %.0f ms, %.0f ms since first change; %s)",
+                req.project, result.summary(),
+                (finished - started) * 1000, (finished - req.first_event_at) * 1000,
+                rolling,
+            )
+        else:
+            logger.warning("Watcher: %s — re-index failed (%s)", req.project, rolling)
@@ -25,11 +25,13 @@ Environment variables:
     CAIRN_NEO4J_USER        Neo4j username (default: neo4j)
     CAIRN_NEO4J_PASSWORD    Neo4j password (default: cairn-dev-password)
     CAIRN_NEO4J_DATABASE    Neo4j database (default: neo4j)
-    CAIRN_API_URL           Cairn server URL for project resolution (default: http://localhost:8000)
+    CAIRN_API_URL           Cairn server URL for project resolution and
+                            code.index_progress events (default: http://localhost:8000)
     CAIRN_API_KEY           API key for authenticated cairn instances (optional)
     CAIRN_CODE_PROJECTS     Comma-separated project=path pairs
     CAIRN_CODE_WATCH        Enable file watching (default: true)
     CAIRN_CODE_FORCE        Force re-index even if unchanged (default: false)
+    CAIRN_CODE_PARSE_WORKERS  Parser processes for large parses (default: CPU count)
 """
 
 from __future__ import annotations
@@ -87,6 +89,12 @@ def _parse_args() -> argparse.Namespace:
         help="API key for authenticated cairn instances",
     )
     parser.add_argument("--force", action="store_true", default=os.getenv("CAIRN_CODE_FORCE", "false").lower() in ("true", "1"))
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=int(os.getenv("CAIRN_CODE_PARSE_WORKERS", "0")) or None,
+        help="Parser processes for large parses (default: CPU count)",
+    )
     parser.add_argument("--no-watch", action="store_true", default=os.getenv("CAIRN_CODE_WATCH", "true").lower() in ("false", "0"))
     return parser.parse_args()
 
@@ -209,6 +217,55 @@ def _resolve_project_id(
     return None
 
 
+class _ProgressPoster:
+    """Progress callback publishing ``code.index_progress`` events via the cairn REST API.
+
+    Posts at most once per INTERVAL seconds, plus the final report of each
+    run. A failed post is logged and suspends posting for BACKOFF seconds,
+    so an unreachable server cannot stall the graph writer.
+    """
+
+    INTERVAL = 1.0
+    BACKOFF = 30.0
+    SESSION_NAME = "__system__"
+
+    def __init__(self, cairn_url: str, api_key: str = ""):
+        self.cairn_url = cairn_url
+        self.api_key = api_key
+        self._next_post = 0.0
+
+    def __call__(self, progress: Any) -> None:
+        now = time.monotonic()
+        if progress.phase != "done" and now < self._next_post:
+            return
+        self._next_post = now + self.INTERVAL
+        body = {
+            "session_name": self.SESSION_NAME,
+            "event_type": "code.index_progress",
+            "project": progress.project,
+            "actor": "system",
+            "payload": progress.to_dict(),
+        }
+        try:
+            self._post(body)
+        except Exception:
+            self._next_post = now + self.BACKOFF
+            logger.debug("Failed to post index progress", exc_info=True)
+
+    def _post(self, body: dict) -> None:
+        import json
+        import urllib.request
+
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["X-API-Key"] = self.api_key
+        req = urllib.request.Request(
+            f"{self.cairn_url}/api/events", data=json.dumps(body).encode(), headers=headers, method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=2):
+            pass
+
+
 def main() -> None:
     args = _parse_args()
     projects = _parse_projects(args)
@@ -250,8 +307,8 @@ def main() -> None:
     from cairn.code.indexer import CodeIndexer
     from cairn.code.parser import CodeParser
 
-    parser = CodeParser()
-    indexer = CodeIndexer(parser, graph)
+    parser = CodeParser(workers=args.parse_workers)
+    indexer = CodeIndexer(parser, graph, progress=_ProgressPoster(args.cairn_url, api_key=args.api_key))
 
     for name, path, _ in projects:
         logger.info("Indexing %s at %s ...", name, path)
@@ -276,7 +333,7 @@ def main() -> None:
 
     from cairn.code.watcher import CodeWatcher
 
-    watcher = CodeWatcher(parser, graph)
+    watcher = CodeWatcher(parser, graph, indexer=indexer)
     for name, path, _ in projects:
         watcher.watch(project=name, project_id=project_ids[name], root=path)
     watcher.start()
@@ -300,6 +357,8 @@ def main() -> None:
 
     logger.info("Shutting down...")
     watcher.stop()
+    for name, stats in watcher.stats().items():
+        logger.info("Reindex stats for %s: %s", name, stats)
     graph.close()
     logger.info("Cairn code worker stopped.")
 
@@ -34,12 +34,24 @@ class EmbeddingConfig:
     # Bedrock settings (Titan Text Embeddings V2)
     bedrock_model: str = "amazon.titan-embed-text-v2:0"
     bedrock_region: str = "us-east-1"
+    bedrock_concurrency: int = 8       # max in-flight requests for embed_batch
+    bedrock_rate_limit: float = 0.0    # requests/second across callers; 0 = unlimited
 
     # OpenAI-compatible settings (works with OpenAI, Ollama, vLLM, LM Studio, Together)
     openai_base_url: str = "https://api.openai.com"
     openai_model: str = "text-embedding-3-small"
     openai_api_key: str = ""  # empty = no Authorization header (for local endpoints)
 
+    # Content-addressed embedding cache (keyed by model, dimensions, sha256(text))
+    cache_enabled: bool = True
+    cache_max_mb: int = 64       # in-process LRU byte budget
+    cache_path: str = ""         # SQLite file for the persistent tier; empty = memory only
+    cache_persistent_max_mb: int = 1024  # persistent tier byte budget, LRU-pruned; 0 = unbounded
+
+    # Representation of content over AUTO_SUMMARIZE_EMBED_THRESHOLD:
+    # "summary", "mean" (mean-pooled chunks) or "multi" (summary + chunk vectors)
+    long_content: str = "summary"
+
 
 @dataclass(frozen=True)
 class LLMConfig:
@@ -63,6 +75,28 @@ class LLMConfig:
     openai_api_key: str = ""
 
 
+@dataclass(frozen=True)
+class LLMCacheConfig:
+    """Response cache for prompts fully determined by their inputs (cairn/llm/cache.py)."""
+    enabled: bool = True
+    max_mb: int = 32               # in-process LRU byte budget
+    persistent: bool = False       # also keep responses in Postgres (llm_cache table)
+    # Per-operation TTLs in seconds; 0 = don't cache that operation
+    ttl_routing: int = 86400       # query routing, intent classification, expansion
+    ttl_enrichment: int = 2592000  # enrichment, ingest classification
+    ttl_extraction: int = 2592000  # knowledge extraction
+    ttl_clustering: int = 604800   # cluster labels and summaries
+    ttl_consolidation: int = 86400
+
+
+@dataclass(frozen=True)
+class HTTPClientConfig:
+    """Outbound connection pools for the HTTP LLM and embedding backends."""
+    pool_size: int = 10            # idle keep-alive connections kept per host
+    connect_timeout: float = 10.0  # seconds; read timeouts are per call
+    http2: bool = False            # needs httpx[http2]; falls back to HTTP/1.1
+
+
 @dataclass(frozen=True)
 class ModelTierConfig:
     backend: str = ""   # "bedrock", "ollama", etc. Empty = use llm.backend
@@ -241,6 +275,10 @@ class ClusteringConfig:
     staleness_hours: int = 24       # Recluster after this many hours
     staleness_growth_pct: int = 20  # Recluster after this % memory growth
     tsne_max_samples: int = 500     # t-SNE sample cap (O(n^2) memory)
+    incremental: bool = True        # Assign new memories to existing clusters between full refits
+    assign_max_distance: float = 0.35  # Cosine distance cap for assignment (beyond = noise)
+    refit_noise_pct: int = 30       # Full refit when incremental noise share exceeds this %
+    refit_drift: float = 0.1        # Full refit when cumulative centroid shift exceeds this
 
 
 @dataclass(frozen=True)
@@ -262,6 +300,7 @@ class ConsolidationConfig:
     similarity_threshold: float = 0.80 # Mean pairwise similarity for eligible clusters
     dry_run: bool = True               # Log what would be consolidated without acting
     max_per_run: int = 10              # Max clusters to consolidate per scan
+    max_candidate_pairs: int = 0       # Similar pairs reviewed per consolidate() call (0 = all)
 
 
 @dataclass(frozen=True)
@@ -313,6 +352,8 @@ class Config:
     db: DatabaseConfig = field(default_factory=DatabaseConfig)
     embedding: EmbeddingConfig = field(default_factory=EmbeddingConfig)
     llm: LLMConfig = field(default_factory=LLMConfig)
+    llm_cache: LLMCacheConfig = field(default_factory=LLMCacheConfig)
+    http_client: HTTPClientConfig = field(default_factory=HTTPClientConfig)
     capabilities: LLMCapabilities = field(default_factory=LLMCapabilities)
     terminal: TerminalConfig = field(default_factory=TerminalConfig)
     auth: AuthConfig = field(default_factory=AuthConfig)
@@ -325,6 +366,7 @@ class Config:
     work_items: WorkItemsConfig = field(default_factory=WorkItemsConfig)
     clustering: ClusteringConfig = field(default_factory=ClusteringConfig)
     enrichment_enabled: bool = True
+    enrichment_mode: str = "inline"  # "inline" or "deferred"; projects can override
     extended_tools: bool = False  # Gate for MCP tools not yet earning their keep
     profile: str = ""  # Active CAIRN_PROFILE name (empty = no profile)
     transport: str = "stdio"  # "stdio" or "http"
@@ -338,7 +380,12 @@ class Config:
     ingest_max_size: int = 100_000_000  # Max file size for ingest (~100MB, chunked)
     ingest_chunk_size: int = 512       # tokens per chunk (Chonkie)
     ingest_chunk_overlap: int = 64     # overlap tokens between chunks
+    ingest_batch_size: int = 64        # chunks per dedup query, embed_batch and INSERT
+    ingest_workers: int = 2            # embed threads and insert threads per ingest
+    ingest_queue_depth: int = 4        # batches buffered between pipeline stages
+    ingest_enrich: bool = False        # queue deferred LLM enrichment for ingested chunks
     decay_lambda: float = 0.01        # Exponential decay rate (half-life ~69 days at 0.01)
+    search_execution: str = "sequential"  # Hybrid search SQL: "sequential", "fused", or "compare"
     decay: DecayConfig = field(default_factory=DecayConfig)
     consolidation_worker: ConsolidationConfig = field(default_factory=ConsolidationConfig)
     audit: AuditConfig = field(default_factory=AuditConfig)
@@ -410,18 +457,23 @@ EDITABLE_KEYS: set[str] = {
     "clustering.min_cluster_size", "clustering.min_samples",
     "clustering.selection_method", "clustering.staleness_hours",
     "clustering.staleness_growth_pct", "clustering.tsne_max_samples",
+    "clustering.incremental", "clustering.assign_max_distance",
+    "clustering.refit_noise_pct", "clustering.refit_drift",
     # Work Items
     "work_items.default_prefix_length",
     # Consolidation worker
     "consolidation_worker.enabled", "consolidation_worker.interval_hours",
     "consolidation_worker.min_cluster_size", "consolidation_worker.similarity_threshold",
     "consolidation_worker.dry_run", "consolidation_worker.max_per_run",
+    "consolidation_worker.max_candidate_pairs",
     # Push notifications
     "push.enabled", "push.url", "push.token", "push.default_topic", "push.timeout",
     # Top-level
-    "enrichment_enabled",
+    "enrichment_enabled", "enrichment_mode",
     # event_archive_dir, ingest_dir, code_dir are security-critical (path traversal) — env-only
     "ingest_max_size", "ingest_chunk_size", "ingest_chunk_overlap", "decay_lambda",
+    "ingest_batch_size", "ingest_workers", "ingest_queue_depth", "ingest_enrich",
+    "search_execution",
     "decay.enabled", "decay.scan_interval_hours", "decay.threshold",
     "decay.min_age_days", "decay.protect_importance", "decay.dry_run",
     # Audit
@@ -632,9 +684,16 @@ _ENV_MAP: dict[str, str] = {
     "embedding.dimensions": "CAIRN_EMBEDDING_DIMENSIONS",
     "embedding.bedrock_model": "CAIRN_EMBEDDING_BEDROCK_MODEL",
     "embedding.bedrock_region": "CAIRN_EMBEDDING_BEDROCK_REGION",
+    "embedding.bedrock_concurrency": "CAIRN_EMBEDDING_BEDROCK_CONCURRENCY",
+    "embedding.bedrock_rate_limit": "CAIRN_EMBEDDING_BEDROCK_RPS",
     "embedding.openai_base_url": "CAIRN_EMBEDDING_OPENAI_URL",
     "embedding.openai_model": "CAIRN_EMBEDDING_OPENAI_MODEL",
     "embedding.openai_api_key": "CAIRN_EMBEDDING_OPENAI_KEY",
+    "embedding.cache_enabled": "CAIRN_EMBEDDING_CACHE",
+    "embedding.cache_max_mb": "CAIRN_EMBEDDING_CACHE_MB",
+    "embedding.cache_path": "CAIRN_EMBEDDING_CACHE_PATH",
+    "embedding.cache_persistent_max_mb": "CAIRN_EMBEDDING_CACHE_PERSISTENT_MB",
+    "embedding.long_content": "CAIRN_EMBEDDING_LONG_CONTENT",
     "llm.backend": "CAIRN_LLM_BACKEND",
     "llm.bedrock_model": "CAIRN_BEDROCK_MODEL",
     "llm.bedrock_region": "AWS_DEFAULT_REGION",
@@ -645,6 +704,17 @@ _ENV_MAP: dict[str, str] = {
     "llm.openai_base_url": "CAIRN_OPENAI_BASE_URL",
     "llm.openai_model": "CAIRN_OPENAI_MODEL",
     "llm.openai_api_key": "CAIRN_OPENAI_API_KEY",
+    "llm_cache.enabled": "CAIRN_LLM_CACHE",
+    "llm_cache.max_mb": "CAIRN_LLM_CACHE_MB",
+    "llm_cache.persistent": "CAIRN_LLM_CACHE_PERSISTENT",
+    "llm_cache.ttl_routing": "CAIRN_LLM_CACHE_TTL_ROUTING",
+    "llm_cache.ttl_enrichment": "CAIRN_LLM_CACHE_TTL_ENRICHMENT",
+    "llm_cache.ttl_extraction": "CAIRN_LLM_CACHE_TTL_EXTRACTION",
+    "llm_cache.ttl_clustering": "CAIRN_LLM_CACHE_TTL_CLUSTERING",
+    "llm_cache.ttl_consolidation": "CAIRN_LLM_CACHE_TTL_CONSOLIDATION",
+    "http_client.pool_size": "CAIRN_HTTP_POOL_SIZE",
+    "http_client.connect_timeout": "CAIRN_HTTP_CONNECT_TIMEOUT",
+    "http_client.http2": "CAIRN_HTTP2",
     "router.enabled": "CAIRN_ROUTER_ENABLED",
     "router.capable.backend": "CAIRN_ROUTER_CAPABLE_BACKEND",
     "router.capable.model": "CAIRN_ROUTER_CAPABLE_MODEL",
@@ -739,12 +809,17 @@ _ENV_MAP: dict[str, str] = {
     "clustering.staleness_hours": "CAIRN_CLUSTER_STALENESS_HOURS",
     "clustering.staleness_growth_pct": "CAIRN_CLUSTER_STALENESS_GROWTH_PCT",
     "clustering.tsne_max_samples": "CAIRN_CLUSTER_TSNE_MAX_SAMPLES",
+    "clustering.incremental": "CAIRN_CLUSTER_INCREMENTAL",
+    "clustering.assign_max_distance": "CAIRN_CLUSTER_ASSIGN_MAX_DISTANCE",
+    "clustering.refit_noise_pct": "CAIRN_CLUSTER_REFIT_NOISE_PCT",
+    "clustering.refit_drift": "CAIRN_CLUSTER_REFIT_DRIFT",
     "work_items.default_prefix_length": "CAIRN_WORK_ITEMS_PREFIX_LENGTH",
     "event_archive_dir": "CAIRN_EVENT_ARCHIVE_DIR",
     "ingest_dir": "CAIRN_INGEST_DIR",
     "code_dir": "CAIRN_CODE_DIR",
     "ingest_max_size": "CAIRN_INGEST_MAX_SIZE",
     "enrichment_enabled": "CAIRN_ENRICHMENT_ENABLED",
+    "enrichment_mode": "CAIRN_ENRICHMENT_MODE",
     "extended_tools": "CAIRN_EXTENDED_TOOLS",
     "profile": "CAIRN_PROFILE",
     "transport": "CAIRN_TRANSPORT",
@@ -753,7 +828,12 @@ _ENV_MAP: dict[str, str] = {
     "public_url": "CAIRN_PUBLIC_URL",
     "ingest_chunk_size": "CAIRN_INGEST_CHUNK_SIZE",
     "ingest_chunk_overlap": "CAIRN_INGEST_CHUNK_OVERLAP",
+    "ingest_batch_size": "CAIRN_INGEST_BATCH_SIZE",
+    "ingest_workers": "CAIRN_INGEST_WORKERS",
+    "ingest_queue_depth": "CAIRN_INGEST_QUEUE_DEPTH",
+    "ingest_enrich": "CAIRN_INGEST_ENRICH",
     "decay_lambda": "CAIRN_DECAY_LAMBDA",
+    "search_execution": "CAIRN_SEARCH_EXECUTION",
     "decay.enabled": "CAIRN_DECAY_ENABLED",
     "decay.scan_interval_hours": "CAIRN_DECAY_SCAN_INTERVAL",
     "decay.threshold": "CAIRN_DECAY_THRESHOLD",
@@ -767,6 +847,7 @@ _ENV_MAP: dict[str, str] = {
     "consolidation_worker.min_cluster_size": "CAIRN_CONSOLIDATION_MIN_CLUSTER",
     "consolidation_worker.similarity_threshold": "CAIRN_CONSOLIDATION_SIMILARITY",
     "consolidation_worker.max_per_run": "CAIRN_CONSOLIDATION_MAX_PER_RUN",
+    "consolidation_worker.max_candidate_pairs": "CAIRN_CONSOLIDATION_MAX_PAIRS",
     "audit.enabled": "CAIRN_AUDIT_ENABLED",
     "webhooks.enabled": "CAIRN_WEBHOOKS_ENABLED",
     "webhooks.delivery_interval": "CAIRN_WEBHOOKS_DELIVERY_INTERVAL",
@@ -830,9 +911,16 @@ def load_config() -> Config:
             dimensions=int(os.getenv("CAIRN_EMBEDDING_DIMENSIONS", "384")),
             bedrock_model=os.getenv("CAIRN_EMBEDDING_BEDROCK_MODEL", "amazon.titan-embed-text-v2:0"),
             bedrock_region=os.getenv("CAIRN_EMBEDDING_BEDROCK_REGION", os.getenv("AWS_DEFAULT_REGION", "us-east-1")),
+            bedrock_concurrency=int(os.getenv("CAIRN_EMBEDDING_BEDROCK_CONCURRENCY", "8")),
+            bedrock_rate_limit=float(os.getenv("CAIRN_EMBEDDING_BEDROCK_RPS", "0")),
             openai_base_url=os.getenv("CAIRN_EMBEDDING_OPENAI_URL", os.getenv("CAIRN_OPENAI_BASE_URL", "https://api.openai.com")),
             openai_model=os.getenv("CAIRN_EMBEDDING_OPENAI_MODEL", "text-embedding-3-small"),
             openai_api_key=os.getenv("CAIRN_EMBEDDING_OPENAI_KEY", os.getenv("CAIRN_OPENAI_API_KEY", "")),
+            cache_enabled=os.getenv("CAIRN_EMBEDDING_CACHE", "true").lower() in _BOOL_TRUTHY,
+            cache_max_mb=int(os.getenv("CAIRN_EMBEDDING_CACHE_MB", "64")),
+            cache_path=os.getenv("CAIRN_EMBEDDING_CACHE_PATH", ""),
+            cache_persistent_max_mb=int(os.getenv("CAIRN_EMBEDDING_CACHE_PERSISTENT_MB", "1024")),
+            long_content=os.getenv("CAIRN_EMBEDDING_LONG_CONTENT", "summary").lower().strip(),
         ),
         llm=LLMConfig(
             backend=os.getenv("CAIRN_LLM_BACKEND", "ollama"),
@@ -846,6 +934,21 @@ def load_config() -> Config:
             openai_model=os.getenv("CAIRN_OPENAI_MODEL", "gpt-4o-mini"),
             openai_api_key=os.getenv("CAIRN_OPENAI_API_KEY", ""),
         ),
+        llm_cache=LLMCacheConfig(
+            enabled=os.getenv("CAIRN_LLM_CACHE", "true").lower() in ("true", "1", "yes"),
+            max_mb=int(os.getenv("CAIRN_LLM_CACHE_MB", "32")),
+            persistent=os.getenv("CAIRN_LLM_CACHE_PERSISTENT", "false").lower() in ("true", "1", "yes"),
+            ttl_routing=int(os.getenv("CAIRN_LLM_CACHE_TTL_ROUTING", "86400")),
+            ttl_enrichment=int(os.getenv("CAIRN_LLM_CACHE_TTL_ENRICHMENT", "2592000")),
+            ttl_extraction=int(os.getenv("CAIRN_LLM_CACHE_TTL_EXTRACTION", "2592000")),
+            ttl_clustering=int(os.getenv("CAIRN_LLM_CACHE_TTL_CLUSTERING", "604800")),
+            ttl_consolidation=int(os.getenv("CAIRN_LLM_CACHE_TTL_CONSOLIDATION", "86400")),
+        ),
+        http_client=HTTPClientConfig(
+            pool_size=int(os.getenv("CAIRN_HTTP_POOL_SIZE", "10")),
+            connect_timeout=float(os.getenv("CAIRN_HTTP_CONNECT_TIMEOUT", "10")),
+            http2=os.getenv("CAIRN_HTTP2", "false").lower() in ("true", "1", "yes"),
+        ),
         capabilities=LLMCapabilities(
             relationship_extract=os.getenv("CAIRN_LLM_RELATIONSHIP_EXTRACT", "true").lower() in ("true", "1", "yes"),
             rule_conflict_check=os.getenv("CAIRN_LLM_RULE_CONFLICT_CHECK", "true").lower() in ("true", "1", "yes"),
@@ -969,8 +1072,13 @@ def load_config() -> Config:
             staleness_hours=int(os.getenv("CAIRN_CLUSTER_STALENESS_HOURS", "24")),
             staleness_growth_pct=int(os.getenv("CAIRN_CLUSTER_STALENESS_GROWTH_PCT", "20")),
             tsne_max_samples=int(os.getenv("CAIRN_CLUSTER_TSNE_MAX_SAMPLES", "500")),
+            incremental=os.getenv("CAIRN_CLUSTER_INCREMENTAL", "true").lower() in _BOOL_TRUTHY,
+            assign_max_distance=float(os.getenv("CAIRN_CLUSTER_ASSIGN_MAX_DISTANCE", "0.35")),
+            refit_noise_pct=int(os.getenv("CAIRN_CLUSTER_REFIT_NOISE_PCT", "30")),
+            refit_drift=float(os.getenv("CAIRN_CLUSTER_REFIT_DRIFT", "0.1")),
         ),
         enrichment_enabled=os.getenv("CAIRN_ENRICHMENT_ENABLED", "true").lower() in ("true", "1", "yes"),
+        enrichment_mode=os.getenv("CAIRN_ENRICHMENT_MODE", "inline").lower().strip(),
         extended_tools=os.getenv("CAIRN_EXTENDED_TOOLS", "false").lower() in ("true", "1", "yes"),
         profile=profile_name,
         transport=os.getenv("CAIRN_TRANSPORT", "stdio"),
@@ -984,7 +1092,12 @@ def load_config() -> Config:
         ingest_max_size=int(os.getenv("CAIRN_INGEST_MAX_SIZE", "100000000")),
         ingest_chunk_size=int(os.getenv("CAIRN_INGEST_CHUNK_SIZE", "512")),
         ingest_chunk_overlap=int(os.getenv("CAIRN_INGEST_CHUNK_OVERLAP", "64")),
+        ingest_batch_size=int(os.getenv("CAIRN_INGEST_BATCH_SIZE", "64")),
+        ingest_workers=int(os.getenv("CAIRN_INGEST_WORKERS", "2")),
+        ingest_queue_depth=int(os.getenv("CAIRN_INGEST_QUEUE_DEPTH", "4")),
+        ingest_enrich=os.getenv("CAIRN_INGEST_ENRICH", "false").lower() in ("true", "1", "yes"),
         decay_lambda=float(os.getenv("CAIRN_DECAY_LAMBDA", "0.01")),
+        search_execution=os.getenv("CAIRN_SEARCH_EXECUTION", "sequential").lower().strip(),
         decay=DecayConfig(
             enabled=os.getenv("CAIRN_DECAY_ENABLED", "true").lower() in ("true", "1", "yes"),
             scan_interval_hours=int(os.getenv("CAIRN_DECAY_SCAN_INTERVAL", "24")),
@@ -1001,6 +1114,7 @@ def load_config() -> Config:
             similarity_threshold=float(os.getenv("CAIRN_CONSOLIDATION_SIMILARITY", "0.80")),
             dry_run=os.getenv("CAIRN_CONSOLIDATION_DRY_RUN", "true").lower() in ("true", "1", "yes"),
             max_per_run=int(os.getenv("CAIRN_CONSOLIDATION_MAX_PER_RUN", "10")),
+            max_candidate_pairs=int(os.getenv("CAIRN_CONSOLIDATION_MAX_PAIRS", "0")),
         ),
         audit=AuditConfig(
             enabled=os.getenv("CAIRN_AUDIT_ENABLED", "false").lower() in ("true", "1", "yes"),
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import functools
 import inspect
+import json
 import logging
 import math
 import queue
@@ -13,6 +14,8 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+import psycopg
+
 if TYPE_CHECKING:
     from cairn.config import AnalyticsConfig
     from cairn.storage.database import Database
@@ -29,6 +32,13 @@ def init_analytics_tracker(tracker: UsageTracker | None) -> None:
     _analytics_tracker = tracker
 
 
+def tracker_health() -> dict | None:
+    """Counters from the module-level tracker, or None if analytics is off."""
+    if _analytics_tracker is None:
+        return None
+    return _analytics_tracker.health()
+
+
 # ============================================================
 # Data model
 # ============================================================
@@ -59,29 +69,64 @@ class UsageEvent:
 # UsageTracker — non-blocking async writer
 # ============================================================
 
+_USAGE_COLUMNS = (
+    "timestamp", "operation", "project_id", "session_name",
+    "tokens_in", "tokens_out", "latency_ms", "model",
+    "success", "error_message", "metadata",
+    "trace_id", "span_id", "parent_span_id", "tool_name",
+)
+
+
 class UsageTracker:
     """Thread-safe, non-blocking usage event writer.
 
-    Events are enqueued and flushed to the database in batches
-    by a background thread. If the queue is full, events are
-    silently dropped (acceptable for telemetry).
+    Events are enqueued and flushed to the database in batches by a
+    background thread, one COPY per batch over the tracker's own connection
+    (request handlers never wait on a pooled connection held by telemetry).
+    The batch size adapts: it doubles while flushes come back full, i.e.
+    the queue is backing up, and halves when they run mostly empty. The
+    thread is woken early once a batch's worth is queued. If the queue is
+    full, events are dropped and counted (acceptable for telemetry).
     """
 
     QUEUE_MAX = 10_000
     FLUSH_INTERVAL = 5.0  # seconds
+    MIN_BATCH = 100
+    MAX_BATCH = 5_000
+    DROP_LOG_EVERY = 1_000  # log one warning per this many dropped events
 
     def __init__(self, db: Database):
         self.db = db
         self._queue: queue.Queue[UsageEvent] = queue.Queue(maxsize=self.QUEUE_MAX)
+        self._wake = threading.Event()
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
+        self._conn: psycopg.Connection | None = None
+        self._batch_size = self.MIN_BATCH
+        self._lock = threading.Lock()
+        self._tracked = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_flush_ms = 0.0
+        self._total_flush_ms = 0.0
 
     def track(self, event: UsageEvent) -> None:
-        """Enqueue an event. Non-blocking; drops silently if queue full."""
+        """Enqueue an event. Non-blocking; drops (and counts) if queue full."""
         try:
             self._queue.put_nowait(event)
         except queue.Full:
-            pass  # telemetry loss is acceptable
+            with self._lock:
+                self._dropped += 1
+                dropped = self._dropped
+            if dropped == 1 or dropped % self.DROP_LOG_EVERY == 0:
+                logger.warning("UsageTracker: queue full, %d events dropped so far", dropped)
+            return
+        with self._lock:
+            self._tracked += 1
+        if self._queue.qsize() >= self._batch_size:
+            self._wake.set()
 
     def start(self) -> None:
         """Start the background flush thread."""
@@ -97,6 +142,7 @@ class UsageTracker:
         if self._thread is None:
             return
         self._stop_event.set()
+        self._wake.set()
         self._thread.join(timeout=10)
         if self._thread.is_alive():
             logger.warning("UsageTracker: thread did not stop within timeout")
@@ -104,47 +150,100 @@ class UsageTracker:
             logger.info("UsageTracker: stopped")
         self._thread = None
 
+    def health(self) -> dict:
+        """Return tracker counters for the status endpoint."""
+        with self._lock:
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "queue_depth": self._queue.qsize(),
+                "queue_max": self.QUEUE_MAX,
+                "tracked": self._tracked,
+                "written": self._written,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "batches": self._batches,
+                "batch_size": self._batch_size,
+                "last_flush_ms": round(self._last_flush_ms, 1),
+                "avg_flush_ms": round(self._total_flush_ms / self._batches, 1) if self._batches else 0.0,
+            }
+
     def _flush_loop(self) -> None:
         while not self._stop_event.is_set():
-            self._flush_batch()
-            self._stop_event.wait(timeout=self.FLUSH_INTERVAL)
+            self._wake.wait(timeout=self.FLUSH_INTERVAL)
+            self._wake.clear()
+            self._drain()
         # Final drain on shutdown
-        self._flush_batch()
+        self._drain()
+        self._close()
 
-    def _flush_batch(self) -> None:
+    def _drain(self) -> None:
+        """Flush everything currently queued, adapting the batch size."""
+        while self._flush_batch():
+            pass
+
+    def _flush_batch(self) -> bool:
+        """Write one batch. Returns True if it was full (more may be queued)."""
+        size = self._batch_size
         batch: list[UsageEvent] = []
-        while len(batch) < 500:
+        while len(batch) < size:
             try:
                 batch.append(self._queue.get_nowait())
             except queue.Empty:
                 break
 
         if not batch:
-            return
+            return False
 
+        start = time.monotonic()
         try:
-            for ev in batch:
-                self.db.execute(
-                    """
-                    INSERT INTO usage_events
-                        (timestamp, operation, project_id, session_name,
-                         tokens_in, tokens_out, latency_ms, model,
-                         success, error_message, metadata,
-                         trace_id, span_id, parent_span_id, tool_name)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb,
-                            %s, %s, %s, %s)
-                    """,
-                    (
+            self._write(batch)
+        except Exception:
+            with self._lock:
+                self._failed += len(batch)
+            logger.warning("UsageTracker: flush failed for %d events", len(batch), exc_info=True)
+            self._close()
+            return False
+        elapsed_ms = (time.monotonic() - start) * 1000
+
+        full = len(batch) == size
+        with self._lock:
+            self._written += len(batch)
+            self._batches += 1
+            self._last_flush_ms = elapsed_ms
+            self._total_flush_ms += elapsed_ms
+            if full:
+                self._batch_size = min(size * 2, self.MAX_BATCH)
+            elif len(batch) < size // 4:
+                self._batch_size = max(size // 2, self.MIN_BATCH)
+        return full
+
+    def _write(self, batch: list[UsageEvent]) -> None:
+        conn = self._connection()
+        with conn.cursor() as cur:
+            with cur.copy(f"COPY usage_events ({', '.join(_USAGE_COLUMNS)}) FROM STDIN") as copy:
+                for ev in batch:
+                    copy.write_row((
                         ev.timestamp, ev.operation, ev.project_id, ev.session_name,
                         ev.tokens_in, ev.tokens_out, ev.latency_ms, ev.model,
                         ev.success, ev.error_message,
-                        __import__("json").dumps(ev.metadata) if ev.metadata else "{}",
+                        json.dumps(ev.metadata) if ev.metadata else "{}",
                         ev.trace_id, ev.span_id, ev.parent_span_id, ev.tool_name,
-                    ),
-                )
-            self.db.commit()
-        except Exception:
-            logger.warning("UsageTracker: flush failed for %d events", len(batch), exc_info=True)
+                    ))
+        conn.commit()
+
+    def _connection(self) -> psycopg.Connection:
+        """The tracker's own connection, (re)opened on demand."""
+        if self._conn is None or self._conn.closed:
+            self._conn = psycopg.connect(self.db.config.dsn, autocommit=False)
+        return self._conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
 
 
 # ============================================================
@@ -300,19 +399,102 @@ def track_operation(operation_name: str, tracker: UsageTracker | None | object =
     return decorator
 
 
+# ============================================================
+# LatencySketch — mergeable latency percentiles
+# ============================================================
+
+class LatencySketch:
+    """Log-bucketed latency histogram with bounded relative error (DDSketch).
+
+    A value x lands in bin ceil(log_gamma(x)), gamma = (1 + a) / (1 - a), and
+    reads back as the bin's midpoint, within relative accuracy a of x.
+    Sketches merge by adding bin counts, so a bucket filled by several rollup
+    batches, or a day made of 24 hours, yields the same percentiles as one
+    sketch over all the values.
+
+    Stored in metric_rollups / latency_rollups as JSONB {"<bin>": count};
+    SQL_BIN computes the same bin server-side so rollups and the raw tail agree.
+    """
+
+    RELATIVE_ACCURACY = 0.01
+    MIN_VALUE = 1e-3  # ms; smaller latencies (incl. 0) share the lowest bin
+    GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    LOG_GAMMA = math.log(GAMMA)
+    SQL_BIN = "CEIL(LN(GREATEST({col}::float8, %s)) / %s)::int"
+    SQL_BIN_PARAMS = (MIN_VALUE, LOG_GAMMA)
+
+    def __init__(self, bins: dict[int, int] | None = None):
+        self.bins: dict[int, int] = dict(bins or {})
+
+    @classmethod
+    def bin_of(cls, value: float) -> int:
+        return math.ceil(math.log(max(value, cls.MIN_VALUE)) / cls.LOG_GAMMA)
+
+    @classmethod
+    def from_json(cls, data: dict | None) -> LatencySketch:
+        return cls({int(k): int(v) for k, v in (data or {}).items()})
+
+    def to_json(self) -> dict[str, int]:
+        return {str(k): v for k, v in self.bins.items()}
+
+    @property
+    def count(self) -> int:
+        return sum(self.bins.values())
+
+    def add(self, value: float, count: int = 1) -> None:
+        key = self.bin_of(value)
+        self.bins[key] = self.bins.get(key, 0) + count
+
+    def merge(self, other: LatencySketch) -> None:
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+
+    def quantile(self, q: float) -> float | None:
+        """Value at quantile q (0..1), or None for an empty sketch."""
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+        seen = 0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                break
+        return 2 * self.GAMMA ** key / (self.GAMMA + 1)
+
+
 # ============================================================
 # RollupWorker — background aggregation
 # ============================================================
 
+# ON CONFLICT expression adding EXCLUDED's sketch bins into {table}'s
+_MERGE_SKETCH_SQL = """(
+    SELECT jsonb_object_agg(k, total)
+    FROM (
+        SELECT k, SUM(v::bigint) AS total
+        FROM (
+            SELECT * FROM jsonb_each_text(COALESCE({table}.latency_sketch, '{{}}'))
+            UNION ALL
+            SELECT * FROM jsonb_each_text(EXCLUDED.latency_sketch)
+        ) both_sketches (k, v)
+        GROUP BY k
+    ) merged
+)"""
+
+
 class RollupWorker:
     """Background thread that aggregates raw usage_events into hourly metric_rollups.
 
+    Alongside the per-(operation, project) buckets it keeps one latency
+    sketch per hour across all of them (latency_rollups), so window-wide
+    percentiles merge one row per hour.
+
     Same lifecycle pattern as DigestWorker: daemon thread, stop event,
     exponential backoff on errors.
     """
 
     POLL_INTERVAL = 60.0
-    BATCH_SIZE = 500
+    BATCH_SIZE = 50_000
     MAX_BACKOFF = 300.0
 
     def __init__(self, db: Database, *, retention_days: int = 90):
@@ -362,81 +544,111 @@ class RollupWorker:
             pass
 
     def _process_batch(self) -> bool:
-        """Read raw events above watermark, aggregate, upsert rollups.
+        """Aggregate raw events above the watermark into rollups, in SQL.
+
+        Counts, sums and latency sketches are merged into existing buckets by
+        the upsert itself; percentiles are then recomputed from each touched
+        bucket's merged sketch. The watermark row is locked for the batch, so
+        concurrent workers cannot roll up the same events twice.
 
         Returns True if events were processed.
         """
-        # Get current watermark
-        state = self.db.execute_one("SELECT last_event_id FROM rollup_state WHERE id = 1")
+        try:
+            return self._rollup_next_batch()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def _rollup_next_batch(self) -> bool:
+        state = self.db.execute_one(
+            "SELECT last_event_id FROM rollup_state WHERE id = 1 FOR UPDATE",
+        )
         if not state:
             return False
         watermark = state["last_event_id"]
 
-        # Fetch batch of raw events above watermark
-        rows = self.db.execute(
+        # Upper id of the next batch (index range scan on the primary key)
+        bounds = self.db.execute_one(
             """
-            SELECT id, timestamp, operation, project_id,
-                   tokens_in, tokens_out, latency_ms, success
-            FROM usage_events
-            WHERE id > %s
-            ORDER BY id ASC
-            LIMIT %s
+            SELECT MAX(id) AS max_id, COUNT(*) AS n
+            FROM (SELECT id FROM usage_events WHERE id > %s ORDER BY id LIMIT %s) batch
             """,
             (watermark, self.BATCH_SIZE),
         )
-
-        if not rows:
+        if not bounds or not bounds["n"]:
+            self.db.rollback()
             # Run retention cleanup periodically even when idle
             self._cleanup_old_events()
             return False
+        max_id = bounds["max_id"]
 
-        # Group by (bucket_hour, operation, project_id)
-        buckets: dict[tuple, list[dict]] = {}
-        max_id = watermark
-        for row in rows:
-            ts = row["timestamp"]
-            bucket_hour = ts.replace(minute=0, second=0, microsecond=0)
-            key = (bucket_hour, row["operation"], row["project_id"])
-            buckets.setdefault(key, []).append(row)
-            if row["id"] > max_id:
-                max_id = row["id"]
-
-        # Upsert each bucket
-        for (bucket_hour, operation, project_id), events in buckets.items():
-            op_count = len(events)
-            error_count = sum(1 for e in events if not e["success"])
-            tokens_in_sum = sum(e["tokens_in"] for e in events)
-            tokens_out_sum = sum(e["tokens_out"] for e in events)
-
-            # Calculate latency percentiles
-            latencies = sorted(e["latency_ms"] for e in events)
-            p50 = self._percentile(latencies, 50)
-            p95 = self._percentile(latencies, 95)
-            p99 = self._percentile(latencies, 99)
+        bin_expr = LatencySketch.SQL_BIN.format(col="latency_ms")
+        touched = self.db.execute(
+            f"""
+            INSERT INTO metric_rollups
+                (bucket_hour, operation, project_id,
+                 op_count, error_count, tokens_in_sum, tokens_out_sum,
+                 latency_sum, latency_sketch)
+            SELECT bucket_hour, operation, project_id,
+                   SUM(n), SUM(errors), SUM(tokens_in), SUM(tokens_out),
+                   SUM(latency_sum), jsonb_object_agg(bin::text, n)
+            FROM (
+                SELECT date_trunc('hour', timestamp) AS bucket_hour, operation, project_id,
+                       {bin_expr} AS bin,
+                       COUNT(*) AS n,
+                       COUNT(*) FILTER (WHERE NOT success) AS errors,
+                       SUM(tokens_in) AS tokens_in, SUM(tokens_out) AS tokens_out,
+                       SUM(latency_ms::float8) AS latency_sum
+                FROM usage_events
+                WHERE id > %s AND id <= %s
+                GROUP BY 1, 2, 3, 4
+            ) bins
+            GROUP BY bucket_hour, operation, project_id
+            ON CONFLICT (bucket_hour, operation, COALESCE(project_id, 0))
+            DO UPDATE SET
+                op_count = metric_rollups.op_count + EXCLUDED.op_count,
+                error_count = metric_rollups.error_count + EXCLUDED.error_count,
+                tokens_in_sum = metric_rollups.tokens_in_sum + EXCLUDED.tokens_in_sum,
+                tokens_out_sum = metric_rollups.tokens_out_sum + EXCLUDED.tokens_out_sum,
+                latency_sum = metric_rollups.latency_sum + EXCLUDED.latency_sum,
+                latency_sketch = {_MERGE_SKETCH_SQL.format(table="metric_rollups")}
+            RETURNING id, latency_sketch
+            """,
+            (*LatencySketch.SQL_BIN_PARAMS, watermark, max_id),
+        )
 
+        self.db.execute(
+            f"""
+            INSERT INTO latency_rollups (bucket_hour, op_count, latency_sketch)
+            SELECT bucket_hour, SUM(n), jsonb_object_agg(bin::text, n)
+            FROM (
+                SELECT date_trunc('hour', timestamp) AS bucket_hour, {bin_expr} AS bin, COUNT(*) AS n
+                FROM usage_events
+                WHERE id > %s AND id <= %s
+                GROUP BY 1, 2
+            ) bins
+            GROUP BY bucket_hour
+            ON CONFLICT (bucket_hour) DO UPDATE SET
+                op_count = latency_rollups.op_count + EXCLUDED.op_count,
+                latency_sketch = {_MERGE_SKETCH_SQL.format(table="latency_rollups")}
+            """,
+            (*LatencySketch.SQL_BIN_PARAMS, watermark, max_id),
+        )
 
+        percentiles: list[int | float | None] = []
+        for row in touched:
+            sketch = LatencySketch.from_json(row["latency_sketch"])
+            percentiles.extend((row["id"], sketch.quantile(0.50), sketch.quantile(0.95), sketch.quantile(0.99)))
+        if touched:
+            values = ", ".join(["(%s, %s::real, %s::real, %s::real)"] * len(touched))
             self.db.execute(
-                """
-                INSERT INTO metric_rollups
-                    (bucket_hour, operation, project_id,
-                     op_count, error_count, tokens_in_sum, tokens_out_sum,
-                     latency_p50, latency_p95, latency_p99)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (bucket_hour, operation, COALESCE(project_id, 0))
-                DO UPDATE SET
-                    op_count = metric_rollups.op_count + EXCLUDED.op_count,
-                    error_count = metric_rollups.error_count + EXCLUDED.error_count,
-                    tokens_in_sum = metric_rollups.tokens_in_sum + EXCLUDED.tokens_in_sum,
-                    tokens_out_sum = metric_rollups.tokens_out_sum + EXCLUDED.tokens_out_sum,
-                    latency_p50 = EXCLUDED.latency_p50,
-                    latency_p95 = EXCLUDED.latency_p95,
-                    latency_p99 = EXCLUDED.latency_p99
+                f"""
+                UPDATE metric_rollups r
+                SET latency_p50 = v.p50, latency_p95 = v.p95, latency_p99 = v.p99
+                FROM (VALUES {values}) AS v (id, p50, p95, p99)
+                WHERE r.id = v.id
                 """,
-                (
-                    bucket_hour, operation, project_id,
-                    op_count, error_count, tokens_in_sum, tokens_out_sum,
-                    p50, p95, p99,
-                ),
+                tuple(percentiles),
             )
 
         # Advance watermark
@@ -446,7 +658,7 @@ class RollupWorker:
         )
         self.db.commit()
 
-        logger.info("RollupWorker: processed %d events into %d buckets", len(rows), len(buckets))
+        logger.info("RollupWorker: processed %d events into %d buckets", bounds["n"], len(touched))
         return True
 
     def _cleanup_old_events(self) -> None:
@@ -457,25 +669,28 @@ class RollupWorker:
         )
         self.db.commit()
 
-    @staticmethod
-    def _percentile(sorted_values: list[float], pct: int) -> float | None:
-        if not sorted_values:
-            return None
-        n = len(sorted_values)
-        k = (pct / 100) * (n - 1)
-        f = math.floor(k)
-        c = math.ceil(k)
-        if f == c:
-            return sorted_values[f]
-        return sorted_values[f] * (c - k) + sorted_values[c] * (k - f)
-
 
 # ============================================================
 # AnalyticsQueryEngine — read-only query layer
 # ============================================================
 
+# Raw events not yet rolled up. The literal bound (the watermark read just
+# before) lets the planner range-scan the primary key; the subquery re-reads
+# the watermark in the statement's own snapshot, where it is consistent with
+# the rollups, so an event is never counted both rolled up and raw.
+_TAIL_SQL = "id > %s AND id > COALESCE((SELECT last_event_id FROM rollup_state WHERE id = 1), 0)"
+
+
 class AnalyticsQueryEngine:
-    """Read-only query layer for analytics dashboards."""
+    """Read-only query layer for analytics dashboards.
+
+    Aggregate views (overview, timeseries, projects, heatmap, sparklines)
+    read hourly metric_rollups plus only the raw usage_events the
+    RollupWorker has not reached yet, so their cost follows the number of
+    buckets rather than the number of events. Their windows start on the
+    hour, the rollup granularity. The event log, per-model views and traces
+    still read raw events.
+    """
 
     def __init__(self, db: Database, *, analytics_config: AnalyticsConfig | None = None):
         self.db = db
@@ -485,18 +700,17 @@ class AnalyticsQueryEngine:
         """KPI values + sparkline arrays."""
         cutoff = datetime.now(UTC) - timedelta(days=days)
 
-        # Totals from raw events
+        usage, params = self._usage_source(cutoff)
         totals = self.db.execute_one(
-            """
+            f"""
             SELECT
-                COUNT(*) as total_ops,
-                COALESCE(SUM(tokens_in + tokens_out), 0) as total_tokens,
-                AVG(latency_ms) as avg_latency,
-                COUNT(*) FILTER (WHERE NOT success) as error_count
-            FROM usage_events
-            WHERE timestamp >= %s
+                COALESCE(SUM(u.ops), 0)::bigint as total_ops,
+                COALESCE(SUM(u.tokens_in + u.tokens_out), 0)::bigint as total_tokens,
+                SUM(u.latency_sum) / NULLIF(SUM(u.ops), 0) as avg_latency,
+                COALESCE(SUM(u.errors), 0)::bigint as error_count
+            FROM {usage}
             """,
-            (cutoff,),
+            tuple(params),
         )
 
         total_ops = totals["total_ops"] if totals else 0
@@ -511,6 +725,16 @@ class AnalyticsQueryEngine:
         else:
             sparkline = self._daily_sparkline(cutoff)
 
+        sketch = self._latency_sketch(cutoff)
+        latency = {
+            name: round(value, 1) if value is not None else None
+            for name, value in (
+                ("p50", sketch.quantile(0.50)),
+                ("p95", sketch.quantile(0.95)),
+                ("p99", sketch.quantile(0.99)),
+            )
+        }
+
         return {
             "kpis": {
                 "operations": {"value": total_ops, "label": "Operations"},
@@ -519,6 +743,7 @@ class AnalyticsQueryEngine:
                 "error_rate": {"value": error_rate, "label": "Error Rate (%)"},
             },
             "sparklines": sparkline,
+            "latency": latency,
             "days": days,
         }
 
@@ -534,28 +759,16 @@ class AnalyticsQueryEngine:
         else:
             trunc = "day"
 
-        where = ["timestamp >= %s"]
-        params: list[Any] = [cutoff]
-
-        if project:
-            where.append("project_id = (SELECT id FROM projects WHERE name = %s)")
-            params.append(project)
-        if operation:
-            where.append("operation = %s")
-            params.append(operation)
-
-        where_clause = " AND ".join(where)
-
+        usage, params = self._usage_source(cutoff, project=project, operation=operation)
         rows = self.db.execute(
             f"""
             SELECT
-                date_trunc('{trunc}', timestamp) as bucket,
-                COUNT(*) as operations,
-                COALESCE(SUM(tokens_in), 0) as tokens_in,
-                COALESCE(SUM(tokens_out), 0) as tokens_out,
-                COUNT(*) FILTER (WHERE NOT success) as errors
-            FROM usage_events
-            WHERE {where_clause}
+                date_trunc('{trunc}', u.hour) as bucket,
+                SUM(u.ops)::bigint as operations,
+                SUM(u.tokens_in)::bigint as tokens_in,
+                SUM(u.tokens_out)::bigint as tokens_out,
+                SUM(u.errors)::bigint as errors
+            FROM {usage}
             GROUP BY bucket
             ORDER BY bucket ASC
             """,
@@ -653,32 +866,32 @@ class AnalyticsQueryEngine:
         prev_cutoff = cutoff - timedelta(days=days)
 
         # Current period
+        usage, params = self._usage_source(cutoff)
         current = self.db.execute(
-            """
+            f"""
             SELECT p.name as project,
-                   COUNT(*) as ops,
-                   COALESCE(SUM(ue.tokens_in + ue.tokens_out), 0) as tokens,
-                   AVG(ue.latency_ms) as avg_latency,
-                   COUNT(*) FILTER (WHERE NOT ue.success) as errors
-            FROM usage_events ue
-            LEFT JOIN projects p ON ue.project_id = p.id
-            WHERE ue.timestamp >= %s
+                   SUM(u.ops)::bigint as ops,
+                   SUM(u.tokens_in + u.tokens_out)::bigint as tokens,
+                   SUM(u.latency_sum) / NULLIF(SUM(u.ops), 0) as avg_latency,
+                   SUM(u.errors)::bigint as errors
+            FROM {usage}
+            LEFT JOIN projects p ON u.project_id = p.id
             GROUP BY p.name
             ORDER BY ops DESC
             """,
-            (cutoff,),
+            tuple(params),
         )
 
         # Previous period for trend
+        usage, params = self._usage_source(prev_cutoff, until=cutoff)
         previous = self.db.execute(
-            """
-            SELECT p.name as project, COUNT(*) as ops
-            FROM usage_events ue
-            LEFT JOIN projects p ON ue.project_id = p.id
-            WHERE ue.timestamp >= %s AND ue.timestamp < %s
+            f"""
+            SELECT p.name as project, SUM(u.ops)::bigint as ops
+            FROM {usage}
+            LEFT JOIN projects p ON u.project_id = p.id
             GROUP BY p.name
             """,
-            (prev_cutoff, cutoff),
+            tuple(params),
         )
         prev_map = {r["project"]: r["ops"] for r in previous}
 
@@ -926,17 +1139,17 @@ class AnalyticsQueryEngine:
         }
 
     def activity_heatmap(self, days: int = 365) -> dict:
-        """Daily operation counts from usage_events. Pre-aggregated heatmap data."""
+        """Daily operation counts from the hourly rollups. Heatmap data."""
         cutoff = datetime.now(UTC) - timedelta(days=days)
 
+        usage, params = self._usage_source(cutoff)
         rows = self.db.execute(
-            """
-            SELECT date_trunc('day', timestamp) as bucket, COUNT(*) as cnt
-            FROM usage_events
-            WHERE timestamp >= %s
+            f"""
+            SELECT date_trunc('day', u.hour) as bucket, SUM(u.ops)::bigint as cnt
+            FROM {usage}
             GROUP BY bucket ORDER BY bucket ASC
             """,
-            (cutoff,),
+            tuple(params),
         )
 
         day_list = [
@@ -1021,40 +1234,106 @@ class AnalyticsQueryEngine:
 
     # --- internal helpers ---
 
-    def _hourly_sparkline(self, cutoff: datetime) -> dict:
+    def _usage_source(
+        self, since: datetime, until: datetime | None = None, *,
+        project: str | None = None, operation: str | None = None,
+    ) -> tuple[str, list[Any]]:
+        """FROM item ``u`` of hourly usage: rollups plus the unrolled raw tail.
+
+        Columns: hour, operation, project_id, ops, errors, tokens_in,
+        tokens_out, latency_sum. Raw events above the rollup watermark are
+        bucketed on the fly. Bounds are truncated to the hour.
+        """
+        since = since.replace(minute=0, second=0, microsecond=0)
+        rollup_where = ["bucket_hour >= %s"]
+        raw_where = [_TAIL_SQL, "timestamp >= %s"]
+        rollup_params: list[Any] = [since]
+        raw_params: list[Any] = [self._watermark(), since]
+
+        if until is not None:
+            until = until.replace(minute=0, second=0, microsecond=0)
+            rollup_where.append("bucket_hour < %s")
+            raw_where.append("timestamp < %s")
+            rollup_params.append(until)
+            raw_params.append(until)
+        if project:
+            clause = "project_id = (SELECT id FROM projects WHERE name = %s)"
+            rollup_where.append(clause)
+            raw_where.append(clause)
+            rollup_params.append(project)
+            raw_params.append(project)
+        if operation:
+            rollup_where.append("operation = %s")
+            raw_where.append("operation = %s")
+            rollup_params.append(operation)
+            raw_params.append(operation)
+
+        source = f"""(
+                SELECT bucket_hour AS hour, operation, project_id,
+                       op_count::bigint AS ops, error_count::bigint AS errors,
+                       tokens_in_sum AS tokens_in, tokens_out_sum AS tokens_out,
+                       latency_sum
+                FROM metric_rollups
+                WHERE {" AND ".join(rollup_where)}
+                UNION ALL
+                SELECT date_trunc('hour', timestamp), operation, project_id,
+                       COUNT(*), COUNT(*) FILTER (WHERE NOT success),
+                       SUM(tokens_in), SUM(tokens_out), SUM(latency_ms::float8)
+                FROM usage_events
+                WHERE {" AND ".join(raw_where)}
+                GROUP BY 1, 2, 3
+            ) u"""
+        return source, rollup_params + raw_params
+
+    def _watermark(self) -> int:
+        """Last rolled-up event id, as a plannable lower bound for the raw tail."""
+        row = self.db.execute_one("SELECT last_event_id FROM rollup_state WHERE id = 1")
+        return row["last_event_id"] if row else 0
+
+    def _latency_sketch(self, since: datetime) -> LatencySketch:
+        """Merged latency sketch over hourly rollups and the raw tail since ``since``."""
+        since = since.replace(minute=0, second=0, microsecond=0)
+        bin_expr = LatencySketch.SQL_BIN.format(col="latency_ms")
         rows = self.db.execute(
-            """
-            SELECT date_trunc('hour', timestamp) as bucket,
-                   COUNT(*) as ops,
-                   COALESCE(SUM(tokens_in + tokens_out), 0) as tokens,
-                   COUNT(*) FILTER (WHERE NOT success) as errors
+            f"""
+            SELECT b.key::int AS bin, SUM(b.value::bigint) AS n
+            FROM latency_rollups r, jsonb_each_text(r.latency_sketch) b
+            WHERE r.bucket_hour >= %s
+            GROUP BY 1
+            UNION ALL
+            SELECT {bin_expr}, COUNT(*)
             FROM usage_events
-            WHERE timestamp >= %s
-            GROUP BY bucket ORDER BY bucket ASC
+            WHERE {_TAIL_SQL} AND timestamp >= %s
+            GROUP BY 1
             """,
-            (cutoff,),
+            (since, *LatencySketch.SQL_BIN_PARAMS, self._watermark(), since),
         )
-        return {
-            "operations": [{"t": r["bucket"].isoformat(), "v": r["ops"]} for r in rows],
-            "tokens": [{"t": r["bucket"].isoformat(), "v": r["tokens"]} for r in rows],
-            "errors": [{"t": r["bucket"].isoformat(), "v": r["errors"]} for r in rows],
-        }
+        sketch = LatencySketch()
+        for r in rows:
+            sketch.bins[r["bin"]] = sketch.bins.get(r["bin"], 0) + int(r["n"])
+        return sketch
 
-    def _daily_sparkline(self, cutoff: datetime) -> dict:
+    def _sparkline(self, cutoff: datetime, trunc: str) -> dict:
+        usage, params = self._usage_source(cutoff)
         rows = self.db.execute(
-            """
-            SELECT date_trunc('day', timestamp) as bucket,
-                   COUNT(*) as ops,
-                   COALESCE(SUM(tokens_in + tokens_out), 0) as tokens,
-                   COUNT(*) FILTER (WHERE NOT success) as errors
-            FROM usage_events
-            WHERE timestamp >= %s
+            f"""
+            SELECT date_trunc('{trunc}', u.hour) as bucket,
+                   SUM(u.ops)::bigint as ops,
+                   SUM(u.tokens_in + u.tokens_out)::bigint as tokens,
+                   SUM(u.errors)::bigint as errors
+            FROM {usage}
             GROUP BY bucket ORDER BY bucket ASC
             """,
-            (cutoff,),
+            tuple(params),
         )
         return {
             "operations": [{"t": r["bucket"].isoformat(), "v": r["ops"]} for r in rows],
             "tokens": [{"t": r["bucket"].isoformat(), "v": r["tokens"]} for r in rows],
             "errors": [{"t": r["bucket"].isoformat(), "v": r["errors"]} for r in rows],
         }
+
+    def _hourly_sparkline(self, cutoff: datetime) -> dict:
+        return self._sparkline(cutoff, "hour")
+
+    def _daily_sparkline(self, cutoff: datetime) -> dict:
+        return self._sparkline(cutoff, "day")
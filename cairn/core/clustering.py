@@ -15,10 +15,12 @@ from sklearn.metrics.pairwise import cosine_distances
 
 from cairn.config import ClusteringConfig
 from cairn.core.analytics import track_operation
-from cairn.core.utils import extract_json, parse_vector
+from cairn.core.utils import extract_json
 from cairn.embedding.interface import EmbeddingInterface
+from cairn.llm.cache import generate_checked, parses_as
 from cairn.llm.prompts import build_cluster_summary_messages
 from cairn.storage.database import Database
+from cairn.storage.vector import stack_vectors, to_vector
 
 if TYPE_CHECKING:
     from cairn.llm.interface import LLMInterface
@@ -26,9 +28,63 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _unit_rows(m: np.ndarray) -> np.ndarray:
+    """Row-normalize (zero rows stay zero)."""
+    m = np.asarray(m, dtype=np.float64)
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    return m / np.where(norms == 0, 1.0, norms)
+
+
+def centroid_distances(embeddings: np.ndarray, labels: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Centroids per label and each point's cosine distance to its own centroid.
+
+    Labels are HDBSCAN output (0..k-1, noise = -1). Returns (centroids of
+    shape (k, dim), distances of shape (n,)); noise points get distance 0.
+    All distances come from one normalized row-wise dot product.
+    """
+    labels = np.asarray(labels)
+    vectors = np.asarray(embeddings, dtype=np.float64)
+    k = int(labels.max()) + 1 if labels.size else 0
+    dim = vectors.shape[1] if vectors.ndim == 2 else 0
+    distances = np.zeros(len(labels))
+    if k == 0:
+        return np.zeros((0, dim)), distances
+
+    clustered = labels >= 0
+    counts = np.bincount(labels[clustered], minlength=k).astype(np.float64)
+    sums = np.zeros((k, dim))
+    np.add.at(sums, labels[clustered], vectors[clustered])
+    centroids = sums / np.maximum(counts, 1)[:, None]
+
+    cosine = np.einsum(
+        "ij,ij->i", _unit_rows(vectors[clustered]), _unit_rows(centroids)[labels[clustered]],
+    )
+    distances[clustered] = np.clip(1.0 - cosine, 0.0, 2.0)
+    return centroids, distances
+
+
+def assign_to_centroids(
+    vectors: np.ndarray, centroids: np.ndarray, max_distance: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Nearest-centroid assignment by cosine distance.
+
+    Returns (indices into centroids, distances). Points farther than
+    max_distance from every centroid get index -1 (noise).
+    """
+    if len(vectors) == 0 or len(centroids) == 0:
+        return np.full(len(vectors), -1), np.ones(len(vectors))
+    distances = np.clip(1.0 - _unit_rows(vectors) @ _unit_rows(centroids).T, 0.0, 2.0)
+    nearest = distances.argmin(axis=1)
+    best = distances[np.arange(len(vectors)), nearest]
+    return np.where(best <= max_distance, nearest, -1), best
+
+
 class ClusterEngine:
     """HDBSCAN clustering with LLM-generated summaries and lazy reclustering."""
 
+    # Incremental memories needed before the noise share can trigger a refit
+    REFIT_MIN_SAMPLE = 10
+
     def __init__(
         self,
         db: Database,
@@ -57,16 +113,22 @@ class ClusterEngine:
         """Check if clustering needs to run for a project (or globally)."""
         project_id = self._resolve_project_id(project) if project else None
 
-        # Get last clustering run
+        # Get last clustering run (either mode) and when the last full refit ran
         if project_id:
             run = self.db.execute_one(
-                "SELECT memory_count, created_at FROM clustering_runs "
+                "SELECT memory_count, created_at, "
+                "(SELECT MAX(created_at) FROM clustering_runs "
+                " WHERE project_id = %s AND mode = 'full') AS full_at "
+                "FROM clustering_runs "
                 "WHERE project_id = %s ORDER BY created_at DESC LIMIT 1",
-                (project_id,),
+                (project_id, project_id),
             )
         else:
             run = self.db.execute_one(
-                "SELECT memory_count, created_at FROM clustering_runs "
+                "SELECT memory_count, created_at, "
+                "(SELECT MAX(created_at) FROM clustering_runs "
+                " WHERE project_id IS NULL AND mode = 'full') AS full_at "
+                "FROM clustering_runs "
                 "WHERE project_id IS NULL ORDER BY created_at DESC LIMIT 1",
             )
 
@@ -74,9 +136,10 @@ class ClusterEngine:
         if not run:
             return True
 
-        # Check time staleness
+        # Check time staleness (incremental runs don't reset the refit clock)
         now = datetime.now(UTC)
-        age_hours = (now - run["created_at"]).total_seconds() / 3600
+        refit_at = run.get("full_at") or run["created_at"]
+        age_hours = (now - refit_at).total_seconds() / 3600
         if age_hours > self.config.staleness_hours:
             return True
 
@@ -99,7 +162,7 @@ class ClusterEngine:
 
         def _do_cluster():
             try:
-                self.run_clustering(project)
+                self.refresh(project)
                 # Invalidate viz cache so next request gets fresh data
                 self._viz_cache.pop(project_id, None)
                 self._viz_timestamps.pop(project_id, None)
@@ -135,14 +198,16 @@ class ClusterEngine:
         # Fetch all active memory embeddings
         if project_id:
             rows = self.db.execute(
-                "SELECT id, embedding::text, summary, tags, auto_tags FROM memories "
+                "SELECT id, embedding, summary, tags, auto_tags, updated_at FROM memories "
                 "WHERE project_id = %s AND is_active = true AND embedding IS NOT NULL",
                 (project_id,),
+                binary=True,
             )
         else:
             rows = self.db.execute(
-                "SELECT id, embedding::text, summary, tags, auto_tags FROM memories "
+                "SELECT id, embedding, summary, tags, auto_tags, updated_at FROM memories "
                 "WHERE is_active = true AND embedding IS NOT NULL",
+                binary=True,
             )
 
         memory_count = len(rows)
@@ -154,16 +219,14 @@ class ClusterEngine:
             return {"cluster_count": 0, "noise_count": 0, "memory_count": memory_count,
                     "duration_ms": self._elapsed_ms(start)}
 
-        # Parse embeddings into numpy array (skip memories without embeddings)
-        paired = [(r, parse_vector(r["embedding"])) for r in rows]
-        paired = [(r, v) for r, v in paired if v is not None]
-        if len(paired) < min_size:
+        # Stack embeddings into a float32 matrix (skip memories without embeddings)
+        rows = [r for r in rows if r["embedding"] is not None]
+        if len(rows) < min_size:
             self._record_run(project_id, memory_count, 0, 0, start)
             return {"cluster_count": 0, "noise_count": 0, "memory_count": memory_count,
                     "duration_ms": self._elapsed_ms(start)}
-        rows = [r for r, _ in paired]
         memory_ids = [r["id"] for r in rows]
-        embeddings = np.array([v for _, v in paired])
+        embeddings = stack_vectors([r["embedding"] for r in rows])
 
         # HDBSCAN on cosine metric — no precomputed distance matrix needed
         hdb = HDBSCAN(
@@ -184,17 +247,14 @@ class ClusterEngine:
                 continue
             cluster_groups.setdefault(label, []).append(idx)
 
-        # Compute centroids and confidence for each cluster
+        # Compute centroids and member distances for all clusters at once
+        centroids, point_distances = centroid_distances(embeddings, labels)
+
         cluster_data = []
         for label, member_indices in cluster_groups.items():
-            member_vecs = embeddings[member_indices]
-            centroid = member_vecs.mean(axis=0)
-
+            centroid = centroids[label]
             # Distances from centroid (still useful for DB storage and display)
-            distances = np.array([
-                float(cosine_distances(member_vecs[i:i+1], centroid.reshape(1, -1))[0, 0])
-                for i in range(len(member_indices))
-            ])
+            distances = point_distances[member_indices]
             avg_distance = float(distances.mean())
 
             # Confidence from HDBSCAN membership probabilities (0-1 per point)
@@ -218,9 +278,16 @@ class ClusterEngine:
         else:
             summaries = {}
 
+        # How well did incremental assignments since the last refit hold up?
+        agreement = self._incremental_agreement(project_id, memory_ids, labels)
+
         # Atomic DB write: delete old, insert new
-        self._write_clusters(project_id, cluster_data, summaries)
-        self._record_run(project_id, memory_count, len(cluster_data), noise_count, start)
+        noise = [(r["id"], r["updated_at"]) for r, label in zip(rows, labels, strict=True) if label == -1]
+        self._write_clusters(project_id, cluster_data, summaries, noise)
+        self._record_run(
+            project_id, memory_count, len(cluster_data), noise_count, start,
+            max_memory_id=max(memory_ids), agreement=agreement,
+        )
 
         # Compute and store PageRank (piggybacks on clustering)
         self._update_pagerank(project_id)
@@ -231,7 +298,7 @@ class ClusterEngine:
             len(cluster_data), noise_count, memory_count, duration_ms,
         )
 
-        result: dict[str, int | str] = {
+        result: dict[str, int | float | str] = {
             "cluster_count": len(cluster_data),
             "noise_count": noise_count,
             "memory_count": memory_count,
@@ -239,6 +306,198 @@ class ClusterEngine:
         }
         if labeling_error:
             result["labeling_error"] = labeling_error
+        if agreement is not None:
+            result["incremental_agreement"] = round(agreement, 4)
+        return result
+
+    # ============================================================
+    # Incremental Assignment
+    # ============================================================
+
+    def refresh(self, project: str | None = None) -> dict:
+        """Bring clusters up to date as cheaply as possible.
+
+        Runs a full HDBSCAN refit when incremental mode is off, when no usable
+        full run exists, or when the last full run is older than
+        staleness_hours. Otherwise assigns new memories to existing clusters
+        (which may itself escalate to a full refit).
+        """
+        project_id = self._resolve_project_id(project) if project else None
+        if self.config.incremental:
+            last_full = self._last_run(project_id, mode="full")
+            if last_full is not None and last_full.get("max_memory_id") is not None:
+                age_hours = (datetime.now(UTC) - last_full["created_at"]).total_seconds() / 3600
+                if age_hours <= self.config.staleness_hours:
+                    return self.run_incremental(project)
+        result = self.run_clustering(project)
+        result["mode"] = "full"
+        return result
+
+    @track_operation("insights.assign")
+    def run_incremental(self, project: str | None = None) -> dict:
+        """Assign unclustered memories to the nearest stored centroid.
+
+        Takes active, embedded memories that are in none of the scope's
+        clusters and that no run has judged in their current version (see
+        cluster_placements), so late commits and late embeddings are picked
+        up too. Memories within assign_max_distance (cosine) of a centroid join that
+        cluster; centroids, member counts, and average distances are updated
+        in place. The rest count as noise. A full refit runs instead when the
+        noise share since the last refit exceeds refit_noise_pct or the
+        cumulative centroid shift exceeds refit_drift.
+        """
+        start = time.monotonic()
+        project_id = self._resolve_project_id(project) if project else None
+
+        last_full = self._last_run(project_id, mode="full")
+        latest = self._last_run(project_id)
+        if last_full is None or last_full.get("max_memory_id") is None or latest is None:
+            result = self.run_clustering(project)
+            result["mode"] = "full"
+            return result
+        scope, scope_params = self._scope(project_id)
+        memory_scope, memory_params = ("m.project_id = %s AND ", (project_id,)) if project_id else ("", ())
+
+        new_rows = self.db.execute(
+            f"""
+            SELECT m.id, m.embedding, m.updated_at FROM memories m
+            WHERE {memory_scope}m.is_active = true AND m.embedding IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM cluster_members cm JOIN clusters c ON c.id = cm.cluster_id
+                  WHERE cm.memory_id = m.id AND c.{scope}
+              )
+              AND NOT EXISTS (
+                  SELECT 1 FROM cluster_placements p
+                  WHERE COALESCE(p.project_id, 0) = %s AND p.memory_id = m.id
+                    AND p.memory_updated_at IS NOT DISTINCT FROM m.updated_at
+              )
+            ORDER BY m.id
+            """,
+            (*memory_params, *scope_params, project_id or 0),
+            binary=True,
+        )
+        if not new_rows:
+            return {"mode": "incremental", "assigned_count": 0, "noise_count": 0,
+                    "duration_ms": self._elapsed_ms(start)}
+
+        clusters = self.db.execute(
+            f"SELECT id, centroid, member_count, avg_distance FROM clusters WHERE {scope} "
+            "AND centroid IS NOT NULL ORDER BY id",
+            scope_params,
+            binary=True,
+        )
+        if not clusters:
+            result = self.run_clustering(project)
+            result["mode"] = "full"
+            return result
+
+        vectors = stack_vectors([r["embedding"] for r in new_rows]).astype(np.float64)
+        centroids = stack_vectors([c["centroid"] for c in clusters]).astype(np.float64)
+        assigned, distances = assign_to_centroids(
+            vectors, centroids, self.config.assign_max_distance,
+        )
+
+        # Fold new members into their cluster's running mean
+        updates: list[tuple] = []
+        member_rows: list[tuple[int, int, float]] = []
+        max_shift = 0.0
+        for j in np.unique(assigned[assigned >= 0]):
+            members = assigned == j
+            n_new = int(members.sum())
+            count = clusters[j]["member_count"]
+            old = centroids[j]
+            new = (old * count + vectors[members].sum(axis=0)) / (count + n_new)
+            shift = float(1.0 - _unit_rows(old[None])[0] @ _unit_rows(new[None])[0])
+            max_shift = max(max_shift, shift)
+            avg = ((clusters[j]["avg_distance"] or 0.0) * count
+                   + float(distances[members].sum())) / (count + n_new)
+            updates.append((clusters[j]["id"], to_vector(new), count + n_new, avg))
+            member_rows.extend(
+                (clusters[j]["id"], new_rows[i]["id"], float(distances[i]))
+                for i in np.flatnonzero(members)
+            )
+
+        try:
+            if updates:
+                ids, vecs, counts, avgs = (list(col) for col in zip(*updates, strict=True))
+                self.db.execute(
+                    """
+                    UPDATE clusters c
+                    SET centroid = u.centroid, member_count = u.member_count,
+                        avg_distance = u.avg_distance, updated_at = NOW()
+                    FROM unnest(%s::int[], %s::vector[], %s::int[], %s::float8[])
+                         AS u(id, centroid, member_count, avg_distance)
+                    WHERE c.id = u.id
+                    """,
+                    (ids, vecs, counts, avgs),
+                )
+                self.db.copy_rows(
+                    "cluster_members", ["cluster_id", "memory_id", "distance"], member_rows,
+                )
+            placed_in = [clusters[j]["id"] if j >= 0 else None for j in assigned.tolist()]
+            self.db.execute(
+                """
+                INSERT INTO cluster_placements (project_id, memory_id, cluster_id, mode, memory_updated_at)
+                SELECT %s, p.memory_id, p.cluster_id, 'incremental', p.updated_at
+                FROM unnest(%s::int[], %s::int[], %s::timestamptz[]) AS p(memory_id, cluster_id, updated_at)
+                ON CONFLICT ((COALESCE(project_id, 0)), memory_id) DO UPDATE
+                SET cluster_id = EXCLUDED.cluster_id, mode = EXCLUDED.mode,
+                    memory_updated_at = EXCLUDED.memory_updated_at, placed_at = NOW()
+                """,
+                (project_id, [r["id"] for r in new_rows], placed_in, [r["updated_at"] for r in new_rows]),
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        assigned_count = len(member_rows)
+        noise_count = len(new_rows) - assigned_count
+        prev_drift = (latest.get("drift") or 0.0) if latest.get("mode") == "incremental" else 0.0
+        drift = prev_drift + max_shift
+        self._record_run(
+            project_id, self._count_active_memories(project_id), len(clusters), noise_count, start,
+            mode="incremental", assigned_count=assigned_count,
+            max_memory_id=max(new_rows[-1]["id"], latest.get("max_memory_id") or 0), drift=drift,
+        )
+
+        # Noise share across all incremental runs since the last refit
+        totals = self.db.execute_one(
+            "SELECT COALESCE(SUM(noise_count), 0) AS noise, "
+            "COALESCE(SUM(assigned_count), 0) AS assigned FROM clustering_runs "
+            f"WHERE {scope} AND mode = 'incremental' AND created_at >= %s",
+            (*scope_params, last_full["created_at"]),
+        )
+        total_noise = totals["noise"] if totals else noise_count
+        total_seen = total_noise + (totals["assigned"] if totals else assigned_count)
+        noise_ratio = total_noise / total_seen if total_seen else 0.0
+
+        result = {
+            "mode": "incremental",
+            "assigned_count": assigned_count,
+            "noise_count": noise_count,
+            "cluster_count": len(clusters),
+            "noise_ratio": round(noise_ratio, 4),
+            "drift": round(drift, 4),
+            "duration_ms": self._elapsed_ms(start),
+        }
+        logger.info(
+            "Incremental clustering: %d assigned, %d noise (ratio %.2f), drift %.3f, %dms",
+            assigned_count, noise_count, noise_ratio, drift, result["duration_ms"],
+        )
+
+        refit_reason = None
+        if total_seen >= self.REFIT_MIN_SAMPLE and noise_ratio * 100 > self.config.refit_noise_pct:
+            refit_reason = "noise"
+        elif drift > self.config.refit_drift:
+            refit_reason = "drift"
+        if refit_reason:
+            logger.info("Incremental clustering: %s threshold crossed, running full refit", refit_reason)
+            full = self.run_clustering(project)
+            full["mode"] = "full"
+            full["refit_reason"] = refit_reason
+            full["incremental"] = result
+            return full
         return result
 
     # ============================================================
@@ -259,7 +518,7 @@ class ClusterEngine:
         # Fetch clusters
         if project_id:
             clusters = self.db.execute(
-                "SELECT id, label, summary, centroid::text, member_count, "
+                "SELECT id, label, summary, centroid, member_count, "
                 "avg_distance, confidence, created_at "
                 "FROM clusters WHERE project_id = %s AND confidence >= %s "
                 "ORDER BY member_count DESC",
@@ -267,7 +526,7 @@ class ClusterEngine:
             )
         else:
             clusters = self.db.execute(
-                "SELECT id, label, summary, centroid::text, member_count, "
+                "SELECT id, label, summary, centroid, member_count, "
                 "avg_distance, confidence, created_at "
                 "FROM clusters WHERE confidence >= %s "
                 "ORDER BY member_count DESC",
@@ -282,7 +541,7 @@ class ClusterEngine:
             topic_vec = np.array(self.embedding.embed(topic)).reshape(1, -1)
             scored = []
             for c in clusters:
-                centroid = np.array(parse_vector(c["centroid"])).reshape(1, -1)
+                centroid = stack_vectors([c["centroid"]])
                 similarity = 1.0 - float(cosine_distances(topic_vec, centroid)[0, 0])
                 scored.append((similarity, c))
             scored.sort(key=lambda x: x[0], reverse=True)
@@ -342,16 +601,18 @@ class ClusterEngine:
         # Fetch active memories with embeddings
         if project_id:
             rows = self.db.execute(
-                "SELECT m.id, m.embedding::text, m.summary, m.memory_type "
+                "SELECT m.id, m.embedding, m.summary, m.memory_type "
                 "FROM memories m "
                 "WHERE m.project_id = %s AND m.is_active = true AND m.embedding IS NOT NULL",
                 (project_id,),
+                binary=True,
             )
         else:
             rows = self.db.execute(
-                "SELECT m.id, m.embedding::text, m.summary, m.memory_type "
+                "SELECT m.id, m.embedding, m.summary, m.memory_type "
                 "FROM memories m "
                 "WHERE m.is_active = true AND m.embedding IS NOT NULL",
+                binary=True,
             )
 
         if not rows:
@@ -367,11 +628,11 @@ class ClusterEngine:
             rows = [rows[i] for i in sorted(indices)]
             sampled = True
 
-        paired = [(r, parse_vector(r["embedding"])) for r in rows]
-        paired = [(r, v) for r, v in paired if v is not None]
-        rows = [r for r, _ in paired]
+        rows = [r for r in rows if r["embedding"] is not None]
+        if not rows:
+            return {"points": [], "generated_at": datetime.now(UTC).isoformat()}
         memory_ids = [r["id"] for r in rows]
-        embeddings = np.array([v for _, v in paired])
+        embeddings = stack_vectors([r["embedding"] for r in rows])
 
         # t-SNE needs at least 2 samples; perplexity must be < n_samples
         n = len(embeddings)
@@ -448,37 +709,43 @@ class ClusterEngine:
     def _update_pagerank(self, project_id: int | None) -> None:
         """Compute and store PageRank scores for all memories in the project.
 
-        Called after clustering completes. Gracefully degrades if the
-        pagerank column doesn't exist (migration not applied).
+        Called after clustering completes. Warm-starts from the stored scores
+        so a run after small graph changes converges in a few iterations, and
+        writes back only the scores that changed in one bulk UPDATE.
+        Gracefully degrades if the pagerank column doesn't exist (migration
+        not applied).
         """
         try:
             from cairn.core.activation import ActivationEngine
 
-            # Load graph
+            # Load graph (nodes carry their previous score for warm start).
+            # Edges are restricted to active endpoints with a join rather than
+            # an IN list of every node ID.
+            edge_sql = """
+                SELECT r.source_id, r.target_id, COALESCE(r.edge_weight, 1.0) as weight
+                FROM memory_relations r
+                JOIN memories s ON s.id = r.source_id AND s.is_active = true
+                JOIN memories t ON t.id = r.target_id AND t.is_active = true
+            """
             if project_id is not None:
                 node_rows = self.db.execute(
-                    "SELECT id FROM memories WHERE project_id = %s AND is_active = true",
+                    "SELECT id, pagerank FROM memories WHERE project_id = %s AND is_active = true",
                     (project_id,),
                 )
+                edge_rows = self.db.execute(
+                    edge_sql + "WHERE s.project_id = %s AND t.project_id = %s",
+                    (project_id, project_id),
+                )
             else:
                 node_rows = self.db.execute(
-                    "SELECT id FROM memories WHERE is_active = true",
+                    "SELECT id, pagerank FROM memories WHERE is_active = true",
                 )
+                edge_rows = self.db.execute(edge_sql)
 
             nodes = {r["id"] for r in node_rows}
             if not nodes:
                 return
-
-            # Load edges
-            placeholders = ",".join(["%s"] * len(nodes))
-            edge_rows = self.db.execute(
-                f"""
-                SELECT source_id, target_id, COALESCE(edge_weight, 1.0) as weight
-                FROM memory_relations
-                WHERE source_id IN ({placeholders}) AND target_id IN ({placeholders})
-                """,
-                tuple(nodes) + tuple(nodes),
-            )
+            previous = {r["id"]: r["pagerank"] for r in node_rows}
 
             edges: dict[int, list[tuple[int, float]]] = {}
             for r in edge_rows:
@@ -486,17 +753,25 @@ class ClusterEngine:
                     (r["target_id"], float(r["weight"]))
                 )
 
-            pr = ActivationEngine.compute_pagerank(nodes, edges)
+            pr = ActivationEngine.compute_pagerank(nodes, edges, initial=previous)
 
-            # Batch update pagerank scores
-            for nid, score in pr.items():
+            # Bulk update, skipping scores that didn't change
+            changed = {nid: score for nid, score in pr.items() if previous.get(nid) != score}
+            if changed:
                 self.db.execute(
-                    "UPDATE memories SET pagerank = %s WHERE id = %s",
-                    (score, nid),
+                    """
+                    UPDATE memories m SET pagerank = u.score
+                    FROM unnest(%s::int[], %s::float8[]) AS u(id, score)
+                    WHERE m.id = u.id
+                    """,
+                    (list(changed), list(changed.values())),
                 )
             self.db.commit()
 
-            logger.info("PageRank updated for %d memories (project_id=%s)", len(pr), project_id)
+            logger.info(
+                "PageRank updated for %d memories (%d changed, project_id=%s)",
+                len(pr), len(changed), project_id,
+            )
 
         except Exception:
             logger.debug("PageRank update skipped (column may not exist)", exc_info=True)
@@ -553,7 +828,7 @@ class ClusterEngine:
             messages = build_cluster_summary_messages(prompt_clusters)
             # Scale output budget: ~80 tokens per cluster label+summary
             max_tok = max(1024, len(cluster_data) * 80)
-            raw = self.llm.generate(messages, max_tokens=max_tok)
+            raw = generate_checked(self.llm, messages, max_tok, parses_as("array"))
             return self._parse_summaries(raw, cluster_data), None
         except Exception as exc:
             error_msg = f"Cluster labeling LLM failed: {type(exc).__name__}: {exc}"
@@ -602,57 +877,151 @@ class ClusterEngine:
         }
 
     def _write_clusters(self, project_id: int | None, cluster_data: list[dict],
-                        summaries: dict[int, dict]) -> None:
-        """Atomic write: delete old clusters for project, insert new ones."""
-        # Delete old clusters
-        if project_id:
-            self.db.execute("DELETE FROM clusters WHERE project_id = %s", (project_id,))
-        else:
-            self.db.execute("DELETE FROM clusters WHERE project_id IS NULL")
+                        summaries: dict[int, dict], noise: list[tuple] | None = None) -> None:
+        """Atomic write: delete old clusters for project, COPY new ones in.
+
+        Cluster ids are reserved from the sequence up front so clusters and
+        their members can both be bulk-loaded; everything lands in one
+        transaction, so readers see either the old set or the new one.
+        The scope's placements are replaced by ``noise`` (memory id,
+        updated_at), the memories this refit left unclustered.
+        """
+        try:
+            # Delete old clusters (members cascade)
+            if project_id:
+                self.db.execute("DELETE FROM clusters WHERE project_id = %s", (project_id,))
+            else:
+                self.db.execute("DELETE FROM clusters WHERE project_id IS NULL")
 
-        # Insert new clusters and members
-        for cd in cluster_data:
-            s = summaries.get(cd["label_id"], {"label": "Unlabeled", "summary": ""})
+            if cluster_data:
+                id_rows = self.db.execute(
+                    "SELECT nextval(pg_get_serial_sequence('clusters', 'id')) AS id "
+                    "FROM generate_series(1, %s)",
+                    (len(cluster_data),),
+                )
+                cluster_ids = [r["id"] for r in id_rows]
+
+                cluster_rows: list[tuple] = []
+                member_rows: list[tuple[int, int, float]] = []
+                for cluster_id, cd in zip(cluster_ids, cluster_data, strict=True):
+                    s = summaries.get(cd["label_id"], {"label": "Unlabeled", "summary": ""})
+                    cluster_rows.append((
+                        cluster_id,
+                        project_id,
+                        s["label"],
+                        s["summary"],
+                        to_vector(cd["centroid"]),
+                        len(cd["member_ids"]),
+                        cd["avg_distance"],
+                        cd["confidence"],
+                    ))
+                    member_rows.extend(zip(
+                        [cluster_id] * len(cd["member_ids"]), cd["member_ids"], cd["distances"],
+                        strict=True,
+                    ))
+
+                self.db.copy_rows(
+                    "clusters",
+                    ["id", "project_id", "label", "summary", "centroid", "member_count",
+                     "avg_distance", "confidence"],
+                    cluster_rows,
+                )
+                self.db.copy_rows(
+                    "cluster_members", ["cluster_id", "memory_id", "distance"], member_rows,
+                )
 
-            row = self.db.execute_one(
-                """
-                INSERT INTO clusters (project_id, label, summary, centroid, member_count,
-                                      avg_distance, confidence)
-                VALUES (%s, %s, %s, %s::vector, %s, %s, %s)
-                RETURNING id
-                """,
-                (
-                    project_id,
-                    s["label"],
-                    s["summary"],
-                    str(cd["centroid"]),
-                    len(cd["member_ids"]),
-                    cd["avg_distance"],
-                    cd["confidence"],
-                ),
+            self.db.execute(
+                "DELETE FROM cluster_placements WHERE COALESCE(project_id, 0) = %s", (project_id or 0,),
             )
-            assert row is not None
-            cluster_id = row["id"]
-
-            # Insert members
-            for i, memory_id in enumerate(cd["member_ids"]):
-                self.db.execute(
-                    "INSERT INTO cluster_members (cluster_id, memory_id, distance) "
-                    "VALUES (%s, %s, %s)",
-                    (cluster_id, memory_id, cd["distances"][i]),
+            if noise:
+                self.db.copy_rows(
+                    "cluster_placements", ["project_id", "memory_id", "mode", "memory_updated_at"],
+                    [(project_id, mid, "full", updated_at) for mid, updated_at in noise],
                 )
 
-        self.db.commit()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
 
     def _record_run(self, project_id: int | None, memory_count: int,
-                    cluster_count: int, noise_count: int, start: float) -> None:
+                    cluster_count: int, noise_count: int, start: float, *,
+                    mode: str = "full", assigned_count: int = 0,
+                    max_memory_id: int | None = None, drift: float | None = None,
+                    agreement: float | None = None) -> None:
         """Record a clustering run for staleness tracking."""
         self.db.execute(
             """
             INSERT INTO clustering_runs (project_id, memory_count, cluster_count,
-                                         noise_count, duration_ms)
-            VALUES (%s, %s, %s, %s, %s)
+                                         noise_count, duration_ms, mode, assigned_count,
+                                         max_memory_id, drift, agreement)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """,
-            (project_id, memory_count, cluster_count, noise_count, self._elapsed_ms(start)),
+            (project_id, memory_count, cluster_count, noise_count, self._elapsed_ms(start),
+             mode, assigned_count, max_memory_id, drift, agreement),
         )
         self.db.commit()
+
+    @staticmethod
+    def _scope(project_id: int | None) -> tuple[str, tuple]:
+        """WHERE fragment selecting a project (or the global scope)."""
+        if project_id:
+            return "project_id = %s", (project_id,)
+        return "project_id IS NULL", ()
+
+    def _last_run(self, project_id: int | None, mode: str | None = None) -> dict | None:
+        """Most recent clustering run, optionally of one mode."""
+        scope, params = self._scope(project_id)
+        if mode:
+            scope += " AND mode = %s"
+            params = (*params, mode)
+        return self.db.execute_one(
+            "SELECT mode, memory_count, max_memory_id, drift, created_at "
+            f"FROM clustering_runs WHERE {scope} ORDER BY created_at DESC, id DESC LIMIT 1",
+            params,
+        )
+
+    def _incremental_agreement(self, project_id: int | None, memory_ids: list[int],
+                               labels: np.ndarray) -> float | None:
+        """Share of incrementally placed memories a full refit agrees with.
+
+        A memory incrementally assigned to cluster C agrees when the refit puts
+        it with the majority of C's refit-time members; an incremental noise
+        memory agrees when the refit also calls it noise. None when nothing
+        was placed incrementally since the previous refit.
+        """
+        new_label = {mid: int(label) for mid, label in zip(memory_ids, labels.tolist(), strict=True)}
+        placed = {
+            p["memory_id"]: p["cluster_id"]
+            for p in self.db.execute(
+                "SELECT memory_id, cluster_id FROM cluster_placements "
+                "WHERE COALESCE(project_id, 0) = %s AND mode = 'incremental'",
+                (project_id or 0,),
+            )
+            if p["memory_id"] in new_label
+        }
+        if not placed:
+            return None
+
+        scope, params = self._scope(project_id)
+        members = self.db.execute(
+            "SELECT cm.cluster_id, cm.memory_id FROM cluster_members cm "
+            f"JOIN clusters c ON c.id = cm.cluster_id WHERE c.{scope}",
+            params,
+        )
+        votes: dict[int, dict[int, int]] = {}
+        for m in members:
+            if m["memory_id"] not in placed and m["memory_id"] in new_label:
+                tally = votes.setdefault(m["cluster_id"], {})
+                label = new_label[m["memory_id"]]
+                tally[label] = tally.get(label, 0) + 1
+        majority = {cid: max(tally, key=lambda lbl: tally[lbl]) for cid, tally in votes.items()}
+
+        agree = 0
+        for mid, cluster_id in placed.items():
+            if cluster_id is not None:
+                target = majority.get(cluster_id)
+                agree += int(target is not None and target != -1 and new_label[mid] == target)
+            else:
+                agree += int(new_label[mid] == -1)
+        return agree / len(placed)
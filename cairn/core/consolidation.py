@@ -11,15 +11,17 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
 from cairn.core.analytics import track_operation
-from cairn.core.utils import extract_json, parse_vector
+from cairn.core.utils import extract_json
 from cairn.embedding.interface import EmbeddingInterface
+from cairn.llm.cache import generate_checked, parses_as
 from cairn.storage.database import Database
+from cairn.storage.vector import stack_vectors
 
 if TYPE_CHECKING:
     from cairn.config import ConsolidationConfig, LLMCapabilities
@@ -33,6 +35,57 @@ logger = logging.getLogger(__name__)
 # Similarity threshold for candidate pairs
 SIMILARITY_THRESHOLD = 0.85
 
+# Rows per side of a similarity tile: one float32 tile is
+# SIMILARITY_BLOCK_SIZE**2 * 4 bytes (4 MB), whatever the project size
+SIMILARITY_BLOCK_SIZE = 1024
+
+
+def _unit_rows(m: np.ndarray) -> np.ndarray:
+    """Row-normalize to float32 (zero rows stay zero)."""
+    m = np.asarray(m, dtype=np.float32)
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    return m / np.where(norms == 0, 1.0, norms)
+
+
+def similar_pairs(
+    embeddings: np.ndarray, threshold: float = SIMILARITY_THRESHOLD,
+    block_size: int = SIMILARITY_BLOCK_SIZE,
+) -> Iterator[tuple[int, int, float]]:
+    """Yield (i, j, cosine) for every row pair i < j at or above threshold.
+
+    Cosine similarities are computed tile by tile over the upper triangle
+    (block_size x block_size float32 matmuls), so peak memory is one tile
+    rather than the full n x n matrix, and thresholding is vectorized per
+    tile. Pairs are yielded as each tile is scanned.
+    """
+    unit = _unit_rows(embeddings)
+    n = len(unit)
+    for i0 in range(0, n, block_size):
+        rows = unit[i0:i0 + block_size]
+        for j0 in range(i0, n, block_size):
+            tile = rows @ unit[j0:j0 + block_size].T
+            if j0 == i0:
+                # Diagonal tile: keep the strict upper triangle only
+                tile = np.triu(tile, k=1)
+            ii, jj = np.nonzero(tile >= threshold)
+            for i, j in zip(ii.tolist(), jj.tolist(), strict=True):
+                yield i0 + i, j0 + j, float(tile[i, j])
+
+
+def mean_pairwise_similarity(embeddings: np.ndarray) -> float:
+    """Mean cosine similarity over all pairs i < j, in O(n * dim).
+
+    For unit rows the sum of every entry of U @ U.T is |sum(U)|^2, so the
+    off-diagonal mean follows without building the matrix.
+    """
+    unit = _unit_rows(embeddings).astype(np.float64)
+    n = len(unit)
+    if n < 2:
+        return 0.0
+    total = float(np.square(unit.sum(axis=0)).sum())
+    diagonal = float(np.square(unit).sum())
+    return (total - diagonal) / (n * (n - 1))
+
 
 class ConsolidationEngine:
     """Review project memories for duplicates and recommend merges/promotions/inactivations."""
@@ -41,11 +94,14 @@ class ConsolidationEngine:
         self, db: Database, embedding: EmbeddingInterface, *,
         llm: LLMInterface | None = None,
         capabilities: LLMCapabilities | None = None,
+        max_candidate_pairs: int = 0,
     ):
         self.db = db
         self.embedding = embedding
         self.llm = llm
         self.capabilities = capabilities
+        # Pairs sent to the LLM per consolidate() call; 0 reviews every pair
+        self.max_candidate_pairs = max_candidate_pairs
 
     @track_operation("consolidate")
     def consolidate(self, project: str, dry_run: bool = True) -> dict:
@@ -69,17 +125,17 @@ class ConsolidationEngine:
         if not can_consolidate:
             return {"error": "Consolidation requires LLM"}
 
-        # Fetch all active memories for the project
+        # Fetch embeddings only; text is loaded for candidate pairs below
         rows = self.db.execute(
             """
-            SELECT m.id, m.content, m.summary, m.memory_type, m.importance,
-                   m.tags, m.auto_tags, m.embedding, m.created_at
+            SELECT m.id, m.embedding
             FROM memories m
             LEFT JOIN projects p ON m.project_id = p.id
             WHERE p.name = %s AND m.is_active = true
             ORDER BY m.created_at ASC
             """,
             (project,),
+            binary=True,
         )
 
         if len(rows) < 2:
@@ -91,9 +147,8 @@ class ConsolidationEngine:
                 "applied": False,
             }
 
-        # Parse embeddings and compute pairwise similarity (skip memories without embeddings)
-        filtered = [(r, parse_vector(r["embedding"])) for r in rows]
-        filtered = [(r, v) for r, v in filtered if v is not None]
+        # Skip memories without embeddings
+        filtered = [r for r in rows if r["embedding"] is not None]
         if len(filtered) < 2:
             return {
                 "project": project,
@@ -102,29 +157,38 @@ class ConsolidationEngine:
                 "recommendations": [],
                 "applied": False,
             }
-        rows = [r for r, _ in filtered]
+        rows = filtered
         ids = [r["id"] for r in rows]
-        embeddings = [v for _, v in filtered]
-
-        embeddings_matrix = np.array(embeddings)
-        sim_matrix = cosine_similarity(embeddings_matrix)
+        embeddings_matrix = stack_vectors([r["embedding"] for r in rows])
+
+        # Pairs are consumed as the tiles stream past, in scan order; with a
+        # cap set, pairs beyond it are counted but not kept
+        pairs: list[tuple[int, int, float]] = []
+        found = 0
+        cap = self.max_candidate_pairs
+        for i, j, sim in similar_pairs(embeddings_matrix, SIMILARITY_THRESHOLD):
+            found += 1
+            if not cap or len(pairs) < cap:
+                pairs.append((ids[i], ids[j], sim))
+        del embeddings_matrix
+        if found > len(pairs):
+            logger.warning(
+                "Consolidation: %d similar pairs in %s, reviewing the first %d "
+                "(max_candidate_pairs=%d); %d dropped",
+                found, project, len(pairs), cap, found - len(pairs),
+            )
 
-        # Find pairs above threshold
         candidates = []
-        seen = set()
-        for i in range(len(ids)):
-            for j in range(i + 1, len(ids)):
-                if sim_matrix[i][j] >= SIMILARITY_THRESHOLD:
-                    pair_key = (min(ids[i], ids[j]), max(ids[i], ids[j]))
-                    if pair_key not in seen:
-                        seen.add(pair_key)
-                        candidates.append({
-                            "id_a": ids[i],
-                            "id_b": ids[j],
-                            "similarity": round(float(sim_matrix[i][j]), 4),
-                            "summary_a": rows[i].get("summary") or rows[i]["content"][:200],
-                            "summary_b": rows[j].get("summary") or rows[j]["content"][:200],
-                        })
+        if pairs:
+            texts = self._pair_texts({mid for a, b, _ in pairs for mid in (a, b)})
+            for id_a, id_b, sim in pairs:
+                candidates.append({
+                    "id_a": id_a,
+                    "id_b": id_b,
+                    "similarity": round(sim, 4),
+                    "summary_a": texts.get(id_a, ""),
+                    "summary_b": texts.get(id_b, ""),
+                })
 
         if not candidates:
             return {
@@ -139,7 +203,7 @@ class ConsolidationEngine:
         try:
             assert self.llm is not None
             messages = build_consolidation_messages(candidates, project)
-            raw = self.llm.generate(messages, max_tokens=1024)
+            raw = generate_checked(self.llm, messages, 1024, parses_as("array"))
             recommendations = extract_json(raw, json_type="array") or []
         except Exception:
             logger.warning("Consolidation LLM call failed", exc_info=True)
@@ -168,6 +232,14 @@ class ConsolidationEngine:
 
         return result
 
+    def _pair_texts(self, memory_ids: set[int]) -> dict[int, str]:
+        """Summary (or leading content) for each candidate memory."""
+        rows = self.db.execute(
+            "SELECT id, content, summary FROM memories WHERE id = ANY(%s)",
+            (sorted(memory_ids),),
+        )
+        return {r["id"]: r.get("summary") or r["content"][:200] for r in rows}
+
     def _apply_recommendations(self, recommendations: list[dict]) -> int:
         """Apply consolidation recommendations. Returns count of applied actions."""
         applied = 0
@@ -273,23 +345,14 @@ class ConsolidationEngine:
                   AND consolidated_into IS NULL
                 """,
                 tuple(member_ids),
+                binary=True,
             )
-            if len(rows) < min_size:
+            if len(rows) < max(min_size, 2):
                 continue
 
-            vecs = [parse_vector(r["embedding"]) for r in rows]
-            vecs = [v for v in vecs if v is not None]
-            if len(vecs) < min_size:
-                continue
-
-            mat = np.array(vecs)
-            sim_mat = cosine_similarity(mat)
-            # Mean of upper triangle (excluding diagonal)
-            n = len(vecs)
-            if n < 2:
-                continue
-            upper = sim_mat[np.triu_indices(n, k=1)]
-            mean_sim = float(np.mean(upper))
+            mean_sim = mean_pairwise_similarity(
+                stack_vectors([r["embedding"] for r in rows]),
+            )
 
             if mean_sim >= sim_threshold:
                 eligible.append({
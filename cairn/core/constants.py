@@ -57,6 +57,18 @@ WM_SALIENCE_ARCHIVE_THRESHOLD = 0.1
 
 # Content size management
 AUTO_SUMMARIZE_EMBED_THRESHOLD = 8000  # chars — use summary for embedding above this
+LONG_CONTENT_HEAD_CHARS = 2000  # embedding target above the threshold when there is no summary
+
+# Long-content representation (embedding.long_content), chosen before any
+# model call so large content is embedded once:
+#   "summary" = one vector on the summary, or the head when there is none
+#   "mean"    = one vector: the normalized mean of the chunk vectors
+#   "multi"   = the "summary" vector plus one vector per chunk in
+#               memory_chunks, matched by the vector search signal
+LONG_CONTENT_MODES = ("summary", "mean", "multi")
+LONG_CONTENT_CHUNK_CHARS = 2000
+LONG_CONTENT_CHUNK_OVERLAP = 200
+LONG_CONTENT_MAX_CHUNKS = 64  # longer content is covered by its first 64 chunks
 
 # Input limits
 MAX_CONTENT_SIZE = 500_000      # ~500KB — single memory ceiling (embedding quality
@@ -64,6 +76,8 @@ MAX_CONTENT_SIZE = 500_000      # ~500KB — single memory ceiling (embedding qu
 MAX_INGEST_SIZE = 100_000_000   # ~100MB — ingest pipeline chunks automatically via
                                 # Chonkie; cost is proportional to chunk count, not size
 MAX_NAME_LENGTH = 255  # project, session, branch names
+MAX_STORE_MANY = 1000  # memories per store_many call (MCP / REST)
+STORE_MANY_BATCH_SIZE = 256  # memories per embed_batch + INSERT + commit in store_many
 
 # Document attachments
 ALLOWED_ATTACHMENT_TYPES = {
@@ -77,6 +91,23 @@ MAX_RECALL_IDS = 10
 MAX_LIMIT = 100
 VALID_SEARCH_MODES = ["semantic", "keyword", "vector"]
 
+# Hybrid search execution: how the RRF rank signals are fetched from Postgres.
+#   "sequential" = one query per signal (reference implementation)
+#   "fused"      = all SQL signals ranked + fused in a single CTE statement
+#   "compare"    = run both, log any divergence, return the sequential result
+SEARCH_EXECUTION_MODES = ("sequential", "fused", "compare")
+
+# Store-time LLM enrichment: when extraction/enrichment runs for store().
+#   "inline"   = before the INSERT; store() returns the enriched memory
+#   "deferred" = after the commit, in MemoryEnrichmentListener; store()
+#                returns as soon as content + embedding are persisted
+# Set globally (enrichment_mode) or per project (projects.enrichment_mode).
+ENRICHMENT_MODES = ("inline", "deferred")
+
+# A deferred enrichment's 'enriching' claim can be taken over once it is this
+# old (seconds). Must exceed MemoryEnrichmentListener.HANDLER_TIMEOUT.
+ENRICHMENT_CLAIM_LEASE_SECONDS = 330
+
 # Contradiction handling
 CONTRADICTION_PENALTY = 0.5          # score multiplier for contradicted memories in search
 CONTRADICTION_ESCALATION_THRESHOLD = 0.7  # min importance to trigger conflict escalation on store
@@ -4,6 +4,7 @@ import logging
 
 from cairn.core.constants import VALID_MEMORY_TYPES
 from cairn.core.utils import extract_json
+from cairn.llm.cache import generate_checked
 from cairn.llm.interface import LLMInterface
 from cairn.llm.prompts import build_enrichment_messages
 
@@ -16,15 +17,17 @@ class Enricher:
     def __init__(self, llm: LLMInterface):
         self.llm = llm
 
-    def enrich(self, content: str) -> dict:
+    def enrich(self, content: str, fresh: bool = False) -> dict:
         """Single LLM call -> parsed enrichment dict.
 
+        ``fresh`` bypasses the response cache (explicit re-enrichment).
+
         Returns dict with keys: tags, importance, memory_type, summary, entities,
         plus _status: "complete" | "partial" | "failed".
         """
         try:
             messages = build_enrichment_messages(content)
-            raw = self.llm.generate(messages, max_tokens=512)
+            raw = generate_checked(self.llm, messages, 512, self._parse_response, fresh=fresh)
             result = self._parse_response(raw)
             entities = result.get("entities", [])
             if entities:
@@ -22,6 +22,7 @@ from cairn.core.event_schema import CairnEvent
 from cairn.core.utils import get_or_create_project
 
 if TYPE_CHECKING:
+    from cairn.core.event_writer import EventWriter
     from cairn.core.projects import ProjectManager
     from cairn.storage.database import Database
 
@@ -33,8 +34,8 @@ class EventBus:
 
     Subscribers register named handlers for event types (including wildcards
     like ``work_item.*``). On publish, dispatch records are created for each
-    matching handler. The EventDispatcher background thread polls those
-    records and executes handlers with retry.
+    matching handler. The EventDispatcher background thread claims those
+    records (woken by NOTIFY) and executes handlers with retry.
     """
 
     def __init__(self, db: Database, project_manager: ProjectManager):
@@ -44,18 +45,28 @@ class EventBus:
         self._handlers: dict[str, list[tuple[str, Callable]]] = defaultdict(list)
         # handler_name -> fn (flat lookup for dispatcher)
         self._handler_lookup: dict[str, Callable] = {}
+        # handler_name -> timeout override (seconds) for slow handlers
+        self._handler_timeouts: dict[str, float] = {}
+        # Background batch writer for emit_buffered() — set by services.py
+        self.writer: EventWriter | None = None
 
     # ------------------------------------------------------------------
     # Subscriber registration
     # ------------------------------------------------------------------
 
-    def subscribe(self, event_type: str, handler_name: str, fn: Callable) -> None:
+    def subscribe(
+        self, event_type: str, handler_name: str, fn: Callable, timeout: float | None = None,
+    ) -> None:
         """Register a named handler for an event type.
 
         Supports exact types (``work_item.completed``) and domain wildcards
         (``work_item.*``).  Handler names must be unique across all
         subscriptions.  Duplicate (event_type, handler_name) pairs are ignored
         to handle double-init from uvicorn lifespan.
+
+        ``timeout`` overrides EventDispatcher.HANDLER_TIMEOUT for handlers
+        that make slow calls (LLM extraction); it must stay under the
+        dispatcher's LEASE_SECONDS.
         """
         # Guard against double-registration (uvicorn lifespan runs twice)
         existing = self._handlers[event_type]
@@ -64,12 +75,18 @@ class EventBus:
             return
         existing.append((handler_name, fn))
         self._handler_lookup[handler_name] = fn
+        if timeout is not None:
+            self._handler_timeouts[handler_name] = timeout
         logger.info("EventBus: subscribed handler '%s' to '%s'", handler_name, event_type)
 
     def get_handler(self, handler_name: str) -> Callable | None:
         """Look up a handler function by name (used by EventDispatcher)."""
         return self._handler_lookup.get(handler_name)
 
+    def get_timeout(self, handler_name: str) -> float | None:
+        """Timeout override registered for a handler, if any."""
+        return self._handler_timeouts.get(handler_name)
+
     def _matching_handlers(self, event_type: str) -> list[tuple[str, Callable]]:
         """Return all handlers matching an event type (exact + wildcard)."""
         handlers = list(self._handlers.get(event_type, []))
@@ -104,11 +121,65 @@ class EventBus:
 
         All fields fall back to the current trace context when not provided.
         """
+        event = self._build_event(
+            event_type, session_name=session_name, actor=actor, project=project,
+            agent_id=agent_id, work_item_id=work_item_id, tool_name=tool_name,
+            payload=payload,
+        )
+        return self._persist_and_dispatch(event)
+
+    def emit_buffered(
+        self,
+        event_type: str,
+        *,
+        session_name: str | None = None,
+        actor: str | None = None,
+        project: str | None = None,
+        tool_name: str | None = None,
+        payload: dict | None = None,
+    ) -> None:
+        """Fire-and-forget emit for high-volume telemetry (LLM/embedding usage).
+
+        The event is built on the caller's thread (so it captures the current
+        trace context) and handed to the background EventWriter, which
+        persists it in a multi-row batch. Falls back to a synchronous emit
+        when no writer is running (CLI scripts, tests).
+        """
+        event = self._build_event(
+            event_type, session_name=session_name, actor=actor, project=project,
+            tool_name=tool_name, payload=payload,
+        )
+        if self.writer is not None and self.writer.submit(event):
+            return
+        self._persist_and_dispatch(event)
+
+    def emit_many(self, event_type: str, events: list[dict]) -> list[int]:
+        """Emit many events of one type in a single multi-row INSERT.
+
+        Each item holds emit()'s keyword arguments (session_name, project,
+        payload, ...). Dispatch records and NOTIFYs are created as for emit(),
+        via persist_batch. Returns event ids in input order.
+        """
+        return self.persist_batch([self._build_event(event_type, **fields) for fields in events])
+
+    def _build_event(
+        self,
+        event_type: str,
+        *,
+        session_name: str | None = None,
+        actor: str | None = None,
+        project: str | None = None,
+        agent_id: str | None = None,
+        work_item_id: int | None = None,
+        tool_name: str | None = None,
+        payload: dict | None = None,
+    ) -> CairnEvent:
+        """Build a CairnEvent, filling unset fields from the current trace."""
         from cairn.core.trace import current_trace
 
         trace = current_trace()
 
-        event = CairnEvent(
+        return CairnEvent(
             event_type=event_type,
             session_name=session_name or (getattr(trace, "entry_point", None) if trace else None) or "__system__",
             actor=actor or (trace.actor if trace else "system"),
@@ -121,8 +192,6 @@ class EventBus:
             payload=payload or {},
         )
 
-        return self._persist_and_dispatch(event)
-
     # ------------------------------------------------------------------
     # Legacy publish — delegates to emit()
     # ------------------------------------------------------------------
@@ -239,6 +308,77 @@ class EventBus:
 
         return event_id
 
+    def persist_batch(self, events: list[CairnEvent]) -> list[int]:
+        """Persist many events in one multi-row INSERT. Returns event ids.
+
+        Used by EventWriter for buffered telemetry. The events_notify trigger
+        is FOR EACH ROW, so every event still produces its own NOTIFY. Dispatch
+        records for matching handlers are created in one more statement.
+        Session lifecycle side effects are not applied here — buffered events
+        are telemetry only.
+        """
+        import json
+
+        if not events:
+            return []
+
+        project_ids: dict[str, int] = {}
+        for event in events:
+            if event.project and event.project not in project_ids:
+                project_ids[event.project] = get_or_create_project(self.db, event.project)
+
+        values = ", ".join(["(%s, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, %s, %s)"] * len(events))
+        params: list = []
+        for event in events:
+            params += [
+                event.session_name,
+                event.agent_id,
+                event.work_item_id,
+                project_ids.get(event.project) if event.project else None,
+                event.event_type,
+                event.tool_name,
+                json.dumps(event.payload),
+                event.trace_id,
+                event.actor,
+                event.span_id,
+                event.created_at,
+            ]
+        rows = self.db.execute(
+            f"""
+            INSERT INTO events
+                (session_name, agent_id, work_item_id, project_id,
+                 event_type, tool_name, payload, trace_id, actor, span_id,
+                 created_at)
+            VALUES {values}
+            RETURNING id, event_type
+            """,
+            params,
+        )
+        event_ids = [r["id"] for r in rows]
+
+        dispatch_ids: list[int] = []
+        dispatch_handlers: list[str] = []
+        for r in rows:
+            for handler_name, _ in self._matching_handlers(r["event_type"]):
+                dispatch_ids.append(r["id"])
+                dispatch_handlers.append(handler_name)
+        if dispatch_ids:
+            self.db.execute(
+                """
+                INSERT INTO event_dispatches (event_id, handler)
+                SELECT * FROM unnest(%s::bigint[], %s::text[])
+                ON CONFLICT (event_id, handler) DO NOTHING
+                """,
+                (dispatch_ids, dispatch_handlers),
+            )
+        self.db.commit()
+
+        if stats.event_bus_stats:
+            for event in events:
+                stats.event_bus_stats.record_publish(event.event_type)
+        logger.debug("Event batch published: %d events, %d dispatches", len(events), len(dispatch_ids))
+        return event_ids
+
     def query(
         self,
         *,
@@ -1,12 +1,23 @@
 """EventDispatcher — background worker that processes event dispatch records.
 
-Polls the event_dispatches table for pending/failed records, resolves the
-handler by name via EventBus, executes it, and tracks success/failure with
-exponential backoff retry.
+Claims ready records from the event_dispatches table, resolves the handler by
+name via EventBus, executes it, and tracks success/failure with exponential
+backoff retry.
+
+Wakeup + claiming (multi-node safe):
+- Inserting dispatch records fires NOTIFY cairn_dispatch (migration 056); a
+  listener thread on a dedicated autocommit connection wakes the loop, with a
+  slow poll as safety net for retries, expired leases, and lost connections
+- Rows are claimed with FOR UPDATE SKIP LOCKED under a lease (status
+  'running', next_retry = lease deadline), so any number of dispatchers can
+  drain the table in parallel without double-running a handler
+- A worker that dies mid-handler loses its lease; the row is reclaimed after
+  expiry and the lost run counts as an attempt. If that was the last
+  attempt, the next claim marks the row 'exhausted' instead
 
 Hardened features (ca-108):
 - Concurrent handler execution via ThreadPoolExecutor
-- Per-handler timeout (configurable, default 30s)
+- Per-handler timeout (default 30s, overridable at subscribe time)
 - Circuit breaker — skip handlers failing repeatedly
 - Per-handler metrics (execution time, success/failure counts)
 """
@@ -14,15 +25,20 @@ Hardened features (ca-108):
 from __future__ import annotations
 
 import logging
+import os
+import socket
 import threading
 import time
 import traceback
+import uuid
 from collections import defaultdict, deque
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FutureTimeout
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+import psycopg
+
 if TYPE_CHECKING:
     from cairn.core.event_bus import EventBus
     from cairn.storage.database import Database
@@ -62,6 +78,15 @@ class CircuitBreaker:
                 return False
             return True
 
+    def open_handlers(self) -> list[str]:
+        """Handlers whose circuit is currently open (no half-open transition)."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                name for name, opened_at in self._open_since.items()
+                if now - opened_at < self.cooldown
+            ]
+
     def record_success(self, handler_name: str) -> None:
         with self._lock:
             self._results[handler_name].append(True)
@@ -152,49 +177,73 @@ class EventDispatcher:
     """Background thread that reliably delivers events to registered handlers.
 
     Uses ThreadPoolExecutor for concurrent handler execution with per-handler
-    timeouts and circuit breaker protection.
+    timeouts and circuit breaker protection. Wakes on NOTIFY and claims work
+    with SKIP LOCKED, so several dispatchers (threads, processes, or nodes)
+    can share one event_dispatches table.
     """
 
-    POLL_INTERVAL = 2.0     # seconds between polls
-    BATCH_SIZE = 50         # max dispatches per poll cycle
-    MAX_ATTEMPTS = 5        # give up after this many tries
-    BACKOFF_BASE = 10       # seconds; actual = base * 2^attempts
-    HANDLER_TIMEOUT = 30.0  # seconds; max time a single handler can run
-    MAX_WORKERS = 4         # concurrent handler threads
+    CHANNEL = "cairn_dispatch"   # NOTIFY channel fed by the event_dispatches trigger
+    POLL_INTERVAL = 2.0          # seconds between polls when not listening
+    LISTEN_POLL_INTERVAL = 10.0  # safety-net poll while NOTIFY wakeups work
+    RECONNECT_DELAY = 5.0        # seconds before re-opening a lost LISTEN connection
+    BATCH_SIZE = 50              # max dispatches per poll cycle
+    MAX_ATTEMPTS = 5             # give up after this many tries
+    BACKOFF_BASE = 10            # seconds; actual = base * 2^attempts
+    HANDLER_TIMEOUT = 30.0       # seconds; default max time a single handler can run
+    LEASE_SECONDS = 360.0        # claim lease; must exceed every handler's timeout
+    MAX_WORKERS = 4              # concurrent handler threads (and claim size)
 
     def __init__(self, db: Database, event_bus: EventBus):
         self.db = db
         self.event_bus = event_bus
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"[-100:]
         self._stop_event = threading.Event()
+        self._wake = threading.Event()
         self._thread: threading.Thread | None = None
+        self._listener: threading.Thread | None = None
+        self._listening = False
+        self._notifies = 0
+        self._claimed = 0
         self.circuit_breaker = CircuitBreaker()
         self.metrics = HandlerMetrics()
         self._pool: ThreadPoolExecutor | None = None
 
     def start(self) -> None:
-        """Start the dispatch loop in a background thread."""
+        """Start the dispatch loop and NOTIFY listener in background threads."""
         self._stop_event.clear()
+        self._wake.clear()
         self._pool = ThreadPoolExecutor(
             max_workers=self.MAX_WORKERS,
             thread_name_prefix="EventHandler",
         )
+        self._listener = threading.Thread(
+            target=self._listen, daemon=True, name="EventDispatcherListen",
+        )
+        self._listener.start()
         self._thread = threading.Thread(
             target=self._loop, daemon=True, name="EventDispatcher",
         )
         self._thread.start()
-        logger.info("EventDispatcher: started (workers=%d, timeout=%.0fs)", self.MAX_WORKERS, self.HANDLER_TIMEOUT)
+        logger.info(
+            "EventDispatcher: started as %s (workers=%d, timeout=%.0fs)",
+            self.worker_id, self.MAX_WORKERS, self.HANDLER_TIMEOUT,
+        )
 
     def stop(self) -> None:
-        """Signal stop and wait for the thread to finish."""
+        """Signal stop and wait for the threads to finish."""
         if self._thread is None:
             return
         self._stop_event.set()
+        self._wake.set()
         self._thread.join(timeout=10)
         if self._thread.is_alive():
             logger.warning("EventDispatcher: thread did not stop within timeout")
         else:
             logger.info("EventDispatcher: stopped")
         self._thread = None
+        if self._listener is not None:
+            self._listener.join(timeout=5)
+            self._listener = None
         if self._pool:
             self._pool.shutdown(wait=False)
             self._pool = None
@@ -203,6 +252,10 @@ class EventDispatcher:
         """Return dispatcher health summary."""
         return {
             "running": self._thread is not None and self._thread.is_alive(),
+            "worker_id": self.worker_id,
+            "listening": self._listening,
+            "notifies": self._notifies,
+            "claimed": self._claimed,
             "circuit_breakers": self.circuit_breaker.stats(),
             "handler_metrics": self.metrics.to_dict(),
         }
@@ -213,95 +266,189 @@ class EventDispatcher:
 
     def _loop(self) -> None:
         while not self._stop_event.is_set():
+            # Clear before polling: a NOTIFY that lands mid-poll re-wakes us
+            self._wake.clear()
             try:
                 self._poll()
             except Exception:
                 logger.warning("EventDispatcher: poll cycle failed", exc_info=True)
-            self._stop_event.wait(timeout=self.POLL_INTERVAL)
+            interval = self.LISTEN_POLL_INTERVAL if self._listening else self.POLL_INTERVAL
+            self._wake.wait(timeout=interval)
         # Final drain on shutdown
         try:
             self._poll()
         except Exception:
             pass
 
+    def _listen(self) -> None:
+        """Set the wake flag on every NOTIFY; reconnect when the connection drops."""
+        warned = False
+        while not self._stop_event.is_set():
+            try:
+                with psycopg.connect(self.db.config.dsn, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {self.CHANNEL}")
+                    self._listening = True
+                    warned = False
+                    # Catch up on anything inserted while we weren't listening
+                    self._wake.set()
+                    while not self._stop_event.is_set():
+                        for _ in conn.notifies(timeout=1.0):
+                            self._notifies += 1
+                            self._wake.set()
+            except Exception as e:
+                if not warned:
+                    logger.warning("EventDispatcher: LISTEN unavailable, polling every %.0fs (%s)",
+                                   self.POLL_INTERVAL, e)
+                    warned = True
+            finally:
+                self._listening = False
+            self._stop_event.wait(timeout=self.RECONNECT_DELAY)
+
     def _poll(self) -> None:
-        """Fetch pending dispatches and execute handlers concurrently."""
+        """Claim ready dispatches in small batches and execute them concurrently."""
+        processed = 0
+        while processed < self.BATCH_SIZE:
+            limit = min(self.MAX_WORKERS, self.BATCH_SIZE - processed)
+            rows = self._claim(limit)
+            if not rows:
+                break
+            self._run_claimed(rows)
+            processed += len(rows)
+            if len(rows) < limit:
+                break
+
+        if processed:
+            logger.info("EventDispatcher: processed %d dispatches", processed)
+
+    def _claim(self, limit: int) -> list[dict]:
+        """Lease up to ``limit`` ready dispatches to this worker.
+
+        Ready means pending/failed and due, or running with an expired lease
+        (its worker died; that lost run counts as an attempt). Expired leases
+        whose lost run was the last attempt are marked 'exhausted' in the same
+        statement. Both branches lock with SKIP LOCKED, so concurrent
+        dispatchers claim (or exhaust) disjoint rows without waiting on each
+        other.
+        """
         rows = self.db.execute(
             """
-            SELECT ed.id, ed.event_id, ed.handler, ed.attempts,
-                   e.event_type, e.payload, e.project_id, e.work_item_id,
-                   e.session_name, e.trace_id
-            FROM event_dispatches ed
-            JOIN events e ON e.id = ed.event_id
-            WHERE ed.status IN ('pending', 'failed')
-              AND ed.next_retry <= NOW()
-              AND ed.attempts < %s
-            ORDER BY e.id ASC
-            LIMIT %s
+            WITH lapsed AS (
+                UPDATE event_dispatches
+                SET status = 'exhausted',
+                    attempts = attempts + 1,
+                    last_error = 'lease held by ' || COALESCE(claimed_by, 'unknown worker')
+                                 || ' expired on the final attempt',
+                    completed_at = NOW()
+                WHERE id IN (
+                    SELECT id FROM event_dispatches
+                    WHERE status = 'running'
+                      AND next_retry <= NOW()
+                      AND attempts + 1 >= %s
+                    FOR UPDATE SKIP LOCKED
+                )
+            ),
+            ready AS (
+                SELECT id FROM event_dispatches
+                WHERE status IN ('pending', 'failed', 'running')
+                  AND next_retry <= NOW()
+                  AND attempts + CASE WHEN status = 'running' THEN 1 ELSE 0 END < %s
+                  AND handler <> ALL(%s::text[])
+                ORDER BY event_id ASC
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE event_dispatches ed
+            SET status = 'running',
+                attempts = ed.attempts + CASE WHEN ed.status = 'running' THEN 1 ELSE 0 END,
+                claimed_by = %s,
+                claimed_at = NOW(),
+                next_retry = NOW() + make_interval(secs => %s)
+            FROM ready, events e
+            WHERE ed.id = ready.id AND e.id = ed.event_id
+            RETURNING ed.id, ed.event_id, ed.handler, ed.attempts,
+                      e.event_type, e.payload, e.project_id, e.work_item_id,
+                      e.session_name, e.trace_id
             """,
-            (self.MAX_ATTEMPTS, self.BATCH_SIZE),
+            (
+                self.MAX_ATTEMPTS,
+                self.MAX_ATTEMPTS,
+                self.circuit_breaker.open_handlers(),
+                limit,
+                self.worker_id,
+                self.LEASE_SECONDS,
+            ),
         )
 
         if not rows:
-            # Release the connection so the next poll gets a fresh transaction.
-            self.db.rollback()
-            return
+            # Keep any exhausted leases and release the connection so the
+            # next poll gets a fresh transaction.
+            self.db.commit()
+            return []
+        # Commit the lease before running anything so other workers skip these rows
+        self.db.commit()
+        self._claimed += len(rows)
+        return sorted(rows, key=lambda r: r["event_id"])
 
-        processed = 0
+    def _run_claimed(self, rows: list[dict]) -> None:
+        """Start every claimed dispatch on the pool, then collect results."""
+        pool = self._pool
+        started = []
         for row in rows:
             handler_name = row["handler"]
 
-            # Circuit breaker check
+            # Circuit breaker check (a circuit can open between claim and run)
             if self.circuit_breaker.is_open(handler_name):
                 self.metrics.record(handler_name, success=False, duration_ms=0, skipped=True)
                 logger.debug(
                     "EventDispatcher: skipping '%s' for event %d (circuit open)",
                     handler_name, row["event_id"],
                 )
-                # Don't increment attempts — just skip this cycle
+                # Don't increment attempts — hand the row back for a later cycle
+                self._release(row["id"])
                 continue
 
             handler_fn = self.event_bus.get_handler(handler_name)
             if handler_fn is None:
                 self._mark_exhausted(row["id"], f"handler '{handler_name}' not found")
-                processed += 1
                 continue
 
-            event = {
-                "event_id": row["event_id"],
-                "event_type": row["event_type"],
-                "payload": row["payload"] or {},
-                "project_id": row["project_id"],
-                "work_item_id": row["work_item_id"],
-                "session_name": row["session_name"],
-                "trace_id": row["trace_id"],
-            }
-
-            self._execute_with_timeout(row, handler_name, handler_fn, event)
-            processed += 1
-
-        if processed:
-            logger.info("EventDispatcher: processed %d dispatches", processed)
+            if pool is None:
+                self._release(row["id"])
+                continue
+            timeout = self.event_bus.get_timeout(handler_name) or self.HANDLER_TIMEOUT
+            started.append((
+                row, handler_name, self._submit(pool, handler_fn, self._event(row)),
+                time.monotonic(), timeout,
+            ))
 
-    def _execute_with_timeout(
-        self, row: dict, handler_name: str, handler_fn, event: dict
-    ) -> None:
-        """Execute a handler with timeout enforcement via the thread pool."""
-        if not self._pool:
-            return
+        for row, handler_name, future, t0, timeout in started:
+            self._collect(row, handler_name, future, t0, timeout)
 
-        t0 = time.monotonic()
+    @staticmethod
+    def _event(row: dict) -> dict:
+        return {
+            "event_id": row["event_id"],
+            "event_type": row["event_type"],
+            "payload": row["payload"] or {},
+            "project_id": row["project_id"],
+            "work_item_id": row["work_item_id"],
+            "session_name": row["session_name"],
+            "trace_id": row["trace_id"],
+        }
 
+    def _submit(self, pool: ThreadPoolExecutor, handler_fn, event: dict) -> Future:
         def _run_handler():
             try:
                 return handler_fn(event)
             finally:
                 self.db.release_if_held()
 
-        future = self._pool.submit(_run_handler)
+        return pool.submit(_run_handler)
 
+    def _collect(self, row: dict, handler_name: str, future: Future, t0: float, timeout: float) -> None:
+        """Wait for a started handler (up to ``timeout`` from t0) and record the outcome."""
         try:
-            future.result(timeout=self.HANDLER_TIMEOUT)
+            future.result(timeout=max(0.0, t0 + timeout - time.monotonic()))
             duration_ms = (time.monotonic() - t0) * 1000
             self._mark_success(row["id"])
             self.circuit_breaker.record_success(handler_name)
@@ -309,7 +456,7 @@ class EventDispatcher:
         except FutureTimeout:
             duration_ms = (time.monotonic() - t0) * 1000
             future.cancel()
-            error_msg = f"handler '{handler_name}' timed out after {self.HANDLER_TIMEOUT}s"
+            error_msg = f"handler '{handler_name}' timed out after {timeout}s"
             self._mark_failed(row["id"], row["attempts"], error_msg)
             self.circuit_breaker.record_failure(handler_name)
             self.metrics.record(handler_name, success=False, duration_ms=duration_ms, timeout=True)
@@ -331,15 +478,17 @@ class EventDispatcher:
     # ------------------------------------------------------------------
     # Status updates
     # ------------------------------------------------------------------
+    # Every update is fenced on claimed_by: if our lease expired and another
+    # worker reclaimed the row, its outcome wins and ours is dropped.
 
     def _mark_success(self, dispatch_id: int) -> None:
         self.db.execute(
             """
             UPDATE event_dispatches
             SET status = 'success', completed_at = NOW()
-            WHERE id = %s
+            WHERE id = %s AND claimed_by = %s
             """,
-            (dispatch_id,),
+            (dispatch_id, self.worker_id),
         )
         self.db.commit()
 
@@ -353,9 +502,9 @@ class EventDispatcher:
                 attempts = %s,
                 last_error = %s,
                 next_retry = NOW() + make_interval(secs => %s)
-            WHERE id = %s
+            WHERE id = %s AND claimed_by = %s
             """,
-            (next_attempts, error[:2000], backoff_seconds, dispatch_id),
+            (next_attempts, error[:2000], backoff_seconds, dispatch_id, self.worker_id),
         )
         self.db.commit()
 
@@ -364,8 +513,21 @@ class EventDispatcher:
             """
             UPDATE event_dispatches
             SET status = 'exhausted', last_error = %s, completed_at = NOW()
-            WHERE id = %s
+            WHERE id = %s AND claimed_by = %s
+            """,
+            (reason, dispatch_id, self.worker_id),
+        )
+        self.db.commit()
+
+    def _release(self, dispatch_id: int) -> None:
+        """Give a claimed row back without counting an attempt."""
+        self.db.execute(
+            """
+            UPDATE event_dispatches
+            SET status = CASE WHEN attempts > 0 THEN 'failed' ELSE 'pending' END,
+                next_retry = NOW()
+            WHERE id = %s AND claimed_by = %s
             """,
-            (reason, dispatch_id),
+            (dispatch_id, self.worker_id),
         )
         self.db.commit()
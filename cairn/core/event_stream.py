@@ -0,0 +1,213 @@
+"""EventStreamHub — one LISTEN connection shared by every SSE client.
+
+Each SSE stream used to open its own asyncio Postgres connection, LISTEN on
+cairn_events and filter every notification in Python, so N open dashboards
+meant N backends all receiving the same traffic.
+
+The hub runs a single listener task on the event loop. Each notification is
+decoded and re-serialized once, then offered to every subscription whose
+precompiled filter matches. Subscriptions own a bounded asyncio queue; a
+consumer that falls QUEUE_MAX events behind is shed — its queue is cleared
+and the stream is told to close, so the client reconnects (EventSource does
+this automatically) instead of holding memory for a stalled socket.
+
+The listener starts with the first subscription and stops with the last, so
+the process holds one LISTEN connection while anyone is streaming and none
+otherwise. It reconnects on its own when the connection drops; streams keep
+their heartbeats in the meantime.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import json
+import logging
+import re
+import threading
+from typing import TYPE_CHECKING
+
+from cairn.core import stats
+
+if TYPE_CHECKING:
+    from cairn.storage.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Queued in place of an event when a subscription is shed
+_SHED = None
+
+
+class Subscription:
+    """One SSE client's filter and bounded queue.
+
+    Filters are compiled once: the fnmatch patterns collapse into a single
+    regex, and exact-match fields become a tuple of (key, value) checks.
+    """
+
+    def __init__(
+        self,
+        hub: EventStreamHub,
+        *,
+        patterns: list[str] | None = None,
+        session_name: str | None = None,
+        event_type: str | None = None,
+        project_id: int | None = None,
+    ):
+        self.hub = hub
+        self.queue: asyncio.Queue[tuple[dict, str] | None] = asyncio.Queue(maxsize=hub.QUEUE_MAX)
+        self.shed = False
+        self._pattern = (
+            re.compile("|".join(fnmatch.translate(p) for p in patterns))
+            if patterns and "*" not in patterns else None
+        )
+        self._fields = tuple(
+            (key, value) for key, value in (
+                ("session_name", session_name),
+                ("event_type", event_type),
+                ("project_id", project_id),
+            ) if value is not None
+        )
+
+    def matches(self, data: dict) -> bool:
+        for key, value in self._fields:
+            if data.get(key) != value:
+                return False
+        if self._pattern is not None:
+            return self._pattern.match(data.get("event_type") or "") is not None
+        return True
+
+    async def get(self, timeout: float) -> tuple[dict, str] | None:
+        """Next (event, json) pair, or None when shed.
+
+        Raises TimeoutError when nothing arrives within ``timeout`` seconds.
+        """
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+
+class EventStreamHub:
+    """Single LISTEN task fanning notifications out to SSE subscriptions."""
+
+    CHANNEL = "cairn_events"
+    QUEUE_MAX = 256  # events buffered per subscriber before it is shed
+    RECONNECT_DELAY = 2.0  # seconds
+
+    def __init__(self, db: Database):
+        self.db = db
+        self._subscribers: set[Subscription] = set()
+        self._task: asyncio.Task | None = None
+        self._lock = threading.Lock()
+        self._connected = False
+        self._connects = 0
+        self._notifies = 0
+        self._decode_errors = 0
+        self._delivered = 0
+        self._shed = 0
+
+    def subscribe(self, **filters) -> Subscription:
+        """Register a subscription; starts the listener if it isn't running.
+
+        Must be called from the event loop the streams are served on.
+        """
+        sub = Subscription(self, **filters)
+        self._subscribers.add(sub)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._listen())
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        self._subscribers.discard(sub)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _connect(self):
+        import psycopg
+        return await psycopg.AsyncConnection.connect(self.db.config.dsn, autocommit=True)
+
+    async def _listen(self) -> None:
+        """Fan out every NOTIFY; reconnect when the connection drops."""
+        warned = False
+        while self._subscribers:
+            try:
+                conn = await self._connect()
+                async with conn:
+                    await conn.execute(f"LISTEN {self.CHANNEL}")
+                    self._connected = True
+                    self._connects += 1
+                    warned = False
+                    async for notify in conn.notifies():
+                        self._dispatch(notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not warned:
+                    logger.warning("EventStreamHub: LISTEN failed, retrying every %.0fs (%s)",
+                                   self.RECONNECT_DELAY, e)
+                    warned = True
+                if stats.event_bus_stats:
+                    stats.event_bus_stats.record_error(f"SSE listen: {e}")
+            finally:
+                self._connected = False
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    def _dispatch(self, payload: str) -> None:
+        """Decode one notification and queue it for every matching subscriber."""
+        with self._lock:
+            self._notifies += 1
+        try:
+            data = json.loads(payload)
+        except (json.JSONDecodeError, TypeError):
+            with self._lock:
+                self._decode_errors += 1
+            return
+        if not isinstance(data, dict):
+            with self._lock:
+                self._decode_errors += 1
+            return
+
+        item = None
+        delivered = 0
+        for sub in list(self._subscribers):
+            if not sub.matches(data):
+                continue
+            if item is None:
+                item = (data, json.dumps(data, default=str))
+            try:
+                sub.queue.put_nowait(item)
+                delivered += 1
+            except asyncio.QueueFull:
+                self._shed_subscriber(sub)
+        if delivered:
+            with self._lock:
+                self._delivered += delivered
+
+    def _shed_subscriber(self, sub: Subscription) -> None:
+        """Drop a consumer that stopped keeping up and tell its stream to end."""
+        sub.shed = True
+        self._subscribers.discard(sub)
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        sub.queue.put_nowait(_SHED)
+        with self._lock:
+            self._shed += 1
+            shed = self._shed
+        logger.warning("EventStreamHub: shed slow SSE subscriber (%d so far)", shed)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def health(self) -> dict:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "listening": self._connected,
+                "connects": self._connects,
+                "notifies": self._notifies,
+                "decode_errors": self._decode_errors,
+                "delivered": self._delivered,
+                "shed": self._shed,
+            }
@@ -0,0 +1,169 @@
+"""EventWriter — background batched persistence for high-volume telemetry events.
+
+LLM and embedding usage events are emitted from inside every embed() and
+generate() call. Persisting each one synchronously costs an INSERT + COMMIT
+on the caller's connection in the middle of search and store requests.
+
+EventWriter takes fully-built CairnEvents on a bounded in-process queue and a
+background thread flushes them through EventBus.persist_batch() as multi-row
+INSERTs. The events table's per-row trigger still fires NOTIFY for every
+event, so SSE consumers see the same stream — just up to FLUSH_INTERVAL later.
+
+Flush policy: a batch is written when BATCH_SIZE events are queued or
+FLUSH_INTERVAL seconds have passed, whichever comes first. When the queue is
+full, new events are dropped and counted (telemetry loss is acceptable;
+blocking the hot path is not).
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cairn.core.event_bus import EventBus
+    from cairn.core.event_schema import CairnEvent
+
+logger = logging.getLogger(__name__)
+
+
+class EventWriter:
+    """Bounded queue + background thread that batch-persists events."""
+
+    QUEUE_MAX = 10_000
+    BATCH_SIZE = 200
+    FLUSH_INTERVAL = 1.0  # seconds
+    DROP_LOG_EVERY = 1_000  # log one warning per this many dropped events
+
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+        self._queue: queue.Queue[CairnEvent] = queue.Queue(maxsize=self.QUEUE_MAX)
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, event: CairnEvent) -> bool:
+        """Enqueue an event. Never blocks.
+
+        Returns False when the writer isn't running so the caller can persist
+        synchronously instead. A full queue drops the event (and returns True —
+        it was accepted by the telemetry path, just not kept).
+        """
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+                dropped = self._dropped
+            if dropped == 1 or dropped % self.DROP_LOG_EVERY == 0:
+                logger.warning("EventWriter: queue full, %d events dropped so far", dropped)
+            return True
+        with self._lock:
+            self._submitted += 1
+        if self._queue.qsize() >= self.BATCH_SIZE:
+            self._wake.set()
+        return True
+
+    def start(self) -> None:
+        """Start the background flush thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._flush_loop, daemon=True, name="EventWriter",
+        )
+        self._thread.start()
+        logger.info(
+            "EventWriter: started (batch=%d, interval=%.1fs, queue=%d)",
+            self.BATCH_SIZE, self.FLUSH_INTERVAL, self.QUEUE_MAX,
+        )
+
+    def stop(self) -> None:
+        """Signal stop and wait for the final drain."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._wake.set()
+        self._thread.join(timeout=10)
+        if self._thread.is_alive():
+            logger.warning("EventWriter: thread did not stop within timeout")
+        else:
+            logger.info("EventWriter: stopped")
+        self._thread = None
+
+    def health(self) -> dict:
+        """Return writer counters for the event-bus health endpoint."""
+        with self._lock:
+            return {
+                "running": self.running,
+                "queue_depth": self._queue.qsize(),
+                "queue_max": self.QUEUE_MAX,
+                "submitted": self._submitted,
+                "written": self._written,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "batches": self._batches,
+                "last_flush_ms": round(self._last_flush_ms, 1),
+            }
+
+    # ------------------------------------------------------------------
+    # Background loop
+    # ------------------------------------------------------------------
+
+    def _flush_loop(self) -> None:
+        while not self._stop_event.is_set():
+            self._wake.wait(timeout=self.FLUSH_INTERVAL)
+            self._wake.clear()
+            self._drain()
+        # Final drain on shutdown
+        self._drain()
+
+    def _drain(self) -> None:
+        """Flush everything currently queued, BATCH_SIZE events at a time."""
+        try:
+            while True:
+                batch: list[CairnEvent] = []
+                while len(batch) < self.BATCH_SIZE:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if not batch:
+                    return
+                self._flush(batch)
+                if len(batch) < self.BATCH_SIZE:
+                    return
+        finally:
+            self.event_bus.db.release_if_held()
+
+    def _flush(self, batch: list[CairnEvent]) -> None:
+        start = time.monotonic()
+        try:
+            self.event_bus.persist_batch(batch)
+        except Exception:
+            with self._lock:
+                self._failed += len(batch)
+            logger.warning("EventWriter: flush failed for %d events", len(batch), exc_info=True)
+            try:
+                self.event_bus.db.rollback()
+            except Exception:
+                pass
+            return
+        with self._lock:
+            self._written += len(batch)
+            self._batches += 1
+            self._last_flush_ms = (time.monotonic() - start) * 1000
@@ -10,8 +10,11 @@ to returning only basic enrichment fields from the raw content.
 from __future__ import annotations
 
 import logging
+import math
 import threading
-from typing import TYPE_CHECKING
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, field_validator
 
@@ -21,6 +24,8 @@ from cairn.core.extraction_prompt import (
     build_normalize_messages,
 )
 from cairn.core.utils import extract_json
+from cairn.graph.interface import Statement
+from cairn.llm.cache import generate_checked
 
 if TYPE_CHECKING:
     from cairn.embedding.interface import EmbeddingInterface
@@ -44,6 +49,18 @@ VALID_ENTITY_TYPES = {
     "Task", "Technology", "Product", "Concept",
 }
 
+# Name similarity needed to merge into an existing entity of the same type,
+# and (stricter) of any type. These are vector index scores, (1 + cos) / 2.
+MERGE_THRESHOLD = 0.85
+MERGE_ANY_TYPE_THRESHOLD = 0.95
+
+
+def _similarity_score(a: list[float], b: list[float]) -> float:
+    """Cosine similarity on the vector index's scale, (1 + cos) / 2."""
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    cos = sum(x * y for x, y in zip(a, b, strict=True)) / norm if norm else 0.0
+    return (1 + cos) / 2
+
 
 class ExtractedEntity(BaseModel):
     name: str
@@ -127,6 +144,18 @@ class KnowledgeExtractor:
         self._embed_cache: dict[str, list[float]] = {}
         self._cache_lock = threading.Lock()
 
+    def _cached_embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Batch variant of _cached_embed: all misses go out in one embed_batch."""
+        with self._cache_lock:
+            found = {t: self._embed_cache[t] for t in texts if t in self._embed_cache}
+        missing = list(dict.fromkeys(t for t in texts if t not in found))
+        if missing:
+            vectors = self.embedding.embed_batch(missing)
+            found.update(zip(missing, vectors, strict=True))
+            with self._cache_lock:
+                self._embed_cache.update(zip(missing, vectors, strict=True))
+        return [found[t] for t in texts]
+
     def _cached_embed(self, text: str) -> list[float]:
         """Embed with thread-safe cache. Saves redundant API calls for repeated entity names."""
         with self._cache_lock:
@@ -191,13 +220,13 @@ class KnowledgeExtractor:
                 extract_content, created_at=created_at, author=author,
                 known_entities=known_entities,
             )
-            raw = self.llm.generate(messages, max_tokens=2048)
+            raw = generate_checked(self.llm, messages, 2048, self._parse)
             return self._parse(raw)
         except Exception as first_error:
             logger.warning("Extraction first attempt failed: %s", first_error)
             try:
                 messages = build_extraction_retry_messages(extract_content, str(first_error))
-                raw = self.llm.generate(messages, max_tokens=2048)
+                raw = generate_checked(self.llm, messages, 2048, self._parse)
                 return self._parse(raw)
             except Exception:
                 logger.warning("Extraction retry failed, returning None", exc_info=True)
@@ -218,7 +247,204 @@ class KnowledgeExtractor:
     ) -> dict:
         """Resolve entities, detect contradictions, and persist to graph.
 
-        Returns summary dict with counts of created/merged entities and statements.
+        Batched: one embed_batch for all entity names and facts, one entity
+        resolution query, one contradiction lookup, and one write transaction,
+        regardless of how many entities and statements were extracted. Names
+        with no match in the graph are also matched against entities created
+        earlier in the same extraction. If any batched step fails, nothing has
+        been written and the extraction is persisted item by item instead, so
+        one bad entity or statement doesn't lose the rest.
+
+        Returns summary dict with counts of created/merged entities and
+        statements, plus a per-phase ``timings_ms`` breakdown.
+        """
+        summary: dict[str, Any] = {
+            "entities_created": 0,
+            "entities_merged": 0,
+            "statements_created": 0,
+            "contradictions_found": 0,
+        }
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+
+        def _lap(phase: str, t0: float) -> float:
+            now = time.perf_counter()
+            timings[phase] = round((now - t0) * 1000, 1)
+            return now
+
+        # Repeated names in one extraction refer to the same entity
+        entities: dict[str, ExtractedEntity] = {}
+        for entity in result.entities:
+            entities.setdefault(entity.name, entity)
+        statements: list[ExtractedStatement] = []
+        for stmt in result.statements:
+            if stmt.subject in entities:
+                statements.append(stmt)
+            else:
+                logger.debug("Skipping statement, subject not found: %s", stmt.subject)
+
+        try:
+            # Step 1: Embed every entity name and fact in one call
+            t = time.perf_counter()
+            vectors = self._cached_embed_batch(
+                list(entities) + [s.fact for s in statements],
+            )
+            name_vectors = dict(zip(entities, vectors[:len(entities)], strict=True))
+            fact_vectors = vectors[len(entities):]
+            t = _lap("embed", t)
+
+            # Step 2: Resolve entities — merge into an existing match or create
+            names = list(entities)
+            matches = self.graph.resolve_entities_batch(
+                [
+                    {"name": n, "entity_type": entities[n].entity_type, "embedding": name_vectors[n]}
+                    for n in names
+                ],
+                project_id,
+                threshold=MERGE_THRESHOLD,
+                any_type_threshold=MERGE_ANY_TYPE_THRESHOLD,
+            )
+            entity_map: dict[str, str] = {}  # entity name -> UUID
+            new_entities: list[dict] = []
+            for name, match in zip(names, matches, strict=True):
+                if match is not None:
+                    entity_map[name] = match.uuid
+                    logger.debug("Entity merged: %s (%s) -> %s (%s)",
+                                 name, entities[name].entity_type, match.name, match.entity_type)
+                    continue
+                # Near-duplicate of an entity this extraction already created
+                earlier = self._match_new_entity(
+                    entities[name].entity_type, name_vectors[name], new_entities,
+                )
+                if earlier is not None:
+                    entity_map[name] = earlier["uuid"]
+                    logger.debug("Entity merged (same extraction): %s (%s) -> %s (%s)",
+                                 name, entities[name].entity_type,
+                                 earlier["name"], earlier["entity_type"])
+                    continue
+                entity_map[name] = str(uuid.uuid4())
+                new_entities.append({
+                    "uuid": entity_map[name],
+                    "name": name,
+                    "entity_type": entities[name].entity_type,
+                    "embedding": name_vectors[name],
+                    "attributes": entities[name].attributes,
+                })
+            t = _lap("resolve", t)
+
+            # Step 3: Contradictions (same subject + predicate). Only merged
+            # subjects can have statements already in the graph.
+            new_uuids = {e["uuid"] for e in new_entities}
+            pairs = [
+                (entity_map[s.subject], s.predicate) for s in statements
+                if entity_map[s.subject] not in new_uuids
+            ]
+            existing = self.graph.find_contradictions_batch(pairs, project_id) if pairs else {}
+            t = _lap("contradictions", t)
+
+            # Step 4: Build statements in order. Earlier statements from this
+            # extraction can be contradicted by later ones, as when written one by one.
+            statement_rows: list[dict] = []
+            invalidate: list[str] = []
+            invalidated: set[str] = set()
+            for stmt, fact_vector in zip(statements, fact_vectors, strict=True):
+                subject_uuid = entity_map[stmt.subject]
+                key = (subject_uuid, stmt.predicate)
+                # Only flag contradictions within Identity, Preference, Belief,
+                # Directive aspects. Event/Action/Knowledge accumulate.
+                for old_stmt in existing.get(key, []):
+                    if old_stmt.uuid in invalidated:
+                        continue
+                    if old_stmt.aspect not in CONTRADICTING_ASPECTS:
+                        continue
+                    # Skip if both have valid_at dates and they differ (temporal evolution)
+                    if (old_stmt.valid_at and stmt.event_date
+                            and old_stmt.valid_at != stmt.event_date):
+                        continue
+                    invalidated.add(old_stmt.uuid)
+                    invalidate.append(old_stmt.uuid)
+
+                # Resolve object — could be entity name or literal
+                object_uuid = entity_map.get(stmt.object)
+                stmt_uuid = str(uuid.uuid4())
+                row = {
+                    "uuid": stmt_uuid,
+                    "fact": stmt.fact,
+                    "embedding": fact_vector,
+                    "aspect": stmt.aspect,
+                    "valid_at": stmt.event_date,
+                    "subject_id": subject_uuid,
+                    "predicate": stmt.predicate,
+                    "object_id": object_uuid,
+                    "object_value": stmt.object if not object_uuid else None,
+                }
+                statement_rows.append(row)
+                existing.setdefault(key, []).append(Statement(
+                    uuid=stmt_uuid, fact=stmt.fact, aspect=stmt.aspect,
+                    episode_id=episode_id, project_id=project_id, valid_at=stmt.event_date,
+                ))
+
+            # Step 5: One transaction for entities, statements, triples, invalidations
+            if new_entities or statement_rows or invalidate:
+                self.graph.write_extraction_batch(
+                    project_id, episode_id, new_entities, statement_rows, invalidate,
+                )
+            _lap("write", t)
+        except Exception:
+            logger.warning(
+                "Batched graph persist failed for episode %d, persisting item by item",
+                episode_id, exc_info=True,
+            )
+            t = time.perf_counter()
+            summary.update(self._persist_each(result, episode_id, project_id))
+            _lap("fallback", t)
+        else:
+            summary.update(
+                entities_created=len(new_entities),
+                entities_merged=len(entities) - len(new_entities),
+                statements_created=len(statement_rows),
+                contradictions_found=len(invalidate),
+            )
+
+        timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+        summary["timings_ms"] = timings
+        logger.debug(
+            "Graph persist timings (episode %d): %s",
+            episode_id, " ".join(f"{k}={v}ms" for k, v in timings.items()),
+        )
+        return summary
+
+    @staticmethod
+    def _match_new_entity(
+        entity_type: str, embedding: list[float], new_entities: list[dict],
+    ) -> dict | None:
+        """Best match among entities created earlier in the same extraction.
+
+        Same rules and score scale as resolve_entities_batch: same-type
+        matches above MERGE_THRESHOLD win, otherwise any type above
+        MERGE_ANY_TYPE_THRESHOLD.
+        """
+        best: dict | None = None
+        best_key = (False, 0.0)
+        for other in new_entities:
+            score = _similarity_score(embedding, other["embedding"])
+            same_type = other["entity_type"] == entity_type
+            if not ((same_type and score > MERGE_THRESHOLD) or score > MERGE_ANY_TYPE_THRESHOLD):
+                continue
+            if best is None or (same_type, score) > best_key:
+                best, best_key = other, (same_type, score)
+        return best
+
+    def _persist_each(
+        self,
+        result: ExtractionResult,
+        episode_id: int,
+        project_id: int,
+    ) -> dict[str, int]:
+        """Per-item fallback for resolve_and_persist.
+
+        One graph call per lookup and write; a failure skips only the entity
+        or statement it hit.
         """
         # Step 1: Resolve entities — embed name, find similar, merge or create
         entity_map: dict[str, str] = {}  # entity name -> UUID
@@ -226,12 +452,14 @@ class KnowledgeExtractor:
         entities_merged = 0
 
         for entity in result.entities:
+            if entity.name in entity_map:
+                continue
             try:
                 name_embedding = self._cached_embed(entity.name)
 
-                # Try type-scoped match first (0.85 threshold)
+                # Try type-scoped match first
                 similar = self.graph.find_similar_entities(
-                    name_embedding, entity.entity_type, project_id,
+                    name_embedding, entity.entity_type, project_id, threshold=MERGE_THRESHOLD,
                 )
                 if similar:
                     entity_map[entity.name] = similar[0].uuid
@@ -239,9 +467,9 @@ class KnowledgeExtractor:
                     logger.debug("Entity merged (type-scoped): %s -> %s", entity.name, similar[0].uuid)
                     continue
 
-                # Fallback: type-agnostic match (0.95 threshold — stricter)
+                # Fallback: type-agnostic match (stricter threshold)
                 similar_any = self.graph.find_similar_entities_any_type(
-                    name_embedding, project_id, threshold=0.95,
+                    name_embedding, project_id, threshold=MERGE_ANY_TYPE_THRESHOLD,
                 )
                 if similar_any:
                     entity_map[entity.name] = similar_any[0].uuid
@@ -254,14 +482,13 @@ class KnowledgeExtractor:
                     continue
 
                 # Create new entity
-                uuid = self.graph.create_entity(
+                entity_map[entity.name] = self.graph.create_entity(
                     name=entity.name,
                     entity_type=entity.entity_type,
                     embedding=name_embedding,
                     project_id=project_id,
                     attributes=entity.attributes,
                 )
-                entity_map[entity.name] = uuid
                 entities_created += 1
             except Exception:
                 logger.warning("Entity resolution failed for %s", entity.name, exc_info=True)
@@ -274,39 +501,29 @@ class KnowledgeExtractor:
             try:
                 subject_uuid = entity_map.get(stmt.subject)
                 if not subject_uuid:
-                    # Subject not in our entity map — skip this statement
                     logger.debug("Skipping statement, subject not found: %s", stmt.subject)
                     continue
 
-                # Check for contradictions (same subject + predicate)
-                # Only flag contradictions within Identity, Preference, Belief,
-                # Directive aspects. Event/Action/Knowledge accumulate.
                 existing = self.graph.find_contradictions(
                     subject_uuid, stmt.predicate, project_id,
                 )
                 for old_stmt in existing:
-                    # Skip if the old statement's aspect isn't in contradicting set
                     if old_stmt.aspect not in CONTRADICTING_ASPECTS:
                         continue
-                    # Skip if both have valid_at dates and they differ (temporal evolution)
                     if (old_stmt.valid_at and stmt.event_date
                             and old_stmt.valid_at != stmt.event_date):
                         continue
                     self.graph.invalidate_statement(old_stmt.uuid, invalidated_by="extraction")
                     contradictions_found += 1
 
-                # Create the new statement
-                fact_embedding = self._cached_embed(stmt.fact)
                 stmt_uuid = self.graph.create_statement(
                     fact=stmt.fact,
-                    embedding=fact_embedding,
+                    embedding=self._cached_embed(stmt.fact),
                     aspect=stmt.aspect,
                     episode_id=episode_id,
                     project_id=project_id,
                     valid_at=stmt.event_date,
                 )
-
-                # Resolve object — could be entity name or literal
                 object_uuid = entity_map.get(stmt.object)
                 self.graph.create_triple(
                     statement_id=stmt_uuid,
@@ -316,7 +533,6 @@ class KnowledgeExtractor:
                     object_value=stmt.object if not object_uuid else None,
                 )
                 statements_created += 1
-
             except Exception:
                 logger.warning("Statement creation failed: %s", stmt.fact, exc_info=True)
 
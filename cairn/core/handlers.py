@@ -11,6 +11,8 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from cairn.storage.vector import to_vector
+
 if TYPE_CHECKING:
     from cairn.core.router import RouterOutput
     from cairn.embedding.interface import EmbeddingInterface
@@ -326,7 +328,7 @@ def _vector_search(ctx: SearchContext, limit: int | None = None) -> list[dict]:
     """Standard pgvector cosine similarity search."""
     search_limit = limit or ctx.limit * 3
     try:
-        query_vector = ctx.embedding.embed(ctx.query)
+        vec = to_vector(ctx.embedding.embed(ctx.query))
         where_clauses = ["m.is_active = true", "m.embedding IS NOT NULL"]
         params: list = []
 
@@ -348,7 +350,7 @@ def _vector_search(ctx: SearchContext, limit: int | None = None) -> list[dict]:
             ORDER BY m.embedding <=> %s::vector
             LIMIT %s
             """,
-            [str(query_vector)] + params + [str(query_vector), search_limit],
+            [vec] + params + [vec, search_limit],
         )
 
         return [
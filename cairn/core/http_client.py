@@ -0,0 +1,414 @@
+"""Pooled keep-alive HTTP client shared by the HTTP LLM and embedding backends.
+
+The Ollama, Gemini and OpenAI-compatible backends used to build a fresh
+urllib request per call, so every enrichment, router classification and
+embedding paid a TCP (and TLS) handshake. Here each origin (scheme, host,
+port) gets one HTTPClient for the whole process. It keeps up to pool_size
+idle connections alive and hands them to whichever thread asks next.
+
+Beyond pool_size, concurrent requests open extra connections that are closed
+after use, so a burst is never blocked on the pool. A reused connection that
+the server has since closed is replaced transparently, once, before the
+request counts as failed.
+
+With http2 enabled and httpx[http2] installed, requests multiplex over
+HTTP/2 instead; without h2 the setting logs a warning and HTTP/1.1
+keep-alive is used.
+
+Errors keep urllib's shape so callers didn't have to change how they react:
+status >= 400 raises urllib.error.HTTPError (with a readable body), and
+transport failures raise ConnectionError, TimeoutError or URLError. post()
+retries transient failures per RetryPolicy; open() is single-shot, for
+streaming.
+"""
+
+from __future__ import annotations
+
+import base64
+import http.client
+import io
+import logging
+import queue
+import socket
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from cairn import __version__
+from cairn.config import HTTPClientConfig
+
+logger = logging.getLogger(__name__)
+
+# Failures on a reused connection that mean the server closed it while idle
+# (over TLS, a close without close_notify surfaces as SSLEOFError)
+_STALE_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError, ssl.SSLEOFError)
+
+_settings = HTTPClientConfig()
+_clients: dict[str, HTTPClient] = {}
+_registry_lock = threading.Lock()
+_ssl_context: ssl.SSLContext | None = None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Attempts and backoff for transient failures.
+
+    Waits min(2**attempt + backoff_offset, backoff_cap) seconds between
+    attempts. HTTP statuses outside ``statuses`` raise immediately.
+    """
+
+    attempts: int = 3
+    statuses: frozenset[int] = field(default_factory=lambda: frozenset({429, 500, 502, 503}))
+    backoff_offset: int = 0
+    backoff_cap: int = 30
+
+    def wait(self, attempt: int) -> int:
+        return min(2 ** attempt + self.backoff_offset, self.backoff_cap)
+
+
+class HTTPResponse:
+    """Response from HTTPClient.open(): read() the body or iterate its lines.
+
+    Closing returns the connection to its pool when the body was fully read,
+    and discards it otherwise.
+    """
+
+    def __init__(self, status: int, headers, read, lines, release):
+        self.status = status
+        self.headers = headers
+        self._read = read
+        self._lines = lines
+        self._release = release
+
+    def read(self) -> bytes:
+        return self._read()
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._lines()
+
+    def close(self) -> None:
+        if self._release is not None:
+            release, self._release = self._release, None
+            release()
+
+    def __enter__(self) -> HTTPResponse:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class HTTPClient:
+    """Thread-safe keep-alive connection pool for one origin."""
+
+    def __init__(self, origin: str, pool_size: int = 10, connect_timeout: float = 10.0, http2: bool = False):
+        parts = urllib.parse.urlsplit(origin)
+        self.origin = origin
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or (443 if self.scheme == "https" else 80)
+        self.pool_size = max(1, pool_size)
+        self.connect_timeout = connect_timeout
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(maxsize=self.pool_size)
+        self._proxy, self._proxy_auth = self._proxy_for(self.scheme, self.host)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._opened = 0
+        self._reused = 0
+        self._stale = 0
+        self._retries = 0
+        self._errors = 0
+        self._h2 = self._http2_client() if http2 else None
+
+    # -- public API --
+
+    def post(
+        self,
+        url: str,
+        body: bytes,
+        headers: dict[str, str],
+        *,
+        timeout: float = 60.0,
+        retry: RetryPolicy | None = None,
+        label: str = "HTTP",
+    ) -> bytes:
+        """POST and return the response body, retrying transient failures.
+
+        Raises the last error once ``retry.attempts`` are used up.
+        """
+        retry = retry or RetryPolicy()
+        last_error: Exception | None = None
+        for attempt in range(retry.attempts):
+            try:
+                with self.open("POST", url, body, headers, timeout=timeout) as resp:
+                    return resp.read()
+            except urllib.error.HTTPError as e:
+                if e.code not in retry.statuses:
+                    raise
+                last_error = e
+                reason: object = f"HTTP {e.code}"
+            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+                last_error = e
+                reason = e
+            wait = retry.wait(attempt)
+            with self._lock:
+                self._retries += 1
+            logger.warning(
+                "%s transient error (attempt %d/%d): %s. Retrying in %ds...",
+                label, attempt + 1, retry.attempts, reason, wait,
+            )
+            time.sleep(wait)
+        assert last_error is not None
+        raise last_error
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        timeout: float = 60.0,
+    ) -> HTTPResponse:
+        """Send one request and return the open response (no retries)."""
+        headers = {"User-Agent": f"cairn/{__version__}", **(headers or {})}
+        with self._lock:
+            self._requests += 1
+        try:
+            if self._h2 is not None:
+                return self._open_h2(self._h2, method, url, body, headers, timeout)
+            return self._open_h1(method, url, body, headers, timeout)
+        except urllib.error.HTTPError:
+            raise
+        except Exception:
+            with self._lock:
+                self._errors += 1
+            raise
+
+    def close(self) -> None:
+        """Close idle connections. In-flight ones close when released."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        if self._h2 is not None:
+            self._h2.close()
+
+    def health(self) -> dict:
+        with self._lock:
+            return {
+                "protocol": "HTTP/2" if self._h2 is not None else "HTTP/1.1",
+                "pool_size": self.pool_size,
+                "idle": self._idle.qsize(),
+                "requests": self._requests,
+                "connections_opened": self._opened,
+                "connections_reused": self._reused,
+                "stale_reconnects": self._stale,
+                "retries": self._retries,
+                "errors": self._errors,
+            }
+
+    # -- HTTP/1.1 keep-alive --
+
+    def _open_h1(self, method, url, body, headers, timeout) -> HTTPResponse:
+        target = url if self._proxy and self.scheme == "http" else self._path(url)
+        if self._proxy_auth and self.scheme == "http":
+            # Plain HTTP goes to the proxy directly; HTTPS sends this on CONNECT
+            headers = {**headers, "Proxy-Authorization": self._proxy_auth}
+        conn, reused = self._acquire(timeout)
+        try:
+            conn.request(method, target, body=body, headers=headers)
+            resp = conn.getresponse()
+        except _STALE_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            # Idle connection closed by the server: one fresh try, not an attempt
+            with self._lock:
+                self._stale += 1
+            conn, _ = self._acquire(timeout, fresh=True)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                resp = conn.getresponse()
+            except BaseException:
+                conn.close()
+                raise
+        except socket.gaierror as e:
+            conn.close()
+            raise urllib.error.URLError(e) from e
+        except BaseException:
+            conn.close()
+            raise
+
+        def release():
+            if resp.length == 0:
+                # readline() consumed the whole body but leaves the response open
+                resp.close()
+            if resp.isclosed() and not resp.will_close:
+                try:
+                    self._idle.put_nowait(conn)
+                    return
+                except queue.Full:
+                    pass
+            conn.close()
+
+        if resp.status >= 400:
+            payload = resp.read()
+            release()
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(payload))
+
+        def lines():
+            while line := resp.readline():
+                yield line
+
+        return HTTPResponse(resp.status, resp.headers, resp.read, lines, release)
+
+    def _acquire(self, timeout: float, fresh: bool = False) -> tuple[http.client.HTTPConnection, bool]:
+        """An idle pooled connection, or a newly connected one."""
+        if not fresh:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                conn.sock.settimeout(timeout)
+                with self._lock:
+                    self._reused += 1
+                return conn, True
+
+        if self._proxy:
+            host, port = self._proxy
+        else:
+            host, port = self.host, self.port
+        if self.scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=self.connect_timeout, context=_tls_context())
+            if self._proxy:
+                tunnel_headers = {"Proxy-Authorization": self._proxy_auth} if self._proxy_auth else None
+                conn.set_tunnel(self.host, self.port, headers=tunnel_headers)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.connect_timeout)
+        try:
+            conn.connect()
+        except socket.gaierror as e:
+            conn.close()
+            raise urllib.error.URLError(e) from e
+        # Request bodies go out right behind their headers, not after a delayed ACK
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn.sock.settimeout(timeout)
+        with self._lock:
+            self._opened += 1
+        return conn, False
+
+    @staticmethod
+    def _path(url: str) -> str:
+        parts = urllib.parse.urlsplit(url)
+        return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    @staticmethod
+    def _proxy_for(scheme: str, host: str) -> tuple[tuple[str, int] | None, str | None]:
+        """Honor HTTP(S)_PROXY / NO_PROXY the way urlopen did.
+
+        Returns the proxy (host, port), or None, and the Proxy-Authorization
+        value for credentials in the proxy URL (user:pass@), or None.
+        """
+        proxy = urllib.request.getproxies().get(scheme)
+        if not proxy or urllib.request.proxy_bypass(host):
+            return None, None
+        parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        auth = None
+        if parts.username is not None:
+            credentials = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+            auth = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+        return (parts.hostname or "localhost", parts.port or 80), auth
+
+    # -- HTTP/2 (optional httpx[http2]) --
+
+    def _http2_client(self):
+        try:
+            import h2  # noqa: F401
+            import httpx
+        except ImportError:
+            logger.warning("HTTP/2 requested but httpx[http2] is not installed; using HTTP/1.1 keep-alive for %s",
+                           self.origin)
+            return None
+        return httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=self.pool_size),
+            timeout=httpx.Timeout(60.0, connect=self.connect_timeout),
+        )
+
+    def _open_h2(self, client, method, url, body, headers, timeout) -> HTTPResponse:
+        import httpx
+
+        request = client.build_request(
+            method, url, content=body, headers=headers,
+            timeout=httpx.Timeout(timeout, connect=self.connect_timeout),
+        )
+        try:
+            resp = client.send(request, stream=True)
+        except httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+
+        if resp.status_code >= 400:
+            payload = resp.read()
+            resp.close()
+            raise urllib.error.HTTPError(url, resp.status_code, resp.reason_phrase, resp.headers, io.BytesIO(payload))
+
+        def lines():
+            for line in resp.iter_lines():
+                yield line.encode() + b"\n"
+
+        return HTTPResponse(resp.status_code, resp.headers, resp.read, lines, resp.close)
+
+
+def _tls_context() -> ssl.SSLContext:
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+def configure(settings: HTTPClientConfig) -> None:
+    """Apply pool settings. Clients built before this keep their old settings."""
+    global _settings
+    _settings = settings
+
+
+def client_for(url: str) -> HTTPClient:
+    """The shared HTTPClient for ``url``'s origin, created on first use."""
+    parts = urllib.parse.urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    with _registry_lock:
+        client = _clients.get(origin)
+        if client is None:
+            client = HTTPClient(
+                origin,
+                pool_size=_settings.pool_size,
+                connect_timeout=_settings.connect_timeout,
+                http2=_settings.http2,
+            )
+            _clients[origin] = client
+        return client
+
+
+def health() -> dict:
+    """Per-origin pool counters."""
+    with _registry_lock:
+        clients = list(_clients.values())
+    return {c.origin: c.health() for c in clients}
+
+
+def close_all() -> None:
+    with _registry_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
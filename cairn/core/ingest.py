@@ -1,13 +1,39 @@
-"""Smart ingestion pipeline: classify, chunk, dedup, and route content."""
+"""Smart ingestion pipeline: classify, chunk, dedup, and route content.
+
+Chunks are stored by a streaming pipeline with bounded queues between stages:
+
+  chunk + dedup (1 thread) -> embed (ingest_workers) -> insert (ingest_workers)
+
+The chunker works through the document a segment at a time, so embedding
+starts before the whole document is chunked. Each chunk's sha256 is checked
+against chunks already stored in the project; only new ones are embedded.
+A duplicate is linked to the memory already holding its content instead, so
+every chunk of the document still maps to a memory.
+While some batches are being inserted the next ones are being embedded.
+Each insert thread has its own connection, and each INSERT commits together
+with its ingestion_chunks rows and the progress counters in ingestion_log.
+
+ingestion_log gets its row when an ingest starts. An ingest that crashed or
+failed resumes when the same content is ingested again: stored chunks are
+skipped and its doc is reused. A Postgres advisory lock keeps two callers
+from working on the same content at once.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import psycopg
+
 from cairn.core.utils import extract_json, get_or_create_project
+from cairn.llm.cache import generate_checked, parses_as
 
 if TYPE_CHECKING:
     from cairn.config import Config
@@ -25,6 +51,20 @@ _ALLOWED_EXTENSIONS = frozenset({
 })
 
 
+# First key of the two-int advisory lock held while an ingest runs ("in")
+_LOCK_NAMESPACE = 0x696E
+
+# Content is handed to the chunker this many characters at a time
+SEGMENT_CHARS = 32_000
+
+
+class _Cancelled(Exception):
+    """Another pipeline stage failed; stop quietly."""
+
+
+_DONE = object()  # end-of-stream marker between stages
+
+
 class IngestPipeline:
     """Unified content ingestion: dedup, classify, chunk, store, log."""
 
@@ -43,6 +83,9 @@ class IngestPipeline:
         self.config = config
         self.chunk_size = config.ingest_chunk_size
         self.chunk_overlap = config.ingest_chunk_overlap
+        self.batch_size = max(1, config.ingest_batch_size)
+        self.workers = max(1, config.ingest_workers)
+        self.queue_depth = max(1, config.ingest_queue_depth)
         self._chunker = None  # lazy init
 
     @property
@@ -158,12 +201,22 @@ class IngestPipeline:
         url: str | None = None,
         memory_type: str | None = None,
         file_path: str | None = None,
+        enrich: bool | None = None,
+        on_progress: Callable[[dict], None] | None = None,
     ) -> dict:
         """Run the full pipeline. Returns result dict.
 
         If file_path is provided and content is empty, reads from local staging dir.
         If url is provided and content is empty, fetches and extracts from URL.
         If both url and content, stores content and attaches url as source.
+
+        enrich (default config.ingest_enrich) queues deferred LLM enrichment
+        for the stored chunks. on_progress is called after every stored batch
+        with chunks_done, chunks_skipped, chunk_count (None until chunking
+        has finished) and elapsed_s.
+
+        Returns status "in_progress" with the current progress if another
+        caller is already ingesting the same content.
         """
         # 0a. Local file read (before URL extraction)
         if file_path and not content:
@@ -198,45 +251,139 @@ class IngestPipeline:
                     "Read the file first and pass its contents as the content parameter."
                 )
 
-        # 1. Dedup
+        # 1. Dedup: finished ingests of the same content are duplicates,
+        # unfinished ones resume
         content_hash = hashlib.sha256(content.encode()).hexdigest()
         existing = self._check_dedup(content_hash)
-        if existing:
+        if existing and existing["status"] == "complete":
             return {"status": "duplicate", "existing": existing}
 
-        # 2. Classify
-        target_type = self._classify(content, hint)
+        # 2. Classify (a resumed ingest keeps its original decision)
+        if existing:
+            target_type = existing["target_type"]
+        else:
+            target_type = self._classify(content, hint)
+        ingestion_id = existing["id"] if existing else self._start_log(
+            source, project or "", content_hash, target_type,
+        )
+
+        lock = self._claim(ingestion_id)
+        if lock is None:
+            return {"status": "in_progress", "ingestion_id": ingestion_id, "progress": self.status(ingestion_id)}
+        try:
+            return self._run(
+                ingestion_id, content,
+                project=project, doc_type=doc_type, title=title, tags=tags,
+                session_name=session_name, memory_type=memory_type,
+                enrich=self.config.ingest_enrich if enrich is None else enrich,
+                on_progress=on_progress,
+            )
+        except Exception as e:
+            self._fail(ingestion_id, e)
+            raise
+        finally:
+            lock.close()
+
+    def status(self, ingestion_id: int) -> dict | None:
+        """Progress of an ingest: status, chunk counts, timestamps."""
+        row = self.db.execute_one(
+            """
+            SELECT id, source, content_hash, target_type, status, chunk_count,
+                   chunks_done, chunks_skipped, error, created_at, updated_at
+            FROM ingestion_log WHERE id = %s
+            """,
+            (ingestion_id,),
+        )
+        if not row:
+            return None
+        return {
+            **row,
+            "created_at": row["created_at"].isoformat() if row["created_at"] else None,
+            "updated_at": row["updated_at"].isoformat() if row["updated_at"] else None,
+        }
+
+    def _run(
+        self,
+        ingestion_id: int,
+        content: str,
+        *,
+        project: str | None,
+        doc_type: str | None,
+        title: str | None,
+        tags: list[str] | None,
+        session_name: str | None,
+        memory_type: str | None,
+        enrich: bool,
+        on_progress: Callable[[dict], None] | None,
+    ) -> dict:
+        """Store doc and chunks for a claimed ingestion_log row."""
+        row = self.db.execute_one(
+            "SELECT status, target_type, target_ids, chunks_done FROM ingestion_log WHERE id = %s",
+            (ingestion_id,),
+        )
+        assert row is not None
+        if row["status"] == "complete":
+            # Finished by another caller between our dedup check and the claim
+            self.db.release_if_held()
+            return {"status": "duplicate", "existing": self._check_dedup_by_id(ingestion_id)}
+        target_type = row["target_type"]
+        resumed = row["chunks_done"] > 0 or bool(row["target_ids"])
+        self.db.execute(
+            "UPDATE ingestion_log SET status = 'running', chunks_skipped = 0, error = NULL,"
+            " updated_at = NOW() WHERE id = %s",
+            (ingestion_id,),
+        )
+        self.db.commit()
+        if resumed:
+            logger.info("Resuming ingest %d (%d chunks already stored)", ingestion_id, row["chunks_done"])
 
-        # 3. Store doc (if doc or both)
+        # 3. Store doc (if doc or both); a resumed ingest reuses its doc
         doc_id = None
         if target_type in ("doc", "both"):
-            effective_doc_type = doc_type or "guide"
-            result = self.project_manager.create_doc(
-                project, effective_doc_type, content, title=title,
-            )
-            doc_id = result["id"]
+            if row["target_ids"]:
+                doc_id = row["target_ids"][0]
+            else:
+                effective_doc_type = doc_type or "guide"
+                result = self.project_manager.create_doc(
+                    project, effective_doc_type, content, title=title,
+                )
+                doc_id = result["id"]
+                self.db.execute(
+                    "UPDATE ingestion_log SET target_ids = %s, updated_at = NOW() WHERE id = %s",
+                    ([doc_id], ingestion_id),
+                )
+                self.db.commit()
 
         # 4. Chunk + store memories (if memory or both)
-        memory_ids = []
+        memory_ids: list[int] = []
         chunk_count = 0
+        skipped = 0
         if target_type in ("memory", "both"):
-            chunks = self._chunk(content)
-            chunk_count = len(chunks)
-            for _, chunk in enumerate(chunks):
-                mem = self.memory_store.store(
-                    content=chunk.text,
-                    project=project,
-                    memory_type=memory_type or "note",
-                    tags=tags,
-                    session_name=session_name,
-                    source_doc_id=doc_id,
-                    enrich=False,
-                )
-                memory_ids.append(mem["id"])
+            memory_ids, chunk_count, skipped = self._store_chunks(
+                ingestion_id, content,
+                {
+                    "project": project,
+                    "memory_type": memory_type or "note",
+                    "tags": tags,
+                    "session_name": session_name,
+                    "source_doc_id": doc_id,
+                },
+                enrich=enrich,
+                on_progress=on_progress,
+            )
 
         # 5. Log
         target_ids = ([doc_id] if doc_id else []) + memory_ids
-        self._log(source, project or "", content_hash, target_type, target_ids, chunk_count)
+        self.db.execute(
+            """
+            UPDATE ingestion_log
+            SET status = 'complete', target_ids = %s, chunk_count = %s,
+                chunks_done = %s, chunks_skipped = %s, updated_at = NOW()
+            WHERE id = %s
+            """,
+            (target_ids, chunk_count, len(memory_ids), skipped, ingestion_id),
+        )
+        self.db.commit()
 
         return {
             "status": "ingested",
@@ -244,8 +391,285 @@ class IngestPipeline:
             "doc_id": doc_id,
             "memory_ids": memory_ids,
             "chunk_count": chunk_count,
+            "chunks_skipped": skipped,
+            "ingestion_id": ingestion_id,
+            "resumed": resumed,
         }
 
+    def _store_chunks(
+        self,
+        ingestion_id: int,
+        content: str,
+        fields: dict,
+        *,
+        enrich: bool,
+        on_progress: Callable[[dict], None] | None,
+    ) -> tuple[list[int], int, int]:
+        """Run chunk -> dedup -> embed -> insert over bounded queues.
+
+        Returns (memory ids in chunk order, chunk count, chunks skipped as
+        duplicates). Skipped chunks are listed with the memory that already
+        held their content, so an id can appear more than once.
+        """
+        from cairn.core.user import current_user
+
+        project = fields["project"]
+        project_ids = {project: get_or_create_project(self.db, project)}
+        project_id = project_ids[project]
+        user_ctx = current_user()
+        owner_user_id = user_ctx.user_id if user_ctx else None
+        # Chunks this ingest stored before it was interrupted
+        done = {
+            r["seq"]: r["content_hash"]
+            for r in self.db.execute(
+                "SELECT seq, content_hash FROM ingestion_chunks WHERE ingestion_id = %s",
+                (ingestion_id,),
+            )
+        }
+        self.db.commit()
+
+        stop = threading.Event()
+        errors: list[BaseException] = []
+        embed_q: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        insert_q: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        total_chunks: list[int] = []
+        duplicates: list[tuple[int, str, str]] = []
+
+        def fail(e: BaseException) -> None:
+            errors.append(e)
+            stop.set()
+
+        def put(q: queue.Queue, item) -> None:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            raise _Cancelled
+
+        def get(q: queue.Queue):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            raise _Cancelled
+
+        def chunk_stage() -> None:
+            seen = set(done.values())
+            pending: list[tuple[int, str, str]] = []
+            seq = -1
+            try:
+                for seq, text in enumerate(self._iter_chunks(content)):
+                    if seq in done:
+                        continue
+                    pending.append((seq, text, hashlib.sha256(text.encode()).hexdigest()))
+                    if len(pending) >= self.batch_size:
+                        kept, dropped = self._dedup_chunks(pending, project_id, seen)
+                        duplicates.extend(dropped)
+                        put(embed_q, (kept, len(dropped)))
+                        pending = []
+                if pending:
+                    kept, dropped = self._dedup_chunks(pending, project_id, seen)
+                    duplicates.extend(dropped)
+                    put(embed_q, (kept, len(dropped)))
+                total_chunks.append(seq + 1)
+                for _ in range(self.workers):
+                    put(embed_q, _DONE)
+            except _Cancelled:
+                pass
+            except BaseException as e:
+                fail(e)
+            finally:
+                self.db.release_if_held()
+
+        def embed_stage() -> None:
+            try:
+                while (item := get(embed_q)) is not _DONE:
+                    kept, skipped = item
+                    prepared = None
+                    if kept:
+                        prepared = self.memory_store.prepare_batch(
+                            [{**fields, "content": text} for _, text, _ in kept],
+                            project_ids, enrich=enrich, owner_user_id=owner_user_id,
+                        )
+                    put(insert_q, (kept, skipped, prepared))
+                put(insert_q, _DONE)
+            except _Cancelled:
+                pass
+            except BaseException as e:
+                fail(e)
+
+        started = time.monotonic()
+        counts = {"stored": len(done), "skipped": 0}
+        counts_lock = threading.Lock()
+
+        def insert_stage() -> None:
+            try:
+                while (item := get(insert_q)) is not _DONE:
+                    kept, skipped, prepared = item
+
+                    def record(rows: list[dict], kept=kept, skipped=skipped) -> None:
+                        self._record_chunks(ingestion_id, project_id, kept, [r["id"] for r in rows], skipped)
+
+                    if prepared is not None:
+                        self.memory_store.insert_batch(prepared, before_commit=record)
+                    else:
+                        record([])
+                        self.db.commit()
+                    with counts_lock:
+                        counts["stored"] += len(kept)
+                        counts["skipped"] += skipped
+                        if on_progress is not None:
+                            on_progress({
+                                "ingestion_id": ingestion_id,
+                                "chunks_done": counts["stored"],
+                                "chunks_skipped": counts["skipped"],
+                                "chunk_count": total_chunks[0] if total_chunks else None,
+                                "elapsed_s": round(time.monotonic() - started, 2),
+                            })
+            except _Cancelled:
+                pass
+            except BaseException as e:
+                fail(e)
+            finally:
+                self.db.release_if_held()
+
+        # One _DONE per embed worker reaches insert_q; each writer exits on
+        # one, and FIFO order means the last one comes after every batch
+        stages = [(chunk_stage, "chunk", 1), (embed_stage, "embed", self.workers), (insert_stage, "insert", self.workers)]
+        threads = [
+            threading.Thread(target=target, name=f"ingest-{ingestion_id}-{name}-{i}", daemon=True)
+            for target, name, n in stages
+            for i in range(n)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if errors:
+            raise errors[0]
+        self._link_duplicates(ingestion_id, project_id, duplicates, fields.get("source_doc_id"))
+
+        elapsed = time.monotonic() - started
+        logger.info(
+            "Ingest %d: %d chunks (%d stored now, %d duplicates) in %.1fs",
+            ingestion_id, total_chunks[0], counts["stored"] - len(done), counts["skipped"], elapsed,
+        )
+        memory_ids = [
+            r["memory_id"]
+            for r in self.db.execute(
+                "SELECT memory_id FROM ingestion_chunks WHERE ingestion_id = %s ORDER BY seq",
+                (ingestion_id,),
+            )
+        ]
+        return memory_ids, total_chunks[0], counts["skipped"]
+
+    def _dedup_chunks(
+        self, chunks: list[tuple[int, str, str]], project_id: int, seen: set[str],
+    ) -> tuple[list[tuple[int, str, str]], list[tuple[int, str, str]]]:
+        """Split off chunks already stored in the project or earlier in this document.
+
+        Returns (chunks to store, chunks dropped). ``seen`` collects the
+        hashes kept so far.
+        """
+        hashes = list({h for _, _, h in chunks if h not in seen})
+        stored = set()
+        if hashes:
+            stored = {
+                r["content_hash"]
+                for r in self.db.execute(
+                    """
+                    SELECT DISTINCT ic.content_hash
+                    FROM ingestion_chunks ic
+                    JOIN memories m ON m.id = ic.memory_id AND m.is_active = true
+                    WHERE ic.project_id = %s AND ic.content_hash = ANY(%s)
+                    """,
+                    (project_id, hashes),
+                )
+            }
+            self.db.release_if_held()
+        kept, dropped = [], []
+        for chunk in chunks:
+            h = chunk[2]
+            if h in seen or h in stored:
+                dropped.append(chunk)
+                continue
+            seen.add(h)
+            kept.append(chunk)
+        return kept, dropped
+
+    def _link_duplicates(
+        self,
+        ingestion_id: int,
+        project_id: int,
+        chunks: list[tuple[int, str, str]],
+        doc_id: int | None,
+    ) -> None:
+        """Record skipped chunks against the memories already holding their content.
+
+        A chunk repeated within the document maps to this ingest's own memory,
+        one stored by an earlier ingest to the oldest active memory with that
+        hash. Those memories take doc_id as source_doc_id unless they already
+        belong to a document; a memory has one source doc, so a chunk shared
+        with another document stays linked to that one.
+        """
+        if not chunks:
+            return
+        rows = self.db.execute(
+            """
+            INSERT INTO ingestion_chunks (ingestion_id, seq, project_id, content_hash, memory_id)
+            SELECT %s, t.seq, %s, t.hash, src.memory_id
+            FROM unnest(%s::int[], %s::text[]) AS t(seq, hash)
+            CROSS JOIN LATERAL (
+                SELECT ic.memory_id
+                FROM ingestion_chunks ic
+                JOIN memories m ON m.id = ic.memory_id AND m.is_active = true
+                WHERE ic.project_id = %s AND ic.content_hash = t.hash
+                ORDER BY ic.ingestion_id = %s DESC, ic.memory_id
+                LIMIT 1
+            ) src
+            ON CONFLICT (ingestion_id, seq) DO NOTHING
+            RETURNING memory_id
+            """,
+            (ingestion_id, project_id, [c[0] for c in chunks], [c[2] for c in chunks],
+             project_id, ingestion_id),
+        )
+        if doc_id is not None and rows:
+            self.db.execute(
+                "UPDATE memories SET source_doc_id = %s WHERE id = ANY(%s) AND source_doc_id IS NULL",
+                (doc_id, list({r["memory_id"] for r in rows})),
+            )
+        self.db.commit()
+
+    def _record_chunks(
+        self,
+        ingestion_id: int,
+        project_id: int,
+        chunks: list[tuple[int, str, str]],
+        memory_ids: list[int],
+        skipped: int,
+    ) -> None:
+        """Chunk rows and progress counters, in the caller's transaction."""
+        if chunks:
+            self.db.execute(
+                """
+                INSERT INTO ingestion_chunks (ingestion_id, seq, project_id, content_hash, memory_id)
+                SELECT %s, t.seq, %s, t.hash, t.memory_id
+                FROM unnest(%s::int[], %s::text[], %s::int[]) AS t(seq, hash, memory_id)
+                """,
+                (ingestion_id, project_id, [c[0] for c in chunks], [c[2] for c in chunks], memory_ids),
+            )
+        self.db.execute(
+            """
+            UPDATE ingestion_log
+            SET chunks_done = chunks_done + %s, chunks_skipped = chunks_skipped + %s, updated_at = NOW()
+            WHERE id = %s
+            """,
+            (len(chunks), skipped, ingestion_id),
+        )
+
     def _classify(self, content: str, hint: str) -> str:
         """Determine target type: doc, memory, or both."""
         if hint != "auto":
@@ -256,7 +680,7 @@ class IngestPipeline:
         try:
             from cairn.llm.prompts import build_classification_messages
             messages = build_classification_messages(content[:3000])
-            raw = self.llm.generate(messages, max_tokens=64)
+            raw = generate_checked(self.llm, messages, 64, parses_as("object"))
             parsed = extract_json(raw, json_type="object")
             if isinstance(parsed, dict) and parsed.get("type") in ("doc", "memory", "both"):
                 return parsed["type"]
@@ -265,50 +689,106 @@ class IngestPipeline:
 
         return "memory"
 
-    def _chunk(self, content: str) -> list:
-        """Split content into chunks. Returns single-element list if small."""
+    def _iter_chunks(self, content: str) -> Iterator[str]:
+        """Chunk texts in document order. Small content is a single chunk."""
         if len(content) < 2000:
-            from dataclasses import dataclass
+            yield content
+            return
+        for segment in self._segments(content):
+            for chunk in self.chunker(segment):
+                yield chunk.text
 
-            @dataclass
-            class SingleChunk:
-                text: str
-
-            return [SingleChunk(text=content)]
-
-        return self.chunker(content)
+    @staticmethod
+    def _segments(content: str, size: int = SEGMENT_CHARS) -> Iterator[str]:
+        """Split content at paragraph breaks into pieces of about ``size`` chars."""
+        start = 0
+        while len(content) - start > size:
+            cut = content.rfind("\n\n", start + size // 2, start + size)
+            if cut == -1:
+                cut = content.find("\n\n", start + size)
+                if cut == -1:
+                    break
+            yield content[start:cut + 2]
+            start = cut + 2
+        if start < len(content):
+            yield content[start:]
 
     def _check_dedup(self, content_hash: str) -> dict | None:
-        """Check if content has already been ingested."""
+        """Check if content has already been ingested (or started to be)."""
         row = self.db.execute_one(
-            "SELECT id, source, target_type, target_ids, created_at FROM ingestion_log WHERE content_hash = %s",
+            "SELECT id, source, target_type, status, created_at FROM ingestion_log WHERE content_hash = %s",
             (content_hash,),
         )
+        return self._dedup_result(row)
+
+    def _check_dedup_by_id(self, ingestion_id: int) -> dict | None:
+        row = self.db.execute_one(
+            "SELECT id, source, target_type, status, created_at FROM ingestion_log WHERE id = %s",
+            (ingestion_id,),
+        )
+        return self._dedup_result(row)
+
+    @staticmethod
+    def _dedup_result(row: dict | None) -> dict | None:
         if row:
             return {
                 "id": row["id"],
                 "source": row["source"],
                 "target_type": row["target_type"],
+                "status": row["status"],
                 "created_at": row["created_at"].isoformat(),
             }
         return None
 
-    def _log(
-        self,
-        source: str | None,
-        project: str,
-        content_hash: str,
-        target_type: str,
-        target_ids: list[int],
-        chunk_count: int,
-    ) -> None:
-        """Record ingestion in the log for dedup and audit."""
+    def _start_log(self, source: str | None, project: str, content_hash: str, target_type: str) -> int:
+        """Insert the 'running' log row for a new ingest. Returns its id."""
         project_id = get_or_create_project(self.db, project)
-        self.db.execute(
+        row = self.db.execute_one(
             """
-            INSERT INTO ingestion_log (source, project_id, content_hash, target_type, target_ids, chunk_count)
-            VALUES (%s, %s, %s, %s, %s, %s)
+            INSERT INTO ingestion_log (source, project_id, content_hash, target_type, status, chunk_count)
+            VALUES (%s, %s, %s, %s, 'running', NULL)
+            ON CONFLICT (content_hash) DO NOTHING
+            RETURNING id
             """,
-            (source, project_id, content_hash, target_type, target_ids, chunk_count),
+            (source, project_id, content_hash, target_type),
         )
+        if row is None:
+            # Another caller started the same content first
+            row = self.db.execute_one(
+                "SELECT id FROM ingestion_log WHERE content_hash = %s", (content_hash,),
+            )
         self.db.commit()
+        assert row is not None
+        return row["id"]
+
+    def _claim(self, ingestion_id: int) -> psycopg.Connection | None:
+        """Take the ingest's advisory lock on a dedicated connection.
+
+        Closing the connection releases it, and so does the process dying,
+        which is what lets a crashed ingest be resumed. Returns None if
+        another caller holds it.
+        """
+        conn = psycopg.connect(self.db.config.dsn, autocommit=True)
+        try:
+            row = conn.execute(
+                "SELECT pg_try_advisory_lock(%s, %s)", (_LOCK_NAMESPACE, ingestion_id),
+            ).fetchone()
+        except Exception:
+            conn.close()
+            raise
+        if not row or not row[0]:
+            conn.close()
+            return None
+        return conn
+
+    def _fail(self, ingestion_id: int, error: Exception) -> None:
+        """Mark the ingest failed; ingesting the same content again resumes it."""
+        try:
+            self.db.release_if_held()
+            self.db.execute(
+                "UPDATE ingestion_log SET status = 'failed', error = %s, updated_at = NOW() WHERE id = %s",
+                (str(error)[:1000], ingestion_id),
+            )
+            self.db.commit()
+        except Exception:
+            logger.warning("Failed to mark ingest %d as failed", ingestion_id, exc_info=True)
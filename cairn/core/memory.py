@@ -4,15 +4,27 @@ from __future__ import annotations
 
 import logging
 import math
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from cairn.core.analytics import track_operation
 from cairn.core.constants import (
     AUTO_SUMMARIZE_EMBED_THRESHOLD,
     CONTRADICTION_ESCALATION_THRESHOLD,
+    ENRICHMENT_CLAIM_LEASE_SECONDS,
+    ENRICHMENT_MODES,
     EPHEMERAL_MEMORY_TYPES,
     GRADUATION_TYPE_MAP,
+    LONG_CONTENT_CHUNK_CHARS,
+    LONG_CONTENT_CHUNK_OVERLAP,
+    LONG_CONTENT_HEAD_CHARS,
+    LONG_CONTENT_MAX_CHUNKS,
+    LONG_CONTENT_MODES,
+    STORE_MANY_BATCH_SIZE,
     WM_DEFAULT_SALIENCE,
     WM_SALIENCE_BOOST_FLOOR,
     WM_SALIENCE_DECAY_RATE,
@@ -21,12 +33,13 @@ from cairn.core.constants import (
 from cairn.core.utils import extract_json, get_or_create_project
 from cairn.embedding.interface import EmbeddingInterface
 from cairn.storage.database import Database
+from cairn.storage.vector import to_vector
 
 if TYPE_CHECKING:
     from cairn.config import LLMCapabilities
     from cairn.core.enrichment import Enricher
     from cairn.core.event_bus import EventBus
-    from cairn.core.extraction import KnowledgeExtractor
+    from cairn.core.extraction import ExtractionResult, KnowledgeExtractor
     from cairn.llm.interface import LLMInterface
 
 logger = logging.getLogger(__name__)
@@ -42,6 +55,8 @@ class MemoryStore:
         capabilities: LLMCapabilities | None = None,
         knowledge_extractor: KnowledgeExtractor | None = None,
         event_bus: EventBus | None = None,
+        enrichment_mode: str = "inline",
+        long_content: str = "summary",
     ):
         self.db = db
         self.embedding = embedding
@@ -50,6 +65,20 @@ class MemoryStore:
         self.capabilities = capabilities
         self.knowledge_extractor = knowledge_extractor
         self.event_bus = event_bus
+        if enrichment_mode not in ENRICHMENT_MODES:
+            logger.warning(
+                "Unknown enrichment mode %r (valid: %s) — using inline",
+                enrichment_mode, ", ".join(ENRICHMENT_MODES),
+            )
+            enrichment_mode = "inline"
+        self.enrichment_mode = enrichment_mode
+        if long_content not in LONG_CONTENT_MODES:
+            logger.warning(
+                "Unknown long-content mode %r (valid: %s) — using summary",
+                long_content, ", ".join(LONG_CONTENT_MODES),
+            )
+            long_content = "summary"
+        self.long_content = long_content
 
     def _publish(
         self, event_type: str, memory_id: int | None = None,
@@ -101,52 +130,25 @@ class MemoryStore:
         Args:
             enrich: When False, skips LLM enrichment and relationship extraction.
                     Embedding is always generated. Use for bulk/chunk ingestion.
+                    Under the "deferred" enrichment mode the LLM work runs in
+                    MemoryEnrichmentListener after the commit, and the memory
+                    is returned with enrichment_status "pending".
 
         Returns the stored memory dict with ID.
         """
         project_id = get_or_create_project(self.db, project)
 
-        # Generate embedding (always — required for search)
-        vector = self.embedding.embed(content)
-
-        # --- Knowledge Extraction path (combined extraction + enrichment) ---
-        use_extraction = (
-            enrich
-            and self.knowledge_extractor is not None
-            and self.capabilities is not None
-            and self.capabilities.knowledge_extraction
-        )
+        # --- Enrichment (skip for chunks/bulk; deferred leaves it to the listener) ---
+        deferred = enrich and self._defers_enrichment(project_id)
         extraction_result = None
-        if use_extraction:
-            assert self.knowledge_extractor is not None
-            try:
-                # Fetch known entities for canonicalization
-                known_entities = None
-                try:
-                    known_entities = self.knowledge_extractor.graph.get_known_entities(
-                        project_id, limit=200,
-                    )
-                except Exception:
-                    logger.debug("Failed to fetch known entities for canonicalization", exc_info=True)
-
-                extraction_result = self.knowledge_extractor.extract(
-                    content, author=author, known_entities=known_entities,
-                )
-            except Exception:
-                logger.warning("Knowledge extraction failed, falling back to enrichment", exc_info=True)
-
-        # --- Enrichment (skip for chunks/bulk, or when extraction succeeded) ---
         enrichment: dict = {}
         enrichment_status = "none"  # default for enrich=False
-        if extraction_result is not None:
-            assert self.knowledge_extractor is not None
-            enrichment = self.knowledge_extractor.extract_enrichment_fields(extraction_result)
-            enrichment_status = "complete"
-        elif enrich and self.enricher:
-            enrichment = self.enricher.enrich(content)
-            enrichment_status = enrichment.pop("_status", "pending")
+        if deferred:
+            enrichment_status = "pending"
         elif enrich:
-            enrichment_status = "pending"  # enricher not available
+            extraction_result, enrichment, enrichment_status = self._enrich_content(
+                content, project_id, author,
+            )
 
         # Override logic: caller-provided values win
         # Tags: caller tags stay in `tags`, LLM tags go to `auto_tags`
@@ -163,24 +165,17 @@ class MemoryStore:
         if memory_type == "note" and "memory_type" in enrichment:
             final_type = enrichment["memory_type"]
 
-        # Summary: from LLM if enriched, otherwise first 200 chars
-        summary = enrichment.get("summary")
-        if not enrich and not summary:
-            summary = content[:200].strip()
+        # Summary: from LLM if enriched, otherwise a slice of the content
+        summary = enrichment.get("summary") or _default_summary(content, enrich)
 
         # Entities: from LLM enrichment
         entities = enrichment.get("entities", [])
 
-        # Content size management: re-embed using summary for large content
+        # Generate embedding (always — required for search). The target is
+        # chosen first so large content costs one model call, not two
+        vector, chunks = self._embed(self._embedding_plan(content, enrichment.get("summary")))
         if len(content) > AUTO_SUMMARIZE_EMBED_THRESHOLD:
-            if summary:
-                vector = self.embedding.embed(summary)
-                logger.info("Large content (%d chars) — embedded summary instead", len(content))
-            else:
-                # No summary available (enrich=False, no enricher) — use truncated content
-                summary = content[:500].strip() + "..."
-                vector = self.embedding.embed(content[:2000])
-                logger.info("Large content (%d chars) — embedded truncated content", len(content))
+            logger.info("Large content (%d chars) — embedded as %s", len(content), self.long_content)
 
         # Auto-salience for ephemeral types
         if final_type in EPHEMERAL_MEMORY_TYPES and salience is None:
@@ -236,7 +231,7 @@ class MemoryStore:
                 final_importance,
                 project_id,
                 session_name,
-                str(vector),
+                to_vector(vector),
                 caller_tags,
                 auto_tags,
                 summary,
@@ -257,6 +252,7 @@ class MemoryStore:
 
         assert row is not None
         memory_id = row["id"]
+        self._insert_chunks([(memory_id, chunks)])
 
         # Create caller-specified relationships (part of core write)
         if related_ids:
@@ -286,6 +282,7 @@ class MemoryStore:
             memory_type=final_type,
             enrich=enrich,
             **({"extraction_result": extraction_result.model_dump()} if extraction_result else {}),
+            **({"deferred": True} if deferred else {}),
         )
 
         # Phase 2: best-effort enrichment
@@ -324,10 +321,217 @@ class MemoryStore:
         if salience is not None:
             result["salience"] = salience
             result["pinned"] = pinned
+        if deferred:
+            result["enrichment_status"] = enrichment_status
         if enrichment_result.get("graph_stats"):
             result["graph"] = enrichment_result["graph_stats"]
         return result
 
+    @track_operation("store_many")
+    def store_many(self, memories: list[dict], enrich: bool = True) -> list[dict]:
+        """Store many memories with batched embedding, INSERT and events.
+
+        Each item takes store()'s keyword arguments; content and project are
+        required. Every STORE_MANY_BATCH_SIZE memories cost one embed_batch,
+        one multi-row INSERT, one commit and one multi-row event insert.
+
+        Nothing is enriched inline. With enrich=True memories are stored
+        enrichment_status 'pending' and their memory.created events are
+        marked deferred, so MemoryEnrichmentListener runs LLM enrichment and
+        Phase 2 in the background dispatcher. Without an event bus both run
+        inline per memory after the commit, as store() does without one.
+
+        Returns one {id, project, memory_type, importance, created_at} dict
+        per memory, in input order.
+        """
+        from cairn.core.user import current_user as _current_user
+
+        _user_ctx = _current_user()
+        owner_user_id = _user_ctx.user_id if _user_ctx else None
+        project_ids: dict[str, int] = {}
+        results: list[dict] = []
+
+        for start in range(0, len(memories), STORE_MANY_BATCH_SIZE):
+            batch = memories[start:start + STORE_MANY_BATCH_SIZE]
+            for item in batch:
+                if item["project"] not in project_ids:
+                    project_ids[item["project"]] = get_or_create_project(self.db, item["project"])
+            prepared = self.prepare_batch(batch, project_ids, enrich=enrich, owner_user_id=owner_user_id)
+            results += self.insert_batch(prepared)
+
+        return results
+
+    def prepare_batch(
+        self,
+        memories: list[dict],
+        project_ids: dict[str, int],
+        *,
+        enrich: bool = True,
+        owner_user_id: int | None = None,
+    ) -> PreparedBatch:
+        """First half of store_many for one batch: build rows and embed them.
+
+        Makes no database calls, so it can run on a worker thread while
+        another batch is being inserted. ``project_ids`` must already map
+        every item's project; ``owner_user_id`` is passed in because the
+        current user is not visible from other threads.
+        """
+        import json as _json
+
+        rows: list[dict] = []
+        plans: list[_EmbeddingPlan] = []
+        for item in memories:
+            content = item["content"]
+            project = item["project"]
+            memory_type = item.get("memory_type") or "note"
+            salience = item.get("salience")
+            if memory_type in EPHEMERAL_MEMORY_TYPES and salience is None:
+                salience = WM_DEFAULT_SALIENCE.get(memory_type, 0.6)
+            if salience is not None:
+                salience = max(0.0, min(1.0, salience))
+            # Same summary and embedding plan store() uses when nothing is
+            # enriched inline (no summary yet)
+            summary = _default_summary(content, enrich)
+            plans.append(self._embedding_plan(content, None))
+            rows.append({
+                "content": content,
+                "project": project,
+                "project_id": project_ids[project],
+                "memory_type": memory_type,
+                "importance": item.get("importance", 0.5),
+                "tags": item.get("tags") or [],
+                "session_name": item.get("session_name"),
+                "summary": summary,
+                "related_files": item.get("related_files") or [],
+                "related_ids": item.get("related_ids") or [],
+                "source_doc_id": item.get("source_doc_id"),
+                "file_hashes": _json.dumps(item["file_hashes"]) if item.get("file_hashes") else "{}",
+                "author": item.get("author"),
+                "event_at": _parse_timestamp(item.get("event_at")),
+                "valid_until": _parse_timestamp(item.get("valid_until")),
+                "salience": salience,
+                "pinned": item.get("pinned", False),
+            })
+
+        all_vectors = self.embedding.embed_batch([t for plan in plans for t in plan.texts])
+        vectors: list[list[float]] = []
+        chunks: list[list[tuple[int, int, list[float]]]] = []
+        offset = 0
+        for plan in plans:
+            vector, plan_chunks = plan.resolve(all_vectors[offset:offset + len(plan.texts)])
+            offset += len(plan.texts)
+            vectors.append(vector)
+            chunks.append(plan_chunks)
+        return PreparedBatch(rows, vectors, chunks, enrich, owner_user_id)
+
+    def insert_batch(
+        self,
+        prepared: PreparedBatch,
+        before_commit: Callable[[list[dict]], None] | None = None,
+    ) -> list[dict]:
+        """Second half of store_many: one INSERT, one commit, then events.
+
+        ``before_commit`` gets the inserted {id, created_at} rows and may
+        write more in the same transaction (ingest records its progress
+        there, so a batch and its bookkeeping land together or not at all).
+        """
+        rows, vectors, chunks = prepared.rows, prepared.vectors, prepared.chunks
+        enrich = prepared.enrich
+        enrichment_status = "pending" if enrich else "none"
+
+        values = ", ".join(
+            ["(%s, %s, %s, %s, %s, %s::vector, %s, %s, %s, %s, %s::jsonb, %s, %s, %s, %s, %s, %s, %s)"]
+            * len(rows)
+        )
+        params: list = []
+        for r, vector in zip(rows, vectors, strict=True):
+            params += [
+                r["content"], r["memory_type"], r["importance"], r["project_id"], r["session_name"],
+                to_vector(vector), r["tags"], r["summary"], r["related_files"], r["source_doc_id"],
+                r["file_hashes"], r["author"], enrichment_status, prepared.owner_user_id,
+                r["event_at"], r["valid_until"], r["salience"], r["pinned"],
+            ]
+        inserted = self.db.execute(
+            f"""
+            INSERT INTO memories
+                (content, memory_type, importance, project_id, session_name,
+                 embedding, tags, summary, related_files, source_doc_id,
+                 file_hashes, author, enrichment_status, owner_user_id,
+                 event_at, valid_until, salience, pinned)
+            VALUES {values}
+            RETURNING id, created_at
+            """,
+            params,
+        )
+
+        self._insert_chunks([(row["id"], c) for row, c in zip(inserted, chunks, strict=True)])
+
+        rel_sources: list[int] = []
+        rel_targets: list[int] = []
+        for r, row in zip(rows, inserted, strict=True):
+            for related_id in r["related_ids"]:
+                rel_sources.append(row["id"])
+                rel_targets.append(related_id)
+        if rel_sources:
+            self.db.execute(
+                """
+                INSERT INTO memory_relations (source_id, target_id)
+                SELECT * FROM unnest(%s::int[], %s::int[])
+                ON CONFLICT DO NOTHING
+                """,
+                (rel_sources, rel_targets),
+            )
+        if before_commit is not None:
+            before_commit(inserted)
+        self.db.commit()
+        logger.info("Stored %d memories in one batch (enrich=%s)", len(rows), enrich)
+
+        if self.event_bus:
+            try:
+                self.event_bus.emit_many("memory.created", [
+                    {
+                        "session_name": r["session_name"] or None,
+                        "project": r["project"],
+                        "payload": {"memory_id": row["id"], "project_id": r["project_id"],
+                                    "memory_type": r["memory_type"], "enrich": enrich,
+                                    **({"deferred": True} if enrich else {})},
+                    }
+                    for r, row in zip(rows, inserted, strict=True)
+                ])
+            except Exception:
+                logger.warning("Failed to emit memory.created for %d memories", len(rows), exc_info=True)
+        elif enrich:
+            # No listener will pick up the 'pending' rows: enrich them here
+            for r, row, vector in zip(rows, inserted, vectors, strict=True):
+                try:
+                    applied = self.enrich_deferred(row["id"])
+                except Exception:
+                    logger.warning("Inline enrichment failed for memory #%d", row["id"], exc_info=True)
+                    applied = None
+                self._post_store_enrichment(
+                    memory_id=row["id"],
+                    project_id=r["project_id"],
+                    extraction_result=applied["extraction_result"] if applied else None,
+                    enrich=True,
+                    content=r["content"],
+                    vector=(applied["vector"] or vector) if applied else vector,
+                    session_name=r["session_name"],
+                    entities=applied["entities"] if applied else [],
+                    final_type=applied["memory_type"] if applied else r["memory_type"],
+                    project=r["project"],
+                )
+
+        return [
+            {
+                "id": row["id"],
+                "project": r["project"],
+                "memory_type": r["memory_type"],
+                "importance": r["importance"],
+                "created_at": row["created_at"].isoformat(),
+            }
+            for r, row in zip(rows, inserted, strict=True)
+        ]
+
     def re_enrich(self, memory_id: int) -> dict:
         """Re-run enrichment for a specific memory.
 
@@ -351,7 +555,8 @@ class MemoryStore:
         if not self.enricher:
             return {"error": "Enricher not available"}
 
-        enrichment = self.enricher.enrich(row["content"])
+        # An explicit retry must not replay a cached (possibly bad) response
+        enrichment = self.enricher.enrich(row["content"], fresh=True)
         enrichment_status = enrichment.pop("_status", "failed")
 
         updates = ["enrichment_status = %s"]
@@ -394,6 +599,219 @@ class MemoryStore:
             "auto_tags": auto_tags,
         }
 
+    def _embedding_plan(self, content: str, summary: str | None) -> _EmbeddingPlan:
+        """Choose what to embed for a memory, before any model call.
+
+        Content up to AUTO_SUMMARIZE_EMBED_THRESHOLD is embedded as is.
+        Longer content follows ``long_content``: its summary (or head when
+        there is none yet), the mean of its chunks, or the summary plus one
+        vector per chunk.
+        """
+        if len(content) <= AUTO_SUMMARIZE_EMBED_THRESHOLD:
+            return _EmbeddingPlan([content])
+        target = summary or content[:LONG_CONTENT_HEAD_CHARS]
+        if self.long_content == "summary":
+            return _EmbeddingPlan([target])
+        spans = _chunk_spans(content)
+        texts = [content[start:end] for start, end in spans]
+        if self.long_content == "mean":
+            return _EmbeddingPlan(texts, pooled=True)
+        return _EmbeddingPlan([target] + texts, spans=spans)
+
+    def _embed(self, plan: _EmbeddingPlan) -> tuple[list[float], list[tuple[int, int, list[float]]]]:
+        """Embed a plan's texts in one model call."""
+        if len(plan.texts) == 1:
+            return plan.resolve([self.embedding.embed(plan.texts[0])])
+        return plan.resolve(self.embedding.embed_batch(plan.texts))
+
+    def _insert_chunks(self, memories: list[tuple[int, list[tuple[int, int, list[float]]]]]) -> None:
+        """Write (memory_id, chunks) pairs to memory_chunks in one INSERT."""
+        rows = [
+            (memory_id, i, start, end, vector)
+            for memory_id, chunks in memories
+            for i, (start, end, vector) in enumerate(chunks)
+        ]
+        if not rows:
+            return
+        params: list = []
+        for memory_id, i, start, end, vector in rows:
+            params += [memory_id, i, start, end, to_vector(vector)]
+        self.db.execute(
+            f"""
+            INSERT INTO memory_chunks (memory_id, chunk_index, start_char, end_char, embedding)
+            VALUES {", ".join(["(%s, %s, %s, %s, %s::vector)"] * len(rows))}
+            ON CONFLICT (memory_id, chunk_index) DO UPDATE SET
+                start_char = EXCLUDED.start_char, end_char = EXCLUDED.end_char,
+                embedding = EXCLUDED.embedding
+            """,
+            params,
+        )
+
+    def _defers_enrichment(self, project_id: int) -> bool:
+        """Whether store() leaves LLM enrichment to MemoryEnrichmentListener.
+
+        Needs an event bus to carry the work and an LLM path to defer. The
+        project's enrichment_mode wins over the server-wide default.
+        """
+        if self.event_bus is None:
+            return False
+        if self.enricher is None and not self._extraction_enabled():
+            return False
+        row = self.db.execute_one(
+            "SELECT enrichment_mode FROM projects WHERE id = %s", (project_id,),
+        )
+        mode = (row or {}).get("enrichment_mode") or self.enrichment_mode
+        return mode == "deferred"
+
+    def _extraction_enabled(self) -> bool:
+        return (
+            self.knowledge_extractor is not None
+            and self.capabilities is not None
+            and self.capabilities.knowledge_extraction
+        )
+
+    def _enrich_content(
+        self, content: str, project_id: int, author: str | None,
+    ) -> tuple[ExtractionResult | None, dict, str]:
+        """Run knowledge extraction, falling back to the enricher.
+
+        Returns (extraction_result, enrichment fields, enrichment_status).
+        """
+        extraction_result = None
+        if self._extraction_enabled():
+            assert self.knowledge_extractor is not None
+            try:
+                # Fetch known entities for canonicalization
+                known_entities = None
+                try:
+                    known_entities = self.knowledge_extractor.graph.get_known_entities(
+                        project_id, limit=200,
+                    )
+                except Exception:
+                    logger.debug("Failed to fetch known entities for canonicalization", exc_info=True)
+
+                extraction_result = self.knowledge_extractor.extract(
+                    content, author=author, known_entities=known_entities,
+                )
+            except Exception:
+                logger.warning("Knowledge extraction failed, falling back to enrichment", exc_info=True)
+
+        if extraction_result is not None:
+            assert self.knowledge_extractor is not None
+            return (
+                extraction_result,
+                self.knowledge_extractor.extract_enrichment_fields(extraction_result),
+                "complete",
+            )
+        if self.enricher:
+            enrichment = self.enricher.enrich(content)
+            return None, enrichment, enrichment.pop("_status", "pending")
+        return None, {}, "pending"  # enricher not available
+
+    def enrich_deferred(self, memory_id: int) -> dict | None:
+        """Run the LLM enrichment store() deferred and apply it to the memory.
+
+        Applies the same rules store() does inline: enrichment fills
+        type/importance only where the caller left the defaults, adds
+        auto_tags, summary and entities, and large content is re-embedded
+        from the new summary. Called by MemoryEnrichmentListener.
+
+        The memory is claimed first by moving it from 'pending' to
+        'enriching', so a redelivered event cannot enrich it twice. A claim
+        older than ENRICHMENT_CLAIM_LEASE_SECONDS was abandoned (crash, hung
+        handler) and is taken over. If enrichment raises, the claim is
+        handed back for the retry.
+
+        Returns the memory's post-enrichment type, entities, extraction
+        result and re-embedded vector (None if the embedding was kept), or
+        None if the memory is gone or already enriched (a redelivery).
+        Raises RuntimeError while another delivery holds a live claim, so
+        the dispatcher retries until that claim finishes or lapses.
+        """
+        row = self.db.execute_one(
+            """
+            UPDATE memories
+            SET enrichment_status = 'enriching', enrichment_claimed_at = NOW()
+            WHERE id = %s
+              AND (enrichment_status = 'pending'
+                   OR (enrichment_status = 'enriching'
+                       AND (enrichment_claimed_at IS NULL
+                            OR enrichment_claimed_at < NOW() - make_interval(secs => %s))))
+            RETURNING content, memory_type, importance, project_id, author, salience
+            """,
+            (memory_id, ENRICHMENT_CLAIM_LEASE_SECONDS),
+        )
+        if not row:
+            current = self.db.execute_one(
+                "SELECT enrichment_status FROM memories WHERE id = %s", (memory_id,),
+            )
+            self.db.rollback()
+            if current and current["enrichment_status"] == "enriching":
+                raise RuntimeError(f"Memory #{memory_id} is being enriched by another delivery")
+            return None
+        self.db.commit()
+
+        try:
+            return self._apply_deferred_enrichment(memory_id, row)
+        except Exception:
+            self.db.rollback()
+            self.db.execute(
+                "UPDATE memories SET enrichment_status = 'pending', enrichment_claimed_at = NULL "
+                "WHERE id = %s AND enrichment_status = 'enriching'",
+                (memory_id,),
+            )
+            self.db.commit()
+            raise
+
+    def _apply_deferred_enrichment(self, memory_id: int, row: dict) -> dict:
+        content = row["content"]
+        extraction_result, enrichment, enrichment_status = self._enrich_content(
+            content, row["project_id"], row["author"],
+        )
+
+        final_type = row["memory_type"]
+        if final_type == "note" and "memory_type" in enrichment:
+            final_type = enrichment["memory_type"]
+        final_importance = row["importance"]
+        if final_importance == 0.5 and "importance" in enrichment:
+            final_importance = enrichment["importance"]
+        salience = row["salience"]
+        if final_type in EPHEMERAL_MEMORY_TYPES and salience is None:
+            salience = WM_DEFAULT_SALIENCE.get(final_type, 0.6)
+
+        summary = enrichment.get("summary")
+        vector = None
+        if summary and len(content) > AUTO_SUMMARIZE_EMBED_THRESHOLD and self.long_content != "mean":
+            vector = self.embedding.embed(summary)
+            logger.info("Large content (%d chars) — re-embedded enriched summary", len(content))
+
+        self.db.execute(
+            """
+            UPDATE memories SET
+                memory_type = %s, importance = %s, salience = %s,
+                auto_tags = %s, summary = COALESCE(%s, summary), entities = %s,
+                embedding = COALESCE(%s::vector, embedding),
+                enrichment_status = %s,
+                enriched_at = CASE WHEN %s IN ('complete', 'partial') THEN NOW() ELSE NULL END
+            WHERE id = %s
+            """,
+            (
+                final_type, final_importance, salience,
+                enrichment.get("tags", []), summary, enrichment.get("entities", []),
+                to_vector(vector) if vector is not None else None,
+                enrichment_status, enrichment_status, memory_id,
+            ),
+        )
+        self.db.commit()
+        logger.info("Deferred enrichment for memory #%d: status=%s, type=%s",
+                    memory_id, enrichment_status, final_type)
+        return {
+            "memory_type": final_type,
+            "entities": enrichment.get("entities", []),
+            "extraction_result": extraction_result,
+            "vector": vector,
+        }
+
     def _post_store_enrichment(
         self,
         memory_id: int,
@@ -426,11 +844,12 @@ class MemoryStore:
                         extraction_result, memory_id, project_id,
                     )
                     logger.info(
-                        "Graph persist: %d entities created, %d merged, %d statements, %d contradictions",
+                        "Graph persist: %d entities created, %d merged, %d statements, %d contradictions (%.0f ms)",
                         graph_stats.get("entities_created", 0),
                         graph_stats.get("entities_merged", 0),
                         graph_stats.get("statements_created", 0),
                         graph_stats.get("contradictions_found", 0),
+                        graph_stats.get("timings_ms", {}).get("total", 0),
                     )
 
                     try:
@@ -519,7 +938,7 @@ class MemoryStore:
                 ORDER BY m.embedding <=> %s::vector
                 LIMIT 15
                 """,
-                (memory_id, str(embedding)),
+                (memory_id, to_vector(embedding)),
             )
 
             if not neighbors:
@@ -977,10 +1396,12 @@ class MemoryStore:
             if content is not None:
                 updates.append("content = %s")
                 params.append(content)
-                # Re-embed on content change
-                vector = self.embedding.embed(content)
+                # Re-embed on content change (the old summary no longer applies)
+                vector, chunks = self._embed(self._embedding_plan(content, None))
                 updates.append("embedding = %s::vector")
-                params.append(str(vector))
+                params.append(to_vector(vector))
+                self.db.execute("DELETE FROM memory_chunks WHERE memory_id = %s", (memory_id,))
+                self._insert_chunks([(memory_id, chunks)])
 
             if memory_type is not None:
                 updates.append("memory_type = %s")
@@ -1198,3 +1619,76 @@ class MemoryStore:
             }
             for r in rows
         ]
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp, or None if unset or malformed."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _default_summary(content: str, enrich: bool) -> str | None:
+    """Summary stored when enrichment supplied none.
+
+    Unenriched memories keep their first 200 chars. Enriched ones only get
+    a longer placeholder when large; enrichment fills in the rest.
+    """
+    if not enrich:
+        return content[:200].strip()
+    if len(content) > AUTO_SUMMARIZE_EMBED_THRESHOLD:
+        return content[:500].strip() + "..."
+    return None
+
+
+@dataclass
+class PreparedBatch:
+    """Rows and vectors from MemoryStore.prepare_batch, ready for insert_batch."""
+
+    rows: list[dict]
+    vectors: list[list[float]]
+    chunks: list[list[tuple[int, int, list[float]]]]
+    enrich: bool
+    owner_user_id: int | None = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+@dataclass
+class _EmbeddingPlan:
+    """What to embed for one memory, decided before any model call.
+
+    ``texts`` go to the model together. The primary vector is the first
+    result, or the normalized mean of all of them when ``pooled``; the last
+    ``len(spans)`` results are the per-chunk vectors for memory_chunks.
+    """
+
+    texts: list[str]
+    pooled: bool = False
+    spans: list[tuple[int, int]] = field(default_factory=list)
+
+    def resolve(
+        self, vectors: list[list[float]],
+    ) -> tuple[list[float], list[tuple[int, int, list[float]]]]:
+        if self.pooled:
+            mean = np.mean(np.asarray(vectors, dtype=np.float32), axis=0)
+            primary = (mean / (np.linalg.norm(mean) or 1.0)).tolist()
+        else:
+            primary = vectors[0]
+        chunk_vectors = vectors[len(vectors) - len(self.spans):]
+        return primary, [(start, end, v) for (start, end), v in zip(self.spans, chunk_vectors, strict=True)]
+
+
+def _chunk_spans(content: str) -> list[tuple[int, int]]:
+    """Overlapping character spans covering content, capped at LONG_CONTENT_MAX_CHUNKS."""
+    step = LONG_CONTENT_CHUNK_CHARS - LONG_CONTENT_CHUNK_OVERLAP
+    spans = []
+    for start in range(0, len(content), step):
+        spans.append((start, min(start + LONG_CONTENT_CHUNK_CHARS, len(content))))
+        if start + LONG_CONTENT_CHUNK_CHARS >= len(content) or len(spans) == LONG_CONTENT_MAX_CHUNKS:
+            break
+    return spans
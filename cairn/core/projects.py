@@ -6,6 +6,7 @@ import logging
 
 from cairn.core.analytics import track_operation
 from cairn.core.constants import (
+    ENRICHMENT_MODES,
     MAX_PREFIX_LENGTH,
     MIN_PREFIX_LENGTH,
     VALID_DOC_TYPES,
@@ -34,7 +35,7 @@ class ProjectManager:
         total = count_row["total"]
 
         query = """
-            SELECT p.id, p.name, p.work_item_prefix, p.created_at,
+            SELECT p.id, p.name, p.work_item_prefix, p.enrichment_mode, p.created_at,
                    COALESCE(mc.cnt, 0) AS memory_count,
                    COALESCE(dc.cnt, 0) AS doc_count,
                    COALESCE(wc.cnt, 0) AS work_item_count,
@@ -67,6 +68,7 @@ class ProjectManager:
                 "id": r["id"],
                 "name": r["name"],
                 "work_item_prefix": r["work_item_prefix"],
+                "enrichment_mode": r["enrichment_mode"],
                 "memory_count": r["memory_count"],
                 "doc_count": r["doc_count"],
                 "work_item_count": r["work_item_count"],
@@ -112,6 +114,24 @@ class ProjectManager:
         logger.info("Updated prefix for project %s to '%s'", project, new_prefix)
         return {"project": project, "work_item_prefix": new_prefix}
 
+    @track_operation("projects.update_enrichment_mode")
+    def update_enrichment_mode(self, project: str, mode: str | None) -> dict:
+        """Set a project's store-time enrichment mode. None inherits the server default."""
+        if mode is not None and mode not in ENRICHMENT_MODES:
+            raise ValueError(f"enrichment_mode must be one of: {', '.join(ENRICHMENT_MODES)}")
+
+        project_id = get_project(self.db, project)
+        if project_id is None:
+            raise ValueError(f"project not found: {project}")
+
+        self.db.execute(
+            "UPDATE projects SET enrichment_mode = %s WHERE id = %s",
+            (mode, project_id),
+        )
+        self.db.commit()
+        logger.info("Updated enrichment mode for project %s to %s", project, mode or "default")
+        return {"project": project, "enrichment_mode": mode}
+
     @track_operation("projects.create_doc")
     def create_doc(self, project: str, doc_type: str, content: str, title: str | None = None) -> dict:
         """Create a project document."""
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 from pydantic import BaseModel, field_validator
 
 from cairn.core.utils import extract_json
+from cairn.llm.cache import generate_checked, parses_as
 
 if TYPE_CHECKING:
     from cairn.llm.interface import LLMInterface
@@ -147,7 +148,7 @@ class QueryRouter:
                 {"role": "system", "content": ROUTER_SYSTEM_PROMPT},
                 {"role": "user", "content": query},
             ]
-            raw = self.llm.generate(messages, max_tokens=512)
+            raw = generate_checked(self.llm, messages, 512, parses_as("object"))
             data = extract_json(raw, json_type="object")
             if data is None:
                 logger.warning("Router: no JSON in response")
@@ -29,7 +29,10 @@ Design notes:
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Callable
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 from cairn.core.analytics import track_operation
@@ -42,11 +45,14 @@ from cairn.core.constants import (
     RRF_WEIGHTS_WITH_ACTIVATION,
     RRF_WEIGHTS_WITH_ENTITIES,
     RRF_WEIGHTS_WITH_GRAPH,
+    SEARCH_EXECUTION_MODES,
     TYPE_ROUTING_BOOST,
 )
 from cairn.core.mca import MCA_POOL_MULTIPLIER, MCAGate
 from cairn.embedding.interface import EmbeddingInterface
+from cairn.llm.cache import generate_checked, parses_as
 from cairn.storage.database import Database
+from cairn.storage.vector import to_vector
 
 if TYPE_CHECKING:
     from cairn.config import LLMCapabilities
@@ -71,6 +77,20 @@ DEFAULT_WEIGHTS = {
     "tag": 0.10,
 }
 
+# RRF summation order. Fixed so the fused SQL and the Python fusion add the
+# same float terms in the same sequence and produce identical scores.
+_SIGNAL_ORDER = (
+    "vector", "recency", "keyword", "tag", "entity",
+    "activation", "graph", "access", "importance",
+)
+# Signals computed inside Postgres (activation and graph run outside it)
+_FUSED_SQL_SIGNALS = tuple(s for s in _SIGNAL_ORDER if s not in ("activation", "graph"))
+
+
+def _query_words(query: str) -> list[str]:
+    """Query words used by the tag and entity signals."""
+    return [w.lower() for w in query.split() if len(w) > 2]
+
 
 class SearchEngine:
     """Hybrid search over memories."""
@@ -85,6 +105,8 @@ class SearchEngine:
         graph_provider: GraphProvider | None = None,  # still optional for unit tests
         decay_lambda: float = 0.01,
         memory_store: MemoryStore | None = None,
+        execution_mode: str = "sequential",
+        chunk_vectors: bool = False,
     ):
         self.db = db
         self.embedding = embedding
@@ -96,6 +118,15 @@ class SearchEngine:
         self.activation_engine = activation_engine
         self.graph_provider = graph_provider
         self._memory_store = memory_store
+        if execution_mode not in SEARCH_EXECUTION_MODES:
+            logger.warning(
+                "Unknown search execution mode %r (valid: %s) — using sequential",
+                execution_mode, ", ".join(SEARCH_EXECUTION_MODES),
+            )
+            execution_mode = "sequential"
+        self.execution_mode = execution_mode
+        # Long memories also carry per-chunk vectors (embedding.long_content = "multi")
+        self.chunk_vectors = chunk_vectors
         self._mca_gate: MCAGate | None = None
         if capabilities is not None and capabilities.mca_gate:
             self._mca_gate = MCAGate()
@@ -218,7 +249,7 @@ class SearchEngine:
         ephemeral: bool | None = None,
     ) -> list[dict]:
         """Pure vector similarity search."""
-        query_vector = self.embedding.embed(query)
+        vec = to_vector(self.embedding.embed(query))
         where, params = self._build_filters(
             project, memory_type, required_tags,
             as_of=as_of, event_after=event_after, event_before=event_before,
@@ -227,22 +258,39 @@ class SearchEngine:
 
         # pgvector cosine distance: <=> returns distance (0 = identical)
         # We convert to similarity: 1 - distance
-        rows = self.db.execute(
-            f"""
-            SELECT m.id, m.content, m.summary, m.memory_type, m.importance,
-                   m.tags, m.auto_tags, m.author, m.created_at,
-                   m.enrichment_status,
-                   p.name as project,
-                   1 - (m.embedding <=> %s::vector) as score
-            FROM memories m
-            LEFT JOIN projects p ON m.project_id = p.id
-            WHERE {where}
-                AND m.embedding IS NOT NULL
-            ORDER BY m.embedding <=> %s::vector
-            LIMIT %s
-            """,
-            [str(query_vector)] + params + [str(query_vector), limit],
-        )
+        if self.chunk_vectors:
+            hits, hit_params = self._chunk_vector_hits(where, params, vec, limit)
+            rows = self.db.execute(
+                f"""
+                SELECT m.id, m.content, m.summary, m.memory_type, m.importance,
+                       m.tags, m.auto_tags, m.author, m.created_at,
+                       m.enrichment_status,
+                       p.name as project,
+                       1 - best.distance as score
+                FROM ({hits}) best
+                JOIN memories m ON m.id = best.id
+                LEFT JOIN projects p ON m.project_id = p.id
+                ORDER BY best.distance, m.id
+                """,
+                hit_params,
+            )
+        else:
+            rows = self.db.execute(
+                f"""
+                SELECT m.id, m.content, m.summary, m.memory_type, m.importance,
+                       m.tags, m.auto_tags, m.author, m.created_at,
+                       m.enrichment_status,
+                       p.name as project,
+                       1 - (m.embedding <=> %s::vector) as score
+                FROM memories m
+                LEFT JOIN projects p ON m.project_id = p.id
+                WHERE {where}
+                    AND m.embedding IS NOT NULL
+                ORDER BY m.embedding <=> %s::vector
+                LIMIT %s
+                """,
+                [vec] + params + [vec, limit],
+            )
 
         # Apply contradiction + consolidation penalties and re-sort
         scored = {r["id"]: r["score"] for r in rows}
@@ -254,6 +302,38 @@ class SearchEngine:
 
         return self._format_results(rows, include_full)
 
+    def _chunk_vector_hits(
+        self, where: str, params: list, vec, limit: int,
+    ) -> tuple[str, list]:
+        """SQL for the best cosine distance per memory over primary + chunk vectors.
+
+        A passage deep inside a long memory can match through its chunk
+        vector even when the memory's summary vector does not. Each side is
+        an index-ordered top ``limit``; the result has (id, distance) rows.
+        """
+        sql = f"""
+            SELECT id, MIN(distance) AS distance FROM (
+                (SELECT m.id, m.embedding <=> %s::vector AS distance
+                 FROM memories m
+                 LEFT JOIN projects p ON m.project_id = p.id
+                 WHERE {where} AND m.embedding IS NOT NULL
+                 ORDER BY m.embedding <=> %s::vector
+                 LIMIT %s)
+                UNION ALL
+                (SELECT m.id, c.embedding <=> %s::vector AS distance
+                 FROM memory_chunks c
+                 JOIN memories m ON m.id = c.memory_id
+                 LEFT JOIN projects p ON m.project_id = p.id
+                 WHERE {where} AND c.embedding IS NOT NULL
+                 ORDER BY c.embedding <=> %s::vector
+                 LIMIT %s)
+            ) hits
+            GROUP BY id
+            ORDER BY distance, id
+            LIMIT %s
+        """
+        return sql, [vec] + params + [vec, limit, vec] + params + [vec, limit, limit]
+
     def _keyword_search(
         self, query: str, project: str | list[str] | None, memory_type: str | list[str] | None,
         limit: int, include_full: bool, required_tags: list[str] | None = None,
@@ -304,6 +384,11 @@ class SearchEngine:
 
         Uses expanded query for vector signal (robust to semantic noise)
         and original query for keyword/tag signals (precision-sensitive).
+
+        The SQL signals are fetched according to ``execution_mode``: one query
+        per signal (sequential), one fused CTE statement (fused), or both with
+        a parity check (compare). Everything after candidate selection —
+        salience, MCA, reranking — is shared.
         """
         # Vector signal uses the expanded query for richer semantic matching
         query_vector = self.embedding.embed(expanded)
@@ -330,19 +415,138 @@ class SearchEngine:
         # Fetch a generous candidate set from each signal
         candidate_limit = effective_limit * 5
 
-        # Signal 1: Vector search (uses expanded query embedding)
-        vector_rows = self.db.execute(
-            f"""
-            SELECT m.id,
-                   ROW_NUMBER() OVER (ORDER BY m.embedding <=> %s::vector) as rank
-            FROM memories m
-            LEFT JOIN projects p ON m.project_id = p.id
-            WHERE {where} AND m.embedding IS NOT NULL
-            ORDER BY m.embedding <=> %s::vector
-            LIMIT %s
-            """,
-            [str(query_vector)] + params + [str(query_vector), candidate_limit],
+        # Type routing: classify query intent on first use, i.e. only once a
+        # path has candidates to boost (both execution modes share one call)
+        @functools.cache
+        def query_intent() -> str | None:
+            return self._classify_query_intent(query)
+
+        rank_args = (
+            query, query_vector, where, params, project,
+            candidate_limit, effective_limit, query_intent,
         )
+        mode = self.execution_mode
+        pool = None
+        if mode != "sequential":
+            try:
+                pool = self._rank_fused(*rank_args)
+            except Exception:
+                logger.warning("Fused search failed, falling back to sequential", exc_info=True)
+                mode = "sequential"
+        if mode != "fused":
+            reference = self._rank_sequential(*rank_args)
+            if mode == "compare":
+                self._compare_pools(query, reference, pool)
+            pool = reference
+
+        if pool is None:
+            return []
+        top_ids, row_map, scored, score_components = pool
+
+        # Build ordered candidate list (shared by MCA gate and reranker)
+        candidates = []
+        for memory_id in top_ids:
+            if memory_id in row_map:
+                candidates.append({
+                    "id": memory_id,
+                    "content": row_map[memory_id]["content"],
+                    "row": row_map[memory_id],
+                    "rrf_score": scored[memory_id],
+                    "score_components": score_components.get(memory_id, {}),
+                })
+
+        # Salience weighting: ephemeral items with decayed salience rank lower (ca-173)
+        from cairn.core.memory import MemoryStore as _MS
+        for c in candidates:
+            row = c["row"]
+            if row.get("salience") is not None:
+                computed = _MS._compute_salience(
+                    float(row["salience"]), row["updated_at"], row["pinned"],
+                )
+                c["rrf_score"] *= max(computed, 0.1)
+
+        # Re-sort after salience weighting
+        candidates.sort(key=lambda c: c["rrf_score"], reverse=True)
+
+        # MCA gate: filter by keyword coverage
+        if use_mca:
+            assert self._mca_gate is not None
+            filtered, _mca_stats = self._mca_gate.filter(query, candidates)
+            if filtered:
+                candidates = filtered
+            else:
+                # MCA filtered everything — fall back to RRF order
+                logger.debug("MCA filtered all candidates, falling back to RRF order")
+
+        # Reranking: cross-encoder picks the best `limit` from the (possibly filtered) pool
+        if use_reranker:
+            assert self.reranker is not None
+            try:
+                reranked = self.reranker.rerank(query, candidates, limit=limit)
+            except Exception:
+                logger.warning("Reranking failed, falling back to MCA/RRF order", exc_info=True)
+                reranked = candidates[:limit]
+
+            results = []
+            for c in reranked:
+                r = c["row"]
+                r["score"] = round(c["rrf_score"], 6)
+                r["score_components"] = {
+                    k: round(v, 6) for k, v in c.get("score_components", {}).items()
+                }
+                if "rerank_score" in c:
+                    r["score_components"]["rerank"] = round(c["rerank_score"], 4)
+                if "mca_coverage" in c:
+                    r["score_components"]["mca_coverage"] = c["mca_coverage"]
+                results.append(r)
+
+            return self._format_results(results, include_full, prescored=True)
+
+        # Standard path: RRF ordering (possibly MCA-filtered)
+        results = []
+        for c in candidates[:limit]:
+            r = c["row"]
+            r["score"] = round(c["rrf_score"], 6)
+            r["score_components"] = {
+                k: round(v, 6) for k, v in c.get("score_components", {}).items()
+            }
+            if "mca_coverage" in c:
+                r["score_components"]["mca_coverage"] = c["mca_coverage"]
+            results.append(r)
+
+        return self._format_results(results, include_full, prescored=True)
+
+    def _rank_sequential(
+        self, query: str, query_vector: list[float], where: str, params: list,
+        project: str | list[str] | None, candidate_limit: int, effective_limit: int,
+        query_intent: Callable[[], str | None],
+    ) -> tuple[list[int], dict[int, dict], dict[int, float], dict[int, dict]] | None:
+        """Rank candidates with one query per signal (reference implementation).
+
+        Returns (top_ids, row_map, scored, score_components), or None when no
+        signal produced a candidate.
+        """
+        # Signal 1: Vector search (uses expanded query embedding)
+        vec = to_vector(query_vector)
+        if self.chunk_vectors:
+            hits, hit_params = self._chunk_vector_hits(where, params, vec, candidate_limit)
+            vector_rows = self.db.execute(
+                f"SELECT id, ROW_NUMBER() OVER (ORDER BY distance, id) as rank FROM ({hits}) best",
+                hit_params,
+            )
+        else:
+            vector_rows = self.db.execute(
+                f"""
+                SELECT m.id,
+                       ROW_NUMBER() OVER (ORDER BY m.embedding <=> %s::vector, m.id) as rank
+                FROM memories m
+                LEFT JOIN projects p ON m.project_id = p.id
+                WHERE {where} AND m.embedding IS NOT NULL
+                ORDER BY m.embedding <=> %s::vector
+                LIMIT %s
+                """,
+                [vec] + params + [vec, candidate_limit],
+            )
         vector_ranks = {r["id"]: r["rank"] for r in vector_rows}
 
         # Signal 2: Keyword search (uses ORIGINAL query — exact terms matter)
@@ -351,7 +555,7 @@ class SearchEngine:
             SELECT m.id,
                    ROW_NUMBER() OVER (
                        ORDER BY ts_rank(to_tsvector('english', m.content),
-                                        plainto_tsquery('english', %s)) DESC
+                                        plainto_tsquery('english', %s)) DESC, m.id
                    ) as rank
             FROM memories m
             LEFT JOIN projects p ON m.project_id = p.id
@@ -375,7 +579,7 @@ class SearchEngine:
                            -%s * EXTRACT(EPOCH FROM (
                                NOW() - COALESCE(m.last_accessed_at, m.updated_at)
                            )) / 86400.0
-                       ) DESC
+                       ) DESC, m.id
                    ) as rank
             FROM memories m
             LEFT JOIN projects p ON m.project_id = p.id
@@ -387,7 +591,7 @@ class SearchEngine:
         recency_ranks = {r["id"]: r["rank"] for r in recency_rows}
 
         # Signal 4: Tag search (uses ORIGINAL query words — precision matters)
-        query_words = [w.lower() for w in query.split() if len(w) > 2]
+        query_words = _query_words(query)
         tag_ranks = {}
         if query_words:
             tag_rows = self.db.execute(
@@ -397,7 +601,7 @@ class SearchEngine:
                            ORDER BY (
                                SELECT COUNT(*) FROM unnest(m.tags || m.auto_tags) t
                                WHERE t ILIKE ANY(%s)
-                           ) DESC
+                           ) DESC, m.id
                        ) as rank
                 FROM memories m
                 LEFT JOIN projects p ON m.project_id = p.id
@@ -426,7 +630,7 @@ class SearchEngine:
                                ORDER BY (
                                    SELECT COUNT(*) FROM unnest(m.entities) e
                                    WHERE e ILIKE ANY(%s)
-                               ) DESC
+                               ) DESC, m.id
                            ) as rank
                     FROM memories m
                     LEFT JOIN projects p ON m.project_id = p.id
@@ -444,91 +648,25 @@ class SearchEngine:
                 logger.debug("Entity signal skipped (column may not exist)", exc_info=True)
 
         # Signal 6: Spreading activation (graph-based retrieval)
-        activation_ranks = {}
-        use_activation = (
-            self.activation_engine is not None
-            and self.capabilities is not None
-            and self.capabilities.spreading_activation
+        activation_ranks = self._activation_signal(
+            vector_ranks, keyword_ranks, lambda: self._resolve_project_id(project),
         )
-        if use_activation:
-            try:
-                # Use vector + keyword anchors as activation seeds
-                anchor_ids = list(set(list(vector_ranks.keys())[:10] + list(keyword_ranks.keys())[:5]))
-                anchor_scores: dict[int, float] = {}
-                for aid in anchor_ids:
-                    # Normalize: rank-1 gets 1.0, lower ranks get less
-                    if aid in vector_ranks:
-                        anchor_scores[aid] = max(anchor_scores.get(aid, 0), 1.0 / vector_ranks[aid])
-                    if aid in keyword_ranks:
-                        anchor_scores[aid] = max(anchor_scores.get(aid, 0), 1.0 / keyword_ranks[aid])
-
-                # Resolve project_id for graph scoping
-                act_project_id = None
-                if project and not isinstance(project, list):
-                    proj_row = self.db.execute_one(
-                        "SELECT id FROM projects WHERE name = %s", (project,)
-                    )
-                    if proj_row:
-                        act_project_id = proj_row["id"]
-
-                assert self.activation_engine is not None
-                activations = self.activation_engine.activate(
-                    anchor_ids, anchor_scores, project_id=act_project_id,
-                )
-
-                if activations:
-                    # Convert activation values to ranks (sorted by activation desc)
-                    sorted_acts = sorted(activations.items(), key=lambda x: x[1], reverse=True)
-                    activation_ranks = {
-                        nid: rank + 1 for rank, (nid, _) in enumerate(sorted_acts)
-                    }
-            except Exception:
-                logger.debug("Spreading activation failed", exc_info=True)
 
         # Signal 7: Graph neighbors (memories sharing entities with candidates)
-        graph_ranks = {}
-        if self.graph_provider is not None:  # optional for unit tests
-            try:
-                # Use top vector + keyword candidates as seeds
-                seed_ids = list(set(list(vector_ranks.keys())[:15] + list(keyword_ranks.keys())[:5]))
-                if seed_ids:
-                    # Resolve project_id for graph scoping
-                    graph_project_id = None
-                    if project and not isinstance(project, list):
-                        proj_row = self.db.execute_one(
-                            "SELECT id FROM projects WHERE name = %s", (project,)
-                        )
-                        if proj_row:
-                            graph_project_id = proj_row["id"]
-
-                    if graph_project_id:
-                        neighbor_scores = self.graph_provider.graph_neighbor_episodes(
-                            seed_ids, graph_project_id, limit=candidate_limit,
-                        )
-                        if neighbor_scores:
-                            # Convert to ranks (sorted by shared entity count desc)
-                            sorted_neighbors = sorted(
-                                neighbor_scores.items(), key=lambda x: x[1], reverse=True,
-                            )
-                            graph_ranks = {
-                                mid: rank + 1 for rank, (mid, _) in enumerate(sorted_neighbors)
-                            }
-            except Exception:
-                logger.debug("Graph neighbor signal failed", exc_info=True)
+        graph_ranks = self._graph_signal(
+            vector_ranks, keyword_ranks, candidate_limit,
+            lambda: self._resolve_project_id(project),
+        )
 
         # Signal 8: Access frequency (log-normalized access_count)
         access_ranks = {}
-        use_access = (
-            self.capabilities is not None
-            and self.capabilities.access_frequency
-        )
-        if use_access:
+        if self._use_access():
             try:
                 access_rows = self.db.execute(
                     f"""
                     SELECT m.id,
                            ROW_NUMBER() OVER (
-                               ORDER BY LN(1 + m.access_count) DESC
+                               ORDER BY LN(1 + m.access_count) DESC, m.id
                            ) as rank
                     FROM memories m
                     LEFT JOIN projects p ON m.project_id = p.id
@@ -546,7 +684,7 @@ class SearchEngine:
         importance_rows = self.db.execute(
             f"""
             SELECT m.id,
-                   ROW_NUMBER() OVER (ORDER BY m.importance DESC) as rank
+                   ROW_NUMBER() OVER (ORDER BY m.importance DESC, m.id) as rank
             FROM memories m
             LEFT JOIN projects p ON m.project_id = p.id
             WHERE {where}
@@ -556,69 +694,23 @@ class SearchEngine:
         )
         importance_ranks = {r["id"]: r["rank"] for r in importance_rows}
 
-        # Dynamic weight selection based on available signals
-        if activation_ranks and entity_ranks:
-            weights = RRF_WEIGHTS_WITH_ACTIVATION
-        elif graph_ranks:
-            weights = RRF_WEIGHTS_WITH_GRAPH
-        elif entity_ranks:
-            weights = RRF_WEIGHTS_WITH_ACCESS_ENTITIES if access_ranks else RRF_WEIGHTS_WITH_ENTITIES
-        elif access_ranks:
-            weights = RRF_WEIGHTS_WITH_ACCESS
-        else:
-            weights = RRF_WEIGHTS_DEFAULT
-
-        # Fuse via RRF
-        all_ids = (
-            set(vector_ranks) | set(keyword_ranks) | set(recency_ranks)
-            | set(tag_ranks) | set(entity_ranks) | set(activation_ranks)
-            | set(graph_ranks) | set(access_ranks) | set(importance_ranks)
-        )
-        if not all_ids:
-            return []
-
-        scored = {}
-        score_components = {}
-        for memory_id in all_ids:
-            score = 0.0
-            components = {k: 0.0 for k in weights}
-            if memory_id in vector_ranks:
-                components["vector"] = weights["vector"] * (1.0 / (RRF_K + vector_ranks[memory_id]))
-                score += components["vector"]
-            if "recency" in weights and memory_id in recency_ranks:
-                components["recency"] = weights["recency"] * (1.0 / (RRF_K + recency_ranks[memory_id]))
-                score += components["recency"]
-            if memory_id in keyword_ranks:
-                components["keyword"] = weights["keyword"] * (1.0 / (RRF_K + keyword_ranks[memory_id]))
-                score += components["keyword"]
-            if memory_id in tag_ranks:
-                components["tag"] = weights["tag"] * (1.0 / (RRF_K + tag_ranks[memory_id]))
-                score += components["tag"]
-            if "entity" in weights and memory_id in entity_ranks:
-                components["entity"] = weights["entity"] * (1.0 / (RRF_K + entity_ranks[memory_id]))
-                score += components["entity"]
-            if "activation" in weights and memory_id in activation_ranks:
-                components["activation"] = weights["activation"] * (1.0 / (RRF_K + activation_ranks[memory_id]))
-                score += components["activation"]
-            if "graph" in weights and memory_id in graph_ranks:
-                components["graph"] = weights["graph"] * (1.0 / (RRF_K + graph_ranks[memory_id]))
-                score += components["graph"]
-            if "access" in weights and memory_id in access_ranks:
-                components["access"] = weights["access"] * (1.0 / (RRF_K + access_ranks[memory_id]))
-                score += components["access"]
-            if "importance" in weights and memory_id in importance_ranks:
-                components["importance"] = weights["importance"] * (1.0 / (RRF_K + importance_ranks[memory_id]))
-                score += components["importance"]
-            scored[memory_id] = score
-            score_components[memory_id] = components
+        signal_ranks = {
+            "vector": vector_ranks, "recency": recency_ranks, "keyword": keyword_ranks,
+            "tag": tag_ranks, "entity": entity_ranks, "activation": activation_ranks,
+            "graph": graph_ranks, "access": access_ranks, "importance": importance_ranks,
+        }
+        weights = self._select_weights({s for s, ranks in signal_ranks.items() if ranks})
+        scored, score_components = self._fuse_ranks(weights, signal_ranks)
+        if not scored:
+            return None
 
         # Penalize contradicted and consolidated memories before ranking
         scored = self._apply_contradiction_penalty(scored)
         scored = self._apply_consolidation_demotion(scored)
 
-        # Type routing: classify query intent and boost matching memory types
-        query_intent = self._classify_query_intent(query)
-        if query_intent:
+        # Type routing: boost memory types matching the query intent
+        intent = query_intent()
+        if intent:
             # Lightweight fetch of memory types for scoring
             type_ids = list(scored.keys())
             type_placeholders = ",".join(["%s"] * len(type_ids))
@@ -627,102 +719,568 @@ class SearchEngine:
                 tuple(type_ids),
             )
             memory_types = {r["id"]: r["memory_type"] for r in type_rows}
-            scored = self._apply_type_boost(scored, memory_types, query_intent)
+            scored = self._apply_type_boost(scored, memory_types, intent)
 
         # Sort by fused score, take top N (or wider pool for MCA/reranking)
         top_ids = sorted(scored, key=lambda mid: scored[mid], reverse=True)[:effective_limit]
-
         if not top_ids:
-            return []
+            return None
 
-        # Fetch full details for top results
-        placeholders = ",".join(["%s"] * len(top_ids))
+        return top_ids, self._fetch_candidate_rows(top_ids), scored, score_components
+
+    def _rank_fused(
+        self, query: str, query_vector: list[float], where: str, params: list,
+        project: str | list[str] | None, candidate_limit: int, effective_limit: int,
+        query_intent: Callable[[], str | None],
+    ) -> tuple[list[int], dict[int, dict], dict[int, float], dict[int, dict]] | None:
+        """Rank candidates with all SQL signals computed in one CTE statement.
+
+        When no out-of-database signal applies (spreading activation, Neo4j
+        graph neighbors), fusion, penalties and the detail fetch all happen in
+        that one statement. Otherwise the statement returns the per-signal
+        ranks, the external signals are folded in here, and one more query
+        fetches details for the winners.
+
+        The type boost is applied after the statement, so query intent is only
+        classified when there are candidates. The statement returns every row
+        the boost could lift into the top ``effective_limit``: each memory
+        type's own top rows, minus those that stay below the unboosted cutoff
+        even when boosted.
+
+        Produces the same pool as _rank_sequential (up to ordering of ties).
+        """
+        ctes, cte_params = self._fused_signal_ctes(
+            query, query_vector, where, params, candidate_limit,
+        )
+        needs_external = self._use_activation() or (
+            self.graph_provider is not None
+            and bool(project) and not isinstance(project, list)
+        )
+        if needs_external:
+            return self._rank_fused_two_phase(
+                ctes, cte_params, project, candidate_limit, effective_limit, query_intent,
+            )
+
+        weight_rows = []
+        weight_params: list = []
+        for has_entity in (False, True):
+            for has_access in (False, True):
+                active = {"entity"} if has_entity else set()
+                if has_access:
+                    active.add("access")
+                weights = self._select_weights(active)
+                weight_rows.append(
+                    "(%s::bool, %s::bool, "
+                    + ", ".join(["%s::float8"] * len(_FUSED_SQL_SIGNALS)) + ")"
+                )
+                weight_params += [has_entity, has_access] + [
+                    weights.get(s) for s in _FUSED_SQL_SIGNALS
+                ]
+
+        weight_cols = ", ".join(f"w_{s}" for s in _FUSED_SQL_SIGNALS)
+        component_cols = ",\n                       ".join(
+            f"w.w_{s} * (1.0::float8 / ({RRF_K} + r.{s}_rank)) AS {s}_component"
+            for s in _FUSED_SQL_SIGNALS
+        )
+        score_sum = " + ".join(
+            ["0.0::float8"] + [f"COALESCE(s.{s}_component, 0)" for s in _FUSED_SQL_SIGNALS]
+        )
         rows = self.db.execute(
             f"""
+            WITH {ctes},
+            weight_sets (has_entity, has_access, {weight_cols}) AS (
+                VALUES {", ".join(weight_rows)}
+            ),
+            w AS (
+                SELECT ws.* FROM weight_sets ws
+                WHERE ws.has_entity = EXISTS (SELECT 1 FROM entity_r)
+                  AND ws.has_access = EXISTS (SELECT 1 FROM access_r)
+            ),
+            scored AS (
+                SELECT r.id, w.has_entity, w.has_access,
+                       {component_cols}
+                FROM ranked r CROSS JOIN w
+            ),
+            penalized AS (
+                SELECT s.*, m.memory_type,
+                       ({score_sum})
+                       * CASE WHEN EXISTS (
+                             SELECT 1 FROM memory_relations mr
+                             WHERE mr.target_id = m.id AND mr.relation = 'contradicts'
+                         ) THEN %s::float8 ELSE 1.0::float8 END
+                       * CASE WHEN m.consolidated_into IS NOT NULL
+                              THEN 0.5::float8 ELSE 1.0::float8 END
+                       AS fused_score
+                FROM scored s
+                JOIN memories m ON m.id = s.id
+            ),
+            per_type AS (
+                SELECT pe.*, ROW_NUMBER() OVER (
+                           PARTITION BY pe.memory_type ORDER BY pe.fused_score DESC, pe.id
+                       ) AS type_rank
+                FROM penalized pe
+            )
             SELECT m.id, m.content, m.summary, m.memory_type, m.importance,
                    m.tags, m.auto_tags, m.created_at, m.updated_at,
                    m.enrichment_status, m.salience, m.pinned,
-                   p.name as project
-            FROM memories m
+                   p.name as project,
+                   s.has_entity, s.has_access,
+                   {", ".join(f"s.{s}_component" for s in _FUSED_SQL_SIGNALS)},
+                   s.fused_score
+            FROM per_type s
+            JOIN memories m ON m.id = s.id
             LEFT JOIN projects p ON m.project_id = p.id
-            WHERE m.id IN ({placeholders})
+            WHERE s.type_rank <= %s
+              AND s.fused_score * %s::float8 >= COALESCE((
+                  SELECT pe.fused_score FROM penalized pe
+                  ORDER BY pe.fused_score DESC, pe.id
+                  OFFSET %s LIMIT 1
+              ), '-infinity'::float8)
+            ORDER BY s.fused_score DESC, m.id
             """,
-            tuple(top_ids),
+            cte_params + weight_params + [
+                CONTRADICTION_PENALTY, effective_limit, TYPE_ROUTING_BOOST, max(effective_limit - 1, 0),
+            ],
         )
+        if not rows:
+            return None
 
-        # Build ordered candidate list (shared by MCA gate and reranker)
-        row_map = {r["id"]: r for r in rows}
-        candidates = []
-        for memory_id in top_ids:
-            if memory_id in row_map:
-                candidates.append({
-                    "id": memory_id,
-                    "content": row_map[memory_id]["content"],
-                    "row": row_map[memory_id],
-                    "rrf_score": scored[memory_id],
-                    "score_components": score_components.get(memory_id, {}),
-                })
+        intent = query_intent()
+        affine_types = set(QUERY_TYPE_AFFINITY.get(intent, [])) if intent else set()
+        for r in rows:
+            if r["memory_type"] in affine_types:
+                r["fused_score"] = r["fused_score"] * TYPE_ROUTING_BOOST
+        rows.sort(key=lambda r: (-r["fused_score"], r["id"]))
+        del rows[effective_limit:]
+
+        top_ids: list[int] = []
+        row_map: dict[int, dict] = {}
+        scored: dict[int, float] = {}
+        score_components: dict[int, dict] = {}
+        for r in rows:
+            active = {"entity"} if r.pop("has_entity") else set()
+            if r.pop("has_access"):
+                active.add("access")
+            weights = self._select_weights(active)
+            components = {s: r.pop(f"{s}_component") for s in _FUSED_SQL_SIGNALS}
+            memory_id = r["id"]
+            top_ids.append(memory_id)
+            scored[memory_id] = r.pop("fused_score")
+            score_components[memory_id] = {k: components.get(k) or 0.0 for k in weights}
+            row_map[memory_id] = r
+
+        return top_ids, row_map, scored, score_components
+
+    def _rank_fused_two_phase(
+        self, ctes: str, cte_params: list, project: str | list[str] | None,
+        candidate_limit: int, effective_limit: int, query_intent: Callable[[], str | None],
+    ) -> tuple[list[int], dict[int, dict], dict[int, float], dict[int, dict]] | None:
+        """Fused ranking when activation / graph-neighbor signals must join in.
+
+        Those signals are seeded from the top vector and keyword candidates,
+        so they can't run inside the statement: fetch all SQL ranks (plus the
+        flags the penalties need) in one round trip, fuse in Python exactly as
+        the sequential path does, then fetch details for the winners.
+        """
+        rank_cols = ", ".join(f"r.{s}_rank" for s in _FUSED_SQL_SIGNALS)
+        rows = self.db.execute(
+            f"""
+            WITH {ctes}
+            SELECT r.id, {rank_cols},
+                   m.memory_type,
+                   m.consolidated_into IS NOT NULL AS consolidated,
+                   EXISTS (
+                       SELECT 1 FROM memory_relations mr
+                       WHERE mr.target_id = r.id AND mr.relation = 'contradicts'
+                   ) AS contradicted,
+                   (SELECT id FROM projects WHERE name = %s) AS project_id
+            FROM ranked r
+            JOIN memories m ON m.id = r.id
+            """,
+            cte_params + [project if isinstance(project, str) else None],
+        )
 
-        # Salience weighting: ephemeral items with decayed salience rank lower (ca-173)
-        from cairn.core.memory import MemoryStore as _MS
-        for c in candidates:
-            row = c["row"]
-            if row.get("salience") is not None:
-                computed = _MS._compute_salience(
-                    float(row["salience"]), row["updated_at"], row["pinned"],
-                )
-                c["rrf_score"] *= max(computed, 0.1)
+        signal_ranks: dict[str, dict[int, int]] = {s: {} for s in _SIGNAL_ORDER}
+        for s in _FUSED_SQL_SIGNALS:
+            # Insertion order must follow rank order — activation and graph
+            # seeds are taken from the head of the vector/keyword rankings.
+            rank_col = f"{s}_rank"
+            ranked_rows = sorted((r for r in rows if r[rank_col] is not None), key=itemgetter(rank_col))
+            signal_ranks[s] = {r["id"]: r[rank_col] for r in ranked_rows}
+        flags = {r["id"]: r for r in rows}
+        project_id = rows[0]["project_id"] if rows else None
+
+        signal_ranks["activation"] = self._activation_signal(
+            signal_ranks["vector"], signal_ranks["keyword"], lambda: project_id,
+        )
+        signal_ranks["graph"] = self._graph_signal(
+            signal_ranks["vector"], signal_ranks["keyword"], candidate_limit,
+            lambda: project_id,
+        )
 
-        # Re-sort after salience weighting
-        candidates.sort(key=lambda c: c["rrf_score"], reverse=True)
+        weights = self._select_weights({s for s, ranks in signal_ranks.items() if ranks})
+        scored, score_components = self._fuse_ranks(weights, signal_ranks)
+        if not scored:
+            return None
 
-        # MCA gate: filter by keyword coverage
-        if use_mca:
-            assert self._mca_gate is not None
-            filtered, _mca_stats = self._mca_gate.filter(query, candidates)
-            if filtered:
-                candidates = filtered
-            else:
-                # MCA filtered everything — fall back to RRF order
-                logger.debug("MCA filtered all candidates, falling back to RRF order")
+        # Activation / graph may surface memories outside the SQL candidates
+        missing = [mid for mid in scored if mid not in flags]
+        if missing:
+            for r in self.db.execute(
+                """
+                SELECT m.id, m.memory_type,
+                       m.consolidated_into IS NOT NULL AS consolidated,
+                       EXISTS (
+                           SELECT 1 FROM memory_relations mr
+                           WHERE mr.target_id = m.id AND mr.relation = 'contradicts'
+                       ) AS contradicted
+                FROM memories m
+                WHERE m.id = ANY(%s)
+                """,
+                (missing,),
+            ):
+                flags[r["id"]] = r
+
+        # Same penalty order as the sequential path: contradiction, then
+        # consolidation demotion, then type boost
+        for mid in scored:
+            if mid in flags and flags[mid]["contradicted"]:
+                scored[mid] = scored[mid] * CONTRADICTION_PENALTY
+        for mid in scored:
+            if mid in flags and flags[mid]["consolidated"]:
+                scored[mid] = scored[mid] * 0.5
+        intent = query_intent()
+        if intent:
+            memory_types = {mid: f["memory_type"] for mid, f in flags.items()}
+            scored = self._apply_type_boost(scored, memory_types, intent)
 
-        # Reranking: cross-encoder picks the best `limit` from the (possibly filtered) pool
-        if use_reranker:
-            assert self.reranker is not None
-            try:
-                reranked = self.reranker.rerank(query, candidates, limit=limit)
-            except Exception:
-                logger.warning("Reranking failed, falling back to MCA/RRF order", exc_info=True)
-                reranked = candidates[:limit]
+        top_ids = sorted(scored, key=lambda mid: scored[mid], reverse=True)[:effective_limit]
+        if not top_ids:
+            return None
 
-            results = []
-            for c in reranked:
-                r = c["row"]
-                r["score"] = round(c["rrf_score"], 6)
-                r["score_components"] = {
-                    k: round(v, 6) for k, v in c.get("score_components", {}).items()
+        return top_ids, self._fetch_candidate_rows(top_ids), scored, score_components
+
+    def _fused_signal_ctes(
+        self, query: str, query_vector: list[float], where: str, params: list,
+        candidate_limit: int,
+    ) -> tuple[str, list]:
+        """Build the per-signal rank CTEs shared by both fused statements.
+
+        Each CTE mirrors one sequential signal query. Disabled signals become
+        empty CTEs so the fusion SQL stays the same shape. The final ``ranked``
+        CTE has one row per candidate with a ``<signal>_rank`` column per signal.
+        """
+        empty = "SELECT 0 AS id, 0::bigint AS rank WHERE false"
+        vec = to_vector(query_vector)
+        query_words = _query_words(query)
+
+        if self.chunk_vectors:
+            hits, vector_params = self._chunk_vector_hits(where, params, vec, candidate_limit)
+            vector_cte = f"""vector_r AS (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY distance, id) AS rank
+                FROM ({hits}) best
+            )"""
+        else:
+            vector_cte = f"""vector_r AS (
+                SELECT m.id,
+                       ROW_NUMBER() OVER (ORDER BY m.embedding <=> %s::vector, m.id) AS rank
+                FROM memories m
+                LEFT JOIN projects p ON m.project_id = p.id
+                WHERE {where} AND m.embedding IS NOT NULL
+                ORDER BY m.embedding <=> %s::vector
+                LIMIT %s
+            )"""
+            vector_params = [vec] + params + [vec, candidate_limit]
+
+        ctes = [
+            vector_cte,
+            f"""keyword_r AS (
+                SELECT m.id,
+                       ROW_NUMBER() OVER (
+                           ORDER BY ts_rank(to_tsvector('english', m.content),
+                                            plainto_tsquery('english', %s)) DESC, m.id
+                       ) AS rank
+                FROM memories m
+                LEFT JOIN projects p ON m.project_id = p.id
+                WHERE {where}
+                    AND to_tsvector('english', m.content) @@ plainto_tsquery('english', %s)
+                ORDER BY rank
+                LIMIT %s
+            )""",
+            f"""recency_r AS (
+                SELECT m.id,
+                       ROW_NUMBER() OVER (
+                           ORDER BY EXP(
+                               -%s * EXTRACT(EPOCH FROM (
+                                   NOW() - COALESCE(m.last_accessed_at, m.updated_at)
+                               )) / 86400.0
+                           ) DESC, m.id
+                       ) AS rank
+                FROM memories m
+                LEFT JOIN projects p ON m.project_id = p.id
+                WHERE {where}
+                ORDER BY rank
+                LIMIT %s
+            )""",
+        ]
+        cte_params: list = (
+            vector_params
+            + [query] + params + [query, candidate_limit]
+            + [self.decay_lambda] + params + [candidate_limit]
+        )
+
+        if query_words:
+            patterns = [f"%{w}%" for w in query_words]
+            ctes.append(f"""tag_r AS (
+                SELECT m.id,
+                       ROW_NUMBER() OVER (
+                           ORDER BY (
+                               SELECT COUNT(*) FROM unnest(m.tags || m.auto_tags) t
+                               WHERE t ILIKE ANY(%s)
+                           ) DESC, m.id
+                       ) AS rank
+                FROM memories m
+                LEFT JOIN projects p ON m.project_id = p.id
+                WHERE {where}
+                    AND (m.tags || m.auto_tags) && %s
+                ORDER BY rank
+                LIMIT %s
+            )""")
+            ctes.append(f"""entity_r AS (
+                SELECT m.id,
+                       ROW_NUMBER() OVER (
+                           ORDER BY (
+                               SELECT COUNT(*) FROM unnest(m.entities) e
+                               WHERE e ILIKE ANY(%s)
+                           ) DESC, m.id
+                       ) AS rank
+                FROM memories m
+                LEFT JOIN projects p ON m.project_id = p.id
+                WHERE {where}
+                    AND m.entities != '{{}}' AND EXISTS (
+                        SELECT 1 FROM unnest(m.entities) e WHERE e ILIKE ANY(%s)
+                    )
+                ORDER BY rank
+                LIMIT %s
+            )""")
+            cte_params += (
+                [patterns] + params + [query_words, candidate_limit]
+                + [patterns] + params + [patterns, candidate_limit]
+            )
+        else:
+            ctes.append(f"tag_r AS ({empty})")
+            ctes.append(f"entity_r AS ({empty})")
+
+        if self._use_access():
+            ctes.append(f"""access_r AS (
+                SELECT m.id,
+                       ROW_NUMBER() OVER (ORDER BY LN(1 + m.access_count) DESC, m.id) AS rank
+                FROM memories m
+                LEFT JOIN projects p ON m.project_id = p.id
+                WHERE {where}
+                    AND m.access_count > 0
+                ORDER BY rank
+                LIMIT %s
+            )""")
+            cte_params += params + [candidate_limit]
+        else:
+            ctes.append(f"access_r AS ({empty})")
+
+        ctes.append(f"""importance_r AS (
+                SELECT m.id,
+                       ROW_NUMBER() OVER (ORDER BY m.importance DESC, m.id) AS rank
+                FROM memories m
+                LEFT JOIN projects p ON m.project_id = p.id
+                WHERE {where}
+                ORDER BY rank
+                LIMIT %s
+            )""")
+        cte_params += params + [candidate_limit]
+
+        union = "\n                UNION ".join(f"SELECT id FROM {s}_r" for s in _FUSED_SQL_SIGNALS)
+        joins = "\n                ".join(
+            f"LEFT JOIN {s}_r ON {s}_r.id = c.id" for s in _FUSED_SQL_SIGNALS
+        )
+        rank_cols = ", ".join(f"{s}_r.rank AS {s}_rank" for s in _FUSED_SQL_SIGNALS)
+        ctes.append(f"""ranked AS (
+                SELECT c.id, {rank_cols}
+                FROM ({union}) c
+                {joins}
+            )""")
+
+        return ",\n            ".join(ctes), cte_params
+
+    def _use_activation(self) -> bool:
+        return (
+            self.activation_engine is not None
+            and self.capabilities is not None
+            and self.capabilities.spreading_activation
+        )
+
+    def _use_access(self) -> bool:
+        return (
+            self.capabilities is not None
+            and self.capabilities.access_frequency
+        )
+
+    def _resolve_project_id(self, project: str | list[str] | None) -> int | None:
+        """Resolve a single project name to its ID for graph scoping."""
+        if project and not isinstance(project, list):
+            proj_row = self.db.execute_one(
+                "SELECT id FROM projects WHERE name = %s", (project,)
+            )
+            if proj_row:
+                return proj_row["id"]
+        return None
+
+    def _activation_signal(
+        self, vector_ranks: dict[int, int], keyword_ranks: dict[int, int],
+        resolve_project_id: Callable[[], int | None],
+    ) -> dict[int, int]:
+        """Spreading activation ranks, seeded from the top vector + keyword hits."""
+        activation_ranks: dict[int, int] = {}
+        if not self._use_activation():
+            return activation_ranks
+        try:
+            # Use vector + keyword anchors as activation seeds
+            anchor_ids = list(set(list(vector_ranks.keys())[:10] + list(keyword_ranks.keys())[:5]))
+            anchor_scores: dict[int, float] = {}
+            for aid in anchor_ids:
+                # Normalize: rank-1 gets 1.0, lower ranks get less
+                if aid in vector_ranks:
+                    anchor_scores[aid] = max(anchor_scores.get(aid, 0), 1.0 / vector_ranks[aid])
+                if aid in keyword_ranks:
+                    anchor_scores[aid] = max(anchor_scores.get(aid, 0), 1.0 / keyword_ranks[aid])
+
+            assert self.activation_engine is not None
+            activations = self.activation_engine.activate(
+                anchor_ids, anchor_scores, project_id=resolve_project_id(),
+            )
+
+            if activations:
+                # Convert activation values to ranks (sorted by activation desc)
+                sorted_acts = sorted(activations.items(), key=lambda x: x[1], reverse=True)
+                activation_ranks = {
+                    nid: rank + 1 for rank, (nid, _) in enumerate(sorted_acts)
                 }
-                if "rerank_score" in c:
-                    r["score_components"]["rerank"] = round(c["rerank_score"], 4)
-                if "mca_coverage" in c:
-                    r["score_components"]["mca_coverage"] = c["mca_coverage"]
-                results.append(r)
+        except Exception:
+            logger.debug("Spreading activation failed", exc_info=True)
+        return activation_ranks
+
+    def _graph_signal(
+        self, vector_ranks: dict[int, int], keyword_ranks: dict[int, int],
+        candidate_limit: int, resolve_project_id: Callable[[], int | None],
+    ) -> dict[int, int]:
+        """Neo4j graph-neighbor ranks (memories sharing entities with the top hits)."""
+        graph_ranks: dict[int, int] = {}
+        if self.graph_provider is None:  # optional for unit tests
+            return graph_ranks
+        try:
+            # Use top vector + keyword candidates as seeds
+            seed_ids = list(set(list(vector_ranks.keys())[:15] + list(keyword_ranks.keys())[:5]))
+            if seed_ids:
+                graph_project_id = resolve_project_id()
+                if graph_project_id:
+                    neighbor_scores = self.graph_provider.graph_neighbor_episodes(
+                        seed_ids, graph_project_id, limit=candidate_limit,
+                    )
+                    if neighbor_scores:
+                        # Convert to ranks (sorted by shared entity count desc)
+                        sorted_neighbors = sorted(
+                            neighbor_scores.items(), key=lambda x: x[1], reverse=True,
+                        )
+                        graph_ranks = {
+                            mid: rank + 1 for rank, (mid, _) in enumerate(sorted_neighbors)
+                        }
+        except Exception:
+            logger.debug("Graph neighbor signal failed", exc_info=True)
+        return graph_ranks
+
+    @staticmethod
+    def _select_weights(active_signals: set[str]) -> dict[str, float]:
+        """Dynamic weight selection based on which signals returned candidates."""
+        if "activation" in active_signals and "entity" in active_signals:
+            return RRF_WEIGHTS_WITH_ACTIVATION
+        if "graph" in active_signals:
+            return RRF_WEIGHTS_WITH_GRAPH
+        if "entity" in active_signals:
+            if "access" in active_signals:
+                return RRF_WEIGHTS_WITH_ACCESS_ENTITIES
+            return RRF_WEIGHTS_WITH_ENTITIES
+        if "access" in active_signals:
+            return RRF_WEIGHTS_WITH_ACCESS
+        return RRF_WEIGHTS_DEFAULT
+
+    @staticmethod
+    def _fuse_ranks(
+        weights: dict[str, float], signal_ranks: dict[str, dict[int, int]],
+    ) -> tuple[dict[int, float], dict[int, dict[str, float]]]:
+        """Fuse per-signal ranks via RRF. Returns (scored, score_components)."""
+        all_ids: set[int] = set()
+        for ranks in signal_ranks.values():
+            all_ids |= set(ranks)
 
-            return self._format_results(results, include_full, prescored=True)
+        scored = {}
+        score_components = {}
+        for memory_id in all_ids:
+            score = 0.0
+            components = {k: 0.0 for k in weights}
+            # Summation order is fixed so fused SQL reproduces the same floats
+            for signal in _SIGNAL_ORDER:
+                ranks = signal_ranks.get(signal, {})
+                if signal in weights and memory_id in ranks:
+                    components[signal] = weights[signal] * (1.0 / (RRF_K + ranks[memory_id]))
+                    score += components[signal]
+            scored[memory_id] = score
+            score_components[memory_id] = components
+        return scored, score_components
 
-        # Standard path: RRF ordering (possibly MCA-filtered)
-        results = []
-        for c in candidates[:limit]:
-            r = c["row"]
-            r["score"] = round(c["rrf_score"], 6)
-            r["score_components"] = {
-                k: round(v, 6) for k, v in c.get("score_components", {}).items()
-            }
-            if "mca_coverage" in c:
-                r["score_components"]["mca_coverage"] = c["mca_coverage"]
-            results.append(r)
+    def _fetch_candidate_rows(self, top_ids: list[int]) -> dict[int, dict]:
+        """Fetch full details for the top results, keyed by memory ID."""
+        placeholders = ",".join(["%s"] * len(top_ids))
+        rows = self.db.execute(
+            f"""
+            SELECT m.id, m.content, m.summary, m.memory_type, m.importance,
+                   m.tags, m.auto_tags, m.created_at, m.updated_at,
+                   m.enrichment_status, m.salience, m.pinned,
+                   p.name as project
+            FROM memories m
+            LEFT JOIN projects p ON m.project_id = p.id
+            WHERE m.id IN ({placeholders})
+            """,
+            tuple(top_ids),
+        )
+        return {r["id"]: r for r in rows}
 
-        return self._format_results(results, include_full, prescored=True)
+    def _compare_pools(self, query: str, reference, fused) -> bool:
+        """Log whether the fused pool matches the sequential one.
+
+        Ties may be broken differently, so scores are compared as an ordered
+        sequence and per ID for the IDs both pools contain.
+        """
+        def _scores(pool) -> tuple[list[float], dict[int, float]]:
+            if pool is None:
+                return [], {}
+            top_ids, _rows, scored, _components = pool
+            by_id = {mid: round(scored[mid], 9) for mid in top_ids}
+            return [by_id[mid] for mid in top_ids], by_id
+
+        ref_seq, ref_by_id = _scores(reference)
+        fused_seq, fused_by_id = _scores(fused)
+        diverged = [
+            mid for mid in ref_by_id.keys() & fused_by_id.keys()
+            if ref_by_id[mid] != fused_by_id[mid]
+        ]
+        if ref_seq == fused_seq and not diverged:
+            logger.debug("Fused search matches sequential (%d candidates)", len(ref_seq))
+            return True
+        logger.warning(
+            "Fused search diverged from sequential for query %r: "
+            "sequential=%s fused=%s (score mismatch on %s)",
+            query[:80], list(ref_by_id.items())[:10], list(fused_by_id.items())[:10],
+            sorted(diverged)[:10],
+        )
+        return False
 
     def _classify_query_intent(self, query: str) -> str | None:
         """Classify query intent for type-routed retrieval.
@@ -743,7 +1301,7 @@ class SearchEngine:
             from cairn.llm.prompts import build_query_classification_messages
             messages = build_query_classification_messages(query)
             assert self.llm is not None
-            raw = self.llm.generate(messages, max_tokens=64)
+            raw = generate_checked(self.llm, messages, 64, parses_as("object"))
             data = extract_json(raw, json_type="object")
             if data and isinstance(data, dict) and "intent" in data:
                 intent = str(data["intent"]).lower()
@@ -915,7 +1473,7 @@ class SearchEngine:
             from cairn.llm.prompts import build_confidence_gating_messages
             messages = build_confidence_gating_messages(query, results)
             assert self.llm is not None
-            raw = self.llm.generate(messages, max_tokens=512)
+            raw = generate_checked(self.llm, messages, 512, parses_as("object"))
             assessment = extract_json(raw, json_type="object")
             if assessment and isinstance(assessment, dict) and "confidence" in assessment:
                 return assessment
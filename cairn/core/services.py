@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from cairn.config import Config, load_config
+from cairn.core import http_client
 from cairn.core.activation import ActivationEngine
 from cairn.core.analytics import (
     AnalyticsQueryEngine,
@@ -23,6 +24,8 @@ from cairn.core.drift import DriftDetector
 from cairn.core.enrichment import Enricher
 from cairn.core.event_bus import EventBus
 from cairn.core.event_dispatcher import EventDispatcher
+from cairn.core.event_stream import EventStreamHub
+from cairn.core.event_writer import EventWriter
 from cairn.core.extraction import KnowledgeExtractor
 from cairn.core.ingest import IngestPipeline
 from cairn.core.memory import MemoryStore
@@ -31,9 +34,11 @@ from cairn.core.reranker import get_reranker
 from cairn.core.search import SearchEngine
 from cairn.core.search_v2 import SearchV2
 from cairn.core.stats import (
+    init_embedding_cache_stats,
     init_embedding_stats,
     init_event_bus_ref,
     init_event_bus_stats,
+    init_llm_cache_stats,
     init_llm_stats,
 )
 from cairn.core.thinking import ThinkingEngine
@@ -41,10 +46,12 @@ from cairn.core.user import UserManager
 from cairn.core.work_items import WorkItemManager
 from cairn.core.working_memory import WorkingMemoryStore
 from cairn.embedding import get_embedding_engine
+from cairn.embedding.cache import CachedEmbedding
 from cairn.embedding.interface import EmbeddingInterface
 from cairn.graph import get_graph_provider
 from cairn.graph.interface import GraphProvider
 from cairn.llm import get_llm
+from cairn.llm.cache import CachedLLM, LLMCache
 from cairn.storage.database import Database
 
 if TYPE_CHECKING:
@@ -52,6 +59,7 @@ if TYPE_CHECKING:
     from cairn.core.consolidation import ConsolidationWorker
     from cairn.core.decay import DecayWorker
     from cairn.llm.interface import LLMInterface
+    from cairn.llm.router import ModelRouter
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +86,8 @@ class Services:
     ingest_pipeline: IngestPipeline
     work_item_manager: WorkItemManager  # experimental — tagged, not deleted
     event_dispatcher: EventDispatcher | None
+    event_writer: EventWriter | None
+    event_stream_hub: EventStreamHub
     analytics_tracker: UsageTracker | None
     rollup_worker: RollupWorker | None
     decay_worker: DecayWorker | None
@@ -86,6 +96,8 @@ class Services:
     working_memory_store: WorkingMemoryStore
     belief_store: BeliefStore | None
     consolidation_worker: ConsolidationWorker | None
+    router: ModelRouter | None = None
+    llm_cache: LLMCache | None = None
 
 
 def create_services(config: Config | None = None, db: Database | None = None) -> Services:
@@ -113,6 +125,9 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
         analytics_engine = AnalyticsQueryEngine(db, analytics_config=config.analytics)
         logger.info("Analytics enabled (retention=%dd)", config.analytics.retention_days)
 
+    # Pool settings must be in place before any HTTP backend is built
+    http_client.configure(config.http_client)
+
     embedding = get_embedding_engine(config.embedding)
 
     # Initialize embedding stats
@@ -125,11 +140,21 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
     init_embedding_stats(config.embedding.backend, emb_model)
     init_event_bus_stats()
 
+    if config.embedding.cache_enabled:
+        cache_bytes = config.embedding.cache_max_mb * 1024 * 1024
+        init_embedding_cache_stats(cache_bytes)
+        embedding = CachedEmbedding(
+            embedding, emb_model, max_bytes=cache_bytes, path=config.embedding.cache_path,
+            persistent_max_bytes=config.embedding.cache_persistent_max_mb * 1024 * 1024,
+        )
+        logger.info("Embedding cache enabled (%d MB)", config.embedding.cache_max_mb)
+
     # LLM enrichment (optional, graceful if disabled)
     llm: LLMInterface | None = None
     llm_capable: LLMInterface | None = None
     llm_fast: LLMInterface | None = None
     llm_chat: LLMInterface | None = None
+    router: ModelRouter | None = None
     enricher: Enricher | None = None
     if config.enrichment_enabled:
         try:
@@ -141,7 +166,6 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
                 llm_chat = router.for_operation("chat")
                 llm = llm_chat
                 init_llm_stats(config.llm.backend, router.get_model_name())
-                enricher = Enricher(llm_fast)
                 logger.info("Model router enabled: capable=%s, fast=%s, chat=%s",
                             llm_capable.get_model_name(), llm_fast.get_model_name(), llm_chat.get_model_name())
             else:
@@ -150,13 +174,32 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
                 llm_fast = llm
                 llm_chat = llm
                 init_llm_stats(config.llm.backend, llm.get_model_name())
-                enricher = Enricher(llm)
                 logger.info("Enrichment enabled: %s", config.llm.backend)
         except Exception:
             logger.warning("Failed to initialize LLM, enrichment disabled", exc_info=True)
     else:
         logger.info("Enrichment disabled by config")
 
+    # Response cache for the operations whose prompts are fully determined by their inputs
+    llm_cache: LLMCache | None = None
+    if llm_fast is not None and config.llm_cache.enabled:
+        init_llm_cache_stats(config.llm_cache.max_mb * 1024 * 1024)
+        llm_cache = LLMCache(config.llm_cache, dsn=db.config.dsn)
+        if router is not None:
+            router.cache = llm_cache
+        logger.info("LLM response cache enabled (%d MB, persistent=%s)",
+                    config.llm_cache.max_mb, config.llm_cache.persistent)
+
+    def cached(inner: LLMInterface | None, operation: str) -> LLMInterface | None:
+        if inner is None or llm_cache is None:
+            return inner
+        return CachedLLM(inner, llm_cache, operation)
+
+    if llm_fast is not None:
+        enrichment_llm = cached(llm_fast, "enrichment")
+        assert enrichment_llm is not None
+        enricher = Enricher(enrichment_llm)
+
     capabilities = config.capabilities
 
     # Graph provider (required — Neo4j must be available)
@@ -165,7 +208,9 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
 
     knowledge_extractor = None
     if capabilities.knowledge_extraction and llm_capable:
-        knowledge_extractor = KnowledgeExtractor(llm_capable, embedding, graph_provider)
+        extraction_llm = cached(llm_capable, "extraction")
+        assert extraction_llm is not None
+        knowledge_extractor = KnowledgeExtractor(extraction_llm, embedding, graph_provider)
         logger.info("Knowledge extraction enabled")
     elif capabilities.knowledge_extraction and not llm:
         logger.warning("Knowledge extraction requested but LLM not available")
@@ -189,12 +234,18 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
         db, embedding, enricher=enricher, llm=llm_capable, capabilities=capabilities,
         knowledge_extractor=knowledge_extractor,
         event_bus=None,  # set after event_bus creation below
+        enrichment_mode=config.enrichment_mode,
+        long_content=config.embedding.long_content,
     )
     project_manager = ProjectManager(db)
 
     # Event bus — created early so managers can publish events
     event_bus = EventBus(db, project_manager)
 
+    # Background batch writer for usage/telemetry events (emit_buffered)
+    event_writer = EventWriter(event_bus)
+    event_bus.writer = event_writer
+
     # Wire event_bus into memory_store
     memory_store.event_bus = event_bus
 
@@ -239,14 +290,19 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
     # Event dispatcher — background delivery worker
     event_dispatcher = EventDispatcher(db, event_bus)
 
+    # Shared LISTEN connection fanning cairn_events out to SSE streams
+    event_stream_hub = EventStreamHub(db)
+
     # RRF search engine (core signal fusion)
     rrf_engine = SearchEngine(
-        db, embedding, llm=llm_fast, capabilities=capabilities,
+        db, embedding, llm=cached(llm_fast, "routing"), capabilities=capabilities,
         reranker=reranker, rerank_candidates=config.reranker.candidates,
         activation_engine=activation_engine,
         graph_provider=graph_provider,
         decay_lambda=config.decay_lambda,
         memory_store=memory_store,
+        execution_mode=config.search_execution,
+        chunk_vectors=config.embedding.long_content == "multi",
     )
 
     # Unified search — always wraps SearchEngine
@@ -254,7 +310,7 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
         db=db,
         embedding=embedding,
         graph=graph_provider,
-        llm=llm_fast,
+        llm=cached(llm_fast, "routing"),
         capabilities=capabilities,
         reranker=reranker,
         rerank_candidates=config.reranker.candidates,
@@ -276,13 +332,16 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
     _belief_store = BeliefStore(db, event_bus=event_bus)
 
     # Cluster engine (needed by both insights and consolidation worker)
-    _cluster_engine = ClusterEngine(db, embedding, llm=llm_fast, config=config.clustering)
+    _cluster_engine = ClusterEngine(db, embedding, llm=cached(llm_fast, "clustering"), config=config.clustering)
 
     # Consolidation worker (background thread for memory synthesis)
     _consolidation_worker = None
     if config.consolidation_worker.enabled:
         from cairn.core.consolidation import ConsolidationWorker
-        _consolidation_engine = ConsolidationEngine(db, embedding, llm=llm_fast, capabilities=capabilities)
+        _consolidation_engine = ConsolidationEngine(
+            db, embedding, llm=cached(llm_fast, "consolidation"), capabilities=capabilities,
+            max_candidate_pairs=config.consolidation_worker.max_candidate_pairs,
+        )
         _consolidation_worker = ConsolidationWorker(
             engine=_consolidation_engine,
             db=db,
@@ -317,11 +376,16 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
             thought_extraction=capabilities.thought_extraction,
             event_bus=event_bus,
         ),
-        consolidation_engine=ConsolidationEngine(db, embedding, llm=llm_fast, capabilities=capabilities),
+        consolidation_engine=ConsolidationEngine(
+            db, embedding, llm=cached(llm_fast, "consolidation"), capabilities=capabilities,
+            max_candidate_pairs=config.consolidation_worker.max_candidate_pairs,
+        ),
         event_bus=event_bus,
         event_dispatcher=event_dispatcher,
+        event_writer=event_writer,
+        event_stream_hub=event_stream_hub,
         drift_detector=DriftDetector(db),
-        ingest_pipeline=IngestPipeline(db, project_manager, memory_store, llm_fast, config),
+        ingest_pipeline=IngestPipeline(db, project_manager, memory_store, cached(llm_fast, "enrichment"), config),
         analytics_tracker=analytics_tracker,
         rollup_worker=rollup_worker,
         decay_worker=decay_worker,
@@ -333,4 +397,6 @@ def create_services(config: Config | None = None, db: Database | None = None) ->
         ),
         belief_store=_belief_store,
         consolidation_worker=_consolidation_worker,
+        router=router,
+        llm_cache=llm_cache,
     )
@@ -67,8 +67,67 @@ class ModelStats:
             }
 
 
+class CacheStats:
+    """Track hits, misses, and evictions for a cache and its persistent tier.
+
+    Persistent-tier hits and evictions count toward the totals and are also
+    reported on their own.
+    """
+
+    def __init__(self, name: str, max_bytes: int = 0):
+        self.name = name
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._persistent_evictions = 0
+        self._entries = 0
+        self._bytes = 0
+
+    def record_hits(self, n: int = 1, *, persistent: bool = False) -> None:
+        with self._lock:
+            self._hits += n
+            if persistent:
+                self._persistent_hits += n
+
+    def record_misses(self, n: int = 1) -> None:
+        with self._lock:
+            self._misses += n
+
+    def record_evictions(self, n: int = 1, *, persistent: bool = False) -> None:
+        with self._lock:
+            self._evictions += n
+            if persistent:
+                self._persistent_evictions += n
+
+    def set_size(self, entries: int, size_bytes: int) -> None:
+        with self._lock:
+            self._entries = entries
+            self._bytes = size_bytes
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "name": self.name,
+                "hits": self._hits,
+                "persistent_hits": self._persistent_hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else None,
+                "evictions": self._evictions,
+                "persistent_evictions": self._persistent_evictions,
+                "entries": self._entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
 # Singletons — initialized by services.py on startup
 embedding_stats: ModelStats | None = None
+embedding_cache_stats: CacheStats | None = None
+llm_cache_stats: CacheStats | None = None
 llm_stats: ModelStats | None = None
 _event_bus = None  # EventBus — set by services.py via init_event_bus_ref()
 
@@ -90,6 +149,18 @@ def init_embedding_stats(backend: str, model: str) -> ModelStats:
     return embedding_stats
 
 
+def init_embedding_cache_stats(max_bytes: int) -> CacheStats:
+    global embedding_cache_stats
+    embedding_cache_stats = CacheStats("embedding", max_bytes)
+    return embedding_cache_stats
+
+
+def init_llm_cache_stats(max_bytes: int) -> CacheStats:
+    global llm_cache_stats
+    llm_cache_stats = CacheStats("llm", max_bytes)
+    return llm_cache_stats
+
+
 def init_llm_stats(backend: str, model: str) -> ModelStats:
     global llm_stats
     llm_stats = ModelStats(backend, model)
@@ -205,7 +276,9 @@ def emit_usage_event(
 ) -> None:
     """Emit LLM/embedding usage as an event through the unified bus.
 
-    Events persist to Postgres and trigger NOTIFY for real-time SSE streaming.
+    Events are queued for the background EventWriter, which persists them in
+    batches (each row still triggers NOTIFY for real-time SSE streaming), so
+    the embed/LLM call path pays no database round trip.
     """
     if _event_bus is not None:
         # Operations arrive as "embed", "embed.batch", "llm.generate", etc.
@@ -217,7 +290,7 @@ def emit_usage_event(
         else:
             event_type = f"llm.{operation}"
         try:
-            _event_bus.emit(
+            _event_bus.emit_buffered(
                 event_type,
                 tool_name=model,
                 payload={
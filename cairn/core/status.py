@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from cairn import __version__
 from cairn.config import EXPERIMENTAL_CAPABILITIES, Config
-from cairn.core import stats
+from cairn.core import analytics, http_client, stats
 from cairn.core.analytics import track_operation
 from cairn.storage.database import Database
 
+if TYPE_CHECKING:
+    from cairn.llm.cache import LLMCache
+    from cairn.llm.router import ModelRouter
+
 
 @track_operation("status")
-def get_status(db: Database, config: Config, graph_provider=None) -> dict:
-    """Aggregate system health metrics."""
+def get_status(
+    db: Database, config: Config, graph_provider=None,
+    router: ModelRouter | None = None, llm_cache: LLMCache | None = None,
+) -> dict:
+    """Aggregate system health metrics.
+
+    The router (or the bare response cache when routing is off) supplies
+    per-operation LLM cache hit rates.
+    """
     subsystem_errors: list[str] = []
 
     # DB reachability check
@@ -56,8 +69,21 @@ def get_status(db: Database, config: Config, graph_provider=None) -> dict:
     models = {}
     if stats.embedding_stats:
         models["embedding"] = stats.embedding_stats.to_dict()
+        if stats.embedding_cache_stats:
+            models["embedding"]["cache"] = stats.embedding_cache_stats.to_dict()
     if stats.llm_stats:
         models["llm"] = stats.llm_stats.to_dict()
+        if router is not None:
+            models["llm"]["router"] = router.stats()
+            if models["llm"]["router"]["cache"] is not None:
+                models["llm"]["cache"] = models["llm"]["router"]["cache"]
+        elif llm_cache is not None:
+            models["llm"]["cache"] = llm_cache.to_dict()
+        elif stats.llm_cache_stats:
+            models["llm"]["cache"] = stats.llm_cache_stats.to_dict()
+    pools = http_client.health()
+    if pools:
+        models["http_pools"] = pools
 
     # Event bus observability
     event_bus_info = None
@@ -113,6 +139,9 @@ def get_status(db: Database, config: Config, graph_provider=None) -> dict:
                 "rollup_watermark": state_row["last_event_id"] if state_row else 0,
                 "rollup_updated_at": state_row["updated_at"].isoformat() if state_row and state_row["updated_at"] else None,
             }
+            tracker = analytics.tracker_health()
+            if tracker is not None:
+                result["analytics"]["tracker"] = tracker
     except Exception:
         pass  # tables may not exist yet (pre-migration)
 
@@ -213,7 +213,7 @@ def budgeted_discover_patterns(
     reclustered = False
     labeling_error = None
     if ce.is_stale(project):
-        cluster_result = ce.run_clustering(project)
+        cluster_result = ce.refresh(project)
         reclustered = True
         labeling_error = cluster_result.get("labeling_error")
 
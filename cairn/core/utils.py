@@ -48,6 +48,34 @@ def validate_store(content, project, memory_type, importance, tags, session_name
         raise ValidationError(f"session_name exceeds {MAX_NAME_LENGTH} character limit")
 
 
+_STORE_MANY_FIELDS = frozenset({
+    "content", "project", "memory_type", "importance", "tags", "session_name",
+    "related_files", "related_ids", "file_hashes", "author", "event_at", "valid_until", "salience",
+})
+
+
+def validate_store_many(memories):
+    """Validate store_many tool inputs: each item as for store. Raises ValidationError."""
+    from cairn.core.constants import MAX_STORE_MANY
+    if not isinstance(memories, list) or not memories:
+        raise ValidationError("memories must be a non-empty list")
+    if len(memories) > MAX_STORE_MANY:
+        raise ValidationError(f"maximum {MAX_STORE_MANY} memories per call")
+    for i, m in enumerate(memories):
+        if not isinstance(m, dict):
+            raise ValidationError(f"memories[{i}] must be an object")
+        unknown = set(m) - _STORE_MANY_FIELDS
+        if unknown:
+            raise ValidationError(f"memories[{i}]: unknown fields {', '.join(sorted(unknown))}")
+        try:
+            validate_store(
+                m.get("content"), m.get("project"), m.get("memory_type"),
+                m.get("importance"), m.get("tags"), m.get("session_name"),
+            )
+        except ValidationError as e:
+            raise ValidationError(f"memories[{i}]: {e}") from None
+
+
 def validate_search(query, limit):
     """Validate search tool inputs."""
     from cairn.core.constants import MAX_LIMIT, MAX_SEARCH_QUERY
@@ -177,19 +205,6 @@ def get_or_create_project(db: Database, project_name: str) -> int:
     return row["id"]
 
 
-def parse_vector(text: str | None) -> list[float] | None:
-    """Parse a pgvector string like '[0.1,0.2,...]' into a list of floats.
-
-    Handles both string representations and already-parsed sequences.
-    Returns None if input is None (no embedding stored).
-    """
-    if text is None:
-        return None
-    if isinstance(text, str):
-        return [float(x) for x in text.strip("[]").split(",")]
-    return list(text)
-
-
 def strip_markdown_fences(text: str) -> str:
     """Remove markdown code fences from LLM response text."""
     text = re.sub(r"^```(?:json)?\s*", "", text)
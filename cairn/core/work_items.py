@@ -25,6 +25,7 @@ from cairn.core.utils import (
     parse_display_id,
 )
 from cairn.storage.database import Database
+from cairn.storage.vector import to_vector
 
 if TYPE_CHECKING:
     from cairn.core.event_bus import EventBus
@@ -220,7 +221,7 @@ class WorkItemManager:
             (
                 project_id, title, description, acceptance_criteria, item_type,
                 priority, parent_id, session_name,
-                content_embedding, _json_dumps(metadata),
+                to_vector(content_embedding), _json_dumps(metadata),
                 _json_dumps(constraints), risk_tier or 0, seq_num, _created_by,
             ),
         )
@@ -342,7 +343,7 @@ class WorkItemManager:
             if emb:
                 self.db.execute(
                     "UPDATE work_items SET embedding = %s WHERE id = %s",
-                    (emb, item["id"]),
+                    (to_vector(emb), item["id"]),
                 )
 
         # Log status change activity
@@ -24,6 +24,7 @@ from cairn.core.constants import (
     WM_SALIENCE_DECAY_RATE,
 )
 from cairn.core.utils import get_or_create_project, get_project
+from cairn.storage.vector import to_vector
 
 if TYPE_CHECKING:
     from cairn.core.beliefs import BeliefStore
@@ -118,7 +119,7 @@ class WorkingMemoryStore:
             RETURNING id, created_at
             """,
             (project_id, content, item_type, salience, author,
-             embedding_vec, session_name),
+             to_vector(embedding_vec), session_name),
         )
         assert row is not None
         self.db.commit()
@@ -5,92 +5,125 @@ import logging
 import time
 
 import boto3
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 from cairn.config import EmbeddingConfig
 from cairn.core import stats
 from cairn.embedding.interface import EmbeddingInterface
+from cairn.embedding.parallel import ParallelRunner
 
 logger = logging.getLogger(__name__)
 
+_TRANSIENT_ERRORS = (
+    "ThrottlingException",
+    "ServiceUnavailableException",
+    "ModelTimeoutException",
+)
+
+
+def _is_transient(error: Exception) -> bool:
+    return (
+        isinstance(error, ClientError)
+        and error.response.get("Error", {}).get("Code", "") in _TRANSIENT_ERRORS
+    )
+
 
 class BedrockEmbedding(EmbeddingInterface):
     """Embedding via AWS Bedrock Titan Text Embeddings V2.
 
-    Single-text-per-call API — embed_batch loops over texts.
+    Single-text-per-call API — embed_batch fans calls out over a bounded,
+    rate-limited thread pool (see cairn.embedding.parallel).
     8,192 token context, configurable output dimensions (256/512/1024).
     """
 
     def __init__(self, config: EmbeddingConfig):
         self._dimensions = config.dimensions
         self._model_id = config.bedrock_model
+        concurrency = max(1, config.bedrock_concurrency)
         self._client = boto3.client(
             "bedrock-runtime",
             region_name=config.bedrock_region,
+            # botocore's default pool (10) would serialize wider fan-out
+            config=BotoConfig(max_pool_connections=max(10, concurrency)),
+        )
+        self._runner = ParallelRunner(
+            concurrency,
+            config.bedrock_rate_limit,
+            is_throttle=_is_transient,
+            name="bedrock-embed",
         )
         logger.info(
-            "Bedrock embedding ready: %s (region=%s, dimensions=%d)",
+            "Bedrock embedding ready: %s (region=%s, dimensions=%d, concurrency=%d)",
             self._model_id,
             config.bedrock_region,
             self._dimensions,
+            concurrency,
         )
 
     @property
     def dimensions(self) -> int:
         return self._dimensions
 
-    def embed(self, text: str) -> list[float]:
-        """Embed a single text string via Titan V2. Returns a normalized float vector."""
-        body = json.dumps({
-            "inputText": text,
-            "dimensions": self._dimensions,
-            "normalize": True,
-        })
+    def _invoke(self, text: str) -> list[float]:
+        """One invoke_model round trip. No retries, no stats."""
+        response = self._client.invoke_model(
+            modelId=self._model_id,
+            contentType="application/json",
+            accept="application/json",
+            body=json.dumps({
+                "inputText": text,
+                "dimensions": self._dimensions,
+                "normalize": True,
+            }),
+        )
+        return json.loads(response["body"].read())["embedding"]
 
-        t0 = time.monotonic()
-        last_error: Exception | None = None
-        for attempt in range(3):
-            try:
-                response = self._client.invoke_model(
-                    modelId=self._model_id,
-                    contentType="application/json",
-                    accept="application/json",
-                    body=body,
-                )
-                result = json.loads(response["body"].read())
-                latency_ms = (time.monotonic() - t0) * 1000
-                tokens_est = len(text) // 4
-                if stats.embedding_stats:
-                    stats.embedding_stats.record_call(tokens_est=tokens_est)
-                stats.emit_usage_event("embed", self._model_id, tokens_in=tokens_est, latency_ms=latency_ms)
-                return result["embedding"]
-            except ClientError as e:
-                error_code = e.response.get("Error", {}).get("Code", "")
-                if error_code in (
-                    "ThrottlingException",
-                    "ServiceUnavailableException",
-                    "ModelTimeoutException",
-                ):
-                    last_error = e
-                    wait = 2 ** attempt
-                    logger.warning(
-                        "Bedrock embedding transient error (attempt %d/3): %s. Retrying in %ds...",
-                        attempt + 1, error_code, wait,
-                    )
-                    time.sleep(wait)
-                    continue
-                raise
-
-        latency_ms = (time.monotonic() - t0) * 1000
+    def _record_success(self, text: str, latency_ms: float) -> None:
+        tokens_est = len(text) // 4
+        if stats.embedding_stats:
+            stats.embedding_stats.record_call(tokens_est=tokens_est)
+        stats.emit_usage_event("embed", self._model_id, tokens_in=tokens_est, latency_ms=latency_ms)
+
+    def _record_failure(self, error: Exception, latency_ms: float) -> None:
         if stats.embedding_stats:
-            stats.embedding_stats.record_error(str(last_error))
+            stats.embedding_stats.record_error(str(error))
         stats.emit_usage_event(
             "embed", self._model_id, latency_ms=latency_ms,
-            success=False, error_message=str(last_error),
+            success=False, error_message=str(error),
         )
-        assert last_error is not None
-        raise last_error  # All retries exhausted
+
+    def embed(self, text: str) -> list[float]:
+        """Embed a single text string via Titan V2. Returns a normalized float vector.
+
+        Runs through the same runner as embed_batch, so single calls count
+        against its concurrency and rate limits and feed throttling back.
+        """
+        return self.embed_batch([text])[0]
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Embed multiple texts. Titan V2 is single-text per call, so we loop."""
-        return [self.embed(text) for text in texts]
+        """Embed multiple texts concurrently. Results are in input order.
+
+        Titan V2 is single-text per call, so each text is its own request,
+        fanned out under the backend's concurrency and rate limits with
+        throttling-aware backoff. Stats and usage events are recorded on the
+        calling thread so pool threads never touch a database connection.
+        """
+        def timed(text: str) -> tuple[list[float], float]:
+            t0 = time.monotonic()
+            vector = self._invoke(text)
+            return vector, (time.monotonic() - t0) * 1000
+
+        t0 = time.monotonic()
+        try:
+            results = self._runner.map(timed, texts)
+        except Exception as e:
+            self._record_failure(e, (time.monotonic() - t0) * 1000)
+            raise
+        for text, (_, latency_ms) in zip(texts, results, strict=True):
+            self._record_success(text, latency_ms)
+        return [vector for vector, _ in results]
+
+    def health(self) -> dict:
+        """Current fan-out limits (concurrency adapts to throttling)."""
+        return self._runner.health()
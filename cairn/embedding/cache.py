@@ -0,0 +1,270 @@
+"""Content-addressed embedding cache. Wraps any EmbeddingInterface backend.
+
+Vectors are keyed by (model, dimensions, sha256(text)), so the same string is
+embedded once no matter which caller asks: repeated queries, entity chunks,
+re-enrichment, content + summary on store.
+
+Two tiers:
+  - In-process LRU bounded by a byte budget (always on when caching is on).
+  - Optional persistent tier in a local SQLite file, so restarts don't start
+    cold. It lives outside Postgres on purpose: cache reads/writes never touch
+    the caller's transaction. It has its own byte budget; when a write takes
+    it over, least-recently-used rows are pruned to 90% of the budget and
+    counted as persistent evictions in the cache stats.
+
+Vectors are stored as float32 (what pgvector keeps anyway). Misses are
+returned through the same float32 round-trip so a text always yields the
+same vector, cached or not.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+from cairn.core import stats
+from cairn.embedding.interface import EmbeddingInterface
+
+logger = logging.getLogger(__name__)
+
+# Approximate per-entry overhead beyond the vector bytes (key, OrderedDict node)
+_ENTRY_OVERHEAD = 120
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class _PersistentTier:
+    """SQLite-backed vector store shared across restarts.
+
+    Args:
+        path: SQLite file.
+        max_bytes: Budget for keys + vectors; 0 means unbounded.
+    """
+
+    # Pruning brings the tier down to this fraction of max_bytes
+    PRUNE_TO = 0.9
+
+    def __init__(self, path: str, max_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            " key BLOB PRIMARY KEY, vector BLOB NOT NULL, used REAL NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(embedding_cache)")}
+        if "used" not in columns:
+            # Files written before the budget existed
+            self._conn.execute("ALTER TABLE embedding_cache ADD COLUMN used REAL NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embedding_cache_used ON embedding_cache (used)")
+        self._entries, self._bytes = self._size()
+        self.evictions = 0
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, bytes]:
+        found: dict[bytes, bytes] = {}
+        now = time.time()
+        with self._lock:
+            # SQLite caps bound parameters; 500 stays well below every default
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embedding_cache WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                if rows:
+                    self._conn.execute(
+                        f"UPDATE embedding_cache SET used = ? WHERE key IN ({placeholders})",
+                        [now, *chunk],
+                    )
+                found.update(rows)
+        return found
+
+    def put_many(self, items: list[tuple[bytes, bytes]]) -> int:
+        """Insert vectors, pruning over budget. Returns the rows evicted."""
+        if not items:
+            return 0
+        now = time.time()
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embedding_cache (key, vector, used) VALUES (?, ?, ?)",
+                [(key, vector, now) for key, vector in items],
+            )
+            self._conn.execute("COMMIT")
+            added = self._conn.total_changes - before
+            self._entries += added
+            self._bytes += added * sum(len(k) + len(v) for k, v in items) // len(items)
+            if self.max_bytes and self._bytes > self.max_bytes:
+                return self._prune()
+        return 0
+
+    def _size(self) -> tuple[int, int]:
+        entries, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(length(key) + length(vector)), 0) FROM embedding_cache"
+        ).fetchone()
+        return entries, size
+
+    def _prune(self) -> int:
+        """Delete least-recently-used rows down to PRUNE_TO of the budget."""
+        entry_size = max(1, self._bytes // max(1, self._entries))
+        excess = self._bytes - int(self.max_bytes * self.PRUNE_TO)
+        count = -(-excess // entry_size)
+        self._conn.execute(
+            "DELETE FROM embedding_cache WHERE key IN"
+            " (SELECT key FROM embedding_cache ORDER BY used LIMIT ?)",
+            (count,),
+        )
+        entries, self._bytes = self._size()
+        evicted = self._entries - entries
+        self.evictions += evicted
+        self._entries = entries
+        return evicted
+
+
+class CachedEmbedding(EmbeddingInterface):
+    """Caching decorator for an embedding backend.
+
+    Args:
+        inner: The backend that actually computes vectors.
+        model: Model identifier used in the cache key.
+        max_bytes: Byte budget for the in-process LRU tier.
+        path: SQLite file for the persistent tier, or "" for memory only.
+        persistent_max_bytes: Byte budget for the persistent tier; 0 means
+            unbounded.
+    """
+
+    def __init__(
+        self,
+        inner: EmbeddingInterface,
+        model: str,
+        *,
+        max_bytes: int,
+        path: str = "",
+        persistent_max_bytes: int = 0,
+    ):
+        self.inner = inner
+        self.model = model
+        self.max_bytes = max_bytes
+        self._lru: OrderedDict[bytes, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._key_prefix = f"{model}\x00{inner.dimensions}\x00".encode()
+        self._stats = stats.embedding_cache_stats or stats.CacheStats("embedding", max_bytes)
+
+        self._persistent: _PersistentTier | None = None
+        if path:
+            try:
+                self._persistent = _PersistentTier(path, persistent_max_bytes)
+                logger.info("Embedding cache: persistent tier at %s", path)
+            except Exception:
+                logger.warning("Embedding cache: persistent tier unavailable (%s)", path, exc_info=True)
+
+    @property
+    def dimensions(self) -> int:
+        return self.inner.dimensions
+
+    def __getattr__(self, name: str):
+        # Backend-specific attributes (config, client, ...) pass through
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(self._key_prefix + text.encode("utf-8")).digest()
+
+    def embed(self, text: str) -> list[float]:
+        """Embed a single text string, served from cache when possible."""
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed multiple texts. Only unique cache misses reach the backend."""
+        keys = [self._key(t) for t in texts]
+        found: dict[bytes, bytes] = {}
+
+        with self._lock:
+            for key in keys:
+                if key in found:
+                    continue
+                blob = self._lru.get(key)
+                if blob is not None:
+                    self._lru.move_to_end(key)
+                    found[key] = blob
+        lru_hits = sum(1 for k in keys if k in found)
+
+        missing = list(dict.fromkeys(k for k in keys if k not in found))
+        persistent_found: dict[bytes, bytes] = {}
+        if missing and self._persistent is not None:
+            try:
+                persistent_found = self._persistent.get_many(missing)
+            except Exception:
+                logger.debug("Embedding cache: persistent lookup failed", exc_info=True)
+            found.update(persistent_found)
+
+        # Compute what's left, one backend call for all unique misses
+        computed: dict[bytes, bytes] = {}
+        to_compute = [k for k in missing if k not in persistent_found]
+        if to_compute:
+            first_text: dict[bytes, str] = {}
+            for key, text in zip(keys, texts, strict=True):
+                first_text.setdefault(key, text)
+            miss_texts = [first_text[k] for k in to_compute]
+            if len(miss_texts) == 1:
+                vectors = [self.inner.embed(miss_texts[0])]
+            else:
+                vectors = self.inner.embed_batch(miss_texts)
+            computed = {k: _pack(v) for k, v in zip(to_compute, vectors, strict=True)}
+            found.update(computed)
+            if self._persistent is not None:
+                try:
+                    evicted = self._persistent.put_many(list(computed.items()))
+                    if evicted:
+                        self._stats.record_evictions(evicted, persistent=True)
+                except Exception:
+                    logger.debug("Embedding cache: persistent write failed", exc_info=True)
+
+        if persistent_found or computed:
+            self._remember({**persistent_found, **computed})
+
+        persistent_hits = sum(1 for k in keys if k in persistent_found)
+        self._stats.record_hits(lru_hits)
+        if persistent_hits:
+            self._stats.record_hits(persistent_hits, persistent=True)
+        self._stats.record_misses(len(keys) - lru_hits - persistent_hits)
+
+        return [_unpack(found[k]) for k in keys]
+
+    def _remember(self, items: dict[bytes, bytes]) -> None:
+        """Insert into the LRU tier, evicting least-recently-used over budget."""
+        evicted = 0
+        with self._lock:
+            for key, blob in items.items():
+                if key in self._lru:
+                    self._lru.move_to_end(key)
+                    continue
+                self._lru[key] = blob
+                self._bytes += len(blob) + _ENTRY_OVERHEAD
+            while self._bytes > self.max_bytes and self._lru:
+                _, old = self._lru.popitem(last=False)
+                self._bytes -= len(old) + _ENTRY_OVERHEAD
+                evicted += 1
+            entries, size = len(self._lru), self._bytes
+        if evicted:
+            self._stats.record_evictions(evicted)
+        self._stats.set_size(entries, size)
@@ -8,26 +8,27 @@ Works with any API that speaks the /v1/embeddings format:
   - Together AI (api.together.xyz)
   - Any OpenAI-compatible endpoint
 
-No SDK dependency — uses urllib like the LLM provider.
+No SDK dependency — uses the pooled HTTP client shared with the LLM providers.
 """
 
 import json
 import logging
 import time
-import urllib.error
-import urllib.request
 
 from cairn.config import EmbeddingConfig
 from cairn.core import stats
+from cairn.core.http_client import RetryPolicy, client_for
 from cairn.embedding.interface import EmbeddingInterface
 
 logger = logging.getLogger(__name__)
 
+_RETRY = RetryPolicy(attempts=3)
+
 
 class OpenAICompatibleEmbedding(EmbeddingInterface):
     """Embedding via any OpenAI-compatible /v1/embeddings endpoint.
 
-    No SDK dependency — uses urllib like the other providers.
+    No SDK dependency — requests go through the shared pooled HTTP client.
     Empty API key = no Authorization header (for local endpoints like Ollama).
     """
 
@@ -36,6 +37,7 @@ class OpenAICompatibleEmbedding(EmbeddingInterface):
         self._model = config.openai_model
         self._api_key = config.openai_api_key
         self._base_url = config.openai_base_url.rstrip("/")
+        self._http = client_for(self._base_url)
         logger.info(
             "OpenAI-compatible embedding ready: %s at %s (dimensions=%d, auth=%s)",
             self._model,
@@ -48,80 +50,52 @@ class OpenAICompatibleEmbedding(EmbeddingInterface):
     def dimensions(self) -> int:
         return self._dimensions
 
-    def _build_request(self, payload: bytes) -> urllib.request.Request:
-        """Build HTTP request with optional auth header."""
+    def _headers(self) -> dict[str, str]:
+        """Request headers with optional auth."""
         headers = {"Content-Type": "application/json"}
         if self._api_key:
             headers["Authorization"] = f"Bearer {self._api_key}"
-        return urllib.request.Request(
-            f"{self._base_url}/v1/embeddings",
-            data=payload,
-            headers=headers,
-        )
+        return headers
+
+    def _post(self, payload: dict, operation: str, timeout: float) -> dict:
+        """POST to /v1/embeddings with retries; records the failure if they run out."""
+        t0 = time.monotonic()
+        try:
+            raw = self._http.post(
+                f"{self._base_url}/v1/embeddings", json.dumps(payload).encode(), self._headers(),
+                timeout=timeout, retry=_RETRY, label="Embedding API",
+            )
+        except Exception as e:
+            latency_ms = (time.monotonic() - t0) * 1000
+            if stats.embedding_stats:
+                stats.embedding_stats.record_error(str(e))
+            stats.emit_usage_event(
+                operation, self._model, latency_ms=latency_ms,
+                success=False, error_message=str(e),
+            )
+            raise
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"API returned invalid JSON: {raw[:200].decode(errors='replace')}") from e
 
     def embed(self, text: str) -> list[float]:
         """Embed a single text string with retry on transient failures."""
-        payload = json.dumps({
-            "model": self._model,
-            "input": text,
-        }).encode()
-
-        req = self._build_request(payload)
-
         t0 = time.monotonic()
-        last_error: Exception | None = None
-        for attempt in range(3):
-            try:
-                with urllib.request.urlopen(req, timeout=60) as resp:
-                    raw = resp.read()
-                try:
-                    result = json.loads(raw)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"API returned invalid JSON: {raw[:200]}") from e
-
-                data = result.get("data", [])
-                if not data:
-                    raise ValueError(f"API returned no data: {list(result.keys())}")
-                embedding = data[0].get("embedding")
-                if embedding is None:
-                    raise ValueError(f"Unexpected response structure: {data[0].keys()}")
-                latency_ms = (time.monotonic() - t0) * 1000
-                tokens_est = len(text) // 4
-                if stats.embedding_stats:
-                    stats.embedding_stats.record_call(tokens_est=tokens_est)
-                stats.emit_usage_event("embed", self._model, tokens_in=tokens_est, latency_ms=latency_ms)
-                return embedding
-
-            except urllib.error.HTTPError as e:
-                if e.code in (429, 500, 502, 503):
-                    last_error = e
-                    wait = 2 ** attempt
-                    logger.warning(
-                        "Embedding API transient error (attempt %d/3): HTTP %d. Retrying in %ds...",
-                        attempt + 1, e.code, wait,
-                    )
-                    time.sleep(wait)
-                    continue
-                raise
-            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
-                last_error = e
-                wait = 2 ** attempt
-                logger.warning(
-                    "Embedding API transient error (attempt %d/3): %s. Retrying in %ds...",
-                    attempt + 1, e, wait,
-                )
-                time.sleep(wait)
-                continue
-
+        result = self._post({"model": self._model, "input": text}, "embed", timeout=60)
+
+        data = result.get("data", [])
+        if not data:
+            raise ValueError(f"API returned no data: {list(result.keys())}")
+        embedding = data[0].get("embedding")
+        if embedding is None:
+            raise ValueError(f"Unexpected response structure: {data[0].keys()}")
         latency_ms = (time.monotonic() - t0) * 1000
+        tokens_est = len(text) // 4
         if stats.embedding_stats:
-            stats.embedding_stats.record_error(str(last_error))
-        stats.emit_usage_event(
-            "embed", self._model, latency_ms=latency_ms,
-            success=False, error_message=str(last_error),
-        )
-        assert last_error is not None
-        raise last_error  # All retries exhausted
+            stats.embedding_stats.record_call(tokens_est=tokens_est)
+        stats.emit_usage_event("embed", self._model, tokens_in=tokens_est, latency_ms=latency_ms)
+        return embedding
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Embed multiple texts using native batch support.
@@ -132,68 +106,22 @@ class OpenAICompatibleEmbedding(EmbeddingInterface):
         if not texts:
             return []
 
-        payload = json.dumps({
-            "model": self._model,
-            "input": texts,
-        }).encode()
+        t0 = time.monotonic()
+        result = self._post({"model": self._model, "input": texts}, "embed.batch", timeout=120)
 
-        req = self._build_request(payload)
+        data = result.get("data", [])
+        if len(data) != len(texts):
+            raise ValueError(
+                f"Expected {len(texts)} embeddings, got {len(data)}"
+            )
 
-        t0 = time.monotonic()
-        last_error: Exception | None = None
-        for attempt in range(3):
-            try:
-                with urllib.request.urlopen(req, timeout=120) as resp:
-                    raw = resp.read()
-                try:
-                    result = json.loads(raw)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"API returned invalid JSON: {raw[:200]}") from e
-
-                data = result.get("data", [])
-                if len(data) != len(texts):
-                    raise ValueError(
-                        f"Expected {len(texts)} embeddings, got {len(data)}"
-                    )
-
-                # Sort by index to guarantee order matches input
-                data.sort(key=lambda d: d.get("index", 0))
-                embeddings = [d["embedding"] for d in data]
-
-                latency_ms = (time.monotonic() - t0) * 1000
-                total_tokens = sum(len(t) // 4 for t in texts)
-                if stats.embedding_stats:
-                    stats.embedding_stats.record_call(tokens_est=total_tokens)
-                stats.emit_usage_event("embed.batch", self._model, tokens_in=total_tokens, latency_ms=latency_ms)
-                return embeddings
-
-            except urllib.error.HTTPError as e:
-                if e.code in (429, 500, 502, 503):
-                    last_error = e
-                    wait = 2 ** attempt
-                    logger.warning(
-                        "Embedding API batch transient error (attempt %d/3): HTTP %d. Retrying in %ds...",
-                        attempt + 1, e.code, wait,
-                    )
-                    time.sleep(wait)
-                    continue
-                raise
-            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
-                last_error = e
-                wait = 2 ** attempt
-                logger.warning(
-                    "Embedding API batch transient error (attempt %d/3): %s. Retrying in %ds...",
-                    attempt + 1, e, wait,
-                )
-                time.sleep(wait)
-                continue
+        # Sort by index to guarantee order matches input
+        data.sort(key=lambda d: d.get("index", 0))
+        embeddings = [d["embedding"] for d in data]
 
         latency_ms = (time.monotonic() - t0) * 1000
+        total_tokens = sum(len(t) // 4 for t in texts)
         if stats.embedding_stats:
-            stats.embedding_stats.record_error(str(last_error))
-        stats.emit_usage_event(
-            "embed.batch", self._model, latency_ms=latency_ms,
-            success=False, error_message=str(last_error),
-        )
-        assert last_error is not None
-        raise last_error  # All retries exhausted
+            stats.embedding_stats.record_call(tokens_est=total_tokens)
+        stats.emit_usage_event("embed.batch", self._model, tokens_in=total_tokens, latency_ms=latency_ms)
+        return embeddings
@@ -0,0 +1,183 @@
+"""Bounded, rate-limited fan-out for single-input embedding APIs.
+
+Some backends (Bedrock Titan V2) embed exactly one text per request, so a
+batch is N independent round trips. ParallelRunner fans those calls out over
+a thread pool while staying polite to the provider:
+
+  - TokenBucket caps the request rate (requests/second, with a small burst).
+  - AdaptiveLimiter caps in-flight requests with AIMD: throttling halves the
+    limit, a run of successes raises it by one, never above the configured max.
+  - Throttled calls back off exponentially with jitter and are retried.
+
+Results always come back in input order. One runner is shared per backend
+instance, so concurrent embed_batch callers share the same limits.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """Classic token bucket. rate <= 0 disables limiting."""
+
+    def __init__(self, rate: float, burst: int | None = None):
+        self.rate = rate
+        self.capacity = burst or max(1, math.ceil(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns seconds spent waiting."""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class AdaptiveLimiter:
+    """Concurrency limit with additive increase / multiplicative decrease."""
+
+    INCREASE_EVERY = 20      # successes needed to raise the limit by one
+    DECREASE_COOLDOWN = 1.0  # seconds; one burst of throttles halves the limit once
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = self.max_concurrency
+        self.throttles = 0
+        self._active = 0
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self, *, throttled: bool = False) -> None:
+        with self._cond:
+            self._active -= 1
+            if throttled:
+                self.throttles += 1
+                self._successes = 0
+                now = time.monotonic()
+                if now - self._last_decrease >= self.DECREASE_COOLDOWN:
+                    self._last_decrease = now
+                    new_limit = max(1, self.limit // 2)
+                    if new_limit < self.limit:
+                        logger.info("Throttled: concurrency %d -> %d", self.limit, new_limit)
+                    self.limit = new_limit
+            else:
+                self._successes += 1
+                if self._successes >= self.INCREASE_EVERY and self.limit < self.max_concurrency:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+class ParallelRunner:
+    """Ordered, bounded, throttle-aware map over a shared thread pool.
+
+    Args:
+        max_concurrency: Upper bound on in-flight calls (and pool size).
+        rate_limit: Requests per second across all callers; 0 = unlimited.
+        is_throttle: Predicate marking an exception as retryable throttling.
+        max_attempts: Attempts per item before the error propagates.
+        base_delay: First backoff delay in seconds (doubles per attempt).
+        max_delay: Backoff ceiling in seconds.
+        name: Thread name prefix.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rate_limit: float = 0.0,
+        *,
+        is_throttle: Callable[[Exception], bool],
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        name: str = "parallel",
+    ):
+        self.limiter = AdaptiveLimiter(max_concurrency)
+        self.bucket = TokenBucket(rate_limit)
+        self.is_throttle = is_throttle
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.limiter.max_concurrency, thread_name_prefix=name,
+        )
+
+    def map(self, fn: Callable[[T], R], items: Sequence[T]) -> list[R]:
+        """Apply fn to every item concurrently. Results are in input order.
+
+        The first non-retryable (or exhausted) error cancels the calls that
+        have not started yet and is re-raised.
+        """
+        if not items:
+            return []
+        if len(items) == 1:
+            return [self.call(fn, items[0])]
+        futures = [self._executor.submit(self.call, fn, item) for item in items]
+        try:
+            return [f.result() for f in futures]
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            raise
+
+    def call(self, fn: Callable[[T], R], item: T) -> R:
+        """Run one call under the rate limit, concurrency limit, and retry policy."""
+        for attempt in range(self.max_attempts):
+            self.bucket.acquire()
+            self.limiter.acquire()
+            try:
+                result = fn(item)
+            except Exception as e:
+                throttled = self.is_throttle(e)
+                self.limiter.release(throttled=throttled)
+                if not throttled or attempt == self.max_attempts - 1:
+                    raise
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+                time.sleep(delay * random.uniform(0.5, 1.0))  # noqa: S311 - backoff jitter, not crypto
+                continue
+            self.limiter.release()
+            return result
+        raise AssertionError("unreachable")
+
+    def health(self) -> dict:
+        return {
+            "max_concurrency": self.limiter.max_concurrency,
+            "concurrency": self.limiter.limit,
+            "throttles": self.limiter.throttles,
+            "rate_limit": self.bucket.rate,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
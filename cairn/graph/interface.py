@@ -319,6 +319,104 @@ class GraphProvider(ABC):
         Returns {episode_id: shared_entity_count} for episodes NOT in candidates.
         """
 
+    # -- Batched extraction persistence --
+    # Defaults fall back to the per-item methods above; backends override
+    # them with one round trip per call.
+
+    def resolve_entities_batch(
+        self,
+        candidates: list[dict],
+        project_id: int,
+        threshold: float = 0.85,
+        any_type_threshold: float = 0.95,
+    ) -> list[Entity | None]:
+        """Resolve many extracted entities against existing ones at once.
+
+        Args:
+            candidates: Dicts with keys name, entity_type, embedding.
+            project_id: Numeric project ID.
+            threshold: Minimum score for a match of the same entity_type.
+            any_type_threshold: Minimum score for a match of any type.
+
+        Returns:
+            One entry per candidate: the best same-type match, else the best
+            any-type match, else None.
+        """
+        resolved: list[Entity | None] = []
+        for c in candidates:
+            matches = self.find_similar_entities(
+                c["embedding"], c["entity_type"], project_id, threshold=threshold,
+            )
+            if not matches:
+                matches = self.find_similar_entities_any_type(
+                    c["embedding"], project_id, threshold=any_type_threshold,
+                )
+            resolved.append(matches[0] if matches else None)
+        return resolved
+
+    def find_contradictions_batch(
+        self,
+        pairs: list[tuple[str, str]],
+        project_id: int,
+    ) -> dict[tuple[str, str], list[Statement]]:
+        """find_contradictions for many (subject_id, predicate) pairs at once."""
+        return {
+            pair: self.find_contradictions(pair[0], pair[1], project_id)
+            for pair in dict.fromkeys(pairs)
+        }
+
+    def write_extraction_batch(
+        self,
+        project_id: int,
+        episode_id: int,
+        entities: list[dict],
+        statements: list[dict],
+        invalidate_ids: list[str],
+        invalidated_by: str = "extraction",
+    ) -> None:
+        """Persist one extraction's new nodes and edges in a single transaction.
+
+        Args:
+            project_id: Numeric project ID.
+            episode_id: PostgreSQL memory ID the statements came from.
+            entities: New entities, dicts with keys uuid, name, entity_type,
+                embedding, attributes.
+            statements: New statements, dicts with keys uuid, fact, embedding,
+                aspect, valid_at, subject_id, predicate, object_id, object_value.
+                subject_id/object_id may reference entities in this batch.
+            invalidate_ids: Statement UUIDs to invalidate; may include
+                statements created in this batch.
+            invalidated_by: Reason recorded on invalidated statements.
+        """
+        # Per-item creates assign their own UUIDs; translate batch references
+        ids: dict[str, str] = {}
+        for e in entities:
+            ids[e["uuid"]] = self.create_entity(
+                name=e["name"],
+                entity_type=e["entity_type"],
+                embedding=e["embedding"],
+                project_id=project_id,
+                attributes=e.get("attributes"),
+            )
+        for s in statements:
+            ids[s["uuid"]] = self.create_statement(
+                fact=s["fact"],
+                embedding=s["embedding"],
+                aspect=s["aspect"],
+                episode_id=episode_id,
+                project_id=project_id,
+                valid_at=s.get("valid_at"),
+            )
+            self.create_triple(
+                statement_id=ids[s["uuid"]],
+                subject_id=ids.get(s["subject_id"], s["subject_id"]),
+                predicate=s["predicate"],
+                object_id=ids.get(s["object_id"], s["object_id"]) if s.get("object_id") else None,
+                object_value=s.get("object_value"),
+            )
+        for statement_id in invalidate_ids:
+            self.invalidate_statement(ids.get(statement_id, statement_id), invalidated_by=invalidated_by)
+
     # -- Thinking sequence + task graph nodes (v0.44.0) --
 
     @abstractmethod
@@ -497,6 +595,7 @@ class GraphProvider(ABC):
         import_edges: list[tuple[str, str]],
         stale_file_uuids: list[str],
         call_edges: list[dict] | None = None,
+        replace_edges_from: list[str] | None = None,
     ) -> dict[str, str]:
         """Batch-upsert an entire code graph in a single transaction.
 
@@ -506,17 +605,72 @@ class GraphProvider(ABC):
         Args:
             project_id: Numeric project ID.
             files: List of dicts, each with keys:
-                path, language, content_hash, symbols (list of symbol dicts)
+                path, language, content_hash, symbols (list of symbol dicts),
+                and optionally mtime_ns, size (the stat the index pre-filter checks)
             import_edges: List of (importer_path, imported_path) tuples.
             stale_file_uuids: UUIDs of CodeFile nodes to delete (no longer on disk).
             call_edges: List of dicts with keys:
                 caller_qname, caller_file, callee_qname, callee_file, line
+            replace_edges_from: File paths whose outgoing IMPORTS and CALLS
+                edges are dropped before the given edges are linked, so a
+                delta (incremental reindex) replaces rather than adds to them.
 
         Returns:
             Mapping of file path -> uuid for all upserted files.
         """
         raise NotImplementedError("Subclass should override for batch performance")
 
+    # The three steps of batch_upsert_code_graph, for writers that stream
+    # files in and link edges once every file is written. A file written by
+    # upsert_code_files is left edges_pending (returned by get_code_files)
+    # until a link_code_edges call lists it in settled_paths, so an index
+    # run that died in between can tell which files still need linking.
+
+    def delete_code_files(self, project_id: int, file_uuids: list[str]) -> None:
+        """Delete CodeFile nodes (and their symbols) no longer on disk."""
+        self.batch_upsert_code_graph(
+            project_id=project_id, files=[], import_edges=[], stale_file_uuids=file_uuids,
+        )
+
+    def upsert_code_files(self, project_id: int, files: list[dict]) -> dict[str, str]:
+        """Upsert CodeFile nodes with their symbols, in batch_upsert_code_graph's format.
+
+        Returns:
+            Mapping of file path -> uuid for the upserted files.
+        """
+        return self.batch_upsert_code_graph(
+            project_id=project_id, files=files, import_edges=[], stale_file_uuids=[],
+        )
+
+    def link_code_edges(
+        self,
+        project_id: int,
+        import_edges: list[tuple[str, str]],
+        call_edges: list[dict] | None = None,
+        replace_edges_from: list[str] | None = None,
+        settled_paths: list[str] | None = None,
+    ) -> None:
+        """Link IMPORTS and CALLS edges between already-written files.
+
+        Args:
+            replace_edges_from: Paths whose outgoing edges are dropped first;
+                they are marked edges_pending.
+            settled_paths: Paths whose edges_pending mark is cleared once
+                these edges are in.
+        """
+        self.batch_upsert_code_graph(
+            project_id=project_id, files=[], import_edges=import_edges, stale_file_uuids=[],
+            call_edges=call_edges, replace_edges_from=replace_edges_from,
+        )
+
+    @abstractmethod
+    def update_code_file_stats(self, project_id: int, stats: list[dict]) -> None:
+        """Store a new (mtime_ns, size) on CodeFile nodes whose content is unchanged.
+
+        Args:
+            stats: List of dicts with keys path, mtime_ns, size.
+        """
+
     # -- Code intelligence queries (v0.58.0 Phase 3) --
 
     @abstractmethod
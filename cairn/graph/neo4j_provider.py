@@ -821,6 +821,197 @@ class Neo4jGraphProvider(GraphProvider):
             )
             return {r["memory_id"]: r["shared_entities"] for r in result}
 
+    # -- Batched extraction persistence --
+
+    def resolve_entities_batch(
+        self,
+        candidates: list[dict],
+        project_id: int,
+        threshold: float = 0.85,
+        any_type_threshold: float = 0.95,
+    ) -> list[Entity | None]:
+        if not candidates:
+            return []
+        rows = [
+            {"idx": i, "embedding": c["embedding"], "entity_type": c["entity_type"]}
+            for i, c in enumerate(candidates)
+        ]
+        resolved: list[Entity | None] = [None] * len(candidates)
+        with self._session() as session:
+            result = session.run(
+                """
+                UNWIND $rows AS r
+                CALL {
+                    WITH r
+                    CALL db.index.vector.queryNodes('entity_name_vec', 5, r.embedding)
+                    YIELD node, score
+                    WITH node, score, node.entity_type = r.entity_type AS same_type
+                    WHERE node.project_id = $pid
+                      AND ((same_type AND score > $threshold) OR score > $any_threshold)
+                    RETURN node, score, same_type
+                    ORDER BY same_type DESC, score DESC
+                    LIMIT 1
+                }
+                RETURN r.idx AS idx, node.uuid AS uuid, node.name AS name,
+                       node.entity_type AS entity_type, node.project_id AS project_id,
+                       node.attributes AS attributes
+                """,
+                rows=rows,
+                pid=project_id,
+                threshold=threshold,
+                any_threshold=any_type_threshold,
+            )
+            for r in result:
+                resolved[r["idx"]] = Entity(
+                    uuid=r["uuid"],
+                    name=r["name"],
+                    entity_type=r["entity_type"],
+                    project_id=r["project_id"],
+                    attributes=json.loads(r["attributes"]) if r["attributes"] else {},
+                )
+        return resolved
+
+    def find_contradictions_batch(
+        self,
+        pairs: list[tuple[str, str]],
+        project_id: int,
+    ) -> dict[tuple[str, str], list[Statement]]:
+        unique = list(dict.fromkeys(pairs))
+        found: dict[tuple[str, str], list[Statement]] = {pair: [] for pair in unique}
+        if not unique:
+            return found
+        with self._session() as session:
+            result = session.run(
+                """
+                UNWIND $pairs AS p
+                MATCH (subj:Entity {uuid: p.subject_id})-[:SUBJECT {predicate: p.predicate}]->(s:Statement)
+                WHERE s.project_id = $pid AND s.invalid_at IS NULL
+                RETURN p.subject_id AS subject_id, p.predicate AS predicate,
+                       s.uuid AS uuid, s.fact AS fact, s.aspect AS aspect,
+                       s.episode_id AS episode_id, s.project_id AS project_id,
+                       s.valid_at AS valid_at
+                """,
+                pairs=[{"subject_id": s, "predicate": p} for s, p in unique],
+                pid=project_id,
+            )
+            for r in result:
+                found[(r["subject_id"], r["predicate"])].append(Statement(
+                    uuid=r["uuid"],
+                    fact=r["fact"],
+                    aspect=r["aspect"],
+                    episode_id=r["episode_id"],
+                    project_id=r["project_id"],
+                    valid_at=r["valid_at"],
+                ))
+        return found
+
+    def write_extraction_batch(
+        self,
+        project_id: int,
+        episode_id: int,
+        entities: list[dict],
+        statements: list[dict],
+        invalidate_ids: list[str],
+        invalidated_by: str = "extraction",
+    ) -> None:
+        now = datetime.now(UTC).isoformat()
+        entity_rows = [
+            {
+                "uuid": e["uuid"],
+                "name": e["name"],
+                "entity_type": e["entity_type"],
+                "embedding": e["embedding"],
+                "attributes": json.dumps(e.get("attributes") or {}),
+            }
+            for e in entities
+        ]
+        statement_rows = [
+            {
+                "uuid": s["uuid"],
+                "fact": s["fact"],
+                "embedding": s["embedding"],
+                "aspect": s["aspect"],
+                "valid_at": s.get("valid_at"),
+                "subject_id": s["subject_id"],
+                "predicate": s["predicate"],
+                # Literal objects live on the statement; entity objects get an edge
+                "object_value": None if s.get("object_id") else s.get("object_value"),
+            }
+            for s in statements
+        ]
+        object_rows = [
+            {"statement_id": s["uuid"], "object_id": s["object_id"]}
+            for s in statements if s.get("object_id")
+        ]
+
+        with self._session() as session:
+            with session.begin_transaction() as tx:
+                if entity_rows:
+                    tx.run(
+                        """
+                        UNWIND $rows AS r
+                        CREATE (e:Entity {
+                            uuid: r.uuid,
+                            name: r.name,
+                            entity_type: r.entity_type,
+                            name_embedding: r.embedding,
+                            project_id: $pid,
+                            attributes: r.attributes,
+                            created_at: $now
+                        })
+                        """,
+                        rows=entity_rows,
+                        pid=project_id,
+                        now=now,
+                    )
+                if statement_rows:
+                    tx.run(
+                        """
+                        UNWIND $rows AS r
+                        CREATE (s:Statement {
+                            uuid: r.uuid,
+                            fact: r.fact,
+                            fact_embedding: r.embedding,
+                            aspect: r.aspect,
+                            episode_id: $episode_id,
+                            project_id: $pid,
+                            valid_at: r.valid_at,
+                            object_value: r.object_value,
+                            attributes: '{}',
+                            created_at: $now
+                        })
+                        WITH s, r
+                        MATCH (subj:Entity {uuid: r.subject_id})
+                        MERGE (subj)-[:SUBJECT {predicate: r.predicate}]->(s)
+                        """,
+                        rows=statement_rows,
+                        episode_id=episode_id,
+                        pid=project_id,
+                        now=now,
+                    )
+                if object_rows:
+                    tx.run(
+                        """
+                        UNWIND $rows AS r
+                        MATCH (obj:Entity {uuid: r.object_id})
+                        MATCH (stmt:Statement {uuid: r.statement_id})
+                        MERGE (obj)-[:OBJECT]->(stmt)
+                        """,
+                        rows=object_rows,
+                    )
+                if invalidate_ids:
+                    tx.run(
+                        """
+                        UNWIND $ids AS sid
+                        MATCH (s:Statement {uuid: sid})
+                        SET s.invalid_at = $now, s.invalidated_by = $invalidated_by
+                        """,
+                        ids=invalidate_ids,
+                        now=now,
+                        invalidated_by=invalidated_by,
+                    )
+                tx.commit()
+
     # -- Thinking sequence + task graph nodes (v0.44.0) --
 
     def create_thinking_sequence(
@@ -1409,20 +1600,37 @@ class Neo4jGraphProvider(GraphProvider):
                 """
                 MATCH (cf:CodeFile {project_id: $pid})
                 RETURN cf.uuid AS uuid, cf.path AS path, cf.language AS language,
-                       cf.content_hash AS content_hash, cf.last_indexed AS last_indexed
+                       cf.content_hash AS content_hash, cf.last_indexed AS last_indexed,
+                       cf.mtime_ns AS mtime_ns, cf.size AS size,
+                       coalesce(cf.edges_pending, false) AS edges_pending
                 ORDER BY cf.path
                 """,
                 pid=project_id,
             )
             return [dict(r) for r in result]
 
-    def batch_upsert_code_graph(  # type: ignore[override]
+    def update_code_file_stats(self, project_id: int, stats: list[dict]) -> None:
+        if not stats:
+            return
+        with self._session() as session:
+            session.run(
+                """
+                UNWIND $rows AS r
+                MATCH (cf:CodeFile {path: r.path, project_id: $pid})
+                SET cf.mtime_ns = r.mtime_ns, cf.size = r.size
+                """,
+                rows=stats,
+                pid=project_id,
+            )
+
+    def batch_upsert_code_graph(
         self,
         project_id: int,
         files: list[dict],
         import_edges: list[tuple[str, str]],
         stale_file_uuids: list[str],
         call_edges: list[dict] | None = None,
+        replace_edges_from: list[str] | None = None,
         chunk_size: int = 50,
     ) -> dict[str, str]:
         """Batch-upsert files, symbols, and edges in chunked transactions.
@@ -1430,27 +1638,55 @@ class Neo4jGraphProvider(GraphProvider):
         Splits work into chunks of `chunk_size` files per transaction to avoid
         blowing Neo4j's transaction memory limit on large codebases.
         """
+        self.delete_code_files(project_id, stale_file_uuids, chunk_size=chunk_size)
+        path_to_uuid = self.upsert_code_files(project_id, files, chunk_size=chunk_size)
+        self.link_code_edges(
+            project_id, import_edges, call_edges,
+            replace_edges_from=replace_edges_from, settled_paths=replace_edges_from,
+            chunk_size=chunk_size,
+        )
+        return path_to_uuid
+
+    def delete_code_files(
+        self,
+        project_id: int,
+        file_uuids: list[str],
+        chunk_size: int = 50,
+    ) -> None:
+        """Delete CodeFile nodes and their symbols, `chunk_size` files per transaction."""
+        if not file_uuids:
+            return
+        with self._session() as session:
+            for i in range(0, len(file_uuids), chunk_size):
+                chunk = file_uuids[i : i + chunk_size]
+                with session.begin_transaction() as tx:
+                    tx.run(
+                        """
+                        UNWIND $uuids AS uid
+                        MATCH (cf:CodeFile {uuid: uid})
+                        OPTIONAL MATCH (cf)-[:CONTAINS]->(cs:CodeSymbol)
+                        DETACH DELETE cs, cf
+                        """,
+                        uuids=chunk,
+                    )
+                    tx.commit()
+
+    def upsert_code_files(
+        self,
+        project_id: int,
+        files: list[dict],
+        chunk_size: int = 50,
+    ) -> dict[str, str]:
+        """Upsert files and replace their symbols, `chunk_size` files per transaction.
+
+        Each file is marked edges_pending until link_code_edges relinks it.
+        """
         now = datetime.now(UTC).isoformat()
         path_to_uuid: dict[str, str] = {}
+        if not files:
+            return path_to_uuid
 
         with self._session() as session:
-            # 1) Delete stale files (separate transaction)
-            if stale_file_uuids:
-                for i in range(0, len(stale_file_uuids), chunk_size):
-                    chunk = stale_file_uuids[i : i + chunk_size]
-                    with session.begin_transaction() as tx:
-                        tx.run(
-                            """
-                            UNWIND $uuids AS uid
-                            MATCH (cf:CodeFile {uuid: uid})
-                            OPTIONAL MATCH (cf)-[:CONTAINS]->(cs:CodeSymbol)
-                            DETACH DELETE cs, cf
-                            """,
-                            uuids=chunk,
-                        )
-                        tx.commit()
-
-            # 2-5) Upsert files + symbols in chunks
             for i in range(0, len(files), chunk_size):
                 file_chunk = files[i : i + chunk_size]
                 with session.begin_transaction() as tx:
@@ -1461,6 +1697,8 @@ class Neo4jGraphProvider(GraphProvider):
                             "path": f["path"],
                             "lang": f["language"],
                             "hash": f["content_hash"],
+                            "mtime": f.get("mtime_ns"),
+                            "size": f.get("size"),
                             "uuid": str(uuid.uuid4()),
                         })
                     result = tx.run(
@@ -1472,6 +1710,7 @@ class Neo4jGraphProvider(GraphProvider):
                                       cf.created_at = $now, cf.last_indexed = $now
                         ON MATCH SET  cf.language = r.lang, cf.content_hash = r.hash,
                                       cf.last_indexed = $now
+                        SET cf.mtime_ns = r.mtime, cf.size = r.size, cf.edges_pending = true
                         RETURN cf.path AS path, cf.uuid AS uuid
                         """,
                         rows=file_rows,
@@ -1566,7 +1805,49 @@ class Neo4jGraphProvider(GraphProvider):
 
                     tx.commit()
 
-            # 6) Link file-level imports (separate chunked transactions)
+        return path_to_uuid
+
+    def link_code_edges(
+        self,
+        project_id: int,
+        import_edges: list[tuple[str, str]],
+        call_edges: list[dict] | None = None,
+        replace_edges_from: list[str] | None = None,
+        settled_paths: list[str] | None = None,
+        chunk_size: int = 50,
+    ) -> None:
+        """Link IMPORTS and CALLS edges in chunked transactions.
+
+        Outgoing edges of replace_edges_from are dropped first, marking those
+        files edges_pending; settled_paths have the mark cleared last, once
+        their edges are in.
+        """
+        if not (import_edges or call_edges or replace_edges_from or settled_paths):
+            return
+        with self._session() as session:
+            # Drop outgoing edges that the given edges replace
+            if replace_edges_from:
+                for i in range(0, len(replace_edges_from), chunk_size):
+                    path_chunk = replace_edges_from[i : i + chunk_size]
+                    with session.begin_transaction() as tx:
+                        tx.run(
+                            """
+                            UNWIND $paths AS p
+                            MATCH (cf:CodeFile {path: p, project_id: $pid})
+                            SET cf.edges_pending = true
+                            WITH cf
+                            OPTIONAL MATCH (cf)-[imp:IMPORTS]->(:CodeFile)
+                            DELETE imp
+                            WITH DISTINCT cf
+                            OPTIONAL MATCH (cf)-[:CONTAINS]->(:CodeSymbol)-[call:CALLS]->()
+                            DELETE call
+                            """,
+                            paths=path_chunk,
+                            pid=project_id,
+                        )
+                        tx.commit()
+
+            # File-level imports
             if import_edges:
                 edge_rows = [{"src": src, "dst": dst} for src, dst in import_edges]
                 for i in range(0, len(edge_rows), chunk_size * 4):
@@ -1584,7 +1865,7 @@ class Neo4jGraphProvider(GraphProvider):
                         )
                         tx.commit()
 
-            # 7) Link symbol-level CALLS edges (chunked transactions)
+            # Symbol-level CALLS
             if call_edges:
                 for i in range(0, len(call_edges), chunk_size * 4):
                     edge_chunk = call_edges[i : i + chunk_size * 4]
@@ -1606,7 +1887,20 @@ class Neo4jGraphProvider(GraphProvider):
                         )
                         tx.commit()
 
-        return path_to_uuid
+            if settled_paths:
+                for i in range(0, len(settled_paths), chunk_size * 4):
+                    path_chunk = settled_paths[i : i + chunk_size * 4]
+                    with session.begin_transaction() as tx:
+                        tx.run(
+                            """
+                            UNWIND $paths AS p
+                            MATCH (cf:CodeFile {path: p, project_id: $pid})
+                            SET cf.edges_pending = false
+                            """,
+                            paths=path_chunk,
+                            pid=project_id,
+                        )
+                        tx.commit()
 
     def get_code_symbols(self, file_path: str, project_id: int) -> list[dict]:
         with self._session() as session:
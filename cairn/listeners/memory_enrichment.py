@@ -4,6 +4,14 @@ Subscribes to memory.created events and runs the Phase 2 enrichment
 that was previously inline in MemoryStore.store(). Gets retry logic
 (5 attempts, exponential backoff) from the EventDispatcher for free.
 
+Events marked ``deferred`` (the "deferred" enrichment mode, store_many)
+also get the LLM extraction/enrichment store() skipped, before Phase 2.
+That LLM work gets a longer handler timeout. A redelivered deferred event
+is a no-op once the memory is enriched: the delivery that claimed it runs
+Phase 2 with its own extraction result, even if the dispatcher timed it
+out. While that claim is live the redelivery fails and is retried; once
+the claim lapses (ENRICHMENT_CLAIM_LEASE_SECONDS) the retry takes it over.
+
 For memory.inactivated events, could clean up Neo4j in the future.
 """
 
@@ -22,12 +30,18 @@ logger = logging.getLogger(__name__)
 class MemoryEnrichmentListener:
     """Event-driven enrichment for memory operations."""
 
+    # Deferred events run LLM extraction (with retries) inside the handler;
+    # ENRICHMENT_CLAIM_LEASE_SECONDS must stay above this
+    HANDLER_TIMEOUT = 300.0
+
     def __init__(self, memory_store: MemoryStore):
         self.memory_store = memory_store
 
     def register(self, event_bus: EventBus) -> None:
         """Subscribe to memory events."""
-        event_bus.subscribe("memory.*", "memory_enrichment", self.handle)
+        event_bus.subscribe(
+            "memory.*", "memory_enrichment", self.handle, timeout=self.HANDLER_TIMEOUT,
+        )
 
     def handle(self, event: dict) -> None:
         """Route event to the appropriate handler."""
@@ -40,7 +54,7 @@ class MemoryEnrichmentListener:
             logger.debug("MemoryEnrichment: no handler for %s", event_type)
 
     def _handle_created(self, event: dict) -> None:
-        """Run post-store enrichment (graph persist, relationships, edges)."""
+        """Run deferred LLM enrichment if any, then post-store enrichment."""
         payload = event["payload"]
         memory_id = payload.get("memory_id")
         if not memory_id:
@@ -64,6 +78,19 @@ class MemoryEnrichmentListener:
                     memory_id, exc_info=True,
                 )
 
+        if payload.get("deferred") and enrich:
+            applied = self.memory_store.enrich_deferred(memory_id)
+            if applied is None:
+                # Redelivery: the delivery that enriched this memory ran
+                # Phase 2 with its own extraction result.
+                logger.info(
+                    "MemoryEnrichment: memory #%d already enriched, skipping",
+                    memory_id,
+                )
+                return
+            memory_type = applied["memory_type"]
+            extraction_result = applied["extraction_result"]
+
         # Fetch memory row for content, embedding, entities, session_name
         row = self.memory_store.db.execute_one(
             """
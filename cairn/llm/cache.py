@@ -0,0 +1,378 @@
+"""Response cache for deterministic LLM calls. Wraps any LLMInterface.
+
+Query routing, enrichment, knowledge extraction, cluster summaries and
+consolidation build their prompts purely from their inputs, so the same
+input always produces the same request. Re-enrichment, re-imports, eval
+reruns and repeated searches used to pay for every one of those calls again.
+
+Responses are keyed by sha256 of (backend, model, normalized messages,
+max_tokens). Normalization only removes differences that can't matter to
+the model: CRLF line endings and leading/trailing whitespace per message.
+
+Two tiers:
+  - In-process LRU bounded by a byte budget.
+  - Optional Postgres tier (llm_cache table), shared by every worker and
+    kept across restarts. It uses its own autocommit connection so cache
+    reads/writes never touch the caller's transaction.
+
+Each operation has its own TTL; a TTL of 0 turns caching off for it.
+Concurrent identical requests are coalesced: one caller computes, the others
+wait for its result (or its exception) instead of all hitting the backend.
+Only generate() is cached. Tool calls and streaming always go to the backend.
+
+Callers that parse the response go through generate_checked() with their
+parser as ``validate``: a response the parser rejects is returned but never
+stored, so one malformed completion isn't replayed for the whole TTL.
+``fresh=True`` skips the lookup (explicit retries) and stores the new
+response if it parses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+import psycopg
+
+from cairn.config import LLMCacheConfig
+from cairn.core import stats
+from cairn.core.utils import extract_json
+from cairn.llm.interface import LLMInterface
+
+logger = logging.getLogger(__name__)
+
+OPERATIONS = ("routing", "enrichment", "extraction", "clustering", "consolidation")
+
+# Approximate per-entry overhead beyond the response bytes (key, OrderedDict node, tuple)
+_ENTRY_OVERHEAD = 160
+
+# Raises, or returns something falsy, when a response is unusable
+Validator = Callable[[str], Any]
+
+
+def _normalize(messages: list[dict]) -> list[list]:
+    normalized = []
+    for m in messages:
+        content = m.get("content", "")
+        if isinstance(content, str):
+            content = content.replace("\r\n", "\n").strip()
+        normalized.append([m.get("role", ""), content])
+    return normalized
+
+
+def cache_key(identity: str, messages: list[dict], max_tokens: int) -> bytes:
+    """sha256 of backend identity, normalized messages and max_tokens."""
+    payload = json.dumps(
+        [identity, _normalize(messages), max_tokens],
+        sort_keys=True, ensure_ascii=False, default=str, separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+class _PostgresTier:
+    """llm_cache table on a dedicated autocommit connection."""
+
+    # Expired rows are deleted once every this many writes
+    PURGE_EVERY = 1000
+
+    def __init__(self, dsn: str):
+        self._dsn = dsn
+        self._lock = threading.Lock()
+        self._conn: psycopg.Connection | None = None
+        self._writes = 0
+
+    def get(self, key: bytes) -> tuple[str, float] | None:
+        with self._lock:
+            try:
+                row = self._connection().execute(
+                    "SELECT response, EXTRACT(EPOCH FROM expires_at) FROM llm_cache"
+                    " WHERE key = %s AND expires_at > now()",
+                    (key,),
+                ).fetchone()
+            except Exception:
+                self._close()
+                raise
+        return (row[0], float(row[1])) if row else None
+
+    def put(self, key: bytes, operation: str, response: str, ttl: int) -> None:
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT INTO llm_cache (key, operation, response, expires_at)"
+                    " VALUES (%s, %s, %s, now() + make_interval(secs => %s))"
+                    " ON CONFLICT (key) DO UPDATE SET operation = EXCLUDED.operation,"
+                    " response = EXCLUDED.response, created_at = now(), expires_at = EXCLUDED.expires_at",
+                    (key, operation, response, ttl),
+                )
+                self._writes += 1
+                if self._writes % self.PURGE_EVERY == 0:
+                    conn.execute("DELETE FROM llm_cache WHERE expires_at <= now()")
+            except Exception:
+                self._close()
+                raise
+
+    def _connection(self) -> psycopg.Connection:
+        if self._conn is None or self._conn.closed:
+            self._conn = psycopg.connect(self._dsn, autocommit=True)
+        return self._conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+
+class LLMCache:
+    """Response store shared by every CachedLLM in the process.
+
+    Args:
+        config: Byte budget, per-operation TTLs, persistent tier switch.
+        dsn: Postgres DSN for the persistent tier; ignored unless
+            config.persistent is set.
+    """
+
+    def __init__(self, config: LLMCacheConfig, dsn: str = ""):
+        self.config = config
+        self.max_bytes = config.max_mb * 1024 * 1024
+        self._lru: OrderedDict[bytes, tuple[str, float]] = OrderedDict()  # key -> (response, expires_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._inflight: dict[bytes, Future[str]] = {}
+        self._by_operation: dict[str, dict[str, int]] = {}
+        self._coalesced = 0
+        self._persistent_errors = 0
+        self._stats = stats.llm_cache_stats or stats.CacheStats("llm", self.max_bytes)
+        self._persistent = _PostgresTier(dsn) if config.persistent and dsn else None
+
+    def ttl(self, operation: str) -> int:
+        return max(0, int(getattr(self.config, f"ttl_{operation}", 0)))
+
+    def get_or_compute(
+        self, key: bytes, operation: str, compute: Callable[[], str],
+        validate: Validator | None = None, fresh: bool = False,
+    ) -> str:
+        """Cached response for ``key``, or compute() it once for all concurrent callers.
+
+        A computed response is stored only if ``validate`` accepts it.
+        ``fresh`` skips the lookup and always computes.
+        """
+        ttl = self.ttl(operation)
+        if ttl <= 0:
+            return compute()
+        if fresh:
+            self._count(operation, "misses")
+            self._stats.record_misses()
+            response = compute()
+            if _storable(response, validate):
+                self._store(key, operation, response, ttl)
+            return response
+
+        hit: str | None = None
+        waiting: Future[str] | None = None
+        now = time.time()
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is not None and entry[1] > now:
+                self._lru.move_to_end(key)
+                hit = entry[0]
+            else:
+                if entry is not None:
+                    self._drop(key)
+                waiting = self._inflight.get(key)
+                if waiting is None:
+                    leader: Future[str] = Future()
+                    self._inflight[key] = leader
+                else:
+                    self._coalesced += 1
+        if waiting is not None:
+            # An identical request is already out; share its outcome
+            hit = waiting.result()
+        if hit is not None:
+            self._count(operation, "hits")
+            self._stats.record_hits()
+            return hit
+
+        try:
+            result = self._lookup_persistent(key)
+            if result is not None:
+                self._count(operation, "hits")
+                self._stats.record_hits(persistent=True)
+            else:
+                self._count(operation, "misses")
+                self._stats.record_misses()
+                result = compute()
+                if _storable(result, validate):
+                    self._store(key, operation, result, ttl)
+        except BaseException as e:
+            leader.set_exception(e)
+            raise
+        else:
+            leader.set_result(result)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return result
+
+    def to_dict(self) -> dict:
+        out = self._stats.to_dict()
+        with self._lock:
+            out["coalesced"] = self._coalesced
+            out["persistent"] = self._persistent is not None
+            out["persistent_errors"] = self._persistent_errors
+            out["operations"] = {
+                op: {
+                    **counts,
+                    "ttl": self.ttl(op),
+                    "hit_rate": round(counts["hits"] / (counts["hits"] + counts["misses"]), 4)
+                    if counts["hits"] + counts["misses"] else None,
+                }
+                for op, counts in self._by_operation.items()
+            }
+        return out
+
+    # -- internals --
+
+    def _count(self, operation: str, field: str) -> None:
+        with self._lock:
+            counts = self._by_operation.setdefault(operation, {"hits": 0, "misses": 0})
+            counts[field] += 1
+
+    def _lookup_persistent(self, key: bytes) -> str | None:
+        if self._persistent is None:
+            return None
+        try:
+            row = self._persistent.get(key)
+        except Exception:
+            with self._lock:
+                self._persistent_errors += 1
+            logger.debug("LLM cache: persistent lookup failed", exc_info=True)
+            return None
+        if row is None:
+            return None
+        response, expires_at = row
+        self._remember(key, response, expires_at)
+        return response
+
+    def _store(self, key: bytes, operation: str, response: str, ttl: int) -> None:
+        self._remember(key, response, time.time() + ttl)
+        if self._persistent is not None:
+            try:
+                self._persistent.put(key, operation, response, ttl)
+            except Exception:
+                with self._lock:
+                    self._persistent_errors += 1
+                logger.debug("LLM cache: persistent write failed", exc_info=True)
+
+    def _remember(self, key: bytes, response: str, expires_at: float) -> None:
+        """Insert into the LRU tier, evicting least-recently-used over budget."""
+        evicted = 0
+        with self._lock:
+            if key in self._lru:
+                self._drop(key)
+            self._lru[key] = (response, expires_at)
+            self._bytes += len(response.encode("utf-8")) + _ENTRY_OVERHEAD
+            while self._bytes > self.max_bytes and self._lru:
+                self._drop(next(iter(self._lru)))
+                evicted += 1
+            entries, size = len(self._lru), self._bytes
+        if evicted:
+            self._stats.record_evictions(evicted)
+        self._stats.set_size(entries, size)
+
+    def _drop(self, key: bytes) -> None:
+        response, _ = self._lru.pop(key)
+        self._bytes -= len(response.encode("utf-8")) + _ENTRY_OVERHEAD
+
+
+def _storable(response: str, validate: Validator | None) -> bool:
+    if not isinstance(response, str) or not response.strip():
+        return False
+    if validate is None:
+        return True
+    try:
+        return bool(validate(response))
+    except Exception:
+        return False
+
+
+class CachedLLM(LLMInterface):
+    """LLMInterface whose generate() is served from an LLMCache.
+
+    Bound to one operation, whose TTL applies to everything it stores.
+    Everything except generate() goes straight to ``inner``.
+    """
+
+    def __init__(self, inner: LLMInterface, cache: LLMCache, operation: str):
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation!r}. Must be one of {OPERATIONS}")
+        self.inner = inner
+        self.cache = cache
+        self.operation = operation
+
+    def __getattr__(self, name: str):
+        # Backend-specific attributes (config, client, ...) pass through
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    def generate(
+        self, messages: list[dict], max_tokens: int = 1024,
+        validate: Validator | None = None, fresh: bool = False,
+    ) -> str:
+        key = cache_key(self.inner.identity(), messages, max_tokens)
+        return self.cache.get_or_compute(
+            key, self.operation, lambda: self.inner.generate(messages, max_tokens),
+            validate=validate, fresh=fresh,
+        )
+
+    def identity(self) -> str:
+        return self.inner.identity()
+
+    def get_model_name(self) -> str:
+        return self.inner.get_model_name()
+
+    def get_context_size(self) -> int:
+        return self.inner.get_context_size()
+
+    def supports_tool_use(self) -> bool:
+        return self.inner.supports_tool_use()
+
+    def generate_with_tools(self, messages, tools, max_tokens=2048):
+        return self.inner.generate_with_tools(messages, tools, max_tokens)
+
+    def generate_stream(self, messages, max_tokens=1024):
+        return self.inner.generate_stream(messages, max_tokens)
+
+    def generate_with_tools_stream(self, messages, tools, max_tokens=2048):
+        return self.inner.generate_with_tools_stream(messages, tools, max_tokens)
+
+
+def generate_checked(
+    llm: LLMInterface, messages: list[dict], max_tokens: int,
+    validate: Validator, fresh: bool = False,
+) -> str:
+    """generate() whose response is cached only if ``validate`` accepts it.
+
+    ``validate`` is the caller's own parser (or a predicate over the raw
+    text). ``fresh`` bypasses cached responses. Uncached backends just
+    generate.
+    """
+    if isinstance(llm, CachedLLM):
+        return llm.generate(messages, max_tokens, validate=validate, fresh=fresh)
+    return llm.generate(messages, max_tokens)
+
+
+def parses_as(json_type: str) -> Validator:
+    """Validator accepting responses extract_json can parse as ``json_type``."""
+    return lambda raw: extract_json(raw, json_type=json_type) is not None
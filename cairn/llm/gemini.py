@@ -3,15 +3,17 @@
 import json
 import logging
 import time
-import urllib.error
-import urllib.request
 
 from cairn.config import LLMConfig
 from cairn.core import stats
+from cairn.core.http_client import RetryPolicy, client_for
 from cairn.llm.interface import LLMInterface
 
 logger = logging.getLogger(__name__)
 
+API_BASE = "https://generativelanguage.googleapis.com"
+_RETRY = RetryPolicy(attempts=3, statuses=frozenset({429, 500, 503}))
+
 # Known context sizes
 CONTEXT_SIZES = {
     "gemini-2.0-flash": 1048576,
@@ -32,6 +34,7 @@ class GeminiLLM(LLMInterface):
         self.api_key = config.gemini_api_key
         if not self.api_key:
             raise ValueError("CAIRN_GEMINI_API_KEY is required for gemini backend")
+        self._http = client_for(API_BASE)
         logger.info("Gemini LLM ready: %s", self.model)
 
     def generate(self, messages: list[dict], max_tokens: int = 1024) -> str:
@@ -61,77 +64,48 @@ class GeminiLLM(LLMInterface):
             body["systemInstruction"] = {"parts": system_parts}
 
         payload = json.dumps(body).encode()
-        url = (
-            f"https://generativelanguage.googleapis.com/v1beta/"
-            f"models/{self.model}:generateContent?key={self.api_key}"
-        )
-        req = urllib.request.Request(
-            url,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-        )
+        url = f"{API_BASE}/v1beta/models/{self.model}:generateContent?key={self.api_key}"
 
         t0 = time.monotonic()
-        last_error: Exception | None = None
-        for attempt in range(3):
-            try:
-                with urllib.request.urlopen(req, timeout=60) as resp:
-                    raw = resp.read()
-                try:
-                    result = json.loads(raw)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Gemini returned invalid JSON: {raw[:200]}") from e
-
-                # Parse response — candidates[0].content.parts[0].text
-                candidates = result.get("candidates", [])
-                if not candidates:
-                    raise ValueError(f"Gemini returned no candidates: {list(result.keys())}")
-                parts = candidates[0].get("content", {}).get("parts", [])
-                if not parts or "text" not in parts[0]:
-                    raise ValueError(f"Unexpected Gemini response structure: {candidates[0].keys()}")
-                result_text = parts[0]["text"]
-                latency_ms = (time.monotonic() - t0) * 1000
-                usage_meta = result.get("usageMetadata", {})
-                tokens_in = usage_meta.get("promptTokenCount") or sum(len(m.get("content", "")) for m in messages) // 4
-                tokens_out = usage_meta.get("candidatesTokenCount") or len(result_text) // 4
-                if stats.llm_stats:
-                    stats.llm_stats.record_call(tokens_est=tokens_in + tokens_out)
-                stats.emit_usage_event(
-                    "llm.generate", self.model,
-                    tokens_in=tokens_in, tokens_out=tokens_out, latency_ms=latency_ms,
-                )
-                return result_text
-
-            except urllib.error.HTTPError as e:
-                if e.code in (429, 500, 503):
-                    last_error = e
-                    wait = 2 ** attempt
-                    logger.warning(
-                        "Gemini transient error (attempt %d/3): HTTP %d. Retrying in %ds...",
-                        attempt + 1, e.code, wait,
-                    )
-                    time.sleep(wait)
-                    continue
-                raise
-            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
-                last_error = e
-                wait = 2 ** attempt
-                logger.warning(
-                    "Gemini transient error (attempt %d/3): %s. Retrying in %ds...",
-                    attempt + 1, e, wait,
-                )
-                time.sleep(wait)
-                continue
-
+        try:
+            raw = self._http.post(
+                url, payload, {"Content-Type": "application/json"},
+                timeout=60, retry=_RETRY, label="Gemini",
+            )
+        except Exception as e:
+            latency_ms = (time.monotonic() - t0) * 1000
+            if stats.llm_stats:
+                stats.llm_stats.record_error(str(e))
+            stats.emit_usage_event(
+                "llm.generate", self.model, latency_ms=latency_ms,
+                success=False, error_message=str(e),
+            )
+            raise
+
+        try:
+            result = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Gemini returned invalid JSON: {raw[:200].decode(errors='replace')}") from e
+
+        # Parse response — candidates[0].content.parts[0].text
+        candidates = result.get("candidates", [])
+        if not candidates:
+            raise ValueError(f"Gemini returned no candidates: {list(result.keys())}")
+        parts = candidates[0].get("content", {}).get("parts", [])
+        if not parts or "text" not in parts[0]:
+            raise ValueError(f"Unexpected Gemini response structure: {candidates[0].keys()}")
+        result_text = parts[0]["text"]
         latency_ms = (time.monotonic() - t0) * 1000
+        usage_meta = result.get("usageMetadata", {})
+        tokens_in = usage_meta.get("promptTokenCount") or sum(len(m.get("content", "")) for m in messages) // 4
+        tokens_out = usage_meta.get("candidatesTokenCount") or len(result_text) // 4
         if stats.llm_stats:
-            stats.llm_stats.record_error(str(last_error))
+            stats.llm_stats.record_call(tokens_est=tokens_in + tokens_out)
         stats.emit_usage_event(
-            "llm.generate", self.model, latency_ms=latency_ms,
-            success=False, error_message=str(last_error),
+            "llm.generate", self.model,
+            tokens_in=tokens_in, tokens_out=tokens_out, latency_ms=latency_ms,
         )
-        assert last_error is not None
-        raise last_error  # All retries exhausted
+        return result_text
 
     def get_model_name(self) -> str:
         return self.model
@@ -59,6 +59,10 @@ class LLMInterface(ABC):
     def get_context_size(self) -> int:
         """Return the model's context window size."""
 
+    def identity(self) -> str:
+        """Backend and model that would serve a call right now (response cache key)."""
+        return f"{type(self).__name__}:{self.get_model_name()}"
+
     def supports_tool_use(self) -> bool:
         """Whether this backend supports tool calling."""
         return False
@@ -5,16 +5,18 @@ from __future__ import annotations
 import json
 import logging
 import time
-import urllib.error
-import urllib.request
 from collections.abc import Iterator
 
 from cairn.config import LLMConfig
 from cairn.core import stats
+from cairn.core.http_client import RetryPolicy, client_for
 from cairn.llm.interface import LLMInterface, LLMResponse, StreamEvent
 
 logger = logging.getLogger(__name__)
 
+_HEADERS = {"Content-Type": "application/json"}
+_RETRY = RetryPolicy(attempts=3)
+
 
 class OllamaLLM(LLMInterface):
     """LLM via local Ollama API."""
@@ -22,6 +24,7 @@ class OllamaLLM(LLMInterface):
     def __init__(self, config: LLMConfig):
         self.model = config.ollama_model
         self.base_url = config.ollama_url.rstrip("/")
+        self._http = client_for(self.base_url)
         logger.info("Ollama LLM ready: %s at %s", self.model, self.base_url)
 
     def generate(self, messages: list[dict], max_tokens: int = 1024) -> str:
@@ -34,53 +37,41 @@ class OllamaLLM(LLMInterface):
             "options": {"num_predict": max_tokens, "temperature": 0.3},
         }).encode()
 
-        req = urllib.request.Request(
-            f"{self.base_url}/api/chat",
-            data=payload,
-            headers={"Content-Type": "application/json"},
-        )
-
         t0 = time.monotonic()
-        last_error: Exception | None = None
-        for attempt in range(3):
-            try:
-                with urllib.request.urlopen(req, timeout=60) as resp:
-                    raw = resp.read()
-                try:
-                    result = json.loads(raw)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Ollama returned invalid JSON: {raw[:200]}") from e
-                # Defensive parsing
-                message = result.get("message", {})
-                content = message.get("content")
-                if content is None:
-                    raise ValueError(f"Unexpected Ollama response structure: {list(result.keys())}")
-                latency_ms = (time.monotonic() - t0) * 1000
-                tokens_in = result.get("prompt_eval_count") or sum(len(m.get("content", "")) for m in messages) // 4
-                tokens_out = result.get("eval_count") or len(content) // 4
-                if stats.llm_stats:
-                    stats.llm_stats.record_call(tokens_est=tokens_in + tokens_out)
-                stats.emit_usage_event(
-                    "llm.generate", self.model,
-                    tokens_in=tokens_in, tokens_out=tokens_out, latency_ms=latency_ms,
-                )
-                return content
-            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
-                last_error = e
-                wait = 2 ** attempt
-                logger.warning("Ollama transient error (attempt %d/3): %s. Retrying in %ds...", attempt + 1, e, wait)
-                time.sleep(wait)
-                continue
+        try:
+            raw = self._http.post(
+                f"{self.base_url}/api/chat", payload, _HEADERS,
+                timeout=60, retry=_RETRY, label="Ollama",
+            )
+        except Exception as e:
+            latency_ms = (time.monotonic() - t0) * 1000
+            if stats.llm_stats:
+                stats.llm_stats.record_error(str(e))
+            stats.emit_usage_event(
+                "llm.generate", self.model, latency_ms=latency_ms,
+                success=False, error_message=str(e),
+            )
+            raise
 
+        try:
+            result = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Ollama returned invalid JSON: {raw[:200].decode(errors='replace')}") from e
+        # Defensive parsing
+        message = result.get("message", {})
+        content = message.get("content")
+        if content is None:
+            raise ValueError(f"Unexpected Ollama response structure: {list(result.keys())}")
         latency_ms = (time.monotonic() - t0) * 1000
+        tokens_in = result.get("prompt_eval_count") or sum(len(m.get("content", "")) for m in messages) // 4
+        tokens_out = result.get("eval_count") or len(content) // 4
         if stats.llm_stats:
-            stats.llm_stats.record_error(str(last_error))
+            stats.llm_stats.record_call(tokens_est=tokens_in + tokens_out)
         stats.emit_usage_event(
-            "llm.generate", self.model, latency_ms=latency_ms,
-            success=False, error_message=str(last_error),
+            "llm.generate", self.model,
+            tokens_in=tokens_in, tokens_out=tokens_out, latency_ms=latency_ms,
         )
-        assert last_error is not None
-        raise last_error  # All retries exhausted
+        return content
 
     def generate_stream(
         self, messages: list[dict], max_tokens: int = 1024,
@@ -94,16 +85,10 @@ class OllamaLLM(LLMInterface):
             "options": {"num_predict": max_tokens, "temperature": 0.3},
         }).encode()
 
-        req = urllib.request.Request(
-            f"{self.base_url}/api/chat",
-            data=payload,
-            headers={"Content-Type": "application/json"},
-        )
-
         t0 = time.monotonic()
         full_text = ""
         try:
-            with urllib.request.urlopen(req, timeout=120) as resp:
+            with self._http.open("POST", f"{self.base_url}/api/chat", payload, _HEADERS, timeout=120) as resp:
                 for line in resp:
                     if not line.strip():
                         continue
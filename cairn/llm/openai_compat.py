@@ -16,20 +16,22 @@ import json
 import logging
 import time
 import urllib.error
-import urllib.request
 from collections.abc import Iterator
 
 from cairn.config import LLMConfig
 from cairn.core import stats
+from cairn.core.http_client import RetryPolicy, client_for
 from cairn.llm.interface import LLMInterface, LLMResponse, StreamEvent, ToolCallInfo
 
 logger = logging.getLogger(__name__)
 
+_RETRY = RetryPolicy(attempts=5, backoff_offset=1)  # 2s, 3s, 5s, 9s, 17s
+
 
 class OpenAICompatibleLLM(LLMInterface):
     """LLM via any OpenAI-compatible /v1/chat/completions endpoint.
 
-    No SDK dependency — uses urllib like the other providers.
+    No SDK dependency — requests go through the shared pooled HTTP client.
     """
 
     def __init__(self, config: LLMConfig):
@@ -42,6 +44,7 @@ class OpenAICompatibleLLM(LLMInterface):
         if not self.api_key:
             raise ValueError("CAIRN_OPENAI_API_KEY is required for openai backend")
         self._tools_unsupported = False
+        self._http = client_for(self.base_url)
         logger.info("OpenAI-compatible LLM ready: %s at %s", self.model, self.base_url)
 
     def generate(self, messages: list[dict], max_tokens: int = 1024) -> str:
@@ -53,78 +56,37 @@ class OpenAICompatibleLLM(LLMInterface):
             "temperature": 0.3,
         }).encode()
 
-        req = urllib.request.Request(
-            f"{self.base_url}/v1/chat/completions",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-                "User-Agent": "cairn/0.55.0",
-            },
-        )
-
-        max_retries = 5
         t0 = time.monotonic()
-        last_error: Exception | None = None
-        for attempt in range(max_retries):
-            try:
-                with urllib.request.urlopen(req, timeout=120) as resp:
-                    raw = resp.read()
-                try:
-                    result = json.loads(raw)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"API returned invalid JSON: {raw[:200]}") from e
-
-                # Parse response — choices[0].message.content
-                choices = result.get("choices", [])
-                if not choices:
-                    raise ValueError(f"API returned no choices: {list(result.keys())}")
-                msg = choices[0].get("message", {})
-                content = msg.get("content") or msg.get("reasoning_content")
-                if content is None:
-                    raise ValueError(f"Unexpected response structure: {choices[0].keys()}")
-                latency_ms = (time.monotonic() - t0) * 1000
-                usage = result.get("usage", {})
-                tokens_in = usage.get("prompt_tokens") or sum(len(m.get("content", "")) for m in messages) // 4
-                tokens_out = usage.get("completion_tokens") or len(content) // 4
-                if stats.llm_stats:
-                    stats.llm_stats.record_call(tokens_est=tokens_in + tokens_out)
-                stats.emit_usage_event(
-                    "llm.generate", self.model,
-                    tokens_in=tokens_in, tokens_out=tokens_out, latency_ms=latency_ms,
-                )
-                return content
-
-            except urllib.error.HTTPError as e:
-                if e.code in (429, 500, 502, 503):
-                    last_error = e
-                    wait = min(2 ** attempt + 1, 30)  # 2s, 3s, 5s, 9s, 17s
-                    logger.warning(
-                        "API transient error (attempt %d/%d): HTTP %d. Retrying in %ds...",
-                        attempt + 1, max_retries, e.code, wait,
-                    )
-                    time.sleep(wait)
-                    continue
-                raise
-            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
-                last_error = e
-                wait = min(2 ** attempt + 1, 30)
-                logger.warning(
-                    "API transient error (attempt %d/%d): %s. Retrying in %ds...",
-                    attempt + 1, max_retries, e, wait,
-                )
-                time.sleep(wait)
-                continue
+        try:
+            raw = self._post(payload)
+        except Exception as e:
+            self._record_failure("llm.generate", t0, e)
+            raise
 
+        try:
+            result = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"API returned invalid JSON: {raw[:200].decode(errors='replace')}") from e
+
+        # Parse response — choices[0].message.content
+        choices = result.get("choices", [])
+        if not choices:
+            raise ValueError(f"API returned no choices: {list(result.keys())}")
+        msg = choices[0].get("message", {})
+        content = msg.get("content") or msg.get("reasoning_content")
+        if content is None:
+            raise ValueError(f"Unexpected response structure: {choices[0].keys()}")
         latency_ms = (time.monotonic() - t0) * 1000
+        usage = result.get("usage", {})
+        tokens_in = usage.get("prompt_tokens") or sum(len(m.get("content", "")) for m in messages) // 4
+        tokens_out = usage.get("completion_tokens") or len(content) // 4
         if stats.llm_stats:
-            stats.llm_stats.record_error(str(last_error))
+            stats.llm_stats.record_call(tokens_est=tokens_in + tokens_out)
         stats.emit_usage_event(
-            "llm.generate", self.model, latency_ms=latency_ms,
-            success=False, error_message=str(last_error),
+            "llm.generate", self.model,
+            tokens_in=tokens_in, tokens_out=tokens_out, latency_ms=latency_ms,
         )
-        assert last_error is not None
-        raise last_error  # All retries exhausted
+        return content
 
     def generate_stream(
         self, messages: list[dict], max_tokens: int = 1024,
@@ -138,20 +100,10 @@ class OpenAICompatibleLLM(LLMInterface):
             "stream": True,
         }).encode()
 
-        req = urllib.request.Request(
-            f"{self.base_url}/v1/chat/completions",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-                "User-Agent": "cairn/0.55.0",
-            },
-        )
-
         t0 = time.monotonic()
         full_text = ""
         try:
-            with urllib.request.urlopen(req, timeout=120) as resp:
+            with self._open_stream(payload) as resp:
                 for raw_line in resp:
                     line = raw_line.decode("utf-8", errors="replace").strip()
                     if not line or not line.startswith("data: "):
@@ -229,115 +181,68 @@ class OpenAICompatibleLLM(LLMInterface):
             "temperature": 0.3,
         }).encode()
 
-        req = urllib.request.Request(
-            f"{self.base_url}/v1/chat/completions",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-                "User-Agent": "cairn/0.59.2",
-            },
-        )
-
         t0 = time.monotonic()
-        last_error: Exception | None = None
-        for attempt in range(5):
+        try:
+            raw = self._post(payload)
+        except urllib.error.HTTPError as e:
+            # Graceful degradation: if 400/422 mentions tools, model doesn't support them
+            if self._rejects_tools(e):
+                text = self.generate(messages, max_tokens)
+                return LLMResponse(text=text, stop_reason="end_turn")
+            self._record_failure("llm.generate_with_tools", t0, e)
+            raise
+        except Exception as e:
+            self._record_failure("llm.generate_with_tools", t0, e)
+            raise
+
+        try:
+            result = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"API returned invalid JSON: {raw[:200].decode(errors='replace')}") from e
+
+        choices = result.get("choices", [])
+        if not choices:
+            raise ValueError(f"API returned no choices: {list(result.keys())}")
+
+        msg = choices[0].get("message", {})
+        finish_reason = choices[0].get("finish_reason", "stop")
+        text = msg.get("content")
+        raw_tool_calls = msg.get("tool_calls") or []
+
+        tool_calls = []
+        for tc in raw_tool_calls:
+            func = tc.get("function", {})
             try:
-                with urllib.request.urlopen(req, timeout=120) as resp:
-                    raw = resp.read()
-                try:
-                    result = json.loads(raw)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"API returned invalid JSON: {raw[:200]}") from e
-
-                choices = result.get("choices", [])
-                if not choices:
-                    raise ValueError(f"API returned no choices: {list(result.keys())}")
-
-                msg = choices[0].get("message", {})
-                finish_reason = choices[0].get("finish_reason", "stop")
-                text = msg.get("content")
-                raw_tool_calls = msg.get("tool_calls") or []
-
-                tool_calls = []
-                for tc in raw_tool_calls:
-                    func = tc.get("function", {})
-                    try:
-                        args = json.loads(func.get("arguments", "{}"))
-                    except json.JSONDecodeError:
-                        args = {}
-                    tool_calls.append(ToolCallInfo(
-                        id=tc.get("id", ""),
-                        name=func.get("name", ""),
-                        input=args,
-                    ))
-
-                latency_ms = (time.monotonic() - t0) * 1000
-                usage = result.get("usage", {})
-                tokens_in = usage.get("prompt_tokens") or sum(
-                    len(m.get("content", "")) for m in messages
-                    if isinstance(m.get("content"), str)
-                ) // 4
-                tokens_out = usage.get("completion_tokens") or (len(text or "") + sum(len(str(tc.input)) for tc in tool_calls)) // 4
-                if stats.llm_stats:
-                    stats.llm_stats.record_call(tokens_est=tokens_in + tokens_out)
-                stats.emit_usage_event(
-                    "llm.generate_with_tools", self.model,
-                    tokens_in=tokens_in, tokens_out=tokens_out, latency_ms=latency_ms,
-                )
-
-                # Detect tool use: finish_reason "tool_calls" or presence of tool_calls
-                is_tool_use = finish_reason == "tool_calls" or (tool_calls and finish_reason != "stop")
-                return LLMResponse(
-                    text=text,
-                    tool_calls=tool_calls,
-                    stop_reason="tool_use" if is_tool_use else "end_turn",
-                )
-
-            except urllib.error.HTTPError as e:
-                # Graceful degradation: if 400/422 mentions tools, model doesn't support them
-                if e.code in (400, 422):
-                    try:
-                        err_body = e.read().decode("utf-8", errors="replace")
-                    except Exception:
-                        err_body = ""
-                    if "tool" in err_body.lower() or "function" in err_body.lower():
-                        logger.warning(
-                            "Model %s does not support tool use, disabling for this session",
-                            self.model,
-                        )
-                        self._tools_unsupported = True
-                        text = self.generate(messages, max_tokens)
-                        return LLMResponse(text=text, stop_reason="end_turn")
-                if e.code in (429, 500, 502, 503):
-                    last_error = e
-                    wait = min(2 ** attempt + 1, 30)
-                    logger.warning(
-                        "API transient error (attempt %d/5): HTTP %d. Retrying in %ds...",
-                        attempt + 1, e.code, wait,
-                    )
-                    time.sleep(wait)
-                    continue
-                raise
-            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
-                last_error = e
-                wait = min(2 ** attempt + 1, 30)
-                logger.warning(
-                    "API transient error (attempt %d/5): %s. Retrying in %ds...",
-                    attempt + 1, e, wait,
-                )
-                time.sleep(wait)
-                continue
+                args = json.loads(func.get("arguments", "{}"))
+            except json.JSONDecodeError:
+                args = {}
+            tool_calls.append(ToolCallInfo(
+                id=tc.get("id", ""),
+                name=func.get("name", ""),
+                input=args,
+            ))
 
         latency_ms = (time.monotonic() - t0) * 1000
+        usage = result.get("usage", {})
+        tokens_in = usage.get("prompt_tokens") or sum(
+            len(m.get("content", "")) for m in messages
+            if isinstance(m.get("content"), str)
+        ) // 4
+        tokens_out = usage.get("completion_tokens") or (len(text or "") + sum(len(str(tc.input)) for tc in tool_calls)) // 4
         if stats.llm_stats:
-            stats.llm_stats.record_error(str(last_error))
+            stats.llm_stats.record_call(tokens_est=tokens_in + tokens_out)
         stats.emit_usage_event(
-            "llm.generate_with_tools", self.model, latency_ms=latency_ms,
-            success=False, error_message=str(last_error),
+            "llm.generate_with_tools", self.model,
+            tokens_in=tokens_in, tokens_out=tokens_out, latency_ms=latency_ms,
+        )
+
+        # Detect tool use: finish_reason "tool_calls" or presence of tool_calls
+        is_tool_use = finish_reason == "tool_calls" or (tool_calls and finish_reason != "stop")
+        return LLMResponse(
+            text=text,
+            tool_calls=tool_calls,
+            stop_reason="tool_use" if is_tool_use else "end_turn",
         )
-        assert last_error is not None
-        raise last_error
 
     def generate_with_tools_stream(
         self,
@@ -372,16 +277,6 @@ class OpenAICompatibleLLM(LLMInterface):
             "stream": True,
         }).encode()
 
-        req = urllib.request.Request(
-            f"{self.base_url}/v1/chat/completions",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-                "User-Agent": "cairn/0.59.2",
-            },
-        )
-
         t0 = time.monotonic()
         full_text = ""
         # Accumulate tool calls by index across streamed deltas
@@ -389,7 +284,7 @@ class OpenAICompatibleLLM(LLMInterface):
         finish_reason = "stop"
 
         try:
-            with urllib.request.urlopen(req, timeout=120) as resp:
+            with self._open_stream(payload) as resp:
                 for raw_line in resp:
                     line = raw_line.decode("utf-8", errors="replace").strip()
                     if not line or not line.startswith("data: "):
@@ -462,19 +357,9 @@ class OpenAICompatibleLLM(LLMInterface):
             )
 
         except urllib.error.HTTPError as e:
-            if e.code in (400, 422):
-                try:
-                    err_body = e.read().decode("utf-8", errors="replace")
-                except Exception:
-                    err_body = ""
-                if "tool" in err_body.lower() or "function" in err_body.lower():
-                    logger.warning(
-                        "Model %s does not support tool use, disabling for this session",
-                        self.model,
-                    )
-                    self._tools_unsupported = True
-                    yield from self.generate_stream(messages, max_tokens)
-                    return
+            if self._rejects_tools(e):
+                yield from self.generate_stream(messages, max_tokens)
+                return
             logger.error("OpenAI-compat streaming error: %s", e)
             if stats.llm_stats:
                 stats.llm_stats.record_error(str(e))
@@ -495,6 +380,48 @@ class OpenAICompatibleLLM(LLMInterface):
             ),
         )
 
+    # -- HTTP --
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+    def _post(self, payload: bytes) -> bytes:
+        return self._http.post(
+            f"{self.base_url}/v1/chat/completions", payload, self._headers(),
+            timeout=120, retry=_RETRY, label="API",
+        )
+
+    def _open_stream(self, payload: bytes):
+        return self._http.open(
+            "POST", f"{self.base_url}/v1/chat/completions", payload, self._headers(), timeout=120,
+        )
+
+    def _record_failure(self, operation: str, t0: float, error: Exception) -> None:
+        latency_ms = (time.monotonic() - t0) * 1000
+        if stats.llm_stats:
+            stats.llm_stats.record_error(str(error))
+        stats.emit_usage_event(
+            operation, self.model, latency_ms=latency_ms,
+            success=False, error_message=str(error),
+        )
+
+    def _rejects_tools(self, error: urllib.error.HTTPError) -> bool:
+        """True (and tools disabled for the session) if a 400/422 complains about tools."""
+        if error.code not in (400, 422):
+            return False
+        try:
+            err_body = error.read().decode("utf-8", errors="replace")
+        except Exception:
+            err_body = ""
+        if "tool" not in err_body.lower() and "function" not in err_body.lower():
+            return False
+        logger.warning("Model %s does not support tool use, disabling for this session", self.model)
+        self._tools_unsupported = True
+        return True
+
     def _prepare_tool_messages(self, messages: list[dict]) -> list[dict]:
         """Convert intermediate message format to OpenAI chat format.
 
@@ -15,11 +15,15 @@ import logging
 from collections.abc import Iterator
 from dataclasses import replace
 from datetime import date
+from typing import TYPE_CHECKING
 
 from cairn.config import LLMConfig, RouterConfig
 from cairn.llm import get_llm
 from cairn.llm.interface import LLMInterface, LLMResponse, StreamEvent
 
+if TYPE_CHECKING:
+    from cairn.llm.cache import LLMCache
+
 logger = logging.getLogger(__name__)
 
 VALID_TIERS = ("capable", "fast", "chat")
@@ -39,6 +43,10 @@ class OperationLLM(LLMInterface):
     def generate(self, messages: list[dict], max_tokens: int = 1024) -> str:
         return self._router.generate(messages, max_tokens, tier=self._tier)
 
+    def identity(self) -> str:
+        # The backend this call would reach now, so budget fallback changes cache keys
+        return self._router._resolve_backend(self._tier).identity()
+
     def get_model_name(self) -> str:
         backend = self._router._resolve_backend(self._tier)
         return backend.get_model_name()
@@ -124,6 +132,9 @@ class ModelRouter(LLMInterface):
         self._daily_counters: dict[str, int] = {}
         self._counter_date: date = date.today()
 
+        # Response cache in front of the deterministic operations (set by services.py)
+        self.cache: LLMCache | None = None
+
         logger.info(
             "ModelRouter ready: capable=%s, fast=%s, chat=%s, budgets=%s",
             self._tier_keys.get("capable"),
@@ -172,6 +183,17 @@ class ModelRouter(LLMInterface):
             raise ValueError(f"Unknown tier: {tier!r}. Must be one of {VALID_TIERS}")
         return OperationLLM(self, tier)
 
+    def stats(self) -> dict:
+        """Tier mapping, today's token use against budgets, and response cache hit rates."""
+        self._reset_if_new_day()
+        return {
+            "tiers": dict(self._tier_keys),
+            "date": self._counter_date.isoformat(),
+            "tokens_today": dict(self._daily_counters),
+            "budgets": dict(self._budgets),
+            "cache": self.cache.to_dict() if self.cache is not None else None,
+        }
+
     def generate(self, messages: list[dict], max_tokens: int = 1024, tier: str | None = None) -> str:
         """Generate via the appropriate backend for the tier."""
         effective_tier = tier or "capable"
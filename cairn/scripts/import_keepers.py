@@ -12,6 +12,7 @@ Usage:
     python3 import_keepers.py [--api-base http://localhost:8000/api] [--input /path/to/keepers.json]
     python3 import_keepers.py --dry-run   # preview without importing
     python3 import_keepers.py --preserve-dates  # restore original timestamps after import
+    python3 import_keepers.py --batch-size 200  # bulk store, enrichment in the background
 """
 
 import argparse
@@ -63,8 +64,8 @@ def api_get(base_url: str, path: str) -> dict | None:
         return None
 
 
-def import_memory(base_url: str, mem: dict) -> dict | None:
-    """Import a single memory via the ingest endpoint."""
+def memory_payload(mem: dict) -> dict:
+    """Build the store payload for an exported memory."""
     # Resolve project name
     project = mem.get("project")
     if isinstance(project, dict):
@@ -86,7 +87,22 @@ def import_memory(base_url: str, mem: dict) -> dict | None:
     if mem.get("author"):
         payload["author"] = mem["author"]
 
-    return api_post(base_url, "/ingest/memory", payload)
+    return payload
+
+
+def import_memory(base_url: str, mem: dict) -> dict | None:
+    """Import a single memory via the ingest endpoint."""
+    return api_post(base_url, "/ingest/memory", memory_payload(mem))
+
+
+def import_memory_batch(base_url: str, mems: list[dict]) -> list[dict] | None:
+    """Import memories in one request via the batch store endpoint.
+
+    Enrichment runs in the server's background dispatcher, not per request.
+    Returns the stored memories in input order, or None on failure.
+    """
+    result = api_post(base_url, "/memories/batch", {"memories": [memory_payload(m) for m in mems]})
+    return result["memories"] if result else None
 
 
 def preserve_dates(
@@ -198,6 +214,13 @@ def main():
         default=1.0,
         help="Delay between memory imports in seconds (default: 1.0, allows enrichment/extraction)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="Import memories N per request via /memories/batch, enriching in the background "
+             "(default: 0, one request per memory)",
+    )
     parser.add_argument(
         "--preserve-dates",
         action="store_true",
@@ -251,33 +274,46 @@ def main():
         imported = 0
         failed = 0
 
-        for i, mem in enumerate(memories, 1):
-            old_id = mem.get("id", "?")
-            cats = mem.get("_keeper_categories", [])
-            cat_str = ",".join(cats) if cats else "uncategorized"
-
-            if args.dry_run:
-                project = mem.get("project")
-                if isinstance(project, dict):
-                    project = project.get("name", "?")
-                print(f"  [{i}/{len(memories)}] #{old_id} ({mem.get('memory_type', '?')}) "
-                      f"[{cat_str}] project={project}")
-                continue
-
-            result = import_memory(args.api_base, mem)
-            if result and "id" in result:
-                new_id = result["id"]
-                id_map[old_id] = new_id
-                imported += 1
-                if i % 10 == 0 or i == len(memories):
-                    print(f"  {i}/{len(memories)} imported... (#{old_id} -> #{new_id})")
-            else:
-                failed += 1
-                print(f"  FAILED #{old_id}: {mem.get('summary', '')[:60]}")
-
-            # Throttle to let enrichment/extraction breathe
-            if args.delay > 0 and not args.dry_run:
-                time.sleep(args.delay)
+        if args.batch_size > 0 and not args.dry_run:
+            for start in range(0, len(memories), args.batch_size):
+                batch = memories[start:start + args.batch_size]
+                stored = import_memory_batch(args.api_base, batch)
+                if stored is None:
+                    failed += len(batch)
+                    print(f"  FAILED batch {start + 1}-{start + len(batch)}")
+                    continue
+                for mem, new in zip(batch, stored, strict=True):
+                    id_map[mem.get("id", "?")] = new["id"]
+                imported += len(stored)
+                print(f"  {start + len(batch)}/{len(memories)} imported...")
+        else:
+            for i, mem in enumerate(memories, 1):
+                old_id = mem.get("id", "?")
+                cats = mem.get("_keeper_categories", [])
+                cat_str = ",".join(cats) if cats else "uncategorized"
+
+                if args.dry_run:
+                    project = mem.get("project")
+                    if isinstance(project, dict):
+                        project = project.get("name", "?")
+                    print(f"  [{i}/{len(memories)}] #{old_id} ({mem.get('memory_type', '?')}) "
+                          f"[{cat_str}] project={project}")
+                    continue
+
+                result = import_memory(args.api_base, mem)
+                if result and "id" in result:
+                    new_id = result["id"]
+                    id_map[old_id] = new_id
+                    imported += 1
+                    if i % 10 == 0 or i == len(memories):
+                        print(f"  {i}/{len(memories)} imported... (#{old_id} -> #{new_id})")
+                else:
+                    failed += 1
+                    print(f"  FAILED #{old_id}: {mem.get('summary', '')[:60]}")
+
+                # Throttle to let enrichment/extraction breathe
+                if args.delay > 0 and not args.dry_run:
+                    time.sleep(args.delay)
 
         if not args.dry_run:
             print(f"  Imported: {imported}, Failed: {failed}")
@@ -128,6 +128,8 @@ def _start_workers(svc, cfg, db_instance):
         logger.warning("Graph reconciliation failed", exc_info=True)
     if svc.event_dispatcher:
         svc.event_dispatcher.start()
+    if svc.event_writer:
+        svc.event_writer.start()
     if svc.analytics_tracker:
         svc.analytics_tracker.start()
     if svc.rollup_worker:
@@ -151,6 +153,8 @@ def _stop_workers(svc, db_instance):
         svc.consolidation_worker.stop()
     if svc.analytics_tracker:
         svc.analytics_tracker.stop()
+    if svc.event_writer:
+        svc.event_writer.stop()
     try:
         svc.graph_provider.close()
     except Exception:
@@ -14,13 +14,16 @@ MCP stdio (serial) works fine too — it just uses one connection at a time.
 
 import logging
 import threading
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 
 import psycopg
+from psycopg import sql
 from psycopg.rows import dict_row
 from psycopg_pool import ConnectionPool
 
 from cairn.config import DatabaseConfig
+from cairn.storage.vector import register_vector
 
 logger = logging.getLogger(__name__)
 
@@ -39,15 +42,18 @@ class Database:
         self.config = config
         self._pool: ConnectionPool | None = None
         self._local = threading.local()
+        self._vector_missing = False
 
     def connect(self) -> None:
         """Initialize the connection pool."""
+        self._vector_missing = False
         self._pool = ConnectionPool(
             self.config.dsn,
             min_size=POOL_MIN_SIZE,
             max_size=POOL_MAX_SIZE,
             timeout=10.0,  # ca-236: fail fast if pool is exhausted
             kwargs={"row_factory": dict_row, "autocommit": False},
+            configure=self._configure,
         )
         # Block until min_size connections are ready
         self._pool.wait()
@@ -57,6 +63,13 @@ class Database:
             POOL_MIN_SIZE, POOL_MAX_SIZE,
         )
 
+    def _configure(self, conn: psycopg.Connection) -> None:
+        """Pool hook, once per physical connection: binary vector adapters."""
+        if not register_vector(conn):
+            # Fresh database: run_migrations reopens the pool once it exists
+            self._vector_missing = True
+        conn.commit()  # the pool only accepts idle connections
+
     def close(self) -> None:
         """Release current thread's connection and shut down the pool."""
         self._release()
@@ -83,8 +96,9 @@ class Database:
         # Check out a new connection from the pool
         if self._pool is None:
             raise RuntimeError("Database not connected. Call connect() first.")
-        self._local.conn = self._pool.getconn()
-        return self._local.conn
+        conn = self._pool.getconn()
+        self._local.conn = conn
+        return conn
 
     def _release(self) -> None:
         """Return the current thread's connection to the pool."""
@@ -96,9 +110,15 @@ class Database:
                 logger.warning("Failed to return connection to pool", exc_info=True)
             self._local.conn = None
 
-    def execute(self, query: str, params: tuple | list | None = None) -> list[dict]:
-        """Execute a query and return results."""
-        with self.conn.cursor() as cur:
+    def execute(
+        self, query: str, params: tuple | list | None = None, *, binary: bool = False,
+    ) -> list[dict]:
+        """Execute a query and return results.
+
+        binary=True requests binary result columns, so ``vector`` columns load
+        straight into float32 arrays without text parsing.
+        """
+        with self.conn.cursor(binary=binary) as cur:
             cur.execute(query, params)
             if cur.description:
                 return cur.fetchall()  # type: ignore[return-value]
@@ -112,6 +132,24 @@ class Database:
                 return cur.fetchone()  # type: ignore[return-value]
             return None
 
+    def copy_rows(self, table: str, columns: Sequence[str], rows: Iterable[Sequence]) -> int:
+        """Bulk-load rows with COPY ... FROM STDIN in the current transaction.
+
+        Values go through the connection's dumpers (vectors included). Does
+        not commit. Returns the number of rows written.
+        """
+        statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table),
+            sql.SQL(", ").join(sql.Identifier(c) for c in columns),
+        )
+        count = 0
+        with self.conn.cursor() as cur:
+            with cur.copy(statement) as copy:
+                for row in rows:
+                    copy.write_row(row)
+                    count += 1
+        return count
+
     def commit(self) -> None:
         """Commit the current transaction and return connection to pool.
 
@@ -200,11 +238,17 @@ class Database:
 
         logger.info("All migrations applied. %d total.", len(migration_files))
 
+        if self._vector_missing and self._pool is not None:
+            # Pooled connections predate the vector extension; reopen them so
+            # _configure registers its adapters
+            self.close()
+            self.connect()
+
     def reconcile_vector_dimensions(self, dimensions: int) -> None:
         """Resize vector columns if configured dimensions differ from schema.
 
         Handles backend switches (e.g. local 384-dim → Bedrock 1024-dim) by:
-        1. Altering vector column types on memories and clusters
+        1. Altering vector column types on memories, memory_chunks and clusters
         2. Nulling existing embeddings (old dimensions are invalid)
         3. Clearing stale clusters
         4. Recreating the HNSW index
@@ -284,6 +328,7 @@ class Database:
             """)
 
         self.commit()
+        self._reconcile_table_embedding("memory_chunks", "idx_memory_chunks_embedding", dimensions)
         logger.info(
             "Vector dimensions reconciled: %d → %d. "
             "Existing embeddings cleared — re-embed required.",
@@ -318,8 +363,9 @@ class Database:
             self.commit()
             logger.info("work_items embedding reconciled to %d dimensions", dimensions)
 
-        # Also check working_memory table
+        # Also check working_memory and memory_chunks tables
         self._reconcile_table_embedding("working_memory", "idx_working_memory_embedding", dimensions)
+        self._reconcile_table_embedding("memory_chunks", "idx_memory_chunks_embedding", dimensions)
 
     def _reconcile_table_embedding(self, table: str, index: str, dimensions: int) -> None:
         """Generic embedding column reconciliation for any table."""
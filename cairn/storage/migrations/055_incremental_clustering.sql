@@ -0,0 +1,23 @@
+-- 055: Incremental clustering bookkeeping
+--
+-- Between full HDBSCAN refits, new memories are assigned to the nearest
+-- stored centroid. clustering_runs records which kind of run happened and
+-- the metrics that decide when the next full refit is due:
+--   mode           'full' (HDBSCAN refit) or 'incremental' (centroid assignment)
+--   assigned_count memories attached to an existing cluster by this run
+--   max_memory_id  highest memory id this run has seen. No longer a watermark:
+--                  since 062, incremental runs pick memories by cluster
+--                  membership and cluster_placements
+--   drift          cumulative centroid shift since the last full run
+--   agreement      on full runs: share of incrementally placed memories the
+--                  refit put in the same place (NULL when none were placed)
+
+ALTER TABLE clustering_runs
+    ADD COLUMN IF NOT EXISTS mode TEXT NOT NULL DEFAULT 'full',
+    ADD COLUMN IF NOT EXISTS assigned_count INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS max_memory_id INTEGER,
+    ADD COLUMN IF NOT EXISTS drift FLOAT,
+    ADD COLUMN IF NOT EXISTS agreement FLOAT;
+
+CREATE INDEX IF NOT EXISTS idx_clustering_runs_project_mode
+    ON clustering_runs (project_id, mode, created_at DESC);
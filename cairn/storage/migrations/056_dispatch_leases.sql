@@ -0,0 +1,30 @@
+-- 056_dispatch_leases.sql — Claimable event dispatches + wakeup NOTIFY
+-- Dispatchers claim rows with FOR UPDATE SKIP LOCKED and hold them under a
+-- lease, so several processes/nodes can drain event_dispatches in parallel
+-- without double-running handlers.
+--
+-- A claimed row has status 'running'. While running, next_retry is the lease
+-- deadline: if the claiming worker dies, the row becomes claimable again once
+-- next_retry passes, using the same index as pending/failed rows.
+
+ALTER TABLE event_dispatches ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(100);
+ALTER TABLE event_dispatches ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMPTZ;
+
+DROP INDEX IF EXISTS idx_dispatches_pending;
+CREATE INDEX IF NOT EXISTS idx_dispatches_claimable
+    ON event_dispatches (next_retry)
+    WHERE status IN ('pending', 'failed', 'running');
+
+-- One wakeup per INSERT statement (persist_batch inserts many rows at once).
+-- Delivered on commit, so a woken dispatcher always sees the new rows.
+CREATE OR REPLACE FUNCTION notify_dispatch() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('cairn_dispatch', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS event_dispatches_notify ON event_dispatches;
+CREATE TRIGGER event_dispatches_notify
+    AFTER INSERT ON event_dispatches
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_dispatch();
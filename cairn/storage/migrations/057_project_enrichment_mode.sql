@@ -0,0 +1,10 @@
+-- 057_project_enrichment_mode.sql — Per-project store-time enrichment policy
+-- NULL inherits the server-wide enrichment_mode; 'inline' runs LLM
+-- extraction/enrichment before the INSERT, 'deferred' leaves it to the
+-- memory.created listener so store() returns once content + embedding land.
+
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS enrichment_mode VARCHAR(16);
+
+ALTER TABLE projects DROP CONSTRAINT IF EXISTS chk_projects_enrichment_mode;
+ALTER TABLE projects ADD CONSTRAINT chk_projects_enrichment_mode
+    CHECK (enrichment_mode IS NULL OR enrichment_mode IN ('inline', 'deferred'));
@@ -0,0 +1,18 @@
+-- 058_memory_chunks.sql — Per-chunk vectors for long memories
+-- With embedding.long_content = 'multi', content over the summarize
+-- threshold keeps its primary (summary) vector on memories.embedding and
+-- gets one vector per character span here, so vector search can match a
+-- passage deep inside a long memory.
+
+CREATE TABLE IF NOT EXISTS memory_chunks (
+    memory_id   INTEGER NOT NULL REFERENCES memories(id) ON DELETE CASCADE,
+    chunk_index INTEGER NOT NULL,
+    start_char  INTEGER NOT NULL,
+    end_char    INTEGER NOT NULL,
+    embedding   vector(384),
+    PRIMARY KEY (memory_id, chunk_index)
+);
+
+CREATE INDEX IF NOT EXISTS idx_memory_chunks_embedding
+    ON memory_chunks USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
@@ -0,0 +1,39 @@
+-- 059_rollup_sketches.sql — Mergeable latency in metric_rollups
+-- latency_sketch holds a log-bucketed latency histogram ({bin: count}, see
+-- LatencySketch in cairn/core/analytics.py). Merging two buckets adds their
+-- counts, so percentiles stay correct when a bucket_hour is filled by several
+-- rollup batches and when hours are combined into days. latency_sum keeps the
+-- exact mean. latency_p50/p95/p99 remain, recomputed from the sketch.
+
+ALTER TABLE metric_rollups ADD COLUMN IF NOT EXISTS latency_sum DOUBLE PRECISION NOT NULL DEFAULT 0;
+ALTER TABLE metric_rollups ADD COLUMN IF NOT EXISTS latency_sketch JSONB;
+
+-- Rows whose raw events are gone (past retention) keep an approximate sum
+UPDATE metric_rollups SET latency_sum = COALESCE(latency_p50, 0) * op_count;
+
+-- Rebuild the span still covered by raw events so it gets sketches: drop those
+-- buckets and rewind the watermark to just below the first event of that span;
+-- RollupWorker re-aggregates from there. The span starts at the first full
+-- hour: retention may already have deleted the start of the oldest hour, and
+-- rebuilding it from what is left would drop those counts.
+DELETE FROM metric_rollups
+WHERE bucket_hour >= (
+    SELECT date_trunc('hour', MIN(timestamp)) + interval '1 hour' FROM usage_events
+);
+UPDATE rollup_state
+SET last_event_id = LEAST(last_event_id, e.first_id - 1), updated_at = now()
+FROM (
+    SELECT MIN(id) AS first_id FROM usage_events
+    WHERE timestamp >= (
+        SELECT date_trunc('hour', MIN(timestamp)) + interval '1 hour' FROM usage_events
+    )
+) e
+WHERE rollup_state.id = 1 AND e.first_id IS NOT NULL;
+
+-- One sketch per hour across all operations and projects, so window-wide
+-- percentiles merge one row per hour instead of every bucket
+CREATE TABLE IF NOT EXISTS latency_rollups (
+    bucket_hour TIMESTAMPTZ PRIMARY KEY,
+    op_count BIGINT NOT NULL DEFAULT 0,
+    latency_sketch JSONB NOT NULL
+);
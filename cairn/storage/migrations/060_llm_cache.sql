@@ -0,0 +1,14 @@
+-- 060_llm_cache.sql — Persistent tier of the LLM response cache
+-- key is sha256(backend, model, normalized messages, max_tokens); see
+-- cairn/llm/cache.py. Rows past expires_at are ignored on read and deleted
+-- periodically by the writer.
+
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key BYTEA PRIMARY KEY,
+    operation TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_cache_expires ON llm_cache (expires_at);
@@ -0,0 +1,43 @@
+-- 061_ingest_progress.sql — Resumable, chunk-deduplicated ingestion
+-- ingestion_log rows are now written when an ingest starts (status
+-- 'running') and updated as chunk batches land, so a crashed ingest of the
+-- same content resumes instead of starting over. chunk_count is NULL until
+-- chunking has finished.
+--
+-- ingestion_chunks records each stored chunk's sha256 with its memory, in
+-- the same transaction as the memory INSERT. It is both the resume point
+-- and the per-chunk dedup index: a chunk already stored in the project (by
+-- this or any earlier ingest) is not stored again.
+
+ALTER TABLE ingestion_log ADD COLUMN IF NOT EXISTS status VARCHAR(20) NOT NULL DEFAULT 'complete';
+ALTER TABLE ingestion_log ADD COLUMN IF NOT EXISTS chunks_done INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE ingestion_log ADD COLUMN IF NOT EXISTS chunks_skipped INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE ingestion_log ADD COLUMN IF NOT EXISTS error TEXT;
+ALTER TABLE ingestion_log ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW();
+ALTER TABLE ingestion_log ALTER COLUMN chunk_count DROP DEFAULT;
+
+UPDATE ingestion_log SET chunks_done = COALESCE(chunk_count, 0), updated_at = created_at;
+
+CREATE TABLE IF NOT EXISTS ingestion_chunks (
+    ingestion_id INTEGER NOT NULL REFERENCES ingestion_log(id) ON DELETE CASCADE,
+    seq          INTEGER NOT NULL,
+    project_id   INTEGER REFERENCES projects(id),
+    content_hash VARCHAR(64) NOT NULL,
+    memory_id    INTEGER NOT NULL REFERENCES memories(id) ON DELETE CASCADE,
+    PRIMARY KEY (ingestion_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_ingestion_chunks_hash
+    ON ingestion_chunks (project_id, content_hash);
+
+-- Backfill from earlier ingests so their chunks dedup too. target_ids holds
+-- the doc id first when target_type is 'both'.
+INSERT INTO ingestion_chunks (ingestion_id, seq, project_id, content_hash, memory_id)
+SELECT l.id, t.ord - 1, l.project_id,
+       encode(sha256(convert_to(m.content, 'UTF8')), 'hex'), m.id
+FROM ingestion_log l
+CROSS JOIN LATERAL unnest(
+    CASE WHEN l.target_type = 'both' THEN l.target_ids[2:] ELSE l.target_ids END
+) WITH ORDINALITY AS t(memory_id, ord)
+JOIN memories m ON m.id = t.memory_id
+WHERE l.target_type IN ('memory', 'both')
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,48 @@
+-- 062: Memories clustering has already judged, per scope
+--
+-- Incremental clustering used to take memories with an id above the last
+-- run's max_memory_id. Rows committed out of id order, and memories whose
+-- embedding was filled in later, fell below that watermark and waited for
+-- the next full refit. It now takes every active, embedded memory that is
+-- not in one of the scope's clusters and has no placement for its current
+-- version.
+--
+-- cluster_placements holds the memories judged since the last full refit
+-- that are not plain HDBSCAN members (project_id NULL = global scope):
+--   mode 'full'         HDBSCAN noise at the last refit
+--   mode 'incremental'  placed by an incremental run, into cluster_id or,
+--                       when cluster_id is NULL, as noise
+-- memory_updated_at is the memories.updated_at the run saw; an edit since
+-- makes the memory eligible again. A full refit replaces the scope's rows.
+
+CREATE TABLE IF NOT EXISTS cluster_placements (
+    project_id        INTEGER REFERENCES projects(id) ON DELETE CASCADE,
+    memory_id         INTEGER NOT NULL REFERENCES memories(id) ON DELETE CASCADE,
+    cluster_id        INTEGER REFERENCES clusters(id) ON DELETE CASCADE,
+    mode              TEXT NOT NULL,
+    memory_updated_at TIMESTAMPTZ,
+    placed_at         TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_cluster_placements_scope_memory
+    ON cluster_placements ((COALESCE(project_id, 0)), memory_id);
+
+-- Unclustered memories the last run already saw were HDBSCAN noise or
+-- incremental noise; record them so they aren't re-judged on upgrade.
+INSERT INTO cluster_placements (project_id, memory_id, mode, memory_updated_at)
+SELECT w.project_id, m.id, 'full', m.updated_at
+FROM (
+    SELECT project_id, MAX(max_memory_id) AS max_id
+    FROM clustering_runs
+    GROUP BY project_id
+) w
+JOIN memories m
+  ON (w.project_id IS NULL OR m.project_id = w.project_id) AND m.id <= w.max_id
+WHERE m.is_active = true
+  AND m.embedding IS NOT NULL
+  AND NOT EXISTS (
+      SELECT 1 FROM cluster_members cm
+      JOIN clusters c ON c.id = cm.cluster_id
+      WHERE cm.memory_id = m.id AND c.project_id IS NOT DISTINCT FROM w.project_id
+  )
+ON CONFLICT DO NOTHING;
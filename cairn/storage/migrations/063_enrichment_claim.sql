@@ -0,0 +1,9 @@
+-- 063: When a deferred enrichment claimed its memory
+--
+-- MemoryStore.enrich_deferred moves a memory from 'pending' to 'enriching'
+-- before its LLM call. If that delivery dies (process crash, hung handler),
+-- the claim is taken over once it is older than the enrichment lease, so
+-- the memory isn't left 'enriching' forever. NULL on an 'enriching' row
+-- (claimed before this migration) counts as expired.
+
+ALTER TABLE memories ADD COLUMN IF NOT EXISTS enrichment_claimed_at TIMESTAMPTZ;
@@ -61,7 +61,7 @@ def register(mcp, svc: Services):
                 reclustered = False
                 labeling_error = None
                 if svc.cluster_engine.is_stale(project):
-                    cluster_result = svc.cluster_engine.run_clustering(project)
+                    cluster_result = svc.cluster_engine.refresh(project)
                     reclustered = True
                     labeling_error = cluster_result.get("labeling_error")
 
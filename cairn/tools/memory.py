@@ -1,11 +1,11 @@
-"""Memory tools: store, search, recall, modify, ingest, consolidate."""
+"""Memory tools: store, store_many, search, recall, modify, ingest, consolidate."""
 
 import logging
 
 from cairn.core.services import Services
 from cairn.core.tool_ops import budgeted_recall, budgeted_search, validate_modify_inputs
 from cairn.core.trace import set_trace_project, set_trace_tool
-from cairn.core.utils import ValidationError, validate_store
+from cairn.core.utils import ValidationError, validate_store, validate_store_many
 from cairn.tools.auth import check_project_access, require_admin
 from cairn.tools.threading import in_thread
 
@@ -110,6 +110,46 @@ def register(mcp, svc: Services):
             logger.exception("store failed")
             return {"error": f"Internal error: {e}"}
 
+    @mcp.tool()
+    async def store_many(
+        memories: list[dict],
+        enrich: bool = True,
+    ) -> dict:
+        """Store many memories in one call. Use for imports and bulk capture, not single notes.
+
+        Embeds every memory in batches and inserts them in bulk, so it is far
+        faster than calling store in a loop. Enrichment (relationships, graph)
+        is not run inline: it happens in the background after the call returns.
+
+        Args:
+            memories: Up to 1000 memories, each a dict with store's arguments:
+                content and project (required), memory_type, importance, tags,
+                session_name, related_files, related_ids, file_hashes, author,
+                event_at, valid_until, salience.
+            enrich: When False, skips enrichment entirely (e.g. chunks of a document).
+
+        Returns {stored, memories: [{id, project, memory_type, importance, created_at}]}
+        in input order.
+        """
+        try:
+            set_trace_tool("store_many")
+            validate_store_many(memories)
+            for project in dict.fromkeys(m["project"] for m in memories):
+                check_project_access(svc, project)
+            if len({m["project"] for m in memories}) == 1:
+                set_trace_project(memories[0]["project"])
+
+            def _do_store_many():
+                return svc.memory_store.store_many(memories, enrich=enrich)
+
+            stored = await in_thread(svc.db, _do_store_many)
+            return {"stored": len(stored), "memories": stored}
+        except ValidationError as e:
+            return {"error": str(e)}
+        except Exception as e:
+            logger.exception("store_many failed")
+            return {"error": f"Internal error: {e}"}
+
     @mcp.tool()
     async def search(
         query: str,
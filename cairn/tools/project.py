@@ -397,7 +397,10 @@ def register(mcp, svc: Services):
         """
         try:
             set_trace_tool("status")
-            return await in_thread(svc.db, get_status, svc.db, svc.config)
+            return await in_thread(
+                svc.db, get_status, svc.db, svc.config,
+                router=svc.router, llm_cache=svc.llm_cache,
+            )
         except Exception as e:
             logger.exception("status failed")
             return {"error": f"Internal error: {e}"}
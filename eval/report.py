@@ -108,9 +108,28 @@ def print_enrichment_results(results: dict) -> None:
     print(f"  Target: overall >= {RECALL_TARGET:.0%}")
 
 
+def print_store_latency_results(results: dict) -> None:
+    """Print the inline vs deferred store latency comparison."""
+    print(f"\n{'=' * 70}")
+    print(f"  Store Latency — simulated LLM at {results['llm_latency_ms']:.0f} ms")
+    print(f"{'=' * 70}")
+    print(f"  {'Mode':<10} {'store p50':>10} {'store p95':>10} {'listener p50':>13}  Status")
+    print(f"  {'-' * 62}")
+    for mode, r in results["modes"].items():
+        store_ms = r["store_ms"]
+        status = ", ".join(f"{k}={v}" for k, v in sorted(r["enrichment_status"].items()))
+        print(f"  {mode:<10} {store_ms.get('p50', 0):>8.1f}ms {store_ms.get('p95', 0):>8.1f}ms "
+              f"{r['listener_ms'].get('p50', 0):>11.1f}ms  {status}")
+
+    print(f"\n  Samples per mode: {results['samples']}")
+    if results.get("speedup_p50"):
+        print(f"  Deferred store p50 speedup: {results['speedup_p50']:.1f}x")
+
+
 def write_json_report(
     search_results: list[dict],
     enrichment_results: dict | None = None,
+    store_latency_results: dict | None = None,
 ) -> Path:
     """Write full results to a timestamped JSON file."""
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -122,6 +141,8 @@ def write_json_report(
     }
     if enrichment_results:
         report["enrichment"] = enrichment_results
+    if store_latency_results:
+        report["store_latency"] = store_latency_results
 
     path = REPORTS_DIR / f"eval_{timestamp}.json"
     path.write_text(json.dumps(report, indent=2, default=str))
@@ -8,6 +8,7 @@ Usage:
     python -m eval.runner --models minilm mpnet  # Specific models
     python -m eval.runner --json                 # Write JSON report to eval/reports/
     python -m eval.runner --keep-dbs             # Don't drop eval databases
+    python -m eval.runner --store-latency        # Also compare inline vs deferred store latency
 """
 
 import argparse
@@ -20,6 +21,7 @@ from eval.report import (
     print_enrichment_results,
     print_model_comparison,
     print_search_results,
+    print_store_latency_results,
     write_json_report,
 )
 
@@ -66,6 +68,14 @@ def main():
         "--k", type=int, default=10,
         help="Number of results to evaluate (default: 10)",
     )
+    parser.add_argument(
+        "--store-latency", action="store_true",
+        help="Also compare store() latency with inline vs deferred enrichment",
+    )
+    parser.add_argument(
+        "--llm-latency-ms", type=float, default=800.0,
+        help="Simulated LLM latency for --store-latency (default: 800)",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true",
         help="Enable debug logging",
@@ -95,6 +105,7 @@ def main():
 
     search_results = []
     enrichment_results = None
+    store_latency_results = None
 
     # Search evaluation
     if not args.enrichment_only:
@@ -126,9 +137,24 @@ def main():
             print(f"\nEnrichment eval failed: {e}")
             logger.exception("Enrichment eval error")
 
+    # Store latency: inline vs deferred enrichment
+    if args.store_latency:
+        try:
+            from eval.store_latency_eval import run_store_latency_eval
+            print("\nRunning store latency comparison...")
+            store_latency_results = run_store_latency_eval(
+                admin_dsn=admin_dsn,
+                llm_latency_ms=args.llm_latency_ms,
+                keep_db=args.keep_dbs,
+            )
+            print_store_latency_results(store_latency_results)
+        except Exception as e:
+            print(f"\nStore latency eval failed: {e}")
+            logger.exception("Store latency eval error")
+
     # JSON report
-    if args.json and (search_results or enrichment_results):
-        path = write_json_report(search_results, enrichment_results)
+    if args.json and (search_results or enrichment_results or store_latency_results):
+        path = write_json_report(search_results, enrichment_results, store_latency_results)
         print(f"\nJSON report: {path}")
 
     print()
@@ -0,0 +1,184 @@
+"""Store latency: inline vs deferred enrichment.
+
+Stores the same memories through MemoryStore.store() under each
+enrichment mode and reports the latency the client sees. Inline mode
+pays for the LLM enrichment call before the INSERT; deferred mode
+returns once content + embedding are committed and leaves enrichment to
+MemoryEnrichmentListener, which is then drained here and timed
+separately so the total enrichment work can be compared too.
+
+The LLM is simulated with a fixed latency and a canned enrichment
+response, so the comparison measures the write path rather than the
+backend. Embeddings use the configured local model, as the search eval.
+"""
+
+import json
+import logging
+import time
+
+from cairn.config import EmbeddingConfig
+from cairn.core.enrichment import Enricher
+from cairn.core.event_bus import EventBus
+from cairn.core.memory import MemoryStore
+from cairn.embedding.interface import EmbeddingInterface
+from cairn.listeners.memory_enrichment import MemoryEnrichmentListener
+from cairn.llm.interface import LLMInterface
+from cairn.storage.database import Database
+from eval.corpus import _replace_dbname, create_eval_db, drop_eval_db
+from eval.search_eval import _parse_dsn
+
+logger = logging.getLogger(__name__)
+
+DB_NAME = "cairn_eval_store_latency"
+PROJECT = "store-latency"
+
+_ENRICHMENT_RESPONSE = json.dumps({
+    "tags": ["deploy", "infrastructure"],
+    "importance": 0.7,
+    "memory_type": "decision",
+    "summary": "Deployment decision.",
+    "entities": ["api-gateway", "Postgres"],
+})
+
+
+class SimulatedLLM(LLMInterface):
+    """Canned enrichment response after a fixed delay."""
+
+    def __init__(self, latency_ms: float):
+        self.latency_ms = latency_ms
+
+    def generate(self, messages: list[dict], max_tokens: int = 1024) -> str:
+        time.sleep(self.latency_ms / 1000)
+        return _ENRICHMENT_RESPONSE
+
+    def get_model_name(self) -> str:
+        return "simulated"
+
+    def get_context_size(self) -> int:
+        return 8192
+
+
+def _contents(samples: int) -> list[str]:
+    return [
+        f"Decided to move service {i % 17} behind the api-gateway and point it at "
+        f"the shared Postgres cluster (replica {i % 3}); rollout in wave {i % 5}."
+        for i in range(samples)
+    ]
+
+
+def _summarize(latencies_ms: list[float]) -> dict:
+    ordered = sorted(latencies_ms)
+    if not ordered:
+        return {}
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))], 1)
+
+    return {
+        "mean": round(sum(ordered) / len(ordered), 1),
+        "p50": pct(50),
+        "p95": pct(95),
+        "max": round(ordered[-1], 1),
+    }
+
+
+def _run_mode(
+    db: Database, embedding: EmbeddingInterface, llm: LLMInterface,
+    mode: str, contents: list[str],
+) -> dict:
+    """Store every content under one enrichment mode; drain deferred work."""
+    bus = EventBus(db, None)
+    store = MemoryStore(
+        db, embedding, enricher=Enricher(llm), event_bus=bus, enrichment_mode=mode,
+    )
+    # Registered so each event gets its dispatch row, as on the server; the
+    # dispatcher itself is not started
+    listener = MemoryEnrichmentListener(store)
+    listener.register(bus)
+
+    store_ms = []
+    for content in contents:
+        t0 = time.monotonic()
+        store.store(content=content, project=PROJECT, session_name=f"eval-{mode}")
+        store_ms.append((time.monotonic() - t0) * 1000)
+
+    # Stand-in for the EventDispatcher: run the listener on each event
+    events = db.execute(
+        """
+        SELECT e.event_type, e.payload FROM events e
+        JOIN projects p ON p.id = e.project_id
+        WHERE p.name = %s AND e.session_name = %s AND e.event_type = 'memory.created'
+        ORDER BY e.id
+        """,
+        (PROJECT, f"eval-{mode}"),
+    )
+    listener_ms = []
+    for event in events:
+        t0 = time.monotonic()
+        listener.handle(event)
+        listener_ms.append((time.monotonic() - t0) * 1000)
+
+    statuses = db.execute(
+        """
+        SELECT enrichment_status, COUNT(*) AS n FROM memories
+        WHERE session_name = %s GROUP BY enrichment_status
+        """,
+        (f"eval-{mode}",),
+    )
+    return {
+        "mode": mode,
+        "store_ms": _summarize(store_ms),
+        "listener_ms": _summarize(listener_ms),
+        "enrichment_status": {r["enrichment_status"]: r["n"] for r in statuses},
+    }
+
+
+def run_store_latency_eval(
+    admin_dsn: str,
+    samples: int = 50,
+    llm_latency_ms: float = 800.0,
+    keep_db: bool = False,
+    embedding: EmbeddingInterface | None = None,
+) -> dict:
+    """Compare client-visible store() latency across enrichment modes.
+
+    Returns:
+        {
+            "samples": int,
+            "llm_latency_ms": float,
+            "modes": {
+                "inline": {"store_ms": {...}, "listener_ms": {...}, "enrichment_status": {...}},
+                "deferred": {...},
+            },
+            "speedup_p50": float,   # inline p50 / deferred p50
+        }
+    """
+    if embedding is None:
+        from cairn.embedding.engine import EmbeddingEngine
+        embedding = EmbeddingEngine(EmbeddingConfig())
+
+    create_eval_db(admin_dsn, DB_NAME, embedding.dimensions)
+    try:
+        db = Database(_parse_dsn(_replace_dbname(admin_dsn, DB_NAME)))
+        db.connect()
+        try:
+            llm = SimulatedLLM(llm_latency_ms)
+            contents = _contents(samples)
+            modes = {
+                mode: _run_mode(db, embedding, llm, mode, contents)
+                for mode in ("inline", "deferred")
+            }
+        finally:
+            db.close()
+    finally:
+        if not keep_db:
+            drop_eval_db(admin_dsn, DB_NAME)
+
+    inline_p50 = modes["inline"]["store_ms"].get("p50", 0.0)
+    deferred_p50 = modes["deferred"]["store_ms"].get("p50", 0.0)
+    return {
+        "samples": samples,
+        "llm_latency_ms": llm_latency_ms,
+        "modes": modes,
+        "speedup_p50": round(inline_p50 / deferred_p50, 1) if deferred_p50 else None,
+    }
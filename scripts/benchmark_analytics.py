@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Benchmark analytics dashboard queries: raw usage_events vs hourly rollups.
+
+Fills usage_events with synthetic events spread over --days, rolls them up
+with RollupWorker, appends an unrolled tail, then times each dashboard query
+two ways:
+
+  raw     the previous queries, aggregating usage_events directly
+  rollup  AnalyticsQueryEngine: metric_rollups + the tail past the watermark
+
+Also reports rollup throughput and how far the merged latency sketch's
+p50/p95/p99 are from exact percentiles over the same events.
+
+Connects to the configured database (CAIRN_DB_* env vars, as for the
+server), which should be a scratch one: the script runs migrations and
+EMPTIES usage_events and metric_rollups, so it refuses to run without
+--empty-tables.
+
+Usage:
+    CAIRN_DB_NAME=cairn_bench python scripts/benchmark_analytics.py --empty-tables
+    CAIRN_DB_NAME=cairn_bench python scripts/benchmark_analytics.py --empty-tables --events 1000000
+"""
+
+import argparse
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cairn.config import load_config  # noqa: E402
+from cairn.core.analytics import AnalyticsQueryEngine, RollupWorker  # noqa: E402
+from cairn.storage.database import Database  # noqa: E402
+
+FILL_CHUNK = 1_000_000
+
+_RAW_TOTALS = """
+    SELECT COUNT(*), COALESCE(SUM(tokens_in + tokens_out), 0), AVG(latency_ms),
+           COUNT(*) FILTER (WHERE NOT success)
+    FROM usage_events WHERE timestamp >= %(since_7d)s
+"""
+_RAW_SPARKLINE = """
+    SELECT date_trunc('hour', timestamp) AS bucket, COUNT(*),
+           COALESCE(SUM(tokens_in + tokens_out), 0), COUNT(*) FILTER (WHERE NOT success)
+    FROM usage_events WHERE timestamp >= %(since_7d)s GROUP BY bucket ORDER BY bucket
+"""
+_RAW_PERCENTILES = """
+    SELECT PERCENTILE_CONT(ARRAY[0.5, 0.95, 0.99]) WITHIN GROUP (ORDER BY latency_ms) AS exact
+    FROM usage_events WHERE timestamp >= %(since_7d)s
+"""
+
+# Each dashboard view: the raw statements it used to need, and the engine call
+VIEWS = {
+    "overview (7d)": (
+        # Percentiles were never computed from raw events; included as the
+        # exact baseline for the sketch-backed latency block
+        [_RAW_TOTALS, _RAW_SPARKLINE, _RAW_PERCENTILES],
+        lambda e: e.overview(days=7),
+    ),
+    "timeseries (30d, day)": (
+        ["""
+        SELECT date_trunc('day', timestamp) AS bucket, COUNT(*), COALESCE(SUM(tokens_in), 0),
+               COALESCE(SUM(tokens_out), 0), COUNT(*) FILTER (WHERE NOT success)
+        FROM usage_events WHERE timestamp >= %(since_30d)s GROUP BY bucket ORDER BY bucket
+        """],
+        lambda e: e.timeseries(days=30, granularity="day"),
+    ),
+    "projects breakdown (30d)": (
+        ["""
+        SELECT p.name, COUNT(*), COALESCE(SUM(ue.tokens_in + ue.tokens_out), 0),
+               AVG(ue.latency_ms), COUNT(*) FILTER (WHERE NOT ue.success)
+        FROM usage_events ue LEFT JOIN projects p ON ue.project_id = p.id
+        WHERE ue.timestamp >= %(since_30d)s GROUP BY p.name
+        """, """
+        SELECT p.name, COUNT(*)
+        FROM usage_events ue LEFT JOIN projects p ON ue.project_id = p.id
+        WHERE ue.timestamp >= %(since_60d)s AND ue.timestamp < %(since_30d)s GROUP BY p.name
+        """],
+        lambda e: e.projects_breakdown(days=30),
+    ),
+    "activity heatmap (365d)": (
+        ["""
+        SELECT date_trunc('day', timestamp) AS bucket, COUNT(*)
+        FROM usage_events WHERE timestamp >= %(since_365d)s GROUP BY bucket ORDER BY bucket
+        """],
+        lambda e: e.activity_heatmap(days=365),
+    ),
+}
+
+OPERATIONS = ["store", "search", "recall", "modify", "orient", "code_query", "embed", "llm.generate"]
+
+
+def reset(db: Database, projects: int) -> list[int]:
+    db.execute("TRUNCATE usage_events, metric_rollups")
+    db.execute("UPDATE rollup_state SET last_event_id = 0 WHERE id = 1")
+    for i in range(projects):
+        db.execute("INSERT INTO projects (name) VALUES (%s) ON CONFLICT DO NOTHING", (f"bench-{i}",))
+    rows = db.execute("SELECT id FROM projects WHERE name LIKE %s ORDER BY id", ("bench-%",))
+    db.commit()
+    return [r["id"] for r in rows]
+
+
+def fill(db: Database, count: int, days: int, project_ids: list[int], recent: bool = False) -> None:
+    """Insert synthetic events server-side, oldest first so ids follow time."""
+    span = "1 hour" if recent else f"{days} days"
+    for start in range(0, count, FILL_CHUNK):
+        n = min(FILL_CHUNK, count - start)
+        db.execute(
+            f"""
+            INSERT INTO usage_events (timestamp, operation, project_id, tokens_in, tokens_out, latency_ms, success)
+            SELECT now() - interval '{span}' * (1 - (%s + g)::float8 / %s),
+                   (%s::text[])[1 + g %% %s],
+                   (%s::int[])[1 + g %% %s],
+                   g %% 400, g %% 250,
+                   exp(random() * 9),
+                   g %% 23 <> 0
+            FROM generate_series(1, %s) g
+            """,
+            (start, count, OPERATIONS, len(OPERATIONS), project_ids, len(project_ids), n),
+        )
+        db.commit()
+
+
+def best_of(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--empty-tables", action="store_true", required=True,
+                        help="confirm usage_events and metric_rollups may be emptied")
+    parser.add_argument("--events", type=int, default=10_000_000)
+    parser.add_argument("--days", type=int, default=90, help="spread events over this many days")
+    parser.add_argument("--tail", type=int, default=20_000, help="unrolled events in the last hour")
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=3, help="best of N per query")
+    args = parser.parse_args()
+
+    db = Database(load_config().db)
+    db.connect()
+    db.run_migrations()
+    project_ids = reset(db, args.projects)
+
+    start = time.perf_counter()
+    fill(db, args.events, args.days, project_ids)
+    db.execute("ANALYZE usage_events")
+    db.commit()
+    print(f"filled {args.events} events over {args.days}d in {time.perf_counter() - start:.1f} s")
+
+    worker = RollupWorker(db, retention_days=10_000)
+    start = time.perf_counter()
+    batches = 0
+    while worker._process_batch():
+        batches += 1
+    elapsed = time.perf_counter() - start
+    buckets = db.execute_one("SELECT COUNT(*) AS n FROM metric_rollups")["n"]
+    db.commit()
+    print(f"rolled up in {elapsed:.1f} s ({batches} batches, {args.events / elapsed:,.0f} events/s, {buckets} buckets)")
+
+    fill(db, args.tail, args.days, project_ids, recent=True)
+    db.execute("ANALYZE usage_events")
+    db.execute("ANALYZE metric_rollups")
+    db.commit()
+    print(f"+ {args.tail} unrolled tail events\n")
+
+    now = datetime.now(UTC)
+    params = {f"since_{d}d": now - timedelta(days=d) for d in (7, 30, 60, 365)}
+    engine = AnalyticsQueryEngine(db)
+
+    def run_raw(statements):
+        for sql in statements:
+            db.execute(sql, params)
+        db.commit()
+
+    def run_engine(view):
+        view(engine)
+        db.commit()
+
+    print(f"  {'view':26s} {'raw ms':>10s} {'rollup ms':>10s} {'speedup':>8s}")
+    for name, (statements, view) in VIEWS.items():
+        raw = best_of(lambda: run_raw(statements), args.runs)
+        rollup = best_of(lambda: run_engine(view), args.runs)
+        print(f"  {name:26s} {raw:10.1f} {rollup:10.1f} {raw / max(rollup, 1e-6):7.0f}x")
+
+    exact = db.execute_one(_RAW_PERCENTILES, params)["exact"]
+    sketch = engine._latency_sketch(params["since_7d"])
+    db.commit()
+    print("\n  latency (7d)      exact     sketch    error")
+    for q, value in zip((0.5, 0.95, 0.99), exact):
+        approx = sketch.quantile(q)
+        print(f"  p{int(q * 100):<3d}        {value:10.1f} {approx:10.1f} {abs(approx - value) / value:8.2%}")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
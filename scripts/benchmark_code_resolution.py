@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Benchmark import + call resolution scaling on synthetic projects.
+
+Generates in-memory ParseResults (no parsing, no disk) for a mixed
+Python / TypeScript / Go project and times _resolve_all_imports and
+_resolve_all_calls sharing one ModuleIndex, at several project sizes.
+Imports mix project modules, symbols inside modules, bare packages and
+stdlib/third-party names — the last kind is what used to force a scan of
+every module per import.
+
+--baseline REV also loads cairn/code/indexer.py as of git revision REV
+(e.g. one from before the index existed), times it on the same input and
+checks both produce identical edges. The old resolver is quadratic: keep
+--baseline-max low.
+
+Usage:
+    python scripts/benchmark_code_resolution.py
+    python scripts/benchmark_code_resolution.py --sizes 1000 10000 50000
+    python scripts/benchmark_code_resolution.py --baseline HEAD~1 --baseline-max 10000
+"""
+
+import argparse
+import importlib.util
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cairn.code.indexer import _resolve_all_calls, _resolve_all_imports  # noqa: E402
+from cairn.code.parser import CallInfo, CodeSymbol, ParseResult  # noqa: E402
+from cairn.code.resolution import ModuleIndex  # noqa: E402
+
+BASE = "/srv/proj"
+EXTERNAL_PY = ["os", "sys", "typing", "collections.abc", "numpy", "psycopg.rows"]
+EXTERNAL_TS = ["react", "axios", "lodash/fp"]
+EXTERNAL_GO = ["fmt", "context", "net/http"]
+NAMES = ["get", "put", "load", "save", "connect", "close", "parse", "render", "search", "index"]
+
+
+def _sym(name, kind, path, parent=None):
+    qname = f"{parent}.{name}" if parent else name
+    return CodeSymbol(name=name, qualified_name=qname, kind=kind, file_path=path,
+                      start_line=1, end_line=2, parent_name=parent)
+
+
+def _imp(text, path):
+    return CodeSymbol(name=text, qualified_name=text, kind="import", file_path=path, start_line=1, end_line=1)
+
+
+def generate(n_files: int, seed: int = 0) -> tuple[list[ParseResult], set[str]]:
+    """A project of roughly n_files: 70% Python packages, 20% TS, 10% Go."""
+    rng = random.Random(seed)
+    files: list[ParseResult] = []
+    py_modules: list[str] = []
+    ts_dirs: list[str] = []
+    go_pkgs: list[str] = []
+
+    n_py, n_ts = int(n_files * 0.7), int(n_files * 0.2)
+    n_go = n_files - n_py - n_ts
+    per_pkg = 20
+
+    def py_path(i):
+        pkg, sub = i // (per_pkg * 10), (i // per_pkg) % 10
+        return f"{BASE}/app/pkg{pkg}/sub{sub}", f"app.pkg{pkg}.sub{sub}"
+
+    for i in range(n_py):
+        d, mod = py_path(i)
+        if i % per_pkg == 0:
+            files.append(ParseResult(file_path=f"{d}/__init__.py", language="python", content_hash=""))
+            py_modules.append(mod)
+        py_modules.append(f"{mod}.m{i}")
+    for i in range(n_ts):
+        ts_dirs.append(f"{BASE}/web/src/c{i // per_pkg}")
+    for i in range(n_go):
+        go_pkgs.append(f"svc/p{i // 8}")
+    for pkg in range(n_py // (per_pkg * 10) + 1):
+        files.append(ParseResult(file_path=f"{BASE}/app/pkg{pkg}/__init__.py", language="python",
+                                 content_hash=""))
+    files.append(ParseResult(file_path=f"{BASE}/app/__init__.py", language="python", content_hash=""))
+
+    for i in range(n_py):
+        d, mod = py_path(i)
+        path = f"{d}/m{i}.py"
+        cls = f"C{i}"
+        funcs = rng.sample(NAMES, 3)
+        symbols = [_sym(cls, "class", path)] + [_sym(f, "method", path, cls) for f in funcs[:2]]
+        symbols.append(_sym(f"{funcs[2]}_{i % 97}", "function", path))
+        imports = [_imp(f"import {rng.choice(EXTERNAL_PY)}", path),
+                   _imp(f"from {rng.choice(EXTERNAL_PY)} import x", path)]
+        for _ in range(3):
+            target = rng.choice(py_modules)
+            form = rng.random()
+            if form < 0.5:
+                imports.append(_imp(f"from {target} import thing", path))
+            elif form < 0.8:
+                imports.append(_imp(f"import {target}.Thing", path))  # Symbol inside a module
+            else:
+                imports.append(_imp(f"import {target.rsplit('.', 2)[0]}", path))
+        calls = [CallInfo(caller_qualified_name=f"{cls}.{funcs[0]}", callee_name=rng.choice(NAMES),
+                          callee_full_name="self.x", line=3, file_path=path) for _ in range(4)]
+        files.append(ParseResult(file_path=path, language="python", content_hash="",
+                                 symbols=symbols, imports=imports, calls=calls))
+
+    for i in range(n_ts):
+        path = f"{ts_dirs[i]}/w{i}.ts"
+        sibling = f"./w{i - 1}" if i % per_pkg else "../shared"
+        other = f"../c{rng.randrange(len(ts_dirs) // per_pkg + 1)}/w{rng.randrange(n_ts)}"
+        imports = [_imp(f"import {{ a }} from '{sibling}'", path), _imp(f"import b from '{other}'", path),
+                   _imp(f"import React from '{rng.choice(EXTERNAL_TS)}'", path)]
+        symbols = [_sym(rng.choice(NAMES), "function", path), _sym(f"W{i}", "class", path)]
+        calls = [CallInfo(caller_qualified_name=f"W{i}", callee_name=rng.choice(NAMES),
+                          callee_full_name="x", line=2, file_path=path) for _ in range(3)]
+        files.append(ParseResult(file_path=path, language="typescript", content_hash="",
+                                 symbols=symbols, imports=imports, calls=calls))
+
+    for i in range(n_go):
+        path = f"{BASE}/{go_pkgs[i]}/g{i}.go"
+        imports = [_imp(f'"{rng.choice(EXTERNAL_GO)}"', path),
+                   _imp(f'"github.com/acme/proj/{rng.choice(go_pkgs)}"', path),
+                   _imp(f'alias "{rng.choice(go_pkgs)}"', path)]
+        symbols = [_sym(rng.choice(NAMES).title(), "function", path)]
+        calls = [CallInfo(caller_qualified_name=symbols[0].name, callee_name=rng.choice(NAMES).title(),
+                          callee_full_name="x", line=2, file_path=path) for _ in range(3)]
+        files.append(ParseResult(file_path=path, language="golang", content_hash="",
+                                 symbols=symbols, imports=imports, calls=calls))
+
+    files.sort(key=lambda p: Path(p.file_path).parts)
+    return files, {p.file_path for p in files}
+
+
+def load_baseline(rev: str):
+    source = subprocess.run(
+        ["git", "show", f"{rev}:cairn/code/indexer.py"], cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+        f.write(source)
+    spec = importlib.util.spec_from_file_location("baseline_indexer", f.name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["baseline_indexer"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--baseline", metavar="REV", help="git revision of the resolver to compare against")
+    parser.add_argument("--baseline-max", type=int, default=10000, help="largest size to run the baseline on")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline) if args.baseline else None
+
+    print(f"{'files':>7s} {'imports':>8s} {'calls':>8s} {'index ms':>9s} {'imports ms':>11s} "
+          f"{'calls ms':>9s} {'total ms':>9s}" + ("   baseline ms  speedup  identical" if baseline else ""))
+    for size in args.sizes:
+        files, known = generate(size)
+        start = time.perf_counter()
+        index = ModuleIndex(files, known)
+        built = time.perf_counter()
+        imports = _resolve_all_imports(files, known, index=index)
+        resolved = time.perf_counter()
+        calls = _resolve_all_calls(files, known, index=index)
+        done = time.perf_counter()
+        line = (f"{len(files):7d} {len(imports):8d} {len(calls):8d} {(built - start) * 1000:9.1f} "
+                f"{(resolved - built) * 1000:11.1f} {(done - resolved) * 1000:9.1f} {(done - start) * 1000:9.1f}")
+        if baseline and size <= args.baseline_max:
+            t0 = time.perf_counter()
+            old_imports = baseline._resolve_all_imports(files, known)
+            old_calls = baseline._resolve_all_calls(files, known)
+            old_ms = (time.perf_counter() - t0) * 1000
+            same = old_imports == imports and old_calls == calls
+            line += f"   {old_ms:11.1f} {old_ms / max((done - start) * 1000, 1e-6):7.1f}x  {same}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
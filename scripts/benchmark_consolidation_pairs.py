@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark near-duplicate pair search: dense similarity matrix vs tiled scan.
+
+Generates synthetic unit embeddings with a planted fraction of near
+duplicates and finds every pair above the consolidation threshold two ways:
+
+  dense  the previous approach: sklearn cosine_similarity over all rows,
+         then a Python double loop over the n x n matrix
+  tiled  cairn.core.consolidation.similar_pairs: float32 block matmuls
+         over the upper triangle, thresholded per tile
+
+Reports wall time, peak traced memory (numpy allocations are tracked by
+tracemalloc) and the pair count, which must match. The dense path is
+skipped above --dense-max rows since its matrix alone is 8 * n^2 bytes.
+
+Usage:
+    python scripts/benchmark_consolidation_pairs.py
+    python scripts/benchmark_consolidation_pairs.py --sizes 2000,10000,30000 --dims 1024
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cairn.core.consolidation import SIMILARITY_THRESHOLD, similar_pairs  # noqa: E402
+
+
+def make_embeddings(n: int, dims: int, dup_fraction: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n, dims)).astype(np.float32)
+    dups = int(n * dup_fraction)
+    sources = rng.integers(0, n - dups, size=dups)
+    vectors[n - dups:] = vectors[sources] + rng.standard_normal((dups, dims)).astype(np.float32) * 0.1
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def dense_pairs(vectors: np.ndarray, threshold: float) -> int:
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    sim = cosine_similarity(vectors.astype(np.float64))
+    count = 0
+    for i in range(len(vectors)):
+        for j in range(i + 1, len(vectors)):
+            if sim[i][j] >= threshold:
+                count += 1
+    return count
+
+
+def tiled_pairs(vectors: np.ndarray, threshold: float, block_size: int) -> int:
+    return sum(1 for _ in similar_pairs(vectors, threshold, block_size=block_size))
+
+
+def measure(fn) -> tuple[int, float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,5000,20000", help="comma-separated row counts")
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--dup-fraction", type=float, default=0.05, help="fraction of rows that are near duplicates")
+    parser.add_argument("--block-size", type=int, default=1024)
+    parser.add_argument("--dense-max", type=int, default=5000, help="skip the dense path above this many rows")
+    args = parser.parse_args()
+
+    print(f"dims={args.dims} threshold={SIMILARITY_THRESHOLD} block={args.block_size} dups={args.dup_fraction:.0%}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        vectors = make_embeddings(n, args.dims, args.dup_fraction)
+        pairs, seconds, peak = measure(lambda: tiled_pairs(vectors, SIMILARITY_THRESHOLD, args.block_size))
+        print(f"  n={n:6d}  tiled {seconds:8.2f} s  peak {peak:8.1f} MB  pairs {pairs}")
+        if n <= args.dense_max:
+            dense, seconds, peak = measure(lambda: dense_pairs(vectors, SIMILARITY_THRESHOLD))
+            match = "ok" if dense == pairs else "MISMATCH"
+            print(f"  {'':8s}  dense {seconds:8.2f} s  peak {peak:8.1f} MB  pairs {dense} ({match})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Benchmark event dispatch: publish -> handler start latency and throughput.
+
+Runs one or more EventDispatchers against the configured database (CAIRN_DB_*
+env vars, as for the server). Each dispatcher gets its own connection pool,
+like separate replicas would. A publisher emits events at a fixed rate; the
+handler records how long each event took from publish to handler start and
+counts runs per event, so double execution across dispatchers shows up.
+
+Modes:
+    notify  NOTIFY wakeup + SKIP LOCKED claiming (current dispatcher)
+    poll    the same claiming with the LISTEN thread disabled, i.e. waking
+            only every POLL_INTERVAL like the old dispatcher
+
+Usage:
+    python scripts/benchmark_event_dispatch.py
+    python scripts/benchmark_event_dispatch.py --events 1000 --rate 200 --dispatchers 3
+    python scripts/benchmark_event_dispatch.py --mode notify --handler-ms 20
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cairn.config import load_config  # noqa: E402
+from cairn.core.event_bus import EventBus  # noqa: E402
+from cairn.core.event_dispatcher import EventDispatcher  # noqa: E402
+from cairn.storage.database import Database  # noqa: E402
+
+EVENT_TYPE = "bench.dispatch"
+HANDLER = "bench_dispatch_handler"
+
+
+class PollingDispatcher(EventDispatcher):
+    """Dispatcher without the NOTIFY listener: wakes on the poll timer only."""
+
+    def _listen(self) -> None:
+        return
+
+
+class Recorder:
+    def __init__(self, handler_ms: float):
+        self.handler_ms = handler_ms
+        self.latencies: list[float] = []
+        self.runs: Counter[int] = Counter()
+        self._lock = threading.Lock()
+
+    def handle(self, event: dict) -> None:
+        started = time.time()
+        with self._lock:
+            self.latencies.append((started - event["payload"]["published_at"]) * 1000)
+            self.runs[event["event_id"]] += 1
+        if self.handler_ms:
+            time.sleep(self.handler_ms / 1000)
+
+
+def _pct(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+def run(mode: str, args, db_config) -> None:
+    recorder = Recorder(args.handler_ms)
+    cls = EventDispatcher if mode == "notify" else PollingDispatcher
+
+    databases: list[Database] = []
+    dispatchers: list[EventDispatcher] = []
+    for _ in range(args.dispatchers):
+        db = Database(db_config)
+        db.connect()
+        bus = EventBus(db, None)
+        bus.subscribe(EVENT_TYPE, HANDLER, recorder.handle)
+        dispatcher = cls(db, bus)
+        dispatcher.start()
+        databases.append(db)
+        dispatchers.append(dispatcher)
+
+    publisher_db = Database(db_config)
+    publisher_db.connect()
+    publisher = EventBus(publisher_db, None)
+    publisher.subscribe(EVENT_TYPE, HANDLER, recorder.handle)
+    time.sleep(0.5)  # let listeners connect
+
+    interval = 1.0 / args.rate if args.rate > 0 else 0.0
+    start = time.perf_counter()
+    for i in range(args.events):
+        publisher.emit(EVENT_TYPE, session_name="bench", payload={"i": i, "published_at": time.time()})
+        if interval:
+            time.sleep(max(0.0, start + (i + 1) * interval - time.perf_counter()))
+
+    deadline = time.monotonic() + args.timeout
+    while len(recorder.runs) < args.events and time.monotonic() < deadline:
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - start
+
+    for dispatcher in dispatchers:
+        dispatcher.stop()
+    publisher_db.execute("DELETE FROM events WHERE event_type = %s", (EVENT_TYPE,))
+    publisher_db.commit()
+    for db in databases + [publisher_db]:
+        db.close()
+
+    lat = recorder.latencies
+    handled = len(recorder.runs)
+    doubled = sum(1 for n in recorder.runs.values() if n > 1)
+    per_worker = [d.health()["claimed"] for d in dispatchers]
+    print(f"  {mode:6s} handled {handled}/{args.events} in {elapsed:6.2f}s "
+          f"({handled / max(elapsed, 1e-6):7.1f} ev/s)   double-runs {doubled}")
+    if lat:
+        print(f"         latency ms  p50 {_pct(lat, 50):7.1f}   p95 {_pct(lat, 95):7.1f}   "
+              f"p99 {_pct(lat, 99):7.1f}   mean {statistics.fmean(lat):7.1f}")
+    print(f"         claims per dispatcher {per_worker}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=100.0, help="events/second; 0 = as fast as possible")
+    parser.add_argument("--dispatchers", type=int, default=2)
+    parser.add_argument("--handler-ms", type=float, default=0.0, help="simulated handler work")
+    parser.add_argument("--mode", choices=["notify", "poll", "both"], default="both")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds to wait for the drain")
+    args = parser.parse_args()
+
+    db_config = load_config().db
+    setup = Database(db_config)
+    setup.connect()
+    setup.run_migrations()
+    setup.close()
+
+    print(f"{args.events} events @ {args.rate or 'max'}/s, {args.dispatchers} dispatchers, "
+          f"handler {args.handler_ms} ms")
+    for mode in (["notify", "poll"] if args.mode == "both" else [args.mode]):
+        run(mode, args, db_config)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Benchmark per-request overhead: urllib.urlopen vs the pooled HTTP client.
+
+Starts a local stub server that answers POSTs with a small JSON body (like
+an embedding or short completion) and times the same requests two ways:
+
+  urlopen  a new urllib request per call, as the backends used to do
+  pooled   cairn.core.http_client: keep-alive connections reused per host
+
+--tls serves HTTPS with a throwaway self-signed certificate, so every new
+connection pays a real TLS handshake. --handshake-ms adds a delay whenever
+the server accepts a new connection, standing in for the extra round trips
+to a gateway in another region. The stub answers instantly, so the
+numbers are pure client and connection overhead.
+
+Usage:
+    python scripts/benchmark_http_client.py
+    python scripts/benchmark_http_client.py --tls --handshake-ms 40 --threads 8
+"""
+
+import argparse
+import datetime
+import http.server
+import ipaddress
+import json
+import os
+import ssl
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+RESPONSE = json.dumps({"data": [{"embedding": [0.0] * 384, "index": 0}]}).encode()
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # as real servers do; else delayed ACKs stall keep-alive
+    handshake_s = 0.0
+
+    def setup(self):
+        # Runs once per accepted connection, not per request
+        time.sleep(StubHandler.handshake_s)
+        super().setup()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, *args):
+        pass
+
+
+def self_signed_cert(directory: str) -> tuple[str, str]:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    Path(cert_path).write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    Path(key_path).write_bytes(key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption(),
+    ))
+    return cert_path, key_path
+
+
+def start_server(tls_files: tuple[str, str] | None) -> tuple[http.server.ThreadingHTTPServer, str]:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    scheme = "http"
+    if tls_files:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(*tls_files)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"{scheme}://127.0.0.1:{server.server_address[1]}"
+
+
+def run(call, requests: int, threads: int) -> list[float]:
+    def timed(_):
+        start = time.perf_counter()
+        call()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(timed, range(requests)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--tls", action="store_true", help="serve HTTPS with a self-signed certificate")
+    parser.add_argument("--handshake-ms", type=float, default=0.0,
+                        help="server-side delay per new connection (simulated network round trips)")
+    parser.add_argument("--pool-size", type=int, default=10)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    tls_files = self_signed_cert(tmp.name) if args.tls else None
+    if tls_files:
+        # Both clients build their TLS context from the default verify paths
+        os.environ["SSL_CERT_FILE"] = tls_files[0]
+    StubHandler.handshake_s = args.handshake_ms / 1000
+    server, base = start_server(tls_files)
+
+    from cairn.core.http_client import HTTPClient
+
+    url = f"{base}/v1/embeddings"
+    body = json.dumps({"model": "stub", "input": "hello world"}).encode()
+    headers = {"Content-Type": "application/json"}
+    pooled = HTTPClient(base, pool_size=args.pool_size)
+
+    def via_urlopen():
+        req = urllib.request.Request(url, data=body, headers=headers)
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            resp.read()
+
+    def via_pool():
+        pooled.post(url, body, headers, timeout=30)
+
+    print(f"{args.requests} requests, {args.threads} thread(s), {base.split(':')[0].upper()}, "
+          f"handshake delay {args.handshake_ms:g} ms\n")
+    print(f"  {'client':8s} {'total s':>8s} {'req/s':>8s} {'mean ms':>8s} {'p50 ms':>8s} {'p99 ms':>8s}")
+    for name, call in (("urlopen", via_urlopen), ("pooled", via_pool)):
+        call()  # warm up: imports, first pooled connection
+        start = time.perf_counter()
+        latencies = sorted(run(call, args.requests, args.threads))
+        total = time.perf_counter() - start
+        print(f"  {name:8s} {total:8.2f} {args.requests / total:8.0f} "
+              f"{sum(latencies) / len(latencies) * 1000:8.2f} "
+              f"{latencies[len(latencies) // 2] * 1000:8.2f} "
+              f"{latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000:8.2f}")
+
+    health = pooled.health()
+    print(f"\npooled: {health['connections_opened']} connections opened, "
+          f"{health['connections_reused']} reuses")
+    pooled.close()
+    server.shutdown()
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark document ingest: chunk-then-store_many vs the streaming pipeline.
+
+Builds a synthetic markdown document (--pages, about 3 KB each) and stores
+its chunks into the configured database (CAIRN_DB_* env vars) two ways:
+
+  store_many  chunk the whole document, then store_many(): embed, INSERT,
+              commit, one batch after another (what ingest used to do)
+  pipeline    IngestPipeline.ingest(): chunking and per-chunk dedup, then
+              embedding and INSERTs on --workers threads each, overlapping
+              over bounded queues
+
+The embedding backend is simulated with a fixed cost per call plus a cost
+per text, standing in for a remote model. A third run re-ingests the
+document with one section edited, to show per-chunk dedup.
+
+Usage:
+    python scripts/benchmark_ingest.py
+    python scripts/benchmark_ingest.py --pages 300 --workers 4 --embed-call-ms 40
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cairn.config import load_config  # noqa: E402
+from cairn.core.ingest import IngestPipeline  # noqa: E402
+from cairn.core.memory import MemoryStore  # noqa: E402
+from cairn.core.projects import ProjectManager  # noqa: E402
+from cairn.storage.database import Database  # noqa: E402
+
+from benchmark_store_many import SimulatedEmbedding  # noqa: E402
+
+PROJECT = "bench-ingest"
+WORDS = ("deploy service port config cache index query shard replica lease token "
+         "schema migration rollback queue worker retry budget latency").split()
+
+
+def document(pages: int, run: str) -> str:
+    rng = random.Random(7)
+    sections = []
+    for page in range(pages):
+        for part in range(3):
+            body = " ".join(rng.choice(WORDS) for _ in range(150))
+            sections.append(f"## [{run}] Page {page}.{part}\n\n{body}")
+    return "\n\n".join(sections)
+
+
+def cleanup(db: Database) -> None:
+    project = "(SELECT id FROM projects WHERE name = %s)"
+    db.execute(f"DELETE FROM ingestion_log WHERE project_id = {project}", (PROJECT,))
+    db.execute(f"DELETE FROM memories WHERE project_id = {project}", (PROJECT,))
+    db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--embed-call-ms", type=float, default=20.0, help="simulated latency per embedding call")
+    parser.add_argument("--embed-text-ms", type=float, default=0.5, help="simulated latency per embedded text")
+    args = parser.parse_args()
+
+    config = replace(load_config(), ingest_workers=args.workers, ingest_batch_size=args.batch_size)
+    db = Database(config.db)
+    db.connect()
+    db.run_migrations()
+    cleanup(db)
+
+    chunker = None
+    try:
+        chunker = IngestPipeline(db, None, None, None, config).chunker
+    except ValueError:
+        # The markdown recipe is fetched from the Hugging Face hub on first use
+        from chonkie import RecursiveChunker
+        print("(markdown recipe unavailable offline; using default recursive rules)")
+        chunker = RecursiveChunker(chunk_size=config.ingest_chunk_size)
+
+    def pipeline_for(embedding) -> IngestPipeline:
+        pipeline = IngestPipeline(db, ProjectManager(db), MemoryStore(db, embedding), None, config)
+        pipeline._chunker = chunker
+        return pipeline
+
+    print(f"{args.pages} pages, batches of {args.batch_size}, {args.workers} embed + insert workers, "
+          f"embedding {args.embed_call_ms} ms/call + {args.embed_text_ms} ms/text\n")
+    try:
+        for label in ("store_many", "pipeline", "re-ingest"):
+            embedding = SimulatedEmbedding(config.embedding.dimensions, args.embed_call_ms, args.embed_text_ms)
+            pipeline = pipeline_for(embedding)
+            doc = document(args.pages, "store_many" if label == "store_many" else "pipeline")
+            if label == "re-ingest":
+                doc = doc.replace("Page 1.1\n", "Page 1.1 (revised)\n")
+            start = time.perf_counter()
+            if label == "store_many":
+                chunks = list(pipeline._iter_chunks(doc))
+                pipeline.memory_store.store_many(
+                    [{"content": text, "project": PROJECT} for text in chunks], enrich=False,
+                )
+                chunk_count, stored = len(chunks), len(chunks)
+            else:
+                result = pipeline.ingest(content=doc, project=PROJECT, hint="memory")
+                chunk_count, stored = result["chunk_count"], len(result["memory_ids"])
+            elapsed = time.perf_counter() - start
+            print(f"  {label:10s} {elapsed:7.2f} s  {chunk_count / elapsed:8.1f} chunks/s  "
+                  f"{stored:5d} stored of {chunk_count}  {embedding.calls:4d} embedding calls")
+    finally:
+        cleanup(db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
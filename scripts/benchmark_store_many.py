@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark bulk memory ingest: store() in a loop vs store_many().
+
+Stores the same synthetic memories twice against the configured database
+(CAIRN_DB_* env vars, as for the server) and prints memories/second for
+each path. The embedding backend is simulated — a fixed cost per call plus
+a cost per text — so the numbers show what batching saves in model round
+trips, INSERTs, commits and event writes, independent of the model.
+
+Both paths store with an event bus whose memory.* handler is registered,
+so each memory.created event also gets its dispatch row, as on the server.
+Enrichment itself is not run: store() is called with enrich=False and
+store_many() defers it to the dispatcher, which this benchmark does not
+start.
+
+Usage:
+    python scripts/benchmark_store_many.py
+    python scripts/benchmark_store_many.py --memories 5000 --embed-call-ms 20 --embed-text-ms 0.5
+"""
+
+import argparse
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cairn.config import load_config  # noqa: E402
+from cairn.core.event_bus import EventBus  # noqa: E402
+from cairn.core.memory import MemoryStore  # noqa: E402
+from cairn.embedding.interface import EmbeddingInterface  # noqa: E402
+from cairn.storage.database import Database  # noqa: E402
+
+PROJECT = "bench-store-many"
+
+
+class SimulatedEmbedding(EmbeddingInterface):
+    """Deterministic vectors with a simulated per-call and per-text latency."""
+
+    def __init__(self, dimensions: int, call_ms: float, text_ms: float):
+        self._dimensions = dimensions
+        self.call_ms = call_ms
+        self.text_ms = text_ms
+        self.calls = 0
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    def _vector(self, text: str) -> list[float]:
+        seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+        v = np.random.default_rng(seed).standard_normal(self._dimensions)
+        return (v / np.linalg.norm(v)).tolist()
+
+    def embed(self, text: str) -> list[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        time.sleep((self.call_ms + self.text_ms * len(texts)) / 1000)
+        return [self._vector(t) for t in texts]
+
+
+def memories(n: int, run: str) -> list[dict]:
+    return [
+        {
+            "content": f"[{run}] memory {i}: the deploy of service {i % 37} moved to port {8000 + i % 100}",
+            "project": PROJECT,
+            "tags": ["bench", f"svc-{i % 37}"],
+            "session_name": "bench",
+        }
+        for i in range(n)
+    ]
+
+
+def cleanup(db: Database) -> None:
+    db.execute("DELETE FROM memories WHERE project_id = (SELECT id FROM projects WHERE name = %s)", (PROJECT,))
+    db.execute("DELETE FROM events WHERE project_id = (SELECT id FROM projects WHERE name = %s)", (PROJECT,))
+    db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", type=int, default=1000)
+    parser.add_argument("--embed-call-ms", type=float, default=10.0, help="simulated latency per embedding call")
+    parser.add_argument("--embed-text-ms", type=float, default=0.2, help="simulated latency per embedded text")
+    args = parser.parse_args()
+
+    config = load_config()
+    db = Database(config.db)
+    db.connect()
+    db.run_migrations()
+    bus = EventBus(db, None)
+    bus.subscribe("memory.*", "memory_enrichment", lambda event: None)
+    cleanup(db)
+
+    print(f"{args.memories} memories, embedding {args.embed_call_ms} ms/call + {args.embed_text_ms} ms/text")
+    try:
+        for label in ("store", "store_many"):
+            embedding = SimulatedEmbedding(config.embedding.dimensions, args.embed_call_ms, args.embed_text_ms)
+            store = MemoryStore(db, embedding, event_bus=bus)
+            items = memories(args.memories, label)
+            start = time.perf_counter()
+            if label == "store":
+                for item in items:
+                    store.store(**item, enrich=False)
+            else:
+                store.store_many(items, enrich=False)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:11s} {elapsed:8.2f} s  {args.memories / elapsed:9.1f} memories/s  "
+                  f"{embedding.calls:6d} embedding calls")
+    finally:
+        cleanup(db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark vector serialization: decimal text vs the binary pgvector adapter.
+
+Without --dsn, times client-side encode/decode only (what each row costs the
+Python process): str(list) + float() parsing against the binary dumper/loader.
+
+With --dsn, also round-trips the vectors through a temporary table and times
+SELECT embedding::text + parse against a binary cursor loading float32 arrays.
+
+Usage:
+    python scripts/benchmark_vector_io.py
+    python scripts/benchmark_vector_io.py --rows 20000 --dims 1024
+    python scripts/benchmark_vector_io.py --dsn postgresql://cairn:pw@localhost/cairn
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cairn.storage.vector import (  # noqa: E402
+    VectorBinaryDumper,
+    VectorBinaryLoader,
+    register_vector,
+    stack_vectors,
+)
+
+
+def parse_text(text: str) -> list[float]:
+    """How vectors were read before the adapter: split '[0.1,0.2,...]' and float() each."""
+    return [float(x) for x in text.strip("[]").split(",")]
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def client_side(vectors: list[list[float]]) -> None:
+    arrays = [np.asarray(v, dtype=np.float32) for v in vectors]
+    dumper = VectorBinaryDumper(np.ndarray)
+    loader = VectorBinaryLoader(0)
+
+    texts: list[str] = []
+    blobs: list[bytes] = []
+    text_dump = _timed(lambda: texts.extend(str(v) for v in vectors))
+    binary_dump = _timed(lambda: blobs.extend(dumper.dump(a) for a in arrays))
+    text_load = _timed(lambda: np.array([parse_text(t) for t in texts]))
+    binary_load = _timed(lambda: np.vstack([loader.load(b) for b in blobs]))
+
+    print(f"  encode  text {text_dump:9.1f} ms   binary {binary_dump:8.1f} ms   "
+          f"x{text_dump / max(binary_dump, 1e-6):.0f}")
+    print(f"  decode  text {text_load:9.1f} ms   binary {binary_load:8.1f} ms   "
+          f"x{text_load / max(binary_load, 1e-6):.0f}")
+    print(f"  payload text {sum(map(len, texts)) / 1e6:7.1f} MB   "
+          f"binary {sum(map(len, blobs)) / 1e6:6.1f} MB")
+
+
+def round_trip(dsn: str, vectors: list[list[float]], dims: int) -> None:
+    import psycopg
+    from psycopg.rows import dict_row
+
+    with psycopg.connect(dsn, row_factory=dict_row) as conn:
+        if not register_vector(conn):
+            print("  pgvector extension not installed — skipping round trip")
+            return
+        conn.execute(f"CREATE TEMP TABLE bench_vectors (id int, embedding vector({dims}))")
+
+        def insert_text():
+            with conn.cursor() as cur:
+                cur.executemany(
+                    "INSERT INTO bench_vectors VALUES (%s, %s::vector)",
+                    [(i, str(v)) for i, v in enumerate(vectors)],
+                )
+
+        def insert_binary():
+            with conn.cursor() as cur:
+                cur.executemany(
+                    "INSERT INTO bench_vectors VALUES (%s, %s)",
+                    [(i, np.asarray(v, dtype=np.float32)) for i, v in enumerate(vectors)],
+                )
+
+        text_insert = _timed(insert_text)
+        conn.execute("TRUNCATE bench_vectors")
+        binary_insert = _timed(insert_binary)
+
+        def select_text():
+            rows = conn.execute("SELECT id, embedding::text AS e FROM bench_vectors").fetchall()
+            return np.array([parse_text(r["e"]) for r in rows])
+
+        def select_binary():
+            with conn.cursor(binary=True) as cur:
+                rows = cur.execute("SELECT id, embedding FROM bench_vectors").fetchall()
+            return stack_vectors([r["embedding"] for r in rows])
+
+        text_select = _timed(select_text)
+        binary_select = _timed(select_binary)
+        conn.rollback()
+
+    print(f"  INSERT  text {text_insert:9.1f} ms   binary {binary_insert:8.1f} ms   "
+          f"x{text_insert / max(binary_insert, 1e-6):.1f}")
+    print(f"  SELECT  text {text_select:9.1f} ms   binary {binary_select:8.1f} ms   "
+          f"x{text_select / max(binary_select, 1e-6):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vector serialization")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--dims", type=int, default=1024)
+    parser.add_argument("--dsn", default="", help="Also round-trip through this database")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((args.rows, args.dims)).astype(np.float32).tolist()
+
+    print(f"rows={args.rows:,} dims={args.dims}")
+    print("client side:")
+    client_side(vectors)
+    if args.dsn:
+        print("database round trip:")
+        round_trip(args.dsn, vectors, args.dims)
+
+
+if __name__ == "__main__":
+    main()
@@ -214,12 +214,14 @@ def compute_pagerank(dsn: str) -> int:
         pr = ActivationEngine.compute_pagerank(nodes, edges)
 
         # Write PageRank scores
-        with conn.cursor() as cur:
-            for nid, score in pr.items():
-                cur.execute(
-                    "UPDATE memories SET pagerank = %s WHERE id = %s",
-                    (score, nid),
-                )
+        conn.execute(
+            """
+            UPDATE memories m SET pagerank = u.score
+            FROM unnest(%s::int[], %s::float8[]) AS u(id, score)
+            WHERE m.id = u.id
+            """,
+            (list(pr), list(pr.values())),
+        )
         conn.commit()
 
         nonzero = sum(1 for v in pr.values() if v > 1e-6)
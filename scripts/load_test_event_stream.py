@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Load test EventStreamHub: many concurrent SSE streams, one LISTEN connection.
+
+Opens --streams subscriptions on a hub (each drained by its own task, the way
+/api/events/stream consumes them), sends --events NOTIFYs on cairn_events
+from a separate connection, and reports:
+
+  - backends LISTENing from this process (pg_stat_activity), which should
+    stay at 1 whatever --streams is
+  - notify -> delivery latency across all streams (p50/p99/max)
+  - events delivered vs expected, and streams shed for falling behind
+
+Only NOTIFYs are sent; no rows are written, so any database works.
+
+Usage:
+    python scripts/load_test_event_stream.py
+    python scripts/load_test_event_stream.py --streams 1000 --events 200 --rate 100
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import psycopg  # noqa: E402
+
+from cairn.config import load_config  # noqa: E402
+from cairn.core.event_stream import EventStreamHub  # noqa: E402
+from cairn.storage.database import Database  # noqa: E402
+
+APP_NAME = "cairn-stream-load-test"
+
+
+async def drain(sub, latencies: list[float], expected: int) -> int:
+    received = 0
+    while received < expected:
+        try:
+            item = await sub.get(10.0)
+        except TimeoutError:
+            break
+        if item is None:
+            break
+        latencies.append(time.perf_counter() - item[0]["payload"]["sent"])
+        received += 1
+    return received
+
+
+async def listeners(conn) -> int:
+    cur = await conn.execute(
+        "SELECT COUNT(*) FROM pg_stat_activity WHERE application_name = %s AND query ILIKE 'LISTEN%%'",
+        (APP_NAME,),
+    )
+    return (await cur.fetchone())[0]
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--streams", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=50, help="NOTIFYs per second")
+    args = parser.parse_args()
+
+    db = Database(load_config().db)
+    dsn = db.config.dsn
+    hub = EventStreamHub(db)
+
+    async def connect():
+        return await psycopg.AsyncConnection.connect(dsn, autocommit=True, application_name=APP_NAME)
+
+    hub._connect = connect
+
+    latencies: list[float] = []
+    subs = [hub.subscribe(patterns=["load_test.*"]) for _ in range(args.streams)]
+    tasks = [asyncio.create_task(drain(sub, latencies, args.events)) for sub in subs]
+    deadline = time.monotonic() + 10
+    while not hub.health()["listening"]:
+        if time.monotonic() > deadline:
+            sys.exit(f"hub could not LISTEN on {db.config.host}:{db.config.port}/{db.config.name}")
+        await asyncio.sleep(0.05)
+
+    async with await psycopg.AsyncConnection.connect(dsn, autocommit=True) as sender:
+        print(f"{args.streams} streams open, {await listeners(sender)} LISTEN connection(s)")
+        start = time.perf_counter()
+        for i in range(args.events):
+            payload = {"event_id": i, "event_type": "load_test.tick", "payload": {"sent": time.perf_counter()}}
+            await sender.execute("SELECT pg_notify('cairn_events', %s)", (json.dumps(payload),))
+            await asyncio.sleep(1 / args.rate)
+        received = await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+        during = await listeners(sender)
+
+    for sub in subs:
+        sub.close()
+    health = hub.health()
+    expected = args.streams * args.events
+    print(f"sent {args.events} events in {elapsed:.1f} s; {during} LISTEN connection(s) at the end")
+    print(f"delivered {sum(received)}/{expected} ({sum(received) / elapsed:,.0f} deliveries/s), "
+          f"{health['shed']} streams shed")
+    if latencies:
+        print(f"latency ms  p50 {percentile(latencies, 0.5):.2f}  p99 {percentile(latencies, 0.99):.2f}  "
+              f"max {max(latencies) * 1000:.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
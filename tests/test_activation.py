@@ -4,11 +4,22 @@ Tests the algorithm logic without a real database — uses a mock graph.
 """
 
 import math
+import random
+
+import numpy as np
+
 from cairn.core.activation import (
     ActivationEngine,
     _sigmoid,
+    _sigmoid_array,
+    _top_k_indices,
+    BETA,
+    DELTA,
     GAMMA,
+    ITERATIONS,
+    SPREAD,
     THETA,
+    TOP_K_INHIBIT,
     MIN_ACTIVATION,
 )
 
@@ -178,6 +189,40 @@ def test_pagerank_sink_node():
     assert pr[1] > 0  # Source should also have rank (from random jump)
 
 
+def test_pagerank_converges_to_fixed_point():
+    """With a tolerance the iteration stops at the stationary distribution."""
+    nodes = {1, 2, 3}
+    edges = {1: [(2, 1.0), (3, 1.0)], 2: [(3, 1.0)], 3: [(1, 1.0)]}
+
+    pr = ActivationEngine.compute_pagerank(nodes, edges, tol=1e-12, iterations=1000)
+
+    # Fixed point: pr = (1-d)/n + d * M·pr
+    d, n = 0.85, 3
+    assert abs(pr[1] - ((1 - d) / n + d * pr[3])) < 1e-7
+    assert abs(pr[2] - ((1 - d) / n + d * pr[1] / 2)) < 1e-7
+    assert abs(pr[3] - ((1 - d) / n + d * (pr[1] / 2 + pr[2]))) < 1e-7
+
+
+def test_pagerank_warm_start_matches_cold():
+    """Warm-starting from stored scores lands on the same result."""
+    rnd = random.Random(3)
+    nodes = set(range(1, 60))
+    edges = {}
+    for _ in range(200):
+        edges.setdefault(rnd.randint(1, 59), []).append((rnd.randint(1, 59), 1.0))
+
+    cold = ActivationEngine.compute_pagerank(nodes, edges)
+    warm = ActivationEngine.compute_pagerank(nodes, edges, initial=cold)
+
+    assert max(abs(cold[n] - warm[n]) for n in nodes) < 1e-6
+
+
+def test_pagerank_ignores_edges_outside_node_set():
+    """Edges whose source isn't a node are skipped instead of raising."""
+    pr = ActivationEngine.compute_pagerank({1, 2}, {1: [(2, 1.0)], 99: [(1, 1.0)]})
+    assert set(pr) == {1, 2}
+
+
 def test_cache_invalidation():
     """Cache should be clearable."""
     engine = ActivationEngine(FakeDB([], []))
@@ -186,3 +231,70 @@ def test_cache_invalidation():
 
     engine.invalidate_cache()
     assert len(engine._graph_cache) == 0
+
+
+def test_sigmoid_array_matches_scalar():
+    """Vectorized sigmoid should match the scalar one, clamping included."""
+    xs = [-100.0, -1.0, 0.0, THETA, 0.7, 3.0, 100.0]
+    assert _sigmoid_array(np.array(xs)).tolist() == [_sigmoid(x) for x in xs]
+
+
+def test_top_k_ties_prefer_lowest_index():
+    """Top-K should break ties like a stable descending sort."""
+    values = np.array([0.1, 0.5, 0.5, 0.9, 0.5, 0.0])
+    assert sorted(_top_k_indices(values, 3).tolist()) == [1, 2, 3]
+    assert sorted(_top_k_indices(values, 10).tolist()) == [0, 1, 2, 3, 4, 5]
+
+
+def _reference_activate(nodes, edges, anchor_scores):
+    """The original per-node loop, as a parity oracle."""
+    fan_out = {src: len(targets) for src, targets in edges.items()}
+    activation = {nid: anchor_scores.get(nid, 0.0) for nid in nodes}
+    for _ in range(ITERATIONS):
+        new_activation = {}
+        for nid in nodes:
+            propagated = 0.0
+            for src, targets in edges.items():
+                for tgt, weight in targets:
+                    if tgt == nid:
+                        propagated += SPREAD * weight * activation[src] / fan_out[src]
+            new_activation[nid] = (1 - DELTA) * activation[nid] + propagated
+        ranked = sorted(new_activation.items(), key=lambda x: x[1], reverse=True)
+        winners = {nid for nid, _ in ranked[:TOP_K_INHIBIT]}
+        for nid in new_activation:
+            if nid not in winners and new_activation[nid] > 0:
+                new_activation[nid] *= (1 - BETA)
+        activation = {nid: _sigmoid(v) for nid, v in new_activation.items()}
+    return {nid: round(v, 6) for nid, v in activation.items() if v > MIN_ACTIVATION}
+
+
+def test_activate_matches_reference_loop():
+    """Sparse propagation should reproduce the per-node loop exactly."""
+    rnd = random.Random(7)
+    node_ids = list(range(1, 121))
+    edge_rows = [
+        {"source_id": rnd.choice(node_ids), "target_id": rnd.choice(node_ids),
+         "weight": round(rnd.uniform(0.2, 1.0), 2)}
+        for _ in range(400)
+    ]
+    engine = ActivationEngine(FakeDB([{"id": n} for n in node_ids], edge_rows))
+    anchors = {3: 1.0, 40: 0.5, 77: 0.25}
+
+    result = engine.activate(list(anchors), anchors)
+
+    edges = {}
+    for r in edge_rows:
+        edges.setdefault(r["source_id"], []).append((r["target_id"], r["weight"]))
+    assert result == _reference_activate(set(node_ids), edges, anchors)
+
+
+def test_adjacency_cached_with_graph():
+    """The CSR matrix is built once per cached graph."""
+    nodes = [{"id": 1}, {"id": 2}]
+    edges = [{"source_id": 1, "target_id": 2, "weight": 1.0}]
+    engine = ActivationEngine(FakeDB(nodes, edges))
+
+    engine.activate([1], {1: 1.0})
+    csr = engine._graph_cache[None]["csr"]
+    engine.activate([1], {1: 1.0})
+    assert engine._graph_cache[None]["csr"] is csr
@@ -1,11 +1,13 @@
 """Tests for cairn.core.analytics — UsageEvent, UsageTracker, track_operation, RollupWorker, query engine."""
 
+import json
 import time
 from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock, patch
 
 from cairn.core.analytics import (
     AnalyticsQueryEngine,
+    LatencySketch,
     UsageEvent,
     UsageTracker,
     RollupWorker,
@@ -63,23 +65,68 @@ class TestUsageTracker:
         tracker.track(UsageEvent(operation="c"))  # should drop silently
         assert tracker._queue.qsize() == 2
 
-    def test_flush_batch_inserts(self):
+    def test_track_drops_are_counted(self):
+        tracker = UsageTracker(MagicMock())
+        tracker._queue = __import__("queue").Queue(maxsize=1)
+        tracker.track(UsageEvent(operation="a"))
+        tracker.track(UsageEvent(operation="b"))
+        health = tracker.health()
+        assert health["tracked"] == 1
+        assert health["dropped"] == 1
+        assert health["queue_depth"] == 1
+
+    def test_flush_batch_copies_on_own_connection(self):
         db = MagicMock()
-        db.execute = MagicMock()
-        db.commit = MagicMock()
         tracker = UsageTracker(db)
-        tracker.track(UsageEvent(operation="store"))
+        tracker.track(UsageEvent(operation="store", metadata={"k": 1}))
         tracker.track(UsageEvent(operation="search"))
-        tracker._flush_batch()
-        assert db.execute.call_count == 2
-        db.commit.assert_called_once()
+        with patch("cairn.core.analytics.psycopg.connect") as connect:
+            tracker._flush_batch()
+
+        conn = connect.return_value
+        cur = conn.cursor.return_value.__enter__.return_value
+        statement = cur.copy.call_args.args[0]
+        assert statement.startswith("COPY usage_events (timestamp, operation")
+        copy = cur.copy.return_value.__enter__.return_value
+        rows = [c.args[0] for c in copy.write_row.call_args_list]
+        assert [r[1] for r in rows] == ["store", "search"]
+        assert rows[0][10] == '{"k": 1}' and rows[1][10] == "{}"
+        conn.commit.assert_called_once()
+        # The request pool is not touched
+        db.execute.assert_not_called()
+        db.commit.assert_not_called()
+        assert tracker.health()["written"] == 2
+
+    def test_batch_size_adapts_to_backlog(self):
+        tracker = UsageTracker(MagicMock())
+        for _ in range(tracker.MIN_BATCH * 3):
+            tracker.track(UsageEvent(operation="store"))
+        with patch("cairn.core.analytics.psycopg.connect"):
+            assert tracker._flush_batch() is True
+            assert tracker._batch_size == tracker.MIN_BATCH * 2
+            assert tracker._flush_batch() is True
+            assert tracker.health()["queue_depth"] == 0
+            grown = tracker._batch_size
+            tracker.track(UsageEvent(operation="store"))
+            assert tracker._flush_batch() is False
+        assert tracker._batch_size == grown // 2
+
+    def test_failed_flush_counts_and_reconnects(self):
+        tracker = UsageTracker(MagicMock())
+        tracker.track(UsageEvent(operation="store"))
+        with patch("cairn.core.analytics.psycopg.connect") as connect:
+            connect.return_value.commit.side_effect = RuntimeError("down")
+            tracker._flush_batch()
+            connect.return_value.close.assert_called_once()
+        assert tracker._conn is None
+        assert tracker.health()["failed"] == 1
 
     def test_flush_batch_empty_noop(self):
         db = MagicMock()
         tracker = UsageTracker(db)
-        tracker._flush_batch()
-        db.execute.assert_not_called()
-        db.commit.assert_not_called()
+        with patch("cairn.core.analytics.psycopg.connect") as connect:
+            assert tracker._flush_batch() is False
+        connect.assert_not_called()
 
 
 class TestTrackOperation:
@@ -179,23 +226,115 @@ class TestTrackOperation:
         assert event.session_name == "sess-1"
 
 
-class TestRollupWorkerPercentile:
-    def test_percentile_single(self):
-        assert RollupWorker._percentile([10.0], 50) == 10.0
+class TestLatencySketch:
+    def _values(self, n=5000, seed=1):
+        import random
+        rng = random.Random(seed)
+        return [rng.lognormvariate(3, 1.5) for _ in range(n)]
+
+    def _sketch(self, values):
+        sketch = LatencySketch()
+        for v in values:
+            sketch.add(v)
+        return sketch
+
+    def test_quantiles_within_relative_accuracy(self):
+        values = self._values()
+        sketch = self._sketch(values)
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            assert abs(sketch.quantile(q) - exact) <= exact * LatencySketch.RELATIVE_ACCURACY * 1.01
+
+    def test_merge_equals_single_sketch(self):
+        values = self._values()
+        merged = LatencySketch()
+        for start in range(0, len(values), 700):
+            merged.merge(self._sketch(values[start:start + 700]))
+        assert merged.bins == self._sketch(values).bins
+        assert merged.count == len(values)
+
+    def test_json_round_trip(self):
+        sketch = self._sketch([0.0, 0.5, 12.0, 12.1, 3000.0])
+        restored = LatencySketch.from_json(json.loads(json.dumps(sketch.to_json())))
+        assert restored.bins == sketch.bins
+
+    def test_zero_and_empty(self):
+        assert LatencySketch().quantile(0.5) is None
+        sketch = self._sketch([0.0, 0.0])
+        assert sketch.quantile(0.5) < 0.01
+
+
+class TestRollupWorkerBatch:
+    def test_idle_batch_releases_lock_and_cleans_up(self):
+        db = MagicMock()
+        db.execute_one.side_effect = [{"last_event_id": 10}, {"max_id": None, "n": 0}]
+        worker = RollupWorker(db)
+
+        assert worker._process_batch() is False
+        db.rollback.assert_called_once()
+        assert "DELETE FROM usage_events" in db.execute.call_args.args[0]
+
+    def test_batch_upserts_then_sets_percentiles_from_merged_sketch(self):
+        db = MagicMock()
+        db.execute_one.side_effect = [{"last_event_id": 10}, {"max_id": 25, "n": 15}]
+        sketch = LatencySketch()
+        for v in (10.0, 20.0, 30.0):
+            sketch.add(v)
+        db.execute.side_effect = [[{"id": 7, "latency_sketch": sketch.to_json()}], [], [], []]
+        worker = RollupWorker(db)
+
+        assert worker._process_batch() is True
+        upsert, hourly, percentiles, watermark = db.execute.call_args_list
+        assert "ON CONFLICT" in upsert.args[0] and upsert.args[1][-2:] == (10, 25)
+        assert "INSERT INTO latency_rollups" in hourly.args[0] and hourly.args[1][-2:] == (10, 25)
+        assert percentiles.args[1][0] == 7
+        assert abs(percentiles.args[1][1] - 20.0) <= 0.2
+        assert watermark.args[1] == (25,)
+        db.commit.assert_called_once()
+
+    def test_failed_batch_rolls_back(self):
+        db = MagicMock()
+        db.execute_one.side_effect = RuntimeError("boom")
+        worker = RollupWorker(db)
+
+        try:
+            worker._process_batch()
+        except RuntimeError:
+            pass
+        db.rollback.assert_called_once()
+
 
-    def test_percentile_multiple(self):
-        vals = [1.0, 2.0, 3.0, 4.0, 5.0]
-        p50 = RollupWorker._percentile(vals, 50)
-        assert p50 == 3.0
+class TestRollupQueries:
+    def test_overview_reads_rollups_and_tail(self):
+        db = MagicMock()
+        db.execute_one.side_effect = lambda sql, params=None: (
+            {"last_event_id": 500} if "rollup_state" in sql and "SUM" not in sql else
+            {"total_ops": 10, "total_tokens": 100, "avg_latency": 12.34, "error_count": 1}
+        )
+        db.execute.return_value = []
+        engine = AnalyticsQueryEngine(db)
+        result = engine.overview(days=7)
+
+        totals_sql, totals_params = db.execute_one.call_args_list[1].args
+        assert "FROM metric_rollups" in totals_sql
+        assert "id > %s AND id > COALESCE" in totals_sql
+        assert 500 in totals_params
+        assert result["kpis"]["avg_latency"]["value"] == 12.3
+        assert result["kpis"]["error_rate"]["value"] == 10.0
+        assert result["latency"] == {"p50": None, "p95": None, "p99": None}
 
-    def test_percentile_p95(self):
-        vals = list(range(1, 101))
-        p95 = RollupWorker._percentile([float(v) for v in vals], 95)
-        assert p95 is not None
-        assert 94 <= p95 <= 96
+    def test_filters_apply_to_both_sources(self):
+        db = MagicMock()
+        db.execute.return_value = []
+        engine = AnalyticsQueryEngine(db)
+        engine.timeseries(days=1, project="p", operation="store")
 
-    def test_percentile_empty(self):
-        assert RollupWorker._percentile([], 50) is None
+        sql, params = db.execute.call_args.args
+        assert sql.count("operation = %s") == 2
+        assert list(params).count("p") == 2 and list(params).count("store") == 2
+        # Windows start on the hour
+        assert params[0].minute == 0 and params[0].second == 0
 
 
 class TestEmitUsageEvent:
@@ -240,6 +379,20 @@ class TestEmitUsageEvent:
             analytics_mod._analytics_tracker = old
 
 
+class TestTrackerHealth:
+    def test_reports_module_tracker(self):
+        tracker = MagicMock()
+        tracker.health.return_value = {"running": True, "queue_depth": 3}
+        old = analytics_mod._analytics_tracker
+        try:
+            analytics_mod._analytics_tracker = tracker
+            assert analytics_mod.tracker_health() == {"running": True, "queue_depth": 3}
+            analytics_mod._analytics_tracker = None
+            assert analytics_mod.tracker_health() is None
+        finally:
+            analytics_mod._analytics_tracker = old
+
+
 class TestMemoryTypeGrowth:
     def test_returns_series_and_types(self):
         """memory_type_growth returns proper structure."""
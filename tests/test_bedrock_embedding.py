@@ -101,7 +101,7 @@ def test_embed_batch_returns_correct_count(mock_boto3):
 # ── Retry logic ──────────────────────────────────────────────
 
 
-@patch("cairn.embedding.bedrock.time.sleep")  # don't actually sleep in tests
+@patch("cairn.embedding.parallel.time.sleep")  # don't actually sleep in tests
 @patch("cairn.embedding.bedrock.boto3")
 def test_retry_on_throttling(mock_boto3, mock_sleep):
     """Should retry on ThrottlingException and succeed on second attempt."""
@@ -119,19 +119,16 @@ def test_retry_on_throttling(mock_boto3, mock_sleep):
 
     assert len(result) == dims
     assert mock_client.invoke_model.call_count == 2
-    mock_sleep.assert_called_once_with(1)  # 2^0 = 1
+    mock_sleep.assert_called_once()
+    assert engine.health()["throttles"] == 1
 
 
-@patch("cairn.embedding.bedrock.time.sleep")
+@patch("cairn.embedding.parallel.time.sleep")
 @patch("cairn.embedding.bedrock.boto3")
 def test_retry_exhausted_raises(mock_boto3, mock_sleep):
-    """Should raise after 3 failed attempts on transient errors."""
+    """Should raise once the runner's attempts on transient errors run out."""
     mock_client = MagicMock()
-    mock_client.invoke_model.side_effect = [
-        _make_client_error("ServiceUnavailableException"),
-        _make_client_error("ServiceUnavailableException"),
-        _make_client_error("ServiceUnavailableException"),
-    ]
+    mock_client.invoke_model.side_effect = _make_client_error("ServiceUnavailableException")
     mock_boto3.client.return_value = mock_client
 
     cfg = EmbeddingConfig(backend="bedrock", dimensions=1024)
@@ -140,7 +137,7 @@ def test_retry_exhausted_raises(mock_boto3, mock_sleep):
     with pytest.raises(ClientError):
         engine.embed("test")
 
-    assert mock_client.invoke_model.call_count == 3
+    assert mock_client.invoke_model.call_count == engine._runner.max_attempts
 
 
 @patch("cairn.embedding.bedrock.boto3")
@@ -186,3 +183,45 @@ def test_bedrock_satisfies_interface(mock_boto3):
     cfg = EmbeddingConfig(backend="bedrock", dimensions=1024)
     engine = BedrockEmbedding(cfg)
     assert isinstance(engine, EmbeddingInterface)
+
+
+# ── Concurrent embed_batch ───────────────────────────────────
+
+
+@patch("cairn.embedding.parallel.time.sleep")
+@patch("cairn.embedding.bedrock.boto3")
+def test_embed_batch_concurrent_ordered_with_throttling(mock_boto3, mock_sleep):
+    """embed_batch fans out, retries throttled texts, and keeps input order."""
+    mock_client = MagicMock()
+    throttled = set()
+
+    def invoke_model(**kwargs):
+        text = json.loads(kwargs["body"])["inputText"]
+        if text.endswith("3") and text not in throttled:
+            throttled.add(text)
+            raise _make_client_error("ThrottlingException")
+        return _make_invoke_response([float(text.split("-")[1])] * 4)
+
+    mock_client.invoke_model.side_effect = invoke_model
+    mock_boto3.client.return_value = mock_client
+
+    cfg = EmbeddingConfig(backend="bedrock", dimensions=4, bedrock_concurrency=4)
+    engine = BedrockEmbedding(cfg)
+    texts = [f"text-{i}" for i in range(20)]
+    results = engine.embed_batch(texts)
+
+    assert [vec[0] for vec in results] == [float(i) for i in range(20)]
+    assert throttled == {"text-3", "text-13"}
+    assert mock_client.invoke_model.call_count == 22
+    assert engine.health()["throttles"] == 2
+
+
+@patch("cairn.embedding.bedrock.boto3")
+def test_embed_batch_non_retryable_error_raises(mock_boto3):
+    mock_client = MagicMock()
+    mock_client.invoke_model.side_effect = _make_client_error("ValidationException")
+    mock_boto3.client.return_value = mock_client
+
+    engine = BedrockEmbedding(EmbeddingConfig(backend="bedrock", dimensions=4))
+    with pytest.raises(ClientError):
+        engine.embed_batch(["a", "b", "c"])
@@ -14,6 +14,7 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
 from sklearn.metrics.pairwise import cosine_distances
 
 from cairn.config import ClusteringConfig
@@ -143,6 +144,33 @@ def test_centroid_computation():
         assert dist < 0.05, f"Point {i} too far from centroid: {dist}"
 
 
+def test_centroid_distances_match_sklearn():
+    """Vectorized member-to-centroid distances match per-row cosine_distances."""
+    from cairn.core.clustering import centroid_distances
+
+    rng = np.random.RandomState(7)
+    embeddings = rng.randn(30, 16).astype(np.float32)
+    labels = np.array([0] * 10 + [1] * 12 + [-1] * 3 + [2] * 5)
+
+    centroids, distances = centroid_distances(embeddings, labels)
+
+    assert centroids.shape == (3, 16)
+    for label in range(3):
+        members = embeddings[labels == label].astype(np.float64)
+        np.testing.assert_allclose(centroids[label], members.mean(axis=0), atol=1e-6)
+        expected = cosine_distances(members, centroids[label].reshape(1, -1))[:, 0]
+        np.testing.assert_allclose(distances[labels == label], expected, atol=1e-6)
+    assert (distances[labels == -1] == 0).all()
+
+
+def test_centroid_distances_all_noise():
+    from cairn.core.clustering import centroid_distances
+
+    centroids, distances = centroid_distances(np.ones((4, 3)), np.array([-1] * 4))
+    assert centroids.shape == (0, 3)
+    assert distances.tolist() == [0.0] * 4
+
+
 # ============================================================
 # Confidence Scoring (HDBSCAN probabilities)
 # ============================================================
@@ -355,6 +383,208 @@ def test_llm_success_produces_real_labels():
     assert error is None
 
 
+# ============================================================
+# Bulk Write
+# ============================================================
+
+def test_write_clusters_copies_in_one_transaction():
+    """Clusters and members are COPYed with pre-reserved ids, then committed once."""
+    db = MagicMock()
+    db.execute.side_effect = [[], [{"id": 41}, {"id": 42}], []]
+    engine = ClusterEngine(db, MagicMock())
+    cluster_data = [
+        {"label_id": 0, "centroid": [0.1, 0.2], "member_ids": [1, 2],
+         "distances": [0.01, 0.02], "avg_distance": 0.015, "confidence": 0.9},
+        {"label_id": 1, "centroid": [0.3, 0.4], "member_ids": [3],
+         "distances": [0.03], "avg_distance": 0.03, "confidence": 0.8},
+    ]
+    summaries = {0: {"label": "A", "summary": "first"}}
+    seen = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    engine._write_clusters(7, cluster_data, summaries, [(4, seen)])
+
+    delete_sql = db.execute.call_args_list[0][0][0]
+    assert "DELETE FROM clusters" in delete_sql
+    assert "nextval" in db.execute.call_args_list[1][0][0]
+    assert db.execute.call_args_list[2][0] == (
+        "DELETE FROM cluster_placements WHERE COALESCE(project_id, 0) = %s", (7,),
+    )
+    (cl_table, cl_cols, cl_rows), (m_table, _, m_rows), (p_table, _, p_rows) = (
+        c.args for c in db.copy_rows.call_args_list
+    )
+    assert p_table == "cluster_placements"
+    assert p_rows == [(7, 4, "full", seen)]
+    assert cl_table == "clusters" and cl_cols[0] == "id"
+    assert [(r[0], r[1], r[2]) for r in cl_rows] == [(41, 7, "A"), (42, 7, "Unlabeled")]
+    assert cl_rows[0][4].dtype == np.float32
+    assert m_table == "cluster_members"
+    assert list(m_rows) == [(41, 1, 0.01), (41, 2, 0.02), (42, 3, 0.03)]
+    db.commit.assert_called_once()
+    db.execute_one.assert_not_called()
+
+
+def test_write_clusters_rolls_back_on_failure():
+    db = MagicMock()
+    db.execute.side_effect = [[], [{"id": 1}]]
+    db.copy_rows.side_effect = RuntimeError("copy failed")
+    engine = ClusterEngine(db, MagicMock())
+    cluster_data = [{"label_id": 0, "centroid": [0.1], "member_ids": [1],
+                     "distances": [0.0], "avg_distance": 0.0, "confidence": 1.0}]
+
+    with pytest.raises(RuntimeError):
+        engine._write_clusters(None, cluster_data, {})
+    db.rollback.assert_called_once()
+    db.commit.assert_not_called()
+
+
+# ============================================================
+# Incremental Assignment
+# ============================================================
+
+def _recent_run(mode, max_memory_id, drift=None):
+    return {"mode": mode, "memory_count": 10, "max_memory_id": max_memory_id,
+            "drift": drift, "created_at": datetime.now(timezone.utc) - timedelta(hours=1)}
+
+
+def test_assign_to_centroids_threshold():
+    from cairn.core.clustering import assign_to_centroids
+
+    centroids = np.array([[1.0, 0.0], [0.0, 1.0]])
+    vectors = np.array([[0.9, 0.1], [0.1, 0.9], [-1.0, -1.0]])
+
+    assigned, distances = assign_to_centroids(vectors, centroids, max_distance=0.2)
+
+    assert assigned.tolist() == [0, 1, -1]
+    assert distances[0] < 0.02 and distances[2] > 1.0
+
+
+def test_refresh_runs_full_without_prior_full_run():
+    engine = ClusterEngine(MagicMock(), MagicMock())
+    engine._last_run = MagicMock(return_value=None)
+    engine.run_clustering = MagicMock(return_value={"cluster_count": 2})
+    engine.run_incremental = MagicMock()
+
+    assert engine.refresh()["mode"] == "full"
+    engine.run_incremental.assert_not_called()
+
+
+def test_refresh_prefers_incremental_after_recent_full_run():
+    engine = ClusterEngine(MagicMock(), MagicMock())
+    engine._last_run = MagicMock(return_value=_recent_run("full", 10))
+    engine.run_clustering = MagicMock()
+    engine.run_incremental = MagicMock(return_value={"mode": "incremental"})
+
+    assert engine.refresh()["mode"] == "incremental"
+    engine.run_clustering.assert_not_called()
+
+
+def test_refresh_full_when_incremental_disabled():
+    engine = ClusterEngine(MagicMock(), MagicMock(), config=ClusteringConfig(incremental=False))
+    engine._last_run = MagicMock(return_value=_recent_run("full", 10))
+    engine.run_clustering = MagicMock(return_value={})
+
+    assert engine.refresh()["mode"] == "full"
+
+
+def _memory(mid, vector):
+    return {"id": mid, "embedding": np.array(vector, dtype=np.float32),
+            "updated_at": datetime(2026, 1, 1, tzinfo=timezone.utc)}
+
+
+def test_run_incremental_assigns_and_updates_in_place():
+    db = MagicMock()
+    new_rows = [_memory(11, [1.0, 0.05]), _memory(12, [-1.0, -1.0])]
+    clusters = [{"id": 5, "centroid": np.array([1.0, 0.0], dtype=np.float32),
+                 "member_count": 4, "avg_distance": 0.01}]
+    db.execute.side_effect = [new_rows, clusters, [], [], []]
+    db.execute_one.side_effect = [{"count": 12}, {"noise": 1, "assigned": 1}]
+    engine = ClusterEngine(db, MagicMock())
+    engine._last_run = MagicMock(return_value=_recent_run("full", 10))
+    engine.run_clustering = MagicMock()
+
+    result = engine.run_incremental()
+
+    assert result["mode"] == "incremental"
+    assert result["assigned_count"] == 1
+    assert result["noise_count"] == 1
+    engine.run_clustering.assert_not_called()  # 2 memories < REFIT_MIN_SAMPLE
+
+    update_sql, (ids, vecs, counts, _avgs) = db.execute.call_args_list[2][0]
+    assert "unnest" in update_sql
+    assert ids == [5] and counts == [5]
+    np.testing.assert_allclose(vecs[0], [1.0, 0.01], atol=1e-6)
+    table, _, member_rows = db.copy_rows.call_args[0]
+    assert table == "cluster_members"
+    assert [(c, m) for c, m, _ in member_rows] == [(5, 11)]
+    placement_sql, (_, placed_ids, placed_in, _) = db.execute.call_args_list[3][0]
+    assert "INSERT INTO cluster_placements" in placement_sql
+    assert (placed_ids, placed_in) == ([11, 12], [5, None])
+    run_sql, run_params = db.execute.call_args_list[4][0]
+    assert "INSERT INTO clustering_runs" in run_sql
+    assert run_params[5:8] == ("incremental", 1, 12)
+
+
+def test_run_incremental_selects_by_membership_not_id_watermark():
+    """Late commits below the last run's max id and late embeddings are still picked up."""
+    db = MagicMock()
+    db.execute.return_value = []
+    engine = ClusterEngine(db, MagicMock())
+    engine._resolve_project_id = MagicMock(return_value=7)
+    engine._last_run = MagicMock(return_value=_recent_run("incremental", 500))
+
+    result = engine.run_incremental("proj")
+
+    assert result["assigned_count"] == 0
+    sql, params = db.execute.call_args[0]
+    assert "NOT EXISTS" in sql and "cluster_members" in sql and "cluster_placements" in sql
+    assert "m.id >" not in sql
+    assert params == (7, 7, 7)
+
+
+def test_run_incremental_escalates_on_noise():
+    db = MagicMock()
+    new_rows = [_memory(20 + i, [-1.0, -1.0]) for i in range(ClusterEngine.REFIT_MIN_SAMPLE)]
+    clusters = [{"id": 5, "centroid": np.array([1.0, 0.0], dtype=np.float32),
+                 "member_count": 4, "avg_distance": 0.01}]
+    db.execute.side_effect = [new_rows, clusters, [], []]
+    db.execute_one.side_effect = [{"count": 30}, {"noise": 10, "assigned": 0}]
+    engine = ClusterEngine(db, MagicMock())
+    engine._last_run = MagicMock(return_value=_recent_run("full", 19))
+    engine.run_clustering = MagicMock(return_value={"cluster_count": 3})
+
+    result = engine.run_incremental()
+
+    engine.run_clustering.assert_called_once()
+    assert result["refit_reason"] == "noise"
+    assert result["incremental"]["noise_ratio"] == 1.0
+
+
+def test_incremental_agreement():
+    db = MagicMock()
+    # Memories 1-4 were fitted; 5 was assigned to cluster 100, 6 became noise
+    db.execute.side_effect = [
+        [{"memory_id": 5, "cluster_id": 100}, {"memory_id": 6, "cluster_id": None}],
+        [
+            {"cluster_id": 100, "memory_id": 1}, {"cluster_id": 100, "memory_id": 2},
+            {"cluster_id": 200, "memory_id": 3}, {"cluster_id": 200, "memory_id": 4},
+            {"cluster_id": 100, "memory_id": 5},
+        ],
+    ]
+    engine = ClusterEngine(db, MagicMock())
+
+    # Refit keeps 5 with 1-2 but pulls 6 into a cluster
+    agreement = engine._incremental_agreement(None, [1, 2, 3, 4, 5, 6], np.array([0, 0, 1, 1, 0, 1]))
+    assert agreement == 0.5
+
+
+def test_incremental_agreement_none_without_placements():
+    db = MagicMock()
+    db.execute.return_value = []
+    engine = ClusterEngine(db, MagicMock())
+
+    assert engine._incremental_agreement(7, [1, 2], np.array([0, 0])) is None
+
+
 # ============================================================
 # Staleness Detection
 # ============================================================
@@ -379,6 +609,20 @@ def test_staleness_time_trigger():
     assert engine.is_stale() is True
 
 
+def test_staleness_time_uses_last_full_run():
+    """Incremental runs don't reset the full-refit clock."""
+    db = MagicMock()
+    now = datetime.now(timezone.utc)
+    db.execute_one.return_value = {
+        "memory_count": 100,
+        "created_at": now - timedelta(minutes=5),
+        "full_at": now - timedelta(hours=STALENESS_HOURS + 1),
+    }
+    engine = ClusterEngine(db, MagicMock())
+
+    assert engine.is_stale() is True
+
+
 def test_staleness_growth_trigger():
     """Memory growth exceeding STALENESS_GROWTH_RATIO triggers reclustering."""
     db = MagicMock()
@@ -410,15 +654,44 @@ def test_staleness_not_stale():
 
 
 # ============================================================
-# Vector Parsing
+# PageRank
 # ============================================================
 
-def test_parse_vector():
-    """pgvector string format should parse correctly."""
-    from cairn.core.utils import parse_vector
+def test_pagerank_single_bulk_update():
+    """PageRank is written in one unnest() UPDATE, skipping unchanged scores."""
+    db = MagicMock()
+    db.execute.side_effect = [
+        [{"id": 1, "pagerank": 0.0}, {"id": 2, "pagerank": 0.0}],  # nodes
+        [{"source_id": 1, "target_id": 2, "weight": 1.0}],        # edges
+        [],                                                       # bulk update
+    ]
+    engine = ClusterEngine(db, MagicMock())
+
+    engine._update_pagerank(project_id=7)
+
+    assert db.execute.call_count == 3
+    edge_sql, edge_params = db.execute.call_args_list[1][0]
+    assert "JOIN memories" in edge_sql and "IN (" not in edge_sql
+    assert edge_params == (7, 7)
+    update_sql, (ids, scores) = db.execute.call_args_list[2][0]
+    assert "unnest" in update_sql
+    assert sorted(ids) == [1, 2]
+    assert len(scores) == 2
+    db.commit.assert_called_once()
+
+
+def test_pagerank_no_write_when_unchanged():
+    """A warm-started run that reproduces the stored scores writes nothing."""
+    from cairn.core.activation import ActivationEngine
+
+    stored = ActivationEngine.compute_pagerank({1, 2}, {1: [(2, 1.0)]})
+    db = MagicMock()
+    db.execute.side_effect = [
+        [{"id": nid, "pagerank": score} for nid, score in stored.items()],
+        [{"source_id": 1, "target_id": 2, "weight": 1.0}],
+    ]
+    engine = ClusterEngine(db, MagicMock())
 
-    vec = parse_vector("[0.1,0.2,0.3]")
-    assert vec == [0.1, 0.2, 0.3]
+    engine._update_pagerank(project_id=None)
 
-    vec = parse_vector("[0.0]")
-    assert vec == [0.0]
+    assert db.execute.call_count == 2
@@ -3,11 +3,11 @@
 Uses mock GraphProvider since Neo4j may not be available in CI.
 """
 
-from pathlib import Path
-from unittest.mock import MagicMock, call
+import os
+from unittest.mock import MagicMock, patch
 
-from cairn.code.parser import CodeParser
 from cairn.code.indexer import CodeIndexer, IndexResult
+from cairn.code.parser import CodeParser
 from cairn.code.utils import path_to_module as _path_to_module
 
 
@@ -157,10 +157,11 @@ class TestCodeIndexer:
         )
         assert result.files_scanned == 2  # Only .py files
         assert result.files_indexed == 2
-        # Should have made one batch call with both files
-        assert graph.batch_upsert_code_graph.called
-        call_kwargs = graph.batch_upsert_code_graph.call_args.kwargs
-        assert len(call_kwargs["files"]) == 2
+        # Both files fit in one write chunk
+        assert graph.upsert_code_files.call_count == 1
+        project_id, files = graph.upsert_code_files.call_args.args
+        assert len(files) == 2
+        assert graph.link_code_edges.called
 
     def test_stale_file_cleanup(self, tmp_path):
         """Files in graph but not on disk should be deleted."""
@@ -180,9 +181,9 @@ class TestCodeIndexer:
             tmp_path, project="test", project_id=1
         )
         assert result.files_deleted == 1
-        # Stale UUID should be passed to batch_upsert
-        call_kwargs = graph.batch_upsert_code_graph.call_args.kwargs
-        assert "stale-uuid" in call_kwargs["stale_file_uuids"]
+        # Stale UUID is deleted before anything is written
+        graph.delete_code_files.assert_called_once_with(1, ["stale-uuid"])
+        assert graph.method_calls[1][0] == "delete_code_files"
 
     def test_class_method_symbols_in_batch(self, tmp_path):
         source = '''
@@ -222,3 +223,334 @@ class MyClass:
         assert result.files_scanned == 1
         assert result.files_indexed == 0
         assert not graph.batch_upsert_code_graph.called
+
+    def _stored(self, path, parsed, **overrides):
+        row = {"uuid": f"uuid-{path.name}", "path": str(path), "language": "python",
+               "content_hash": parsed.content_hash, "mtime_ns": parsed.mtime_ns, "size": parsed.size}
+        row.update(overrides)
+        return row
+
+    def test_noop_reindex_never_parses(self, tmp_path):
+        (tmp_path / "a.py").write_text("def a(): pass\n")
+        (tmp_path / "b.py").write_text("def b(): a()\n")
+        seed = CodeParser(workers=1)
+        graph = self._make_mock_graph()
+        graph.get_code_files.return_value = [
+            self._stored(p, seed.parse_file(p)) for p in (tmp_path / "a.py", tmp_path / "b.py")
+        ]
+        parser = CodeParser(workers=1)
+        parser.parse_file = MagicMock(side_effect=AssertionError("parsed an unchanged file"))
+
+        result = CodeIndexer(parser, graph).index_directory(tmp_path, project="test", project_id=1)
+
+        assert result.files_scanned == 2
+        assert result.files_skipped == 2
+        assert result.files_indexed == 0
+        assert not graph.upsert_code_files.called
+        assert not graph.link_code_edges.called
+
+    def test_stat_mismatch_falls_back_to_hash(self, tmp_path):
+        (tmp_path / "a.py").write_text("def a(): pass\n")
+        (tmp_path / "b.py").write_text("def b(): pass\n")
+        seed = CodeParser(workers=1)
+        a, b = seed.parse_file(tmp_path / "a.py"), seed.parse_file(tmp_path / "b.py")
+        graph = self._make_mock_graph()
+        graph.get_code_files.return_value = [
+            # Same content, stale stat (touched / indexed before stats were stored)
+            self._stored(tmp_path / "a.py", a, mtime_ns=None, size=None),
+            # Different content
+            self._stored(tmp_path / "b.py", b, mtime_ns=1, content_hash="old"),
+        ]
+
+        result = CodeIndexer(CodeParser(workers=1), graph).index_directory(
+            tmp_path, project="test", project_id=1,
+        )
+
+        assert result.files_skipped == 1
+        assert result.files_indexed == 1
+        files = graph.upsert_code_files.call_args.args[1]
+        assert [f["path"] for f in files] == [str(tmp_path / "b.py")]
+        assert files[0]["mtime_ns"] == (tmp_path / "b.py").stat().st_mtime_ns
+        assert files[0]["size"] == (tmp_path / "b.py").stat().st_size
+        # a.py's hash matched, so its new stat is stored for the next run
+        st = (tmp_path / "a.py").stat()
+        graph.update_code_file_stats.assert_called_once_with(
+            1, [{"path": str(tmp_path / "a.py"), "mtime_ns": st.st_mtime_ns, "size": st.st_size}],
+        )
+
+
+class _DeltaGraph:
+    """In-memory code graph applying write deltas like Neo4j does."""
+
+    def __init__(self):
+        self.files: dict[str, dict] = {}
+        self.imports: set[tuple[str, str]] = set()
+        self.calls: set[tuple[str, str, str, str]] = set()
+        self.log: list[tuple[str, list[str]]] = []  # (operation, paths)
+
+    def logged(self, operation, since=0):
+        return [p for op, paths in self.log[since:] if op == operation for p in paths]
+
+    def get_code_files(self, project_id):
+        return [dict(f) for f in self.files.values()]
+
+    def get_code_file(self, path, project_id):
+        return self.files.get(path)
+
+    def delete_code_files(self, project_id, file_uuids):
+        stale = {p for p, f in self.files.items() if f["uuid"] in file_uuids}
+        self.log.append(("delete", sorted(stale)))
+        for path in stale:
+            del self.files[path]
+        self.calls = {c for c in self.calls if c[1] not in stale and c[3] not in stale}
+        self.imports = {e for e in self.imports if e[0] not in stale and e[1] not in stale}
+
+    def upsert_code_files(self, project_id, files):
+        self.log.append(("upsert", [f["path"] for f in files]))
+        written = {f["path"] for f in files}
+        for f in files:
+            self.files[f["path"]] = {"uuid": f"uuid:{f['path']}", "path": f["path"],
+                                     "content_hash": f["content_hash"], "mtime_ns": f["mtime_ns"],
+                                     "size": f["size"], "edges_pending": True}
+        # DETACH DELETE of the rewritten files' symbols
+        self.calls = {c for c in self.calls if c[1] not in written and c[3] not in written}
+        return {f["path"]: f"uuid:{f['path']}" for f in files}
+
+    def update_code_file_stats(self, project_id, stats):
+        self.log.append(("stats", [s["path"] for s in stats]))
+        for s in stats:
+            self.files[s["path"]].update(mtime_ns=s["mtime_ns"], size=s["size"])
+
+    def link_code_edges(self, project_id, import_edges, call_edges=None, replace_edges_from=None,
+                        settled_paths=None):
+        replaced = set(replace_edges_from or [])
+        self.log.append(("replace", sorted(replaced)))
+        for path in replaced:
+            self.files[path]["edges_pending"] = True
+        self.calls = {c for c in self.calls if c[1] not in replaced}
+        self.imports = {e for e in self.imports if e[0] not in replaced}
+        self.imports |= set(import_edges)
+        self.calls |= {(c["caller_qname"], c["caller_file"], c["callee_qname"], c["callee_file"])
+                       for c in call_edges or []}
+        for path in settled_paths or []:
+            self.files[path]["edges_pending"] = False
+
+
+class TestIndexPaths:
+
+    def _project(self, tmp_path):
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        (pkg / "db.py").write_text("def connect():\n    pass\n")
+        (pkg / "api.py").write_text("from pkg.db import connect\n\ndef serve():\n    connect()\n")
+        (pkg / "cli.py").write_text("def main():\n    print('hi')\n")
+        graph = _DeltaGraph()
+        indexer = CodeIndexer(CodeParser(workers=1), graph)
+        indexer.index_directory(tmp_path, project="test", project_id=1)
+        return pkg, graph, indexer
+
+    def _assert_matches_full_index(self, tmp_path, graph):
+        fresh = _DeltaGraph()
+        CodeIndexer(CodeParser(workers=1), fresh).index_directory(tmp_path, project="test", project_id=1)
+        assert set(graph.files) == set(fresh.files)
+        assert graph.imports == fresh.imports
+        assert graph.calls == fresh.calls
+
+    def test_falls_back_to_full_index_without_state(self, tmp_path):
+        (tmp_path / "a.py").write_text("def a(): pass\n")
+        graph = _DeltaGraph()
+        indexer = CodeIndexer(CodeParser(workers=1), graph)
+
+        result = indexer.index_paths(tmp_path, [tmp_path / "a.py"], project="test", project_id=1)
+
+        assert result.files_indexed == 1
+        assert str(tmp_path / "a.py") in graph.files
+
+    def test_edit_reparses_only_changed_file_and_relinks_dependents(self, tmp_path):
+        pkg, graph, indexer = self._project(tmp_path)
+        mark = len(graph.log)
+        (pkg / "db.py").write_text("def connect():\n    pass\n\ndef close():\n    pass\n")
+
+        result = indexer.index_paths(tmp_path, [pkg / "db.py"], project="test", project_id=1)
+
+        assert result.files_indexed == 1
+        assert result.files_relinked == 1
+        assert graph.logged("upsert", mark) == [str(pkg / "db.py")]
+        assert set(graph.logged("replace", mark)) == {str(pkg / "db.py"), str(pkg / "api.py")}
+        self._assert_matches_full_index(tmp_path, graph)
+
+    def test_unchanged_save_writes_nothing(self, tmp_path):
+        pkg, graph, indexer = self._project(tmp_path)
+        mark = len(graph.log)
+
+        result = indexer.index_paths(tmp_path, [pkg / "cli.py"], project="test", project_id=1)
+
+        assert result.files_skipped == 1
+        assert len(graph.log) == mark
+
+    def test_touched_file_stores_new_stat(self, tmp_path):
+        """A save that keeps the content hashes once, then skips on stat alone."""
+        pkg, graph, indexer = self._project(tmp_path)
+        cli = pkg / "cli.py"
+        st = cli.stat()
+        os.utime(cli, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        mark = len(graph.log)
+
+        result = indexer.index_paths(tmp_path, [cli], project="test", project_id=1)
+
+        assert result.files_skipped == 1
+        assert graph.logged("stats", mark) == [str(cli)]
+        assert graph.files[str(cli)]["mtime_ns"] == cli.stat().st_mtime_ns
+        with patch("cairn.code.indexer.file_content_hash", side_effect=AssertionError("re-hashed")):
+            assert indexer.index_paths(tmp_path, [cli], project="test", project_id=1).files_skipped == 1
+            fresh = CodeIndexer(CodeParser(workers=1), graph)
+            assert fresh.index_directory(tmp_path, project="test", project_id=1).files_skipped == 4
+
+    def test_create_delete_and_move(self, tmp_path):
+        pkg, graph, indexer = self._project(tmp_path)
+        (pkg / "cache.py").write_text("def connect():\n    pass\n")
+        (pkg / "cli.py").rename(pkg / "main.py")
+        (pkg / "db.py").unlink()
+        touched = [pkg / "cache.py", pkg / "cli.py", pkg / "main.py", pkg / "db.py"]
+
+        result = indexer.index_paths(tmp_path, touched, project="test", project_id=1)
+
+        assert result.files_indexed == 2
+        assert result.files_deleted == 2
+        self._assert_matches_full_index(tmp_path, graph)
+
+    def test_failed_link_drops_state_and_next_change_reindexes(self, tmp_path):
+        pkg, graph, indexer = self._project(tmp_path)
+        (pkg / "db.py").write_text("def connect():\n    pass\n\ndef close():\n    pass\n")
+        link = indexer._link_edges
+        indexer._link_edges = MagicMock(side_effect=RuntimeError("neo4j down"))
+
+        try:
+            indexer.index_paths(tmp_path, [pkg / "db.py"], project="test", project_id=1)
+        except RuntimeError as e:
+            assert "neo4j down" in str(e)
+        else:
+            raise AssertionError("link error was swallowed")
+
+        assert 1 not in indexer._states
+        assert graph.files[str(pkg / "db.py")]["edges_pending"]
+
+        indexer._link_edges = link
+        (pkg / "cli.py").write_text("def main():\n    print('bye')\n")
+        result = indexer.index_paths(tmp_path, [pkg / "cli.py"], project="test", project_id=1)
+
+        assert result.files_relinked >= 1
+        assert not any(f["edges_pending"] for f in graph.files.values())
+        self._assert_matches_full_index(tmp_path, graph)
+
+    def test_ignored_paths_are_not_indexed(self, tmp_path):
+        pkg, graph, indexer = self._project(tmp_path)
+        (tmp_path / ".gitignore").write_text("build/\n")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "gen.py").write_text("def gen(): pass\n")
+
+        result = indexer.index_paths(tmp_path, [tmp_path / "build" / "gen.py"], project="test", project_id=1)
+
+        assert result.files_scanned == 0
+        assert str(tmp_path / "build" / "gen.py") not in graph.files
+
+
+class TestWritePipeline:
+
+    def _tree(self, tmp_path, n):
+        (tmp_path / "base.py").write_text("def helper():\n    pass\n")
+        for i in range(n):
+            (tmp_path / f"m{i}.py").write_text(f"from base import helper\n\ndef f{i}():\n    helper()\n")
+
+    def test_files_written_in_chunks_with_progress(self, tmp_path):
+        self._tree(tmp_path, 4)
+        graph = _DeltaGraph()
+        reports = []
+        indexer = CodeIndexer(CodeParser(workers=1), graph, progress=reports.append)
+        indexer.WRITE_CHUNK = 2
+        indexer.EDGE_CHUNK = 3
+
+        result = indexer.index_directory(tmp_path, project="test", project_id=1)
+
+        assert result.files_indexed == 5
+        assert [len(paths) for op, paths in graph.log if op == "upsert"] == [2, 2, 1]
+        # 4 imports, then 4 calls, in slices of 3
+        assert [op for op, _ in graph.log].count("replace") == 4
+        assert not any(f["edges_pending"] for f in graph.files.values())
+        assert [r.phase for r in reports][-1] == "done"
+        assert {r.phase for r in reports} == {"write", "link", "done"}
+        final = reports[-1].to_dict()
+        assert (final["files_total"], final["files_written"], final["edges_written"]) == (5, 5, 8)
+        assert final["symbols_written"] == 9  # 5 functions + 4 import symbols
+        assert final["files_per_sec"] > 0
+
+    def test_write_error_reaches_caller(self, tmp_path):
+        self._tree(tmp_path, 3)
+        graph = MagicMock()
+        graph.get_code_files.return_value = []
+        graph.upsert_code_files.side_effect = RuntimeError("neo4j down")
+        indexer = CodeIndexer(CodeParser(workers=1), graph)
+        indexer.WRITE_CHUNK = 1
+
+        try:
+            indexer.index_directory(tmp_path, project="test", project_id=1)
+        except RuntimeError as e:
+            assert "neo4j down" in str(e)
+        else:
+            raise AssertionError("write error was swallowed")
+        assert graph.upsert_code_files.call_count == 1
+        assert not graph.link_code_edges.called
+
+    def test_run_killed_before_linking_is_finished_after_restart(self, tmp_path):
+        self._tree(tmp_path, 3)
+        graph = _DeltaGraph()
+        crashing = CodeIndexer(CodeParser(workers=1), graph)
+        crashing._link_edges = MagicMock(side_effect=KeyboardInterrupt)
+        try:
+            crashing.index_directory(tmp_path, project="test", project_id=1)
+        except KeyboardInterrupt:
+            pass
+        assert all(f["edges_pending"] for f in graph.files.values())
+        assert not graph.imports
+
+        mark = len(graph.log)
+        result = CodeIndexer(CodeParser(workers=1), graph).index_directory(tmp_path, project="test", project_id=1)
+
+        assert result.files_indexed == 0
+        assert result.files_relinked == 4
+        assert graph.logged("upsert", mark) == []
+        assert not any(f["edges_pending"] for f in graph.files.values())
+        fresh = _DeltaGraph()
+        CodeIndexer(CodeParser(workers=1), fresh).index_directory(tmp_path, project="test", project_id=1)
+        assert graph.imports == fresh.imports
+        assert graph.calls == fresh.calls
+
+
+class TestProgressPoster:
+
+    def test_throttles_but_always_posts_final_report(self):
+        from cairn.code.indexer import IndexProgress
+        from cairn.code.worker import _ProgressPoster
+
+        poster = _ProgressPoster("http://cairn", api_key="k")
+        poster._post = MagicMock()
+        for phase in ("write", "write", "link", "done"):
+            poster(IndexProgress(project="p", project_id=1, phase=phase))
+
+        bodies = [c.args[0] for c in poster._post.call_args_list]
+        assert [b["payload"]["phase"] for b in bodies] == ["write", "done"]
+        assert bodies[0]["event_type"] == "code.index_progress"
+        assert bodies[0]["project"] == "p"
+
+    def test_failed_post_backs_off(self):
+        from cairn.code.indexer import IndexProgress
+        from cairn.code.worker import _ProgressPoster
+
+        poster = _ProgressPoster("http://cairn")
+        poster._post = MagicMock(side_effect=OSError("refused"))
+        poster(IndexProgress(project="p", project_id=1))
+        poster._next_post -= poster.INTERVAL  # An interval later, still backing off
+        poster(IndexProgress(project="p", project_id=1))
+
+        assert poster._post.call_count == 1
@@ -1,5 +1,6 @@
 """Tests for the tree-sitter code parser."""
 
+import os
 from pathlib import Path
 
 from cairn.code.parser import CodeParser, CodeSymbol, ParseResult
@@ -159,6 +160,49 @@ class TestParseDirectory:
         total_symbols = sum(len(r.symbols) for r in results)
         assert total_symbols > 500  # We know there are 1000+
 
+    def test_scan_prunes_ignored_and_excluded_dirs(self, tmp_path):
+        (tmp_path / ".gitignore").write_text("build/\n")
+        for rel in ("a.py", "build/b.py", "vendor/c.py", "pkg/d.py", "pkg/e.txt"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("x = 1\n")
+        (tmp_path / "pkg" / ".gitignore").write_text("d.py\n")
+
+        paths = CodeParser().scan_directory(tmp_path, exclude={"vendor"})
+
+        assert [p.relative_to(tmp_path).as_posix() for p in paths] == ["a.py"]
+
+    def test_parse_files_reuses_cache_until_file_changes(self, tmp_path):
+        target = tmp_path / "a.py"
+        target.write_text("def a(): pass\n")
+        parser = CodeParser(workers=1)
+
+        first = parser.parse_files([target])[0]
+        assert parser.parse_files([target])[0] is first
+
+        target.write_text("def a(): pass\ndef b(): pass\n")
+        os.utime(target, ns=(first.mtime_ns, first.mtime_ns + 1_000_000))
+        second = parser.parse_files([target])[0]
+        assert second is not first
+        assert {s.name for s in second.symbols} == {"a", "b"}
+
+        parser.forget([str(target)])
+        assert parser.parse_files([target])[0] is not second
+
+    def test_parse_files_in_process_pool(self, tmp_path):
+        paths = []
+        for i in range(6):
+            paths.append(tmp_path / f"m{i}.py")
+            paths[-1].write_text(f"def f{i}(): pass\n")
+        (tmp_path / "notes.txt").write_text("skip me\n")
+        parser = CodeParser(workers=2)
+        parser.PARALLEL_MIN_FILES = 4
+
+        results = parser.parse_files(paths + [tmp_path / "notes.txt"])
+
+        assert [r.file_path for r in results] == [str(p) for p in paths]
+        assert [r.symbols[0].name for r in results] == [f"f{i}" for i in range(6)]
+        assert all(r.mtime_ns and r.size for r in results)
+
 
 class TestDecorators:
 
@@ -0,0 +1,122 @@
+"""Tests for the module-resolution index used by the code indexer."""
+
+import random
+
+from cairn.code.indexer import _resolve_all_calls, _resolve_all_imports
+from cairn.code.parser import CallInfo, CodeSymbol, ParseResult
+from cairn.code.resolution import ModuleIndex, ModuleTrie
+
+
+def _linear_nearest(modules: dict[str, str], imported: str) -> str | None:
+    """The scan ModuleTrie.nearest replaces."""
+    for mod, path in modules.items():
+        if imported.startswith(mod + ".") or mod.startswith(imported + "."):
+            return path
+    return None
+
+
+def _imp(text, path):
+    return CodeSymbol(name=text, qualified_name=text, kind="import", file_path=path, start_line=1, end_line=1)
+
+
+def _fn(name, path):
+    return CodeSymbol(name=name, qualified_name=name, kind="function", file_path=path, start_line=1, end_line=2)
+
+
+def _file(path, language="python", imports=(), symbols=(), calls=()):
+    return ParseResult(
+        file_path=path, language=language, content_hash="",
+        imports=[_imp(t, path) for t in imports],
+        symbols=[_fn(n, path) for n in symbols],
+        calls=[CallInfo(caller_qualified_name="main", callee_name=c, callee_full_name=c, line=1, file_path=path)
+               for c in calls],
+    )
+
+
+class TestModuleTrie:
+
+    def test_nearest_matches_linear_scan(self):
+        rng = random.Random(7)
+        parts = ["a", "b", "c", "core", "x"]
+        modules: dict[str, str] = {}
+        trie = ModuleTrie()
+        for i in range(300):
+            mod = ".".join(rng.choice(parts) for _ in range(rng.randint(1, 4)))
+            modules[mod] = f"/p/{i}.py"
+            trie.insert(mod, f"/p/{i}.py")
+
+        for _ in range(500):
+            imported = ".".join(rng.choice(parts + ["zz"]) for _ in range(rng.randint(1, 5)))
+            assert trie.get(imported) == modules.get(imported)
+            assert trie.nearest(imported) == _linear_nearest(modules, imported)
+
+    def test_reinsert_keeps_position_updates_path(self):
+        trie = ModuleTrie()
+        trie.insert("pkg.a", "/old.py")
+        trie.insert("pkg.b", "/b.py")
+        trie.insert("pkg.a", "/new.py")
+
+        assert trie.nearest("pkg") == "/new.py"
+        assert len(trie) == 2
+
+
+class TestModuleIndex:
+
+    def test_python_exact_symbol_and_package_imports(self):
+        files = [
+            _file("/r/app/__init__.py"),
+            _file("/r/app/db.py"),
+            _file("/r/app/api.py", imports=["from app.db import connect", "import app.db.Session",
+                                            "import os", "from typing import Any"]),
+            _file("/r/svc.py", imports=["import app"]),
+        ]
+        known = {f.file_path for f in files}
+        index = ModuleIndex(files, known)
+
+        assert index.root_prefix == "/r/"
+        # "app.db.Session" falls back to the first-seen enclosing module
+        assert index.imports_of(files[2]) == ["/r/app/db.py", "/r/app/__init__.py"]
+        assert index.imports_of(files[3]) == ["/r/app/__init__.py"]
+
+    def test_go_package_suffix_skips_own_directory(self):
+        files = [
+            _file("/r/svc/auth/a.go", "golang", imports=['"fmt"', '"store"']),
+            _file("/r/svc/auth/b.go", "golang", imports=['x "auth"']),
+            _file("/r/svc/store/s.go", "golang"),
+            _file("/r/svc/store/t.go", "golang"),
+        ]
+        index = ModuleIndex(files, {f.file_path for f in files})
+
+        assert index.root_prefix == "/r/svc/"
+        assert index.imports_of(files[0]) == ["/r/svc/store/s.go"]
+        assert index.imports_of(files[1]) == []
+
+    def test_only_relative_imports_disambiguate_calls(self):
+        files = [
+            _file("/r/a.py", symbols=["run"]),
+            _file("/r/b.py", symbols=["run"]),
+            _file("/r/main.py", imports=["from b import run"], calls=["run"]),
+            _file("/r/web/x.ts", "typescript", symbols=["run"]),
+            _file("/r/web/y.ts", "typescript", symbols=["run"]),
+            _file("/r/web/main.ts", "typescript", imports=["import { run } from './y'"], calls=["run"]),
+        ]
+        known = {f.file_path for f in files}
+        index = ModuleIndex(files, known)
+
+        assert index.call_imports(files[2]) == set()
+        assert index.call_imports(files[5]) == {"/r/web/y.ts"}
+        edges = {e["caller_file"]: e["callee_file"] for e in _resolve_all_calls(files, known, index=index)}
+        assert edges["/r/main.py"] == "/r/a.py"  # First candidate, as before the index
+        assert edges["/r/web/main.ts"] == "/r/web/y.ts"
+
+    def test_sources_subset_uses_whole_tree_tables(self):
+        files = [
+            _file("/r/a.py", symbols=["helper"]),
+            _file("/r/b.py", imports=["from a import helper"], calls=["helper"]),
+            _file("/r/c.py", imports=["import a"]),
+        ]
+        known = {f.file_path for f in files}
+
+        assert _resolve_all_imports(files, known, sources=[files[1]]) == [("/r/b.py", "/r/a.py")]
+        calls = _resolve_all_calls(files, known, sources=[files[1]])
+        assert [(c["caller_file"], c["callee_file"]) for c in calls] == [("/r/b.py", "/r/a.py")]
@@ -0,0 +1,123 @@
+"""Tests for the code watcher's burst accumulation and reindex metrics."""
+
+import logging
+from pathlib import Path
+from queue import Queue
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from cairn.code.indexer import IndexResult
+from cairn.code.watcher import (
+    CodeWatcher,
+    ReindexMetrics,
+    _IndexRequest,
+    _ProjectEventHandler,
+)
+
+
+def _event(src, dest=None, is_directory=False):
+    return SimpleNamespace(src_path=src, dest_path=dest, is_directory=is_directory)
+
+
+def _handler(tmp_path):
+    queue: Queue = Queue()
+    handler = _ProjectEventHandler("proj", 1, tmp_path, queue, frozenset({".py"}))
+    return handler, queue
+
+
+class TestProjectEventHandler:
+
+    def test_burst_accumulates_touched_paths(self, tmp_path):
+        handler, queue = _handler(tmp_path)
+        handler.on_modified(_event(f"{tmp_path}/a.py"))
+        handler.on_created(_event(f"{tmp_path}/b.py"))
+        handler.on_deleted(_event(f"{tmp_path}/c.py"))
+        handler.on_moved(_event(f"{tmp_path}/d.py", f"{tmp_path}/e.py"))
+        handler.on_modified(_event(f"{tmp_path}/notes.txt"))
+        handler._timer.cancel()
+
+        handler._enqueue()
+
+        req = queue.get_nowait()
+        assert req.paths == {f"{tmp_path}/{n}.py" for n in "abcde"}
+        assert req.first_event_at <= req.enqueued_at
+
+    def test_pending_paths_reset_after_enqueue(self, tmp_path):
+        handler, queue = _handler(tmp_path)
+        handler.on_modified(_event(f"{tmp_path}/a.py"))
+        handler._timer.cancel()
+        handler._enqueue()
+        handler.on_modified(_event(f"{tmp_path}/b.py"))
+        handler._timer.cancel()
+        handler._enqueue()
+
+        queue.get_nowait()
+        assert queue.get_nowait().paths == {f"{tmp_path}/b.py"}
+
+    def test_directory_move_requests_full_rescan(self, tmp_path):
+        handler, queue = _handler(tmp_path)
+        handler.on_modified(_event(f"{tmp_path}/a.py"))
+        handler.on_moved(_event(f"{tmp_path}/pkg", f"{tmp_path}/lib", is_directory=True))
+        handler.on_modified(_event(f"{tmp_path}/b.py"))
+        handler._timer.cancel()
+
+        handler._enqueue()
+
+        assert queue.get_nowait().paths is None
+
+
+class TestWatcherProcess:
+
+    def test_routes_paths_to_index_paths_and_records_burst(self, tmp_path):
+        indexer = MagicMock()
+        indexer.index_paths.return_value = IndexResult(project="proj", project_id=1, files_indexed=1,
+                                                       files_relinked=3)
+        watcher = CodeWatcher(MagicMock(), MagicMock(), indexer=indexer)
+
+        watcher._process(_IndexRequest("proj", 1, tmp_path, {f"{tmp_path}/b.py", f"{tmp_path}/a.py"}))
+
+        kwargs = indexer.index_paths.call_args.kwargs
+        assert kwargs["paths"] == [Path(f"{tmp_path}/a.py"), Path(f"{tmp_path}/b.py")]
+        indexer.index_directory.assert_not_called()
+        stats = watcher.stats()["proj"]
+        assert stats["bursts"] == 1
+        assert stats["files_relinked"] == 3
+        assert stats["last"]["paths"] == 2
+        assert set(stats["latency_ms"]) == {"p50", "p95", "max"}
+
+    def test_each_burst_logs_rolling_stats(self, tmp_path, caplog):
+        indexer = MagicMock()
+        indexer.index_paths.return_value = IndexResult(project="proj", project_id=1, files_indexed=1)
+        watcher = CodeWatcher(MagicMock(), MagicMock(), indexer=indexer)
+
+        with caplog.at_level(logging.INFO, logger="cairn.code.watcher"):
+            watcher._process(_IndexRequest("proj", 1, tmp_path, {f"{tmp_path}/a.py"}))
+            watcher._process(_IndexRequest("proj", 1, tmp_path, {f"{tmp_path}/a.py"}))
+
+        assert "1 bursts, 0 failed" in caplog.text
+        assert "2 bursts, 0 failed" in caplog.text
+
+    def test_full_rescan_and_failure_are_counted(self, tmp_path):
+        indexer = MagicMock()
+        indexer.index_directory.side_effect = RuntimeError("neo4j down")
+        watcher = CodeWatcher(MagicMock(), MagicMock(), indexer=indexer)
+
+        watcher._process(_IndexRequest("proj", 1, tmp_path, None))
+
+        stats = watcher.stats()["proj"]
+        assert stats["full_rescans"] == 1
+        assert stats["failures"] == 1
+        assert stats["last"]["ok"] is False
+
+
+class TestReindexMetrics:
+
+    def test_percentiles_over_window(self):
+        metrics = ReindexMetrics()
+        for ms in range(1, 101):
+            metrics.record("proj", latency_ms=float(ms), reindex_ms=ms / 10, paths=1)
+
+        stats = metrics.to_dict()["proj"]
+
+        assert stats["latency_ms"] == {"p50": 51.0, "p95": 96.0, "max": 100.0}
+        assert stats["bursts"] == 100
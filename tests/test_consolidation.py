@@ -14,8 +14,7 @@ import numpy as np
 
 from cairn.config import LLMCapabilities
 from cairn.core.consolidation import ConsolidationEngine
-
-from tests.helpers import ExplodingLLM, MockLLM
+from tests.helpers import MockLLM
 
 
 def _make_memory_rows(n: int = 4) -> list[dict]:
@@ -141,3 +140,104 @@ def test_consolidation_apply():
     assert result["applied"] is True
     assert result["applied_count"] >= 1
     db.commit.assert_called()
+
+
+# ============================================================
+# Blocked pair search
+# ============================================================
+
+def _dense_pairs(vectors: np.ndarray, threshold: float) -> set[tuple[int, int]]:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    sim = unit @ unit.T
+    return {(i, j) for i in range(len(unit)) for j in range(i + 1, len(unit)) if sim[i, j] >= threshold}
+
+
+def test_similar_pairs_matches_dense_scan_across_tiles():
+    """Tiled scan finds exactly the dense upper-triangle pairs, whatever the block size."""
+    from cairn.core.consolidation import similar_pairs
+
+    rng = np.random.RandomState(7)
+    base = rng.randn(20, 16)
+    vectors = np.vstack([base, base[:10] + rng.randn(10, 16) * 0.05, rng.randn(7, 16)])
+    expected = _dense_pairs(vectors, 0.85)
+    assert expected
+
+    for block_size in (1, 5, 16, 1024):
+        found = list(similar_pairs(vectors, 0.85, block_size=block_size))
+        assert {(i, j) for i, j, _ in found} == expected
+        assert all(i < j and sim >= 0.85 for i, j, sim in found)
+
+
+def test_similar_pairs_ignores_zero_vectors():
+    from cairn.core.consolidation import similar_pairs
+
+    vectors = np.array([[0.0, 0.0], [0.0, 0.0], [1.0, 0.0]])
+    assert list(similar_pairs(vectors, 0.5)) == []
+
+
+def test_mean_pairwise_similarity_matches_upper_triangle_mean():
+    from cairn.core.consolidation import mean_pairwise_similarity
+
+    rng = np.random.RandomState(3)
+    vectors = rng.randn(9, 12)
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = float(np.mean((unit @ unit.T)[np.triu_indices(9, k=1)]))
+    assert np.isclose(mean_pairwise_similarity(vectors), expected, atol=1e-6)
+    assert mean_pairwise_similarity(vectors[:1]) == 0.0
+
+
+def test_consolidation_loads_text_for_candidates_only():
+    """Candidate summaries come from a follow-up query over the paired ids."""
+    rows = _make_memory_rows(4)
+    db = MagicMock()
+    db.execute.side_effect = [rows, rows[:2]]
+    engine = ConsolidationEngine(
+        db, MagicMock(),
+        llm=MockLLM("[]"),
+        capabilities=LLMCapabilities(consolidation=True),
+    )
+
+    # Only memories 1 and 2 keep an embedding, so the second query asks for them
+    for row in rows[2:]:
+        row["embedding"] = None
+    result = engine.consolidate("test-project")
+
+    assert [(c["id_a"], c["id_b"]) for c in result["candidates"]] == [(1, 2)]
+    assert result["candidates"][0]["summary_a"] == "Summary of memory 1."
+    assert db.execute.call_args_list[1].args[1] == ([1, 2],)
+
+
+def test_consolidation_reviews_every_pair_in_scan_order():
+    """Without a cap, every pair above threshold is reviewed, in scan order."""
+    rows = _make_memory_rows(6)
+    db = MagicMock()
+    db.execute.side_effect = [rows, rows]
+    engine = ConsolidationEngine(
+        db, MagicMock(),
+        llm=MockLLM("[]"),
+        capabilities=LLMCapabilities(consolidation=True),
+    )
+
+    result = engine.consolidate("test-project")
+
+    assert [(c["id_a"], c["id_b"]) for c in result["candidates"]] == [(1, 2), (3, 4), (5, 6)]
+
+
+def test_consolidation_cap_keeps_first_pairs_and_logs_dropped(caplog):
+    """max_candidate_pairs keeps the first pairs found and warns about the rest."""
+    rows = _make_memory_rows(6)
+    db = MagicMock()
+    db.execute.side_effect = [rows, rows]
+    engine = ConsolidationEngine(
+        db, MagicMock(),
+        llm=MockLLM("[]"),
+        capabilities=LLMCapabilities(consolidation=True),
+        max_candidate_pairs=2,
+    )
+
+    with caplog.at_level("WARNING", logger="cairn.core.consolidation"):
+        result = engine.consolidate("test-project")
+
+    assert [(c["id_a"], c["id_b"]) for c in result["candidates"]] == [(1, 2), (3, 4)]
+    assert db.execute.call_args_list[1].args[1] == ([1, 2, 3, 4],)
+    assert "1 dropped" in caplog.text
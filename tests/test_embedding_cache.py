@@ -0,0 +1,134 @@
+"""Tests for cairn.embedding.cache — content-addressed embedding cache."""
+
+from unittest.mock import patch
+
+from cairn.embedding.cache import CachedEmbedding, _PersistentTier
+from cairn.embedding.interface import EmbeddingInterface
+
+
+class CountingEmbedding(EmbeddingInterface):
+    """Deterministic backend that records every call it receives."""
+
+    def __init__(self, dims: int = 8):
+        self._dims = dims
+        self.calls: list[tuple[str, list[str]]] = []
+
+    def _vector(self, text: str) -> list[float]:
+        base = float(len(text))
+        return [base + i * 0.5 for i in range(self._dims)]
+
+    def embed(self, text: str) -> list[float]:
+        self.calls.append(("embed", [text]))
+        return self._vector(text)
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(("embed_batch", list(texts)))
+        return [self._vector(t) for t in texts]
+
+    @property
+    def dimensions(self) -> int:
+        return self._dims
+
+
+def _cached(inner=None, model="test-model", max_bytes=1 << 20, path=""):
+    inner = inner or CountingEmbedding()
+    return CachedEmbedding(inner, model, max_bytes=max_bytes, path=path), inner
+
+
+class TestCachedEmbedding:
+    def test_repeat_embed_hits_cache(self):
+        cache, inner = _cached()
+        first = cache.embed("redis connection pool")
+        second = cache.embed("redis connection pool")
+
+        assert first == second
+        assert len(inner.calls) == 1
+        stats = cache._stats.to_dict()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_single_miss_uses_embed(self):
+        cache, inner = _cached()
+        cache.embed_batch(["only one"])
+        assert inner.calls == [("embed", ["only one"])]
+
+    def test_batch_dedupes_misses_into_one_call(self):
+        cache, inner = _cached()
+        cache.embed("cached")
+        inner.calls.clear()
+
+        vectors = cache.embed_batch(["a", "bb", "a", "cached", "bb"])
+
+        assert inner.calls == [("embed_batch", ["a", "bb"])]
+        assert vectors[0] == vectors[2]
+        assert vectors[1] == vectors[4]
+        assert len(vectors) == 5
+
+    def test_lru_evicts_over_byte_budget(self):
+        # Each 8-dim float32 entry costs 32 bytes + overhead; budget fits two
+        cache, inner = _cached(max_bytes=2 * (32 + 120))
+        cache.embed("one")
+        cache.embed("two")
+        cache.embed("one")      # refresh "one"
+        cache.embed("three")    # evicts "two"
+        inner.calls.clear()
+
+        cache.embed("one")
+        assert inner.calls == []
+        cache.embed("two")
+        assert inner.calls == [("embed", ["two"])]
+        assert cache._stats.to_dict()["evictions"] >= 1
+
+    def test_model_is_part_of_key(self):
+        inner = CountingEmbedding()
+        a, _ = _cached(inner, model="model-a")
+        b, _ = _cached(inner, model="model-b")
+        assert a._key("same text") != b._key("same text")
+
+    def test_persistent_tier_survives_restart(self, tmp_path):
+        path = str(tmp_path / "embeddings.sqlite")
+        cache, inner = _cached(path=path)
+        original = cache.embed_batch(["alpha", "beta"])
+
+        restarted, inner2 = _cached(path=path)
+        assert restarted.embed_batch(["alpha", "beta"]) == original
+        assert inner2.calls == []
+        assert restarted._stats.to_dict()["persistent_hits"] == 2
+
+    def test_persistent_evictions_reach_cache_stats(self, tmp_path):
+        entry = 32 + 32  # key + 8 float32s
+        cache = CachedEmbedding(
+            CountingEmbedding(), "test-model", max_bytes=1 << 20,
+            path=str(tmp_path / "embeddings.sqlite"), persistent_max_bytes=4 * entry,
+        )
+        cache.embed_batch([f"text {i}" for i in range(6)])
+
+        stats = cache._stats.to_dict()
+        assert stats["persistent_evictions"] == cache._persistent.evictions > 0
+        assert stats["evictions"] == stats["persistent_evictions"]
+
+    def test_persistent_tier_prunes_least_recently_used(self, tmp_path):
+        entry = 32 + 32  # key + 8 float32s
+        tier = _PersistentTier(str(tmp_path / "embeddings.sqlite"), max_bytes=10 * entry)
+        keys = [bytes([i]) * 32 for i in range(14)]
+        with patch("cairn.embedding.cache.time.time", return_value=1.0):
+            tier.put_many([(k, b"v" * 32) for k in keys[:8]])
+        with patch("cairn.embedding.cache.time.time", return_value=2.0):
+            tier.get_many([keys[0]])  # touched: now newer than keys[1:8]
+        with patch("cairn.embedding.cache.time.time", return_value=3.0):
+            tier.put_many([(k, b"v" * 32) for k in keys[8:]])
+
+        remaining = tier.get_many(keys)
+        assert len(remaining) == 9 and tier.evictions == 5
+        assert keys[0] in remaining
+        assert all(k in remaining for k in keys[8:])
+
+        reopened = _PersistentTier(str(tmp_path / "embeddings.sqlite"), max_bytes=10 * entry)
+        assert reopened._entries == 9 and reopened._bytes == 9 * entry
+
+    def test_delegates_backend_attributes(self):
+        inner = CountingEmbedding()
+        inner.config = "backend-config"
+        cache, _ = _cached(inner)
+        assert cache.config == "backend-config"
+        assert cache.dimensions == 8
@@ -0,0 +1,125 @@
+"""Tests for cairn.embedding.parallel — bounded, throttle-aware fan-out."""
+
+import threading
+import time
+
+import pytest
+
+from cairn.embedding.parallel import AdaptiveLimiter, ParallelRunner, TokenBucket
+
+
+class Throttled(Exception):
+    pass
+
+
+class StubService:
+    """Simulates a single-input API with latency, a concurrency ceiling, and throttling."""
+
+    def __init__(self, latency=0.01, throttle_above=None, throttle_first=0):
+        self.latency = latency
+        self.throttle_above = throttle_above
+        self.throttle_first = throttle_first
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, item):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            over = self.throttle_above is not None and self.active > self.throttle_above
+            early = self.calls <= self.throttle_first
+            if over or early:
+                self.throttled += 1
+                self.active -= 1
+                raise Throttled()
+        time.sleep(self.latency)
+        with self._lock:
+            self.active -= 1
+        return item * 2
+
+
+def _runner(concurrency=4, rate=0.0, **kw):
+    kw.setdefault("base_delay", 0.001)
+    return ParallelRunner(
+        concurrency, rate, is_throttle=lambda e: isinstance(e, Throttled), **kw,
+    )
+
+
+class TestParallelRunner:
+    def test_results_in_input_order(self):
+        service = StubService(latency=0.002)
+        runner = _runner(concurrency=8)
+        items = list(range(50))
+        assert runner.map(service, items) == [i * 2 for i in items]
+
+    def test_concurrency_bounded(self):
+        service = StubService(latency=0.01)
+        runner = _runner(concurrency=3)
+        runner.map(service, list(range(20)))
+        assert 1 < service.peak <= 3
+
+    def test_throttling_retries_and_shrinks_limit(self):
+        service = StubService(latency=0.005, throttle_first=3)
+        runner = _runner(concurrency=8)
+
+        assert runner.map(service, list(range(12))) == [i * 2 for i in range(12)]
+        assert service.throttled == 3
+        health = runner.health()
+        assert health["throttles"] == 3
+        assert health["concurrency"] < 8
+
+    def test_non_throttle_error_propagates(self):
+        def fail_on_five(item):
+            if item == 5:
+                raise ValueError("bad input")
+            return item
+
+        runner = _runner()
+        with pytest.raises(ValueError):
+            runner.map(fail_on_five, list(range(10)))
+
+    def test_exhausted_retries_raise(self):
+        runner = _runner(max_attempts=2)
+
+        def always_throttled(item):
+            raise Throttled()
+
+        with pytest.raises(Throttled):
+            runner.map(always_throttled, [1, 2])
+
+    def test_empty_input(self):
+        assert _runner().map(lambda x: x, []) == []
+
+
+class TestAdaptiveLimiter:
+    def test_aimd(self):
+        limiter = AdaptiveLimiter(8)
+        limiter.acquire()
+        limiter.release(throttled=True)
+        assert limiter.limit == 4
+        # Throttles inside the cooldown window don't halve again
+        limiter.acquire()
+        limiter.release(throttled=True)
+        assert limiter.limit == 4
+        for _ in range(AdaptiveLimiter.INCREASE_EVERY):
+            limiter.acquire()
+            limiter.release()
+        assert limiter.limit == 5
+
+
+class TestTokenBucket:
+    def test_disabled_never_waits(self):
+        bucket = TokenBucket(0)
+        assert all(bucket.acquire() == 0.0 for _ in range(100))
+
+    def test_rate_is_enforced(self):
+        bucket = TokenBucket(200, burst=1)
+        start = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        # 1 burst token + 10 refills at 200/s >= 50ms
+        assert time.monotonic() - start >= 0.045
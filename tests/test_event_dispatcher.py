@@ -117,6 +117,7 @@ class TestEventDispatcher:
     def _make_dispatcher(self, **overrides):
         db = MagicMock()
         event_bus = MagicMock()
+        event_bus.get_timeout.return_value = None
         dispatcher = EventDispatcher(db, event_bus)
         for k, v in overrides.items():
             setattr(dispatcher, k, v)
@@ -133,11 +134,13 @@ class TestEventDispatcher:
         assert dispatcher._thread is None
         assert dispatcher._pool is None
 
-    def test_poll_no_rows_rolls_back(self):
+    def test_poll_no_rows_releases_connection(self):
         dispatcher, db, _ = self._make_dispatcher()
         db.execute.return_value = []
         dispatcher._poll()
-        db.rollback.assert_called_once()
+        # Commit, not rollback: the claim may have exhausted lapsed leases
+        db.commit.assert_called_once()
+        db.rollback.assert_not_called()
 
     def test_poll_missing_handler_marks_exhausted(self):
         dispatcher, db, event_bus = self._make_dispatcher()
@@ -154,7 +157,7 @@ class TestEventDispatcher:
 
         # Should mark exhausted, not call pool.submit
         exhausted_calls = [c for c in db.execute.call_args_list
-                          if "exhausted" in str(c)]
+                          if "exhausted" in str(c) and "SKIP LOCKED" not in str(c)]
         assert len(exhausted_calls) == 1
         dispatcher._pool.submit.assert_not_called()
 
@@ -204,7 +207,7 @@ class TestEventDispatcher:
         from concurrent.futures import ThreadPoolExecutor
         dispatcher._pool = ThreadPoolExecutor(max_workers=1)
 
-        dispatcher._execute_with_timeout(row, "slow", slow_handler, {})
+        dispatcher._run_claimed([row])
 
         dispatcher._pool.shutdown(wait=False)
 
@@ -215,6 +218,32 @@ class TestEventDispatcher:
         # Circuit breaker should have recorded failure
         assert dispatcher.circuit_breaker.stats()["slow"]["failures"] == 1
 
+    def test_handler_timeout_override_extends_deadline(self):
+        dispatcher, db, event_bus = self._make_dispatcher()
+        dispatcher.HANDLER_TIMEOUT = 0.05
+        event_bus.get_timeout.return_value = 2.0
+
+        def slowish_handler(event):
+            time.sleep(0.2)  # over the default, under the override
+
+        event_bus.get_handler.return_value = slowish_handler
+
+        row = {"id": 1, "event_id": 100, "handler": "llm",
+               "attempts": 0, "event_type": "t", "payload": {},
+               "project_id": None, "work_item_id": None,
+               "session_name": "s", "trace_id": None}
+
+        from concurrent.futures import ThreadPoolExecutor
+        dispatcher._pool = ThreadPoolExecutor(max_workers=1)
+
+        dispatcher._run_claimed([row])
+
+        dispatcher._pool.shutdown(wait=True)
+
+        event_bus.get_timeout.assert_called_with("llm")
+        assert any("'success'" in str(c) for c in db.execute.call_args_list)
+        assert dispatcher.metrics.to_dict()["llm"]["timeouts"] == 0
+
     def test_handler_exception_marks_failed(self):
         dispatcher, db, event_bus = self._make_dispatcher()
 
@@ -231,7 +260,7 @@ class TestEventDispatcher:
         from concurrent.futures import ThreadPoolExecutor
         dispatcher._pool = ThreadPoolExecutor(max_workers=1)
 
-        dispatcher._execute_with_timeout(row, "broken", broken_handler, {})
+        dispatcher._run_claimed([row])
 
         dispatcher._pool.shutdown(wait=False)
 
@@ -292,3 +321,126 @@ class TestEventDispatcher:
         # backoff = 10 * 2^3 = 80s
         call_args = db.execute.call_args[0]
         assert 80 in call_args[1]
+
+    def test_claim_uses_skip_locked_lease(self):
+        dispatcher, db, _ = self._make_dispatcher()
+        db.execute.return_value = [
+            {"id": 2, "event_id": 200, "handler": "h", "attempts": 0},
+            {"id": 1, "event_id": 100, "handler": "h", "attempts": 0},
+        ]
+        dispatcher.circuit_breaker.record_failure("h")
+
+        rows = dispatcher._claim(4)
+
+        sql, params = db.execute.call_args[0]
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "status = 'running'" in sql
+        assert params == (5, 5, [], 4, dispatcher.worker_id, dispatcher.LEASE_SECONDS)
+        assert [r["event_id"] for r in rows] == [100, 200]
+        db.commit.assert_called_once()
+        assert dispatcher.health()["claimed"] == 2
+
+    def test_claim_exhausts_expired_final_leases(self):
+        dispatcher, db, _ = self._make_dispatcher()
+        db.execute.return_value = []
+        dispatcher._claim(4)
+        sql = db.execute.call_args[0][0]
+        # A lapsed lease on the last attempt is exhausted, not left 'running'
+        assert "SET status = 'exhausted'" in sql
+        assert "attempts + 1 >= %s" in sql
+        # Both the lapsed and ready branches skip rows another dispatcher holds
+        lapsed, ready = sql.split("ready AS")
+        assert "FOR UPDATE SKIP LOCKED" in lapsed
+        assert "FOR UPDATE SKIP LOCKED" in ready
+        assert "attempts + CASE WHEN status = 'running' THEN 1 ELSE 0 END < %s" in sql
+
+    def test_collect_records_success(self):
+        dispatcher, db, _ = self._make_dispatcher()
+        from concurrent.futures import Future
+        future: Future = Future()
+        future.set_result(None)
+        row = {"id": 4, "event_id": 9, "attempts": 0}
+
+        dispatcher._collect(row, "h", future, time.monotonic(), dispatcher.HANDLER_TIMEOUT)
+
+        assert "'success'" in db.execute.call_args[0][0]
+        assert dispatcher.metrics.to_dict()["h"]["successes"] == 1
+
+    def test_claim_excludes_open_circuits(self):
+        dispatcher, db, _ = self._make_dispatcher()
+        db.execute.return_value = []
+        for _ in range(5):
+            dispatcher.circuit_breaker.record_failure("broken")
+        dispatcher._claim(4)
+        assert db.execute.call_args[0][1][2] == ["broken"]
+
+    def test_poll_claims_in_worker_sized_batches(self):
+        dispatcher, db, event_bus = self._make_dispatcher(BATCH_SIZE=10, MAX_WORKERS=4)
+        event_bus.get_handler.return_value = None
+        full = [{"id": i, "event_id": i, "handler": "h", "attempts": 0} for i in range(4)]
+        claims = [full, full, full[:2]]
+        dispatcher._claim = MagicMock(side_effect=claims)
+        dispatcher._poll()
+        assert [c.args[0] for c in dispatcher._claim.call_args_list] == [4, 4, 2]
+
+    def test_poll_stops_on_short_batch(self):
+        dispatcher, db, event_bus = self._make_dispatcher()
+        event_bus.get_handler.return_value = None
+        dispatcher._claim = MagicMock(return_value=[
+            {"id": 1, "event_id": 1, "handler": "h", "attempts": 0},
+        ])
+        dispatcher._poll()
+        dispatcher._claim.assert_called_once()
+
+    def test_circuit_open_releases_claim(self):
+        dispatcher, db, event_bus = self._make_dispatcher()
+        for _ in range(5):
+            dispatcher.circuit_breaker.record_failure("broken")
+        dispatcher._run_claimed([{"id": 7, "event_id": 1, "handler": "broken", "attempts": 2}])
+        sql, params = db.execute.call_args[0]
+        assert "'pending'" in sql and "claimed_by" in sql
+        assert params == (7, dispatcher.worker_id)
+
+    def test_status_updates_fenced_on_worker(self):
+        dispatcher, db, _ = self._make_dispatcher()
+        dispatcher._mark_success(3)
+        sql, params = db.execute.call_args[0]
+        assert "claimed_by = %s" in sql
+        assert params == (3, dispatcher.worker_id)
+
+    def test_claimed_handlers_run_concurrently(self):
+        dispatcher, db, event_bus = self._make_dispatcher(HANDLER_TIMEOUT=2.0)
+        barrier = threading.Barrier(3, timeout=1.0)
+        event_bus.get_handler.return_value = lambda event: barrier.wait()
+
+        from concurrent.futures import ThreadPoolExecutor
+        dispatcher._pool = ThreadPoolExecutor(max_workers=3)
+        rows = [
+            {"id": i, "event_id": i, "handler": "h", "attempts": 0, "event_type": "t",
+             "payload": {}, "project_id": None, "work_item_id": None,
+             "session_name": "s", "trace_id": None}
+            for i in range(3)
+        ]
+        dispatcher._run_claimed(rows)
+        dispatcher._pool.shutdown(wait=False)
+
+        # Sequential execution would break the barrier and fail every handler
+        assert dispatcher.metrics.to_dict()["h"]["successes"] == 3
+
+    def test_stop_wakes_idle_loop(self):
+        dispatcher, db, _ = self._make_dispatcher(POLL_INTERVAL=60.0)
+        db.execute.return_value = []
+        dispatcher.start()
+        time.sleep(0.05)
+        t0 = time.monotonic()
+        dispatcher.stop()
+        assert time.monotonic() - t0 < 5.0
+
+
+class TestCircuitBreakerOpenHandlers:
+    def test_open_handlers_respects_cooldown(self):
+        cb = CircuitBreaker(threshold=1, cooldown=0.05)
+        cb.record_failure("a")
+        assert cb.open_handlers() == ["a"]
+        time.sleep(0.06)
+        assert cb.open_handlers() == []
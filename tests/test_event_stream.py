@@ -0,0 +1,166 @@
+"""Tests for EventStreamHub: one LISTEN connection fanned out to SSE streams."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+from cairn.api.events import _stream_frames
+from cairn.core.event_stream import EventStreamHub, Subscription
+
+
+class FakeListenConnection:
+    """Async connection whose notifies() yields whatever is pushed to it."""
+
+    def __init__(self):
+        self.pending: asyncio.Queue = asyncio.Queue()
+        self.executed: list[str] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql):
+        self.executed.append(sql)
+
+    async def notifies(self):
+        while True:
+            yield MagicMock(payload=await self.pending.get())
+
+
+def _hub():
+    hub = EventStreamHub(MagicMock())
+    conns: list[FakeListenConnection] = []
+
+    async def connect():
+        conns.append(FakeListenConnection())
+        return conns[-1]
+
+    hub._connect = connect
+    return hub, conns
+
+
+def _event(event_type="work_item.completed", **fields):
+    return json.dumps({"event_id": 1, "event_type": event_type, "session_name": "s1",
+                       "project_id": 7, **fields})
+
+
+class TestSubscriptionFilters:
+
+    def test_patterns_and_fields_are_all_required(self):
+        hub = EventStreamHub(MagicMock())
+
+        async def check():
+            by_pattern = Subscription(hub, patterns=["work_item.*", "deliverable.created"])
+            assert by_pattern.matches({"event_type": "work_item.gated"})
+            assert by_pattern.matches({"event_type": "deliverable.created"})
+            assert not by_pattern.matches({"event_type": "deliverable.approved"})
+            assert not by_pattern.matches({})
+
+            scoped = Subscription(hub, patterns=["*"], session_name="s1", project_id=7)
+            assert scoped.matches({"event_type": "x", "session_name": "s1", "project_id": 7})
+            assert not scoped.matches({"event_type": "x", "session_name": "s2", "project_id": 7})
+            assert not scoped.matches({"event_type": "x", "session_name": "s1", "project_id": 8})
+
+        asyncio.run(check())
+
+
+class TestFanOut:
+
+    def test_one_connection_serves_many_subscribers(self):
+        async def run():
+            hub, conns = _hub()
+            subs = [hub.subscribe(patterns=["work_item.*"]) for _ in range(1000)]
+            others = [hub.subscribe(event_type="memory.created") for _ in range(10)]
+            await asyncio.sleep(0)
+            conns[0].pending.put_nowait(_event())
+
+            received = [await sub.get(1.0) for sub in subs]
+            assert len(conns) == 1
+            assert conns[0].executed == ["LISTEN cairn_events"]
+            # Decoded and serialized once, shared by every matching subscriber
+            assert all(item is received[0] for item in received)
+            data, body = received[0]
+            assert data["event_type"] == "work_item.completed"
+            assert json.loads(body) == data
+            assert all(sub.queue.empty() for sub in others)
+            assert hub.health()["delivered"] == 1000
+
+            for sub in subs + others:
+                sub.close()
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+    def test_listener_stops_with_last_subscriber_and_restarts(self):
+        async def run():
+            hub, conns = _hub()
+            sub = hub.subscribe()
+            await asyncio.sleep(0)
+            task = hub._task
+            sub.close()
+            await asyncio.sleep(0)
+            assert task.cancelled() and hub._task is None
+
+            sub = hub.subscribe()
+            await asyncio.sleep(0)
+            assert len(conns) == 2 and hub.health()["listening"]
+            sub.close()
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+    def test_bad_payloads_are_counted_and_skipped(self):
+        async def run():
+            hub, conns = _hub()
+            sub = hub.subscribe()
+            hub._dispatch("not json")
+            hub._dispatch("[1, 2]")
+            hub._dispatch(_event())
+            assert hub.health()["decode_errors"] == 2
+            assert sub.queue.qsize() == 1
+            sub.close()
+
+        asyncio.run(run())
+
+
+class TestSlowConsumers:
+
+    def test_full_queue_sheds_only_that_subscriber(self):
+        async def run():
+            hub, _ = _hub()
+            hub.QUEUE_MAX = 3
+            slow = hub.subscribe()
+            fast = hub.subscribe()
+            for i in range(4):
+                hub._dispatch(_event(event_id=i))
+                await fast.get(1.0)
+
+            assert slow.shed
+            assert await slow.get(1.0) is None
+            assert hub.health()["shed"] == 1
+            assert hub.health()["subscribers"] == 1
+
+            hub._dispatch(_event())
+            assert slow.queue.empty()
+            assert (await fast.get(1.0))[0]["event_type"] == "work_item.completed"
+            fast.close()
+
+        asyncio.run(run())
+
+    def test_shed_stream_tells_client_to_reconnect(self):
+        async def run():
+            hub, _ = _hub()
+            hub.QUEUE_MAX = 1
+            sub = hub.subscribe()
+            hub._dispatch(_event(event_id=41))
+            frames = _stream_frames(sub, with_ids=True)
+            assert (await frames.__anext__()).startswith("id: 41\nevent: event\n")
+
+            hub._dispatch(_event(event_id=42))
+            hub._dispatch(_event(event_id=43))
+            assert (await frames.__anext__()).startswith("event: error\n")
+            assert [f async for f in frames] == []
+
+        asyncio.run(run())
@@ -0,0 +1,126 @@
+"""Tests for cairn.core.event_writer — batched telemetry event persistence."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from cairn.core import stats
+from cairn.core.event_bus import EventBus
+from cairn.core.event_schema import CairnEvent
+from cairn.core.event_writer import EventWriter
+
+
+def _make_bus():
+    db = MagicMock()
+    bus = EventBus(db, MagicMock())
+    return bus, db
+
+
+# ── EventWriter ─────────────────────────────────────────────────────
+
+class TestEventWriter:
+    def test_submit_refused_when_not_running(self):
+        writer = EventWriter(MagicMock())
+        assert writer.submit(CairnEvent(event_type="llm.generate")) is False
+
+    def test_stop_drains_queue_in_batches(self):
+        bus = MagicMock()
+        writer = EventWriter(bus)
+        writer.BATCH_SIZE = 3
+        writer.FLUSH_INTERVAL = 60.0
+        writer.start()
+        for i in range(7):
+            assert writer.submit(CairnEvent(event_type="embed.embed", payload={"i": i}))
+        writer.stop()
+
+        flushed = [call.args[0] for call in bus.persist_batch.call_args_list]
+        assert sum(len(b) for b in flushed) == 7
+        assert all(len(b) <= 3 for b in flushed)
+        health = writer.health()
+        assert health["submitted"] == 7
+        assert health["written"] == 7
+        assert health["dropped"] == 0
+        bus.db.release_if_held.assert_called()
+
+    def test_full_queue_drops_and_counts(self):
+        class SmallWriter(EventWriter):
+            QUEUE_MAX = 2
+
+        writer = SmallWriter(MagicMock())
+        with patch.object(EventWriter, "running", new_callable=PropertyMock, return_value=True):
+            for _ in range(5):
+                assert writer.submit(CairnEvent(event_type="embed.embed")) is True
+        health = writer.health()
+        assert health["submitted"] == 2
+        assert health["dropped"] == 3
+
+    def test_flush_failure_counts_and_rolls_back(self):
+        bus = MagicMock()
+        bus.persist_batch.side_effect = RuntimeError("db down")
+        writer = EventWriter(bus)
+
+        writer._flush([CairnEvent(event_type="embed.embed")] * 4)
+
+        assert writer.health()["failed"] == 4
+        bus.db.rollback.assert_called_once()
+
+
+# ── EventBus integration ────────────────────────────────────────────
+
+class TestBufferedEmit:
+    def test_emit_buffered_falls_back_to_sync(self):
+        bus, db = _make_bus()
+        db.execute_one.return_value = {"id": 11}
+
+        bus.emit_buffered("llm.generate", tool_name="model", payload={"tokens_in": 5})
+
+        sql = db.execute_one.call_args[0][0]
+        assert "INSERT INTO events" in sql
+        db.commit.assert_called()
+
+    def test_emit_buffered_enqueues_when_writer_running(self):
+        bus, db = _make_bus()
+        bus.writer = MagicMock()
+        bus.writer.submit.return_value = True
+
+        bus.emit_buffered("llm.generate", tool_name="model")
+
+        event = bus.writer.submit.call_args[0][0]
+        assert event.event_type == "llm.generate"
+        assert event.tool_name == "model"
+        db.execute_one.assert_not_called()
+        db.execute.assert_not_called()
+
+    def test_usage_event_routes_through_writer(self):
+        bus, db = _make_bus()
+        bus.writer = MagicMock()
+        bus.writer.submit.return_value = True
+        stats.init_event_bus_ref(bus)
+
+        stats.emit_usage_event("embed", "titan-v2", tokens_in=10, latency_ms=3.0)
+
+        event = bus.writer.submit.call_args[0][0]
+        assert event.event_type == "embed.embed"
+        assert event.payload["tokens_in"] == 10
+        db.commit.assert_not_called()
+
+    def test_persist_batch_single_insert_with_dispatches(self):
+        bus, db = _make_bus()
+        bus.subscribe("llm.*", "llm_handler", lambda e: None)
+        db.execute.side_effect = [
+            [{"id": 1, "event_type": "llm.generate"}, {"id": 2, "event_type": "embed.embed"}],
+            [],
+        ]
+        events = [
+            CairnEvent(event_type="llm.generate", payload={"a": 1}),
+            CairnEvent(event_type="embed.embed"),
+        ]
+
+        assert bus.persist_batch(events) == [1, 2]
+
+        insert_sql, insert_params = db.execute.call_args_list[0][0]
+        assert insert_sql.count("%s::jsonb") == 2
+        assert "created_at" in insert_sql
+        assert len(insert_params) == 22
+        dispatch_sql, (ids, handlers) = db.execute.call_args_list[1][0]
+        assert "unnest" in dispatch_sql
+        assert ids == [1] and handlers == ["llm_handler"]
+        db.commit.assert_called_once()
@@ -0,0 +1,230 @@
+"""Test fused hybrid-search execution.
+
+TestExecutionMode: constructor validation of the execution_mode setting.
+TestFusedPath: the fused path issues one statement and maps its rows back
+into the shared result shape; failures fall back to the sequential path.
+TestCompareMode: compare mode returns the sequential pool and logs divergence.
+TestFusion: the shared weight selection / RRF helpers.
+"""
+
+import logging
+from unittest.mock import MagicMock
+
+from cairn.config import LLMCapabilities
+from cairn.core.constants import (
+    RRF_WEIGHTS_DEFAULT,
+    RRF_WEIGHTS_WITH_ACCESS,
+    RRF_WEIGHTS_WITH_ACCESS_ENTITIES,
+    RRF_WEIGHTS_WITH_ACTIVATION,
+    RRF_WEIGHTS_WITH_ENTITIES,
+    RRF_WEIGHTS_WITH_GRAPH,
+    TYPE_ROUTING_BOOST,
+)
+from cairn.core.search import RRF_K, SearchEngine
+
+# ============================================================
+# Helpers
+# ============================================================
+
+def _make_engine(mode="fused", capabilities=None):
+    db = MagicMock()
+    embedding = MagicMock()
+    embedding.embed.return_value = [0.1] * 384
+    caps = capabilities or LLMCapabilities()
+    return SearchEngine(db, embedding, capabilities=caps, execution_mode=mode), db
+
+
+def _fused_row(memory_id, score, *, has_entity=False, has_access=True, vector=0.01):
+    return {
+        "id": memory_id, "content": f"memory {memory_id}", "summary": None,
+        "memory_type": "note", "importance": 0.5, "tags": [], "auto_tags": [],
+        "created_at": None, "updated_at": None, "enrichment_status": "complete",
+        "salience": None, "pinned": False, "project": "p1",
+        "has_entity": has_entity, "has_access": has_access,
+        "vector_component": vector, "recency_component": None,
+        "keyword_component": None, "tag_component": None, "entity_component": None,
+        "access_component": None, "importance_component": 0.002,
+        "fused_score": score,
+    }
+
+
+# ============================================================
+# TestExecutionMode
+# ============================================================
+
+class TestExecutionMode:
+
+    def test_default_is_sequential(self):
+        engine = SearchEngine(MagicMock(), MagicMock())
+        assert engine.execution_mode == "sequential"
+
+    def test_unknown_mode_falls_back_to_sequential(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="cairn.core.search"):
+            engine, _ = _make_engine(mode="turbo")
+        assert engine.execution_mode == "sequential"
+        assert "turbo" in caplog.text
+
+
+# ============================================================
+# TestFusedPath
+# ============================================================
+
+class TestFusedPath:
+
+    def test_single_statement(self):
+        """Without activation/graph the whole ranking is one round trip."""
+        engine, db = _make_engine()
+        db.execute.return_value = [_fused_row(1, 0.02), _fused_row(2, 0.01)]
+
+        results = engine.search("redis cache", limit=5)
+
+        assert db.execute.call_count == 1
+        sql = db.execute.call_args[0][0]
+        for cte in ("vector_r", "keyword_r", "recency_r", "tag_r", "entity_r",
+                    "access_r", "importance_r", "weight_sets"):
+            assert cte in sql
+        assert [r["id"] for r in results] == [1, 2]
+        assert results[0]["score"] == 0.02
+
+    def test_no_candidates_skips_intent_classification(self):
+        """An empty candidate pool never pays for the classification LLM call."""
+        for mode in ("fused", "sequential"):
+            engine, db = _make_engine(mode=mode)
+            engine._classify_query_intent = MagicMock(return_value="temporal")
+            db.execute.return_value = []
+
+            assert engine.search("redis cache", limit=5) == []
+            engine._classify_query_intent.assert_not_called()
+
+    def test_type_boost_applied_to_statement_rows(self):
+        """Intent is classified after the statement and reorders its rows."""
+        engine, db = _make_engine()
+        engine._classify_query_intent = MagicMock(return_value="temporal")
+        progress = _fused_row(2, 0.018)
+        progress["memory_type"] = "progress"
+        db.execute.return_value = [_fused_row(1, 0.02), progress]
+
+        results = engine.search("redis cache", limit=5)
+
+        engine._classify_query_intent.assert_called_once_with("redis cache")
+        assert [r["id"] for r in results] == [2, 1]
+        assert results[0]["score"] == round(0.018 * TYPE_ROUTING_BOOST, 6)
+        assert "PARTITION BY pe.memory_type" in db.execute.call_args[0][0]
+
+    def test_components_follow_selected_weights(self):
+        engine, db = _make_engine()
+        db.execute.return_value = [_fused_row(1, 0.02, has_entity=True, has_access=True)]
+
+        results = engine.search("redis cache", limit=5)
+
+        components = results[0]["score_components"]
+        assert set(components) == set(RRF_WEIGHTS_WITH_ACCESS_ENTITIES)
+        assert components["vector"] == 0.01
+        assert components["keyword"] == 0.0
+
+    def test_access_disabled_uses_empty_cte(self):
+        engine, db = _make_engine(capabilities=LLMCapabilities(access_frequency=False))
+        db.execute.return_value = []
+
+        assert engine.search("redis cache", limit=5) == []
+        sql = db.execute.call_args[0][0]
+        assert "access_r AS (SELECT 0 AS id, 0::bigint AS rank WHERE false)" in sql
+
+    def test_failure_falls_back_to_sequential(self):
+        engine, db = _make_engine()
+        db.execute.side_effect = [RuntimeError("syntax error")] + [[]] * 20
+
+        assert engine.search("redis cache", limit=5) == []
+        # fused attempt + the sequential signal queries
+        assert db.execute.call_count > 2
+
+    def test_activation_uses_two_phase_statement(self):
+        """Activation seeds come from SQL ranks, so fusion moves to Python."""
+        engine, db = _make_engine(
+            capabilities=LLMCapabilities(spreading_activation=True),
+        )
+        engine.activation_engine = MagicMock()
+        engine.activation_engine.activate.return_value = {2: 0.9}
+        rank_row = {
+            "id": 1, "vector_rank": 1, "keyword_rank": None, "recency_rank": 1,
+            "tag_rank": None, "entity_rank": None, "access_rank": None,
+            "importance_rank": 1, "memory_type": "note", "consolidated": False,
+            "contradicted": False, "project_id": None,
+        }
+        flags_row = {"id": 2, "memory_type": "note", "consolidated": True, "contradicted": False}
+        detail_rows = [_fused_row(1, 0.0), _fused_row(2, 0.0)]
+        db.execute.side_effect = [[rank_row], [flags_row], detail_rows]
+
+        results = engine.search("redis cache", limit=5)
+
+        assert db.execute.call_count == 3
+        engine.activation_engine.activate.assert_called_once()
+        by_id = {r["id"]: r for r in results}
+        weights = RRF_WEIGHTS_DEFAULT
+        # Memory 2 only has the activation signal, which the default weights
+        # ignore, and is consolidated
+        assert by_id[2]["score"] == 0.0
+        expected = (
+            weights["vector"] / (RRF_K + 1) + weights["recency"] / (RRF_K + 1)
+            + weights["importance"] / (RRF_K + 1)
+        )
+        assert by_id[1]["score"] == round(expected, 6)
+
+
+# ============================================================
+# TestCompareMode
+# ============================================================
+
+class TestCompareMode:
+
+    def test_returns_sequential_and_logs_divergence(self, caplog):
+        engine, _ = _make_engine(mode="compare")
+        reference = ([1, 2], {}, {1: 0.2, 2: 0.1}, {})
+        fused = ([2, 1], {}, {1: 0.1, 2: 0.2}, {})
+
+        with caplog.at_level(logging.WARNING, logger="cairn.core.search"):
+            assert engine._compare_pools("q", reference, fused) is False
+        assert "diverged" in caplog.text
+
+    def test_tolerates_reordered_ties(self):
+        engine, _ = _make_engine(mode="compare")
+        reference = ([1, 2], {}, {1: 0.1, 2: 0.1}, {})
+        fused = ([2, 1], {}, {1: 0.1, 2: 0.1}, {})
+        assert engine._compare_pools("q", reference, fused) is True
+
+    def test_search_runs_both_paths(self):
+        engine, db = _make_engine(mode="compare")
+        db.execute.return_value = []
+        engine._rank_fused = MagicMock(return_value=None)
+
+        assert engine.search("redis cache", limit=5) == []
+        engine._rank_fused.assert_called_once()
+        # sequential signal queries ran too
+        assert db.execute.call_count >= 5
+
+
+# ============================================================
+# TestFusion
+# ============================================================
+
+class TestFusion:
+
+    def test_weight_selection_order(self):
+        select = SearchEngine._select_weights
+        assert select(set()) is RRF_WEIGHTS_DEFAULT
+        assert select({"access"}) is RRF_WEIGHTS_WITH_ACCESS
+        assert select({"entity"}) is RRF_WEIGHTS_WITH_ENTITIES
+        assert select({"entity", "access"}) is RRF_WEIGHTS_WITH_ACCESS_ENTITIES
+        assert select({"graph", "entity"}) is RRF_WEIGHTS_WITH_GRAPH
+        assert select({"activation", "entity", "graph"}) is RRF_WEIGHTS_WITH_ACTIVATION
+        # activation without entities does not select the activation weights
+        assert select({"activation"}) is RRF_WEIGHTS_DEFAULT
+
+    def test_fuse_ranks_ignores_unweighted_signals(self):
+        scored, components = SearchEngine._fuse_ranks(
+            RRF_WEIGHTS_DEFAULT,
+            {"vector": {1: 1}, "graph": {1: 1, 2: 1}},
+        )
+        assert scored[1] == RRF_WEIGHTS_DEFAULT["vector"] / (RRF_K + 1)
+        assert scored[2] == 0.0
+        assert set(components[2]) == set(RRF_WEIGHTS_DEFAULT)
@@ -0,0 +1,214 @@
+"""Tests for the pooled keep-alive HTTP client used by the LLM/embedding backends."""
+
+import base64
+import http.server
+import importlib.util
+import json
+import ssl
+import threading
+import urllib.error
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cairn.config import HTTPClientConfig
+from cairn.core import http_client
+from cairn.core.http_client import HTTPClient, RetryPolicy
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    # Per-test knobs
+    statuses: list[int] = []
+    drop_after_response = False
+    client_ports: list[int] = []
+    requests: list[tuple[str, dict]] = []  # (request target, headers)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        _Handler.client_ports.append(self.client_address[1])
+        _Handler.requests.append((self.path, dict(self.headers)))
+        status = _Handler.statuses.pop(0) if _Handler.statuses else 200
+
+        if self.path == "/stream":
+            payload = b"".join(f"data: {i}\n".encode() for i in range(3))
+        else:
+            payload = json.dumps({"echo": body.decode(), "path": self.path}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        # Close without announcing it, like a server reaping idle keep-alives
+        if _Handler.drop_after_response:
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    _Handler.statuses = []
+    _Handler.drop_after_response = False
+    _Handler.client_ports = []
+    _Handler.requests = []
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_sequential_requests_share_one_connection(server):
+    client = HTTPClient(server, pool_size=2)
+    for i in range(5):
+        body = client.post(f"{server}/v1/x", f"req-{i}".encode(), {})
+        assert json.loads(body) == {"echo": f"req-{i}", "path": "/v1/x"}
+
+    health = client.health()
+    assert health["connections_opened"] == 1
+    assert health["connections_reused"] == 4
+    assert len(set(_Handler.client_ports)) == 1
+    client.close()
+
+
+def test_concurrent_requests_keep_at_most_pool_size_idle(server):
+    client = HTTPClient(server, pool_size=2)
+    barrier = threading.Barrier(6)
+
+    def hold_connection():
+        with client.open("POST", f"{server}/v1/x", b"{}") as resp:
+            barrier.wait(timeout=5)
+            resp.read()
+
+    threads = [threading.Thread(target=hold_connection) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert client.health()["connections_opened"] == 6
+    assert client.health()["idle"] == 2
+    client.close()
+
+
+def test_connection_closed_by_server_is_replaced_transparently(server):
+    client = HTTPClient(server)
+    _Handler.drop_after_response = True
+    client.post(f"{server}/v1/x", b"a", {})
+    client.post(f"{server}/v1/x", b"b", {})
+
+    health = client.health()
+    assert health["stale_reconnects"] == 1
+    assert health["errors"] == 0
+    client.close()
+
+
+def test_tls_eof_on_reused_connection_is_stale(server):
+    """A TLS close without close_notify is treated like any idle-close."""
+    client = HTTPClient(server)
+    dead = MagicMock()
+    dead.request.side_effect = ssl.SSLEOFError("EOF occurred in violation of protocol")
+    client._idle.put_nowait(dead)
+
+    assert json.loads(client.post(f"{server}/v1/x", b"a", {}))["echo"] == "a"
+    dead.close.assert_called_once()
+    assert client.health()["stale_reconnects"] == 1
+    assert client.health()["errors"] == 0
+    client.close()
+
+
+def test_proxy_credentials_are_sent(server):
+    """user:pass@ in the proxy URL becomes a Proxy-Authorization header."""
+    proxy = server.replace("http://", "http://alice:s%40cret@")
+    with patch.dict("os.environ", {"http_proxy": proxy, "no_proxy": ""}):
+        client = HTTPClient("http://upstream.test")
+    client.post("http://upstream.test/v1/x", b"x", {})
+
+    target, headers = _Handler.requests[-1]
+    assert target == "http://upstream.test/v1/x"
+    assert headers["Proxy-Authorization"] == "Basic " + base64.b64encode(b"alice:s@cret").decode()
+    client.close()
+
+
+def test_https_proxy_credentials_go_on_the_tunnel():
+    with patch.dict("os.environ", {"https_proxy": "http://bob:pw@proxy.test:3128", "no_proxy": ""}):
+        client = HTTPClient("https://api.test")
+    with patch("cairn.core.http_client.http.client.HTTPSConnection") as conn_cls:
+        client._acquire(timeout=5)
+
+    assert conn_cls.call_args.args[:2] == ("proxy.test", 3128)
+    conn_cls.return_value.set_tunnel.assert_called_once_with(
+        "api.test", 443, headers={"Proxy-Authorization": "Basic " + base64.b64encode(b"bob:pw").decode()},
+    )
+
+
+def test_http_errors_keep_urllib_shape_and_release_connection(server):
+    client = HTTPClient(server)
+    _Handler.statuses = [400]
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        client.post(f"{server}/v1/x", b"bad", {})
+    assert exc.value.code == 400
+    assert json.loads(exc.value.read())["echo"] == "bad"
+
+    client.post(f"{server}/v1/x", b"ok", {})
+    assert client.health()["connections_opened"] == 1
+    client.close()
+
+
+@patch("cairn.core.http_client.time.sleep")
+def test_post_retries_transient_statuses(mock_sleep, server):
+    client = HTTPClient(server)
+    _Handler.statuses = [503, 429]
+    body = client.post(f"{server}/v1/x", b"x", {}, retry=RetryPolicy(attempts=3, backoff_offset=1))
+
+    assert json.loads(body)["echo"] == "x"
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 3]
+    assert client.health()["retries"] == 2
+
+    _Handler.statuses = [503, 503]
+    with pytest.raises(urllib.error.HTTPError):
+        client.post(f"{server}/v1/x", b"x", {}, retry=RetryPolicy(attempts=2))
+    client.close()
+
+
+def test_connection_refused_is_a_connection_error():
+    client = HTTPClient("http://127.0.0.1:9", connect_timeout=1)
+    with pytest.raises(ConnectionError):
+        client.open("POST", "http://127.0.0.1:9/v1/x", b"")
+    assert client.health()["errors"] == 1
+
+
+def test_streamed_lines_then_connection_is_reused(server):
+    client = HTTPClient(server)
+    with client.open("POST", f"{server}/stream", b"{}") as resp:
+        assert list(resp) == [b"data: 0\n", b"data: 1\n", b"data: 2\n"]
+    client.post(f"{server}/v1/x", b"", {})
+    assert client.health()["connections_reused"] == 1
+    client.close()
+
+
+@pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 installed")
+def test_http2_without_h2_falls_back_to_http11(server):
+    client = HTTPClient(server, http2=True)
+    assert client.health()["protocol"] == "HTTP/1.1"
+    client.post(f"{server}/v1/x", b"", {})
+    client.close()
+
+
+def test_client_for_shares_one_client_per_origin():
+    http_client.configure(HTTPClientConfig(pool_size=3))
+    try:
+        a = http_client.client_for("http://gateway.test:8080/v1")
+        b = http_client.client_for("http://gateway.test:8080/api/chat")
+        c = http_client.client_for("https://gateway.test")
+        assert a is b and a is not c
+        assert a.pool_size == 3
+        assert "http://gateway.test:8080" in http_client.health()
+    finally:
+        http_client.configure(HTTPClientConfig())
+        http_client.close_all()
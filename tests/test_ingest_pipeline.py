@@ -0,0 +1,204 @@
+"""Tests for the streaming chunk store in cairn.core.ingest."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cairn.config import Config
+from cairn.core.ingest import IngestPipeline
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class FakeMemoryStore:
+    """prepare_batch/insert_batch that hand out sequential ids."""
+
+    def __init__(self, fail_on_batch: int | None = None):
+        self.fail_on_batch = fail_on_batch
+        self.prepared = 0
+        self.inserted: list[str] = []
+        self._next_id = 100
+        self._lock = threading.Lock()
+
+    def prepare_batch(self, memories, project_ids, *, enrich=True, owner_user_id=None):
+        with self._lock:
+            self.prepared += 1
+            if self.prepared == self.fail_on_batch:
+                raise RuntimeError("embedding backend down")
+        return [m["content"] for m in memories]
+
+    def insert_batch(self, prepared, before_commit=None):
+        with self._lock:
+            rows = [{"id": self._next_id + i} for i in range(len(prepared))]
+            self._next_id += len(prepared)
+            self.inserted.extend(prepared)
+        before_commit(rows)
+        return rows
+
+
+class FakeDB:
+    """Answers the few queries _store_chunks issues from in-memory state."""
+
+    def __init__(self, done: dict[int, str] | None = None, stored_hashes: dict[str, int] | None = None):
+        self.done = done or {}
+        self.stored_hashes = stored_hashes or {}  # hash -> memory_id from earlier ingests
+        self.recorded: list[tuple[int, int]] = []  # (seq, memory_id)
+        self.hash_memory: dict[str, int] = {}  # hash -> memory_id from this ingest
+        self.linked_docs: list[tuple[int, list[int]]] = []
+
+    def execute(self, sql, params=None):
+        if "CROSS JOIN LATERAL" in sql:
+            linked = []
+            for seq, h in zip(params[2], params[3], strict=True):
+                memory_id = self.hash_memory.get(h) or self.stored_hashes.get(h)
+                if memory_id is not None:
+                    self.recorded.append((seq, memory_id))
+                    linked.append({"memory_id": memory_id})
+            return linked
+        if "SET source_doc_id" in sql:
+            self.linked_docs.append((params[0], sorted(params[1])))
+            return []
+        if "SELECT seq, content_hash" in sql:
+            return [{"seq": s, "content_hash": h} for s, h in self.done.items()]
+        if "SELECT DISTINCT ic.content_hash" in sql:
+            return [{"content_hash": h} for h in params[1] if h in self.stored_hashes]
+        if "ORDER BY seq" in sql:
+            return [{"memory_id": m} for _, m in sorted(self.recorded)]
+        return []
+
+    def commit(self):
+        pass
+
+    def release_if_held(self):
+        pass
+
+
+def _pipeline(db, store, *, batch_size=4, workers=2):
+    config = replace(Config(), ingest_batch_size=batch_size, ingest_workers=workers, ingest_queue_depth=2)
+    pipeline = IngestPipeline(db, MagicMock(), store, None, config)
+    pipeline._chunker = lambda text: [SimpleNamespace(text=p) for p in text.split("\n\n") if p]
+
+    def record(ingestion_id, project_id, chunks, memory_ids, skipped):
+        db.recorded.extend(zip((c[0] for c in chunks), memory_ids, strict=True))
+        db.hash_memory.update(zip((c[2] for c in chunks), memory_ids, strict=True))
+
+    pipeline._record_chunks = record
+    return pipeline
+
+
+def _document(paragraphs: list[str]) -> str:
+    return "\n\n".join(paragraphs)
+
+
+def _paragraphs(n: int) -> list[str]:
+    return [f"Paragraph {i}: " + "lorem ipsum " * 20 for i in range(n)]
+
+
+def _run(pipeline, content, on_progress=None, doc_id=None):
+    with patch("cairn.core.ingest.get_or_create_project", return_value=7):
+        return pipeline._store_chunks(
+            1, content, {"project": "p", "memory_type": "note", "source_doc_id": doc_id},
+            enrich=False, on_progress=on_progress,
+        )
+
+
+class TestSegments:
+    def test_segments_rejoin_to_the_document(self):
+        content = _document(_paragraphs(400))
+        segments = list(IngestPipeline._segments(content, size=5000))
+        assert len(segments) > 1
+        assert "".join(segments) == content
+        assert all(s.endswith("\n\n") for s in segments[:-1])
+
+    def test_content_without_breaks_is_one_segment(self):
+        content = "x" * 20_000
+        assert list(IngestPipeline._segments(content, size=5000)) == [content]
+
+    def test_small_content_is_a_single_chunk(self):
+        pipeline = _pipeline(FakeDB(), FakeMemoryStore())
+        assert list(pipeline._iter_chunks("short\n\nnote")) == ["short\n\nnote"]
+
+
+class TestDedupChunks:
+    def test_drops_stored_and_repeated_chunks(self):
+        db = FakeDB(stored_hashes={_sha("old"): 1})
+        pipeline = _pipeline(db, FakeMemoryStore())
+        chunks = [(i, t, _sha(t)) for i, t in enumerate(["old", "new", "new", "other"])]
+        seen: set[str] = set()
+
+        kept, dropped = pipeline._dedup_chunks(chunks, 7, seen)
+
+        assert [c[1] for c in kept] == ["new", "other"]
+        assert [c[0] for c in dropped] == [0, 2]
+        assert seen == {_sha("new"), _sha("other")}
+
+
+class TestStoreChunks:
+    def test_stores_every_chunk_in_order(self):
+        paragraphs = _paragraphs(30)
+        db = FakeDB()
+        store = FakeMemoryStore()
+        progress: list[dict] = []
+
+        memory_ids, chunk_count, skipped = _run(_pipeline(db, store), _document(paragraphs), progress.append)
+
+        assert chunk_count == 30 and skipped == 0
+        assert sorted(store.inserted) == sorted(paragraphs)
+        assert [seq for seq, _ in sorted(db.recorded)] == list(range(30))
+        assert memory_ids == [m for _, m in sorted(db.recorded)]
+        assert progress[-1]["chunks_done"] == 30
+
+    def test_resume_skips_stored_chunks(self):
+        paragraphs = _paragraphs(30)
+        done = {i: _sha(p) for i, p in enumerate(paragraphs[:10])}
+        db = FakeDB(done=done)
+        db.recorded = [(i, 1 + i) for i in done]
+        store = FakeMemoryStore()
+
+        memory_ids, chunk_count, _ = _run(_pipeline(db, store), _document(paragraphs))
+
+        assert chunk_count == 30
+        assert sorted(store.inserted) == sorted(paragraphs[10:])
+        assert memory_ids[:10] == list(range(1, 11))
+
+    def test_duplicate_chunks_are_not_embedded(self):
+        paragraphs = _paragraphs(12)
+        db = FakeDB(stored_hashes={_sha(paragraphs[0]): 1})
+        store = FakeMemoryStore()
+
+        _, _, skipped = _run(_pipeline(db, store), _document(paragraphs + paragraphs[5:7]))
+
+        assert skipped == 3
+        assert len(store.inserted) == 11
+
+    def test_duplicate_chunks_link_to_existing_memories(self):
+        paragraphs = _paragraphs(12)
+        db = FakeDB(stored_hashes={_sha(paragraphs[0]): 1})
+
+        memory_ids, chunk_count, _ = _run(
+            _pipeline(db, FakeMemoryStore()), _document(paragraphs + paragraphs[5:7]), doc_id=42,
+        )
+
+        assert chunk_count == 14 and len(memory_ids) == 14
+        assert memory_ids[0] == 1
+        assert memory_ids[12:] == memory_ids[5:7]
+        assert db.linked_docs == [(42, sorted({1, *memory_ids[5:7]}))]
+
+    def test_stage_failure_propagates_and_stops_pipeline(self):
+        db = FakeDB()
+        store = FakeMemoryStore(fail_on_batch=2)
+        pipeline = _pipeline(db, store, batch_size=2)
+
+        with pytest.raises(RuntimeError, match="embedding backend down"):
+            _run(pipeline, _document(_paragraphs(200)))
+
+        assert len(store.inserted) < 200
+        assert not [t for t in threading.enumerate() if t.name.startswith("ingest-1-")]
@@ -281,3 +281,15 @@ class TestMemoryRoundTrip:
         )
         assert len(results) >= 1
         assert all(r.get("memory_type") == "decision" for r in results)
+
+    def test_store_many_round_trip(self):
+        """store_many returns ids in input order, each recallable."""
+        canary = f"batch-{uuid.uuid4().hex[:6]}"
+        stored = self.memory_store.store_many([
+            {"content": f"{canary} batch memory {i}", "project": "test-roundtrip", "tags": [canary]}
+            for i in range(5)
+        ], enrich=False)
+
+        assert len(stored) == 5
+        recalled = {r["id"]: r["content"] for r in self.memory_store.recall([m["id"] for m in stored])}
+        assert [recalled[m["id"]] for m in stored] == [f"{canary} batch memory {i}" for i in range(5)]
@@ -0,0 +1,239 @@
+"""Tests for KnowledgeExtractor.resolve_and_persist — batched graph persistence."""
+
+from unittest.mock import MagicMock
+
+from cairn.core.extraction import (
+    ExtractedEntity,
+    ExtractedStatement,
+    ExtractionResult,
+    KnowledgeExtractor,
+)
+from cairn.graph.interface import Entity, GraphProvider, Statement
+
+
+def _extractor(graph=None):
+    embedding = MagicMock()
+    embedding.embed_batch.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    graph = graph or MagicMock()
+    return KnowledgeExtractor(MagicMock(), embedding, graph), embedding, graph
+
+
+def _stmt(subject, predicate, obj, fact, aspect="Knowledge", event_date=None):
+    return ExtractedStatement(
+        subject=subject, predicate=predicate, object=obj, fact=fact,
+        aspect=aspect, event_date=event_date,
+    )
+
+
+def _result(entities, statements):
+    return ExtractionResult(
+        entities=[ExtractedEntity(name=n, entity_type=t) for n, t in entities],
+        statements=statements,
+    )
+
+
+class TestBatchedPersist:
+    def test_one_round_trip_per_phase(self):
+        extractor, embedding, graph = _extractor()
+        graph.resolve_entities_batch.return_value = [
+            Entity(uuid="e-alice", name="Alice", entity_type="Person", project_id=1),
+            None,
+        ]
+        graph.find_contradictions_batch.return_value = {}
+        result = _result(
+            [("Alice", "Person"), ("Cairn", "Project")],
+            [
+                _stmt("Alice", "works_on", "Cairn", "Alice works on Cairn"),
+                _stmt("Cairn", "uses", "Postgres", "Cairn uses Postgres"),
+                _stmt("Nobody", "likes", "tea", "Nobody likes tea"),
+            ],
+        )
+
+        summary = extractor.resolve_and_persist(result, episode_id=7, project_id=1)
+
+        embedding.embed_batch.assert_called_once_with(
+            ["Alice", "Cairn", "Alice works on Cairn", "Cairn uses Postgres"],
+        )
+        graph.resolve_entities_batch.assert_called_once()
+        # Only the merged subject can have existing statements
+        pairs, _ = graph.find_contradictions_batch.call_args[0]
+        assert pairs == [("e-alice", "works_on")]
+
+        project_id, episode_id, entities, statements, invalidate = graph.write_extraction_batch.call_args[0]
+        assert (project_id, episode_id) == (1, 7)
+        assert [e["name"] for e in entities] == ["Cairn"]
+        cairn_uuid = entities[0]["uuid"]
+        assert statements[0]["subject_id"] == "e-alice"
+        assert statements[0]["object_id"] == cairn_uuid
+        assert statements[1]["subject_id"] == cairn_uuid
+        assert statements[1]["object_value"] == "Postgres"
+        assert invalidate == []
+
+        assert summary["entities_created"] == 1
+        assert summary["entities_merged"] == 1
+        assert summary["statements_created"] == 2
+        assert set(summary["timings_ms"]) == {"embed", "resolve", "contradictions", "write", "total"}
+        graph.create_entity.assert_not_called()
+        graph.create_statement.assert_not_called()
+
+    def test_existing_contradictions_follow_aspect_and_date_rules(self):
+        extractor, _, graph = _extractor()
+        graph.resolve_entities_batch.return_value = [
+            Entity(uuid="e-bob", name="Bob", entity_type="Person", project_id=1),
+        ]
+        graph.find_contradictions_batch.return_value = {
+            ("e-bob", "prefers"): [
+                Statement(uuid="old-pref", fact="", aspect="Preference", episode_id=1, project_id=1),
+                Statement(uuid="old-event", fact="", aspect="Event", episode_id=1, project_id=1),
+                Statement(uuid="old-dated", fact="", aspect="Preference", episode_id=1,
+                          project_id=1, valid_at="2020-01-01"),
+            ],
+        }
+        result = _result(
+            [("Bob", "Person")],
+            [_stmt("Bob", "prefers", "vim", "Bob prefers vim", "Preference", "2026-01-01")],
+        )
+
+        summary = extractor.resolve_and_persist(result, episode_id=2, project_id=1)
+
+        invalidate = graph.write_extraction_batch.call_args[0][4]
+        assert invalidate == ["old-pref"]
+        assert summary["contradictions_found"] == 1
+
+    def test_later_statement_contradicts_earlier_one_in_same_batch(self):
+        extractor, _, graph = _extractor()
+        graph.resolve_entities_batch.return_value = [None]
+        result = _result(
+            [("Bob", "Person")],
+            [
+                _stmt("Bob", "prefers", "emacs", "Bob prefers emacs", "Preference"),
+                _stmt("Bob", "prefers", "vim", "Bob prefers vim", "Preference"),
+            ],
+        )
+
+        extractor.resolve_and_persist(result, episode_id=3, project_id=1)
+
+        graph.find_contradictions_batch.assert_not_called()
+        statements, invalidate = graph.write_extraction_batch.call_args[0][3:5]
+        assert invalidate == [statements[0]["uuid"]]
+
+    def test_duplicate_entity_names_resolve_once(self):
+        extractor, embedding, graph = _extractor()
+        graph.resolve_entities_batch.return_value = [None]
+        result = _result([("Redis", "Technology"), ("Redis", "Technology")], [])
+
+        summary = extractor.resolve_and_persist(result, episode_id=4, project_id=1)
+
+        assert len(graph.resolve_entities_batch.call_args[0][0]) == 1
+        assert summary["entities_created"] == 1
+
+    def test_near_duplicate_names_in_one_extraction_merge(self):
+        extractor, embedding, graph = _extractor()
+        vectors = {"PostgreSQL": [1.0, 0.0], "Postgres": [0.99, 0.1], "Redis": [0.0, 1.0]}
+        embedding.embed_batch.side_effect = lambda texts: [vectors.get(t, [0.5, 0.5]) for t in texts]
+        graph.resolve_entities_batch.return_value = [None, None, None]
+        result = _result(
+            [("PostgreSQL", "Technology"), ("Postgres", "Technology"), ("Redis", "Technology")],
+            [_stmt("Postgres", "replaces", "Redis", "Postgres replaces Redis")],
+        )
+
+        summary = extractor.resolve_and_persist(result, episode_id=5, project_id=1)
+
+        entities, statements = graph.write_extraction_batch.call_args[0][2:4]
+        assert [e["name"] for e in entities] == ["PostgreSQL", "Redis"]
+        assert statements[0]["subject_id"] == entities[0]["uuid"]
+        assert statements[0]["object_id"] == entities[1]["uuid"]
+        assert summary["entities_created"] == 2
+        assert summary["entities_merged"] == 1
+
+    def test_in_batch_merge_uses_vector_index_scores(self):
+        # cos = 0.8 scores 0.9: enough for the same type, not for any type
+        extractor, embedding, graph = _extractor()
+        vectors = {"Acme": [1.0, 0.0], "Acme Corp": [0.8, 0.6], "ACME": [0.8, 0.6]}
+        embedding.embed_batch.side_effect = lambda texts: [vectors[t] for t in texts]
+        graph.resolve_entities_batch.return_value = [None, None, None]
+        result = _result(
+            [("Acme", "Organization"), ("Acme Corp", "Organization"), ("ACME", "Product")], [],
+        )
+
+        summary = extractor.resolve_and_persist(result, episode_id=5, project_id=1)
+
+        entities = graph.write_extraction_batch.call_args[0][2]
+        assert [e["name"] for e in entities] == ["Acme", "ACME"]
+        assert summary["entities_merged"] == 1
+
+    def test_batch_failure_falls_back_to_per_item_writes(self):
+        extractor, _, graph = _extractor()
+        graph.resolve_entities_batch.return_value = [None, None]
+        graph.write_extraction_batch.side_effect = RuntimeError("neo4j down")
+        graph.find_similar_entities.return_value = []
+        graph.find_similar_entities_any_type.return_value = []
+        graph.find_contradictions.return_value = []
+        graph.create_entity.side_effect = ["e-alice", RuntimeError("bad attributes")]
+        graph.create_statement.return_value = "s-1"
+        result = _result(
+            [("Alice", "Person"), ("Bob", "Person")],
+            [
+                _stmt("Alice", "is", "here", "Alice is here"),
+                _stmt("Bob", "is", "there", "Bob is there"),
+            ],
+        )
+
+        summary = extractor.resolve_and_persist(result, episode_id=5, project_id=1)
+
+        assert graph.create_entity.call_count == 2
+        graph.create_statement.assert_called_once()
+        graph.create_triple.assert_called_once_with(
+            statement_id="s-1", subject_id="e-alice", predicate="is",
+            object_id=None, object_value="here",
+        )
+        assert summary["entities_created"] == 1
+        assert summary["statements_created"] == 1
+        assert "fallback" in summary["timings_ms"]
+
+    def test_embed_cache_skips_known_texts(self):
+        extractor, embedding, graph = _extractor()
+        graph.resolve_entities_batch.return_value = [None]
+        extractor._cached_embed("Alice")
+        result = _result([("Alice", "Person")], [_stmt("Alice", "is", "here", "Alice is here")])
+
+        extractor.resolve_and_persist(result, episode_id=6, project_id=1)
+
+        embedding.embed_batch.assert_called_once_with(["Alice is here"])
+
+
+class TestGraphProviderBatchDefaults:
+    """The base-class fallbacks route through the per-item methods."""
+
+    def test_resolve_prefers_same_type_then_any_type(self):
+        graph = MagicMock()
+        typed = Entity(uuid="t", name="A", entity_type="Person", project_id=1)
+        loose = Entity(uuid="l", name="B", entity_type="Concept", project_id=1)
+        graph.find_similar_entities.side_effect = [[typed], [], []]
+        graph.find_similar_entities_any_type.side_effect = [[loose], []]
+        candidates = [{"name": n, "entity_type": "Person", "embedding": [1.0]} for n in "ABC"]
+
+        resolved = GraphProvider.resolve_entities_batch(graph, candidates, 1)
+
+        assert resolved == [typed, loose, None]
+
+    def test_write_maps_batch_uuids_to_created_ones(self):
+        graph = MagicMock()
+        graph.create_entity.return_value = "real-entity"
+        graph.create_statement.side_effect = ["real-s1", "real-s2"]
+        entities = [{"uuid": "tmp-e", "name": "A", "entity_type": "Person", "embedding": [1.0]}]
+        statements = [
+            {"uuid": "tmp-s1", "fact": "f1", "embedding": [1.0], "aspect": "Preference",
+             "subject_id": "tmp-e", "predicate": "p", "object_id": "existing", "object_value": None},
+            {"uuid": "tmp-s2", "fact": "f2", "embedding": [1.0], "aspect": "Preference",
+             "subject_id": "tmp-e", "predicate": "p", "object_id": None, "object_value": "lit"},
+        ]
+
+        GraphProvider.write_extraction_batch(graph, 1, 9, entities, statements, ["tmp-s1", "old"])
+
+        first, second = graph.create_triple.call_args_list
+        assert first.kwargs["subject_id"] == "real-entity"
+        assert first.kwargs["object_id"] == "existing"
+        assert second.kwargs["object_value"] == "lit"
+        invalidated = [c.args[0] for c in graph.invalidate_statement.call_args_list]
+        assert invalidated == ["real-s1", "old"]
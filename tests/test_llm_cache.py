@@ -0,0 +1,348 @@
+"""Tests for cairn.llm.cache — deterministic LLM response cache."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cairn.config import (
+    Config,
+    LLMCacheConfig,
+    LLMConfig,
+    ModelTierConfig,
+    RouterConfig,
+)
+from cairn.core import stats
+from cairn.core.enrichment import Enricher
+from cairn.core.status import get_status
+from cairn.llm.cache import CachedLLM, LLMCache, cache_key, generate_checked, parses_as
+from cairn.llm.interface import LLMInterface
+from cairn.llm.router import ModelRouter
+
+
+class CountingLLM(LLMInterface):
+    """Backend that answers with a numbered response and records each call."""
+
+    def __init__(self, model: str = "fake-model", response: str | None = None):
+        self.model = model
+        self.response = response
+        self.calls: list[tuple[list[dict], int]] = []
+        self.gate: threading.Event | None = None
+
+    def generate(self, messages: list[dict], max_tokens: int = 1024) -> str:
+        self.calls.append((messages, max_tokens))
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        if self.response is not None:
+            return self.response
+        return f"response {len(self.calls)}"
+
+    def get_model_name(self) -> str:
+        return self.model
+
+    def get_context_size(self) -> int:
+        return 8192
+
+
+class FakePersistentTier:
+    def __init__(self):
+        self.rows: dict[bytes, tuple[str, float]] = {}
+
+    def get(self, key):
+        return self.rows.get(key)
+
+    def put(self, key, operation, response, ttl):
+        self.rows[key] = (response, 4102444800.0)
+
+
+def _messages(text="classify this"):
+    return [{"role": "system", "content": "You are a router."}, {"role": "user", "content": text}]
+
+
+def _cached(operation="enrichment", inner=None, **config):
+    inner = inner or CountingLLM()
+    cache = LLMCache(LLMCacheConfig(**config))
+    return CachedLLM(inner, cache, operation), inner, cache
+
+
+class TestCacheKey:
+    def test_whitespace_and_line_endings_do_not_change_key(self):
+        a = cache_key("Ollama:m", [{"role": "user", "content": "line one\r\nline two  "}], 512)
+        b = cache_key("Ollama:m", [{"role": "user", "content": "  line one\nline two"}], 512)
+        assert a == b
+
+    def test_backend_model_and_max_tokens_change_key(self):
+        base = cache_key("Ollama:m", _messages(), 512)
+        assert cache_key("Ollama:other", _messages(), 512) != base
+        assert cache_key("Gemini:m", _messages(), 512) != base
+        assert cache_key("Ollama:m", _messages(), 1024) != base
+        assert cache_key("Ollama:m", _messages("different"), 512) != base
+
+
+class TestCachedLLM:
+    def test_repeat_prompt_hits_cache(self):
+        llm, inner, cache = _cached()
+        assert llm.generate(_messages(), max_tokens=512) == "response 1"
+        assert llm.generate(_messages(), max_tokens=512) == "response 1"
+        assert len(inner.calls) == 1
+
+        stats = cache.to_dict()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["operations"]["enrichment"]["hit_rate"] == 0.5
+
+    def test_ttl_expiry_recomputes(self):
+        llm, inner, _ = _cached(ttl_enrichment=60)
+        with patch("cairn.llm.cache.time.time", return_value=1000.0):
+            llm.generate(_messages())
+        with patch("cairn.llm.cache.time.time", return_value=1059.0):
+            assert llm.generate(_messages()) == "response 1"
+        with patch("cairn.llm.cache.time.time", return_value=1061.0):
+            assert llm.generate(_messages()) == "response 2"
+        assert len(inner.calls) == 2
+
+    def test_zero_ttl_disables_operation(self):
+        llm, inner, cache = _cached("routing", ttl_routing=0)
+        llm.generate(_messages())
+        llm.generate(_messages())
+        assert len(inner.calls) == 2
+        assert cache.to_dict()["misses"] == 0
+
+    def test_empty_responses_and_errors_are_not_cached(self):
+        llm, inner, _ = _cached(inner=CountingLLM(response=""))
+        llm.generate(_messages())
+        llm.generate(_messages())
+        assert len(inner.calls) == 2
+
+        failing = CountingLLM()
+        failing.generate = lambda messages, max_tokens=1024: (_ for _ in ()).throw(RuntimeError("down"))
+        llm, _, cache = _cached(inner=failing)
+        with pytest.raises(RuntimeError):
+            llm.generate(_messages())
+        assert cache.to_dict()["entries"] == 0
+
+    def test_responses_the_parser_rejects_are_not_cached(self):
+        tier = FakePersistentTier()
+        llm, inner, cache = _cached(inner=CountingLLM(response='{"tags": ["trunc'))
+        cache._persistent = tier
+        for _ in range(2):
+            generate_checked(llm, _messages(), 512, parses_as("object"))
+        assert len(inner.calls) == 2
+        assert cache.to_dict()["entries"] == 0
+        assert tier.rows == {}
+
+        inner.response = '{"tags": ["ok"]}'
+        generate_checked(llm, _messages(), 512, parses_as("object"))
+        generate_checked(llm, _messages(), 512, parses_as("object"))
+        assert len(inner.calls) == 3
+
+    def test_fresh_bypasses_and_replaces_cached_response(self):
+        llm, inner, _ = _cached()
+        assert llm.generate(_messages()) == "response 1"
+        assert generate_checked(llm, _messages(), 1024, bool, fresh=True) == "response 2"
+        assert llm.generate(_messages()) == "response 2"
+        assert len(inner.calls) == 2
+
+    def test_re_enrich_recovers_from_malformed_enrichment(self):
+        llm, inner, _ = _cached(inner=CountingLLM(response="not json"))
+        enricher = Enricher(llm)
+        assert enricher.enrich("content")["_status"] == "failed"
+
+        inner.response = '{"tags": ["x"], "entities": ["E"]}'
+        assert enricher.enrich("content")["_status"] == "complete"
+        assert enricher.enrich("content", fresh=True)["_status"] == "complete"
+        assert len(inner.calls) == 3
+
+    def test_lru_evicts_over_budget(self):
+        llm, inner, cache = _cached(max_mb=1, inner=CountingLLM(response="x" * 400_000))
+        for i in range(3):
+            llm.generate(_messages(f"prompt {i}"))
+        stats = cache.to_dict()
+        assert stats["entries"] == 2 and stats["evictions"] == 1
+        llm.generate(_messages("prompt 0"))
+        assert len(inner.calls) == 4
+
+    def test_operations_share_entries_but_count_separately(self):
+        inner = CountingLLM()
+        cache = LLMCache(LLMCacheConfig())
+        CachedLLM(inner, cache, "clustering").generate(_messages())
+        CachedLLM(inner, cache, "consolidation").generate(_messages())
+        ops = cache.to_dict()["operations"]
+        assert ops["clustering"]["misses"] == 1
+        assert ops["consolidation"]["hits"] == 1
+        assert ops["consolidation"]["ttl"] == 86400
+
+    def test_unknown_operation_rejected(self):
+        with pytest.raises(ValueError):
+            CachedLLM(CountingLLM(), LLMCache(LLMCacheConfig()), "chat")
+
+    def test_tools_and_streaming_bypass_cache(self):
+        llm, inner, _ = _cached()
+        list(llm.generate_stream(_messages()))
+        list(llm.generate_stream(_messages()))
+        assert len(inner.calls) == 2
+        assert llm.model == "fake-model"  # attribute passthrough
+
+
+class TestStampedeProtection:
+    def test_concurrent_identical_requests_call_backend_once(self):
+        llm, inner, cache = _cached()
+        inner.gate = threading.Event()
+        results: list[str] = []
+
+        def call():
+            results.append(llm.generate(_messages()))
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for t in threads:
+            t.start()
+        # Let every thread reach the cache before the backend answers
+        while cache.to_dict()["coalesced"] < 7:
+            pass
+        inner.gate.set()
+        for t in threads:
+            t.join()
+
+        assert len(inner.calls) == 1
+        assert results == ["response 1"] * 8
+
+    def test_followers_see_leader_failure(self):
+        inner = CountingLLM()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing(messages, max_tokens=1024):
+            inner.calls.append((messages, max_tokens))
+            started.set()
+            release.wait(timeout=5)
+            raise TimeoutError("backend timed out")
+
+        inner.generate = failing
+        llm, _, cache = _cached(inner=inner)
+        errors: list[Exception] = []
+
+        def call():
+            try:
+                llm.generate(_messages())
+            except TimeoutError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(timeout=5)
+        follower = threading.Thread(target=call)
+        follower.start()
+        while cache.to_dict()["coalesced"] < 1:
+            pass
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert len(inner.calls) == 1
+        assert len(errors) == 2
+
+
+class TestPersistentTier:
+    def test_persistent_hit_warms_lru(self):
+        tier = FakePersistentTier()
+        first, inner, cache = _cached()
+        cache._persistent = tier
+        first.generate(_messages())
+        assert len(tier.rows) == 1
+
+        # A fresh process: empty LRU, same Postgres table
+        second, inner2, cache2 = _cached()
+        cache2._persistent = tier
+        assert second.generate(_messages()) == "response 1"
+        assert second.generate(_messages()) == "response 1"
+        assert inner2.calls == []
+        assert cache2.to_dict()["persistent_hits"] == 1
+
+    def test_persistent_failure_falls_back_to_backend(self):
+        llm, inner, cache = _cached()
+
+        class Broken:
+            def get(self, key):
+                raise ConnectionError("db down")
+
+            def put(self, *args):
+                raise ConnectionError("db down")
+
+        cache._persistent = Broken()
+        assert llm.generate(_messages()) == "response 1"
+        assert cache.to_dict()["persistent_errors"] == 2
+
+
+def _status_db():
+    db = MagicMock()
+    db.execute_one.side_effect = lambda sql, *args: (
+        None if "clustering_runs" in sql else {"count": 0, "cnt": 0}
+    )
+    db.execute.return_value = []
+    return db
+
+
+class TestRouterIntegration:
+    def _router(self, capable_budget=0):
+        backends: dict[str, CountingLLM] = {}
+
+        def fake_get_llm(config):
+            key = f"{config.backend}:{getattr(config, f'{config.backend}_model', '')}"
+            return backends.setdefault(key, CountingLLM(model=key))
+
+        config = RouterConfig(
+            enabled=True,
+            capable=ModelTierConfig(backend="bedrock", daily_budget=capable_budget),
+            fast=ModelTierConfig(backend="ollama"),
+        )
+        with patch("cairn.llm.router.get_llm", side_effect=fake_get_llm):
+            router = ModelRouter(config, LLMConfig(backend="ollama"))
+        return router, backends
+
+    def test_router_stats_report_cache_hit_rates(self):
+        router, _ = self._router()
+        router.cache = LLMCache(LLMCacheConfig())
+        llm = CachedLLM(router.for_operation("fast"), router.cache, "routing")
+        llm.generate(_messages())
+        llm.generate(_messages())
+
+        stats = router.stats()
+        assert stats["tiers"]["fast"] == "ollama"
+        assert stats["cache"]["operations"]["routing"]["hit_rate"] == 0.5
+        assert stats["tokens_today"]["ollama"] > 0
+
+    def test_status_reports_per_operation_hit_rates(self, monkeypatch):
+        router, _ = self._router()
+        router.cache = LLMCache(LLMCacheConfig())
+        routing = CachedLLM(router.for_operation("fast"), router.cache, "routing")
+        routing.generate(_messages())
+        routing.generate(_messages())
+        CachedLLM(router.for_operation("fast"), router.cache, "enrichment").generate(_messages("enrich"))
+
+        monkeypatch.setattr(stats, "llm_stats", stats.ModelStats("ollama", "fake-model"))
+        status = get_status(_status_db(), Config(), router=router)
+
+        operations = status["models"]["llm"]["cache"]["operations"]
+        assert operations["routing"]["hit_rate"] == 0.5
+        assert operations["enrichment"]["hit_rate"] == 0.0
+        assert status["models"]["llm"]["router"]["tiers"]["fast"] == "ollama"
+
+    def test_status_reports_cache_without_router(self, monkeypatch):
+        llm, _, cache = _cached(operation="extraction")
+        llm.generate(_messages())
+
+        monkeypatch.setattr(stats, "llm_stats", stats.ModelStats("ollama", "fake-model"))
+        status = get_status(_status_db(), Config(), llm_cache=cache)
+
+        assert "router" not in status["models"]["llm"]
+        assert status["models"]["llm"]["cache"]["operations"]["extraction"]["hit_rate"] == 0.0
+
+    def test_budget_fallback_changes_cache_key(self):
+        router, backends = self._router(capable_budget=10)
+        cache = LLMCache(LLMCacheConfig())
+        llm = CachedLLM(router.for_operation("capable"), cache, "extraction")
+        messages = _messages("x" * 200)
+
+        llm.generate(messages)  # bedrock, now over budget
+        llm.generate(messages)  # falls back to ollama: a different model, so a miss
+        assert len(backends["bedrock:moonshotai.kimi-k2.5"].calls) == 1
+        assert len(backends["ollama:qwen2.5-coder:7b"].calls) == 1
@@ -0,0 +1,168 @@
+"""Tests for single-pass, summary-aware embedding of long memories."""
+
+from itertools import pairwise
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from cairn.core.constants import (
+    AUTO_SUMMARIZE_EMBED_THRESHOLD,
+    LONG_CONTENT_CHUNK_CHARS,
+    LONG_CONTENT_CHUNK_OVERLAP,
+    LONG_CONTENT_MAX_CHUNKS,
+)
+from cairn.core.memory import MemoryStore, _chunk_spans
+from cairn.core.search import SearchEngine
+
+BIG = "".join(f"line {i:05d} of a long design document\n" for i in range(400))
+assert len(BIG) > AUTO_SUMMARIZE_EMBED_THRESHOLD
+
+
+def _make_store(long_content="summary", enricher=None):
+    db = MagicMock()
+    embedding = MagicMock()
+    embedding.embed.side_effect = lambda text: [float(len(text)), 1.0]
+    embedding.embed_batch.side_effect = lambda texts: [[float(len(t)), 1.0] for t in texts]
+    created_at = MagicMock()
+    created_at.isoformat.return_value = "2026-01-01T00:00:00"
+    db.execute_one.side_effect = [{"id": 1}, {"id": 42, "created_at": created_at}]
+    return MemoryStore(db, embedding, enricher=enricher, long_content=long_content)
+
+
+class TestChunkSpans:
+
+    def test_spans_overlap_and_cover_content(self):
+        spans = _chunk_spans(BIG)
+        step = LONG_CONTENT_CHUNK_CHARS - LONG_CONTENT_CHUNK_OVERLAP
+        assert spans[0] == (0, LONG_CONTENT_CHUNK_CHARS)
+        assert all(b[0] - a[0] == step for a, b in pairwise(spans))
+        assert spans[-1][1] == len(BIG)
+
+    def test_spans_are_capped(self):
+        spans = _chunk_spans("x" * (LONG_CONTENT_CHUNK_CHARS * (LONG_CONTENT_MAX_CHUNKS + 10)))
+        assert len(spans) == LONG_CONTENT_MAX_CHUNKS
+
+
+class TestEmbeddingPlan:
+
+    def test_short_content_is_embedded_as_is(self):
+        plan = _make_store("multi")._embedding_plan("short", "a summary")
+        assert plan.texts == ["short"] and not plan.pooled and not plan.spans
+
+    def test_summary_mode_prefers_summary_then_head(self):
+        store = _make_store("summary")
+        assert store._embedding_plan(BIG, "the summary").texts == ["the summary"]
+        assert store._embedding_plan(BIG, None).texts == [BIG[:2000]]
+
+    def test_mean_mode_pools_normalized_chunk_vectors(self):
+        plan = _make_store("mean")._embedding_plan(BIG, "ignored")
+        assert plan.pooled and len(plan.texts) == len(_chunk_spans(BIG))
+        primary, chunks = plan.resolve([[3.0, 0.0]] + [[0.0, 4.0]] * (len(plan.texts) - 1))
+        assert np.isclose(np.linalg.norm(primary), 1.0)
+        assert chunks == []
+
+    def test_multi_mode_keeps_summary_vector_and_chunk_vectors(self):
+        plan = _make_store("multi")._embedding_plan(BIG, "the summary")
+        spans = _chunk_spans(BIG)
+        assert plan.texts[0] == "the summary"
+        assert plan.texts[1:] == [BIG[a:b] for a, b in spans]
+        primary, chunks = plan.resolve([[float(i)] for i in range(len(plan.texts))])
+        assert primary == [0.0]
+        assert [(a, b) for a, b, _ in chunks] == spans
+        assert chunks[-1][2] == [float(len(spans))]
+
+    def test_unknown_mode_falls_back_to_summary(self):
+        assert _make_store("passages").long_content == "summary"
+
+
+class TestSinglePassStore:
+
+    def test_large_content_embeds_enriched_summary_once(self):
+        enricher = MagicMock()
+        enricher.enrich.return_value = {"_status": "complete", "summary": "short summary"}
+        store = _make_store(enricher=enricher)
+
+        with patch.object(store, "_post_store_enrichment", return_value={}):
+            result = store.store(content=BIG, project="p")
+
+        store.embedding.embed.assert_called_once_with("short summary")
+        store.embedding.embed_batch.assert_not_called()
+        assert result["summary"] == "short summary"
+
+    def test_large_content_without_summary_embeds_head_once(self):
+        store = _make_store()
+
+        with patch.object(store, "_post_store_enrichment", return_value={}):
+            result = store.store(content=BIG, project="p", enrich=False)
+
+        store.embedding.embed.assert_called_once_with(BIG[:2000])
+        assert result["summary"] == BIG[:200].strip()
+
+    def test_store_many_summaries_match_store(self):
+        for enrich in (False, True):
+            store = _make_store()
+            with patch.object(store, "_post_store_enrichment", return_value={}):
+                stored = store.store(content=BIG, project="p", enrich=enrich)
+            batch = store.prepare_batch([{"content": BIG, "project": "p"}], {"p": 1}, enrich=enrich)
+            assert batch.rows[0]["summary"] == stored["summary"]
+        assert stored["summary"] == BIG[:500].strip() + "..."
+
+    def test_multi_mode_writes_chunks_from_the_same_call(self):
+        store = _make_store("multi")
+
+        with patch.object(store, "_post_store_enrichment", return_value={}):
+            store.store(content=BIG, project="p", enrich=False)
+
+        store.embedding.embed_batch.assert_called_once()
+        store.embedding.embed.assert_not_called()
+        chunk_inserts = [c for c in store.db.execute.call_args_list if "memory_chunks" in c.args[0]]
+        assert len(chunk_inserts) == 1
+        params = chunk_inserts[0].args[1]
+        assert params[:4] == [42, 0, 0, LONG_CONTENT_CHUNK_CHARS]
+        assert len(params) == 5 * len(_chunk_spans(BIG))
+
+    def test_store_many_slices_one_batch_across_plans(self):
+        store = _make_store("multi")
+        created_at = MagicMock()
+        created_at.isoformat.return_value = "2026-01-01T00:00:00"
+
+        def execute(query, params=None):
+            if "INSERT INTO memories" in query:
+                return [{"id": 100 + i, "created_at": created_at} for i in range(query.count("::vector"))]
+            return []
+
+        store.db.execute.side_effect = execute
+        with patch("cairn.core.memory.get_or_create_project", return_value=7), \
+                patch.object(store, "_insert_chunks") as insert_chunks:
+            store.store_many([{"content": "small", "project": "p"},
+                              {"content": BIG, "project": "p"}], enrich=False)
+
+        texts = store.embedding.embed_batch.call_args.args[0]
+        assert texts[:2] == ["small", BIG[:2000]]
+        assert len(texts) == 2 + len(_chunk_spans(BIG))
+        (small, big), = insert_chunks.call_args.args
+        assert small == (100, [])
+        assert big[0] == 101 and len(big[1]) == len(_chunk_spans(BIG))
+
+
+class TestChunkVectorSearch:
+
+    def _engine(self, chunk_vectors):
+        db = MagicMock()
+        db.execute.return_value = []
+        embedding = MagicMock()
+        embedding.embed.return_value = [0.1, 0.2]
+        return SearchEngine(db, embedding, chunk_vectors=chunk_vectors)
+
+    def test_vector_signal_reads_chunks_only_when_enabled(self):
+        for enabled in (False, True):
+            engine = self._engine(enabled)
+            engine.search("passage", search_mode="semantic", limit=5)
+            first_query = engine.db.execute.call_args_list[0].args[0]
+            assert ("memory_chunks" in first_query) is enabled
+
+    def test_fused_vector_cte_reads_chunks(self):
+        engine = self._engine(True)
+        ctes, params = engine._fused_signal_ctes("passage", [0.1, 0.2], "m.is_active = true", [], 50)
+        assert "FROM memory_chunks c" in ctes.split("keyword_r AS")[0]
+        assert ctes.count("%s") == len(params)
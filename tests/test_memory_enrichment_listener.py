@@ -34,6 +34,7 @@ def test_register_subscribes_to_memory_wildcard():
     listener.register(event_bus)
     event_bus.subscribe.assert_called_once_with(
         "memory.*", "memory_enrichment", listener.handle,
+        timeout=MemoryEnrichmentListener.HANDLER_TIMEOUT,
     )
 
 
@@ -50,6 +51,43 @@ def test_handle_routes_created_event():
     ms._post_store_enrichment.assert_called_once()
 
 
+def test_handle_deferred_event_enriches_before_phase2():
+    listener, ms = _make_listener()
+    ms.db.execute_one.return_value = _make_row()
+    ms.enrich_deferred.return_value = {"memory_type": "decision", "extraction_result": None}
+    event = {
+        "event_type": "memory.created",
+        "payload": {"memory_id": 1, "project_id": 1, "enrich": True,
+                    "memory_type": "note", "deferred": True},
+    }
+    listener.handle(event)
+    ms.enrich_deferred.assert_called_once_with(1)
+    assert ms._post_store_enrichment.call_args.kwargs["final_type"] == "decision"
+
+
+def test_handle_redelivered_deferred_event_skips_phase2():
+    listener, ms = _make_listener()
+    ms.enrich_deferred.return_value = None  # already claimed by an earlier delivery
+    event = {
+        "event_type": "memory.created",
+        "payload": {"memory_id": 1, "project_id": 1, "enrich": True,
+                    "memory_type": "note", "deferred": True},
+    }
+    listener.handle(event)
+    ms._post_store_enrichment.assert_not_called()
+
+
+def test_handle_non_deferred_event_skips_llm_enrichment():
+    listener, ms = _make_listener()
+    ms.db.execute_one.return_value = _make_row()
+    event = {
+        "event_type": "memory.created",
+        "payload": {"memory_id": 1, "project_id": 1, "enrich": True, "memory_type": "note"},
+    }
+    listener.handle(event)
+    ms.enrich_deferred.assert_not_called()
+
+
 def test_handle_missing_memory_id_is_noop():
     listener, ms = _make_listener()
     event = {"event_type": "memory.created", "payload": {}}
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from cairn.core.constants import ENRICHMENT_CLAIM_LEASE_SECONDS
 from cairn.core.memory import MemoryStore
 
 
@@ -116,6 +117,257 @@ class TestMemoryEventPublishing:
         # No event bus — _publish is a no-op. No crash.
 
 
+class TestStoreManyEvents:
+    """store_many batches embedding, INSERT and memory.created events."""
+
+    def _make_store(self, event_bus=None):
+        db = MagicMock()
+        embedding = MagicMock()
+        embedding.embed_batch.side_effect = lambda texts: [[0.1] * 10 for _ in texts]
+        created_at = MagicMock()
+        created_at.isoformat.return_value = "2026-01-01T00:00:00"
+        next_id = iter(range(100, 10_000))
+
+        def execute(query, params=None):
+            if "INSERT INTO memories" in query:
+                return [{"id": next(next_id), "created_at": created_at} for _ in range(query.count("::vector"))]
+            return []
+
+        db.execute.side_effect = execute
+        return MemoryStore(db, embedding, event_bus=event_bus)
+
+    def test_one_embed_insert_and_event_batch_per_chunk(self):
+        bus = MagicMock()
+        store = self._make_store(event_bus=bus)
+        memories = [{"content": f"m{i}", "project": "p"} for i in range(5)]
+
+        with patch("cairn.core.memory.STORE_MANY_BATCH_SIZE", 2), \
+                patch("cairn.core.memory.get_or_create_project", return_value=7) as get_project, \
+                patch.object(store, "_post_store_enrichment") as mock_enrich:
+            results = store.store_many(memories)
+
+        assert [r["id"] for r in results] == [100, 101, 102, 103, 104]
+        assert [len(c.args[0]) for c in store.embedding.embed_batch.call_args_list] == [2, 2, 1]
+        assert store.db.commit.call_count == 3
+        assert get_project.call_count == 1
+        store.embedding.embed.assert_not_called()
+        mock_enrich.assert_not_called()
+        assert [c.args[0] for c in bus.emit_many.call_args_list] == ["memory.created"] * 3
+        first = bus.emit_many.call_args_list[0].args[1][0]
+        assert first["project"] == "p"
+        assert first["payload"] == {"memory_id": 100, "project_id": 7, "memory_type": "note",
+                                    "enrich": True, "deferred": True}
+
+    def test_large_content_embeds_head_once(self):
+        store = self._make_store(event_bus=MagicMock())
+        big = "word " * 3000
+
+        with patch("cairn.core.memory.get_or_create_project", return_value=7):
+            store.store_many([{"content": big, "project": "p"}], enrich=False)
+
+        assert store.embedding.embed_batch.call_args.args[0] == [big[:2000]]
+
+    def test_enrichment_runs_inline_without_event_bus(self):
+        store = self._make_store(event_bus=None)
+
+        applied = {"memory_type": "decision", "entities": ["E"], "extraction_result": None, "vector": None}
+        with patch("cairn.core.memory.get_or_create_project", return_value=7), \
+                patch.object(store, "enrich_deferred", return_value=applied) as enrich_deferred, \
+                patch.object(store, "_post_store_enrichment", return_value={}) as mock_enrich:
+            store.store_many([{"content": "a", "project": "p"}, {"content": "b", "project": "p"}])
+
+        # No listener will run for the 'pending' rows, so LLM enrichment runs here too
+        assert [c.args[0] for c in enrich_deferred.call_args_list] == [100, 101]
+        assert [c.kwargs["memory_id"] for c in mock_enrich.call_args_list] == [100, 101]
+        assert mock_enrich.call_args.kwargs["final_type"] == "decision"
+        assert mock_enrich.call_args.kwargs["entities"] == ["E"]
+        assert mock_enrich.call_args.kwargs["vector"] == [0.1] * 10
+
+    def test_inline_enrichment_failure_still_runs_phase2(self):
+        store = self._make_store(event_bus=None)
+
+        with patch("cairn.core.memory.get_or_create_project", return_value=7), \
+                patch.object(store, "enrich_deferred", side_effect=RuntimeError("llm down")), \
+                patch.object(store, "_post_store_enrichment", return_value={}) as mock_enrich:
+            results = store.store_many([{"content": "a", "project": "p"}])
+
+        assert [r["id"] for r in results] == [100]
+        assert mock_enrich.call_args.kwargs["final_type"] == "note"
+
+
+class TestDeferredEnrichment:
+    """The "deferred" enrichment mode moves LLM work from store() to the listener."""
+
+    def _make_store(self, mode="deferred"):
+        db = MagicMock()
+        embedding = MagicMock()
+        embedding.embed.return_value = [0.1] * 10
+        db.execute.return_value = []
+        enricher = MagicMock()
+        enricher.enrich.return_value = {
+            "_status": "complete", "memory_type": "decision", "importance": 0.8,
+            "summary": "s", "tags": ["t"], "entities": ["a", "b"],
+        }
+        bus = MagicMock()
+        return MemoryStore(db, embedding, enricher=enricher, event_bus=bus, enrichment_mode=mode)
+
+    def _stub_store_calls(self, store, project_mode=None):
+        created_at = MagicMock()
+        created_at.isoformat.return_value = "2026-01-01T00:00:00"
+        store.db.execute_one.side_effect = [
+            {"id": 1},                              # get_or_create_project
+            {"enrichment_mode": project_mode},      # project policy
+            {"id": 42, "created_at": created_at},   # INSERT RETURNING
+            {"name": "p"},                          # project name lookup in _publish
+        ]
+
+    def test_store_defers_llm_enrichment(self):
+        store = self._make_store()
+        self._stub_store_calls(store)
+
+        result = store.store(content="hello", project="p")
+
+        store.enricher.enrich.assert_not_called()
+        assert result["enrichment_status"] == "pending"
+        assert result["memory_type"] == "note"
+        assert store.event_bus.emit.call_args.kwargs["payload"]["deferred"] is True
+
+    def test_project_policy_overrides_default(self):
+        store = self._make_store(mode="deferred")
+        self._stub_store_calls(store, project_mode="inline")
+
+        result = store.store(content="hello", project="p")
+
+        store.enricher.enrich.assert_called_once_with("hello")
+        assert result["memory_type"] == "decision"
+        assert "deferred" not in store.event_bus.emit.call_args.kwargs["payload"]
+
+    def test_unknown_mode_falls_back_to_inline(self):
+        assert self._make_store(mode="later").enrichment_mode == "inline"
+
+    def test_enrich_deferred_applies_store_override_rules(self):
+        store = self._make_store()
+        store.db.execute_one.return_value = {
+            "content": "hello", "memory_type": "note", "importance": 0.9, "project_id": 1,
+            "author": None, "salience": None,
+        }
+
+        applied = store.enrich_deferred(42)
+
+        assert applied == {
+            "memory_type": "decision", "entities": ["a", "b"], "extraction_result": None, "vector": None,
+        }
+        params = store.db.execute.call_args.args[1]
+        # Type was the default so enrichment fills it; the caller's importance stays
+        assert params[:3] == ("decision", 0.9, None)
+        assert params[3:6] == (["t"], "s", ["a", "b"])
+        assert params[6] is None  # small content keeps its embedding
+        assert params[-3:] == ("complete", "complete", 42)
+        # One commit for the 'enriching' claim, one for the result
+        assert store.db.commit.call_count == 2
+        claim_sql = store.db.execute_one.call_args.args[0]
+        assert "enrichment_status = 'enriching'" in claim_sql
+        assert "enrichment_status = 'pending'" in claim_sql
+
+    def test_enrich_deferred_skips_redelivery(self):
+        store = self._make_store()
+        store.db.execute_one.return_value = None  # no longer 'pending': claim matched nothing
+
+        assert store.enrich_deferred(42) is None
+        store.enricher.enrich.assert_not_called()
+        store.db.execute.assert_not_called()
+
+    def test_enrich_deferred_releases_claim_on_error(self):
+        store = self._make_store()
+        store.db.execute_one.return_value = {
+            "content": "hello", "memory_type": "note", "importance": 0.5, "project_id": 1,
+            "author": None, "salience": None,
+        }
+        store.enricher.enrich.side_effect = RuntimeError("llm down")
+
+        with pytest.raises(RuntimeError):
+            store.enrich_deferred(42)
+
+        sql, params = store.db.execute.call_args.args
+        assert "enrichment_status = 'pending'" in sql
+        assert params == (42,)
+
+    def _deferred_delivery(self, status="pending", claim_age=None):
+        """Store + listener over a fake memories row with an enrichment claim."""
+        from cairn.listeners.memory_enrichment import MemoryEnrichmentListener
+
+        store = self._make_store()
+        state = {"status": status, "claim_age": claim_age}
+        memory = {
+            "content": "hello", "memory_type": "note", "importance": 0.5, "project_id": 1,
+            "author": None, "salience": None, "embedding": [0.1] * 10,
+            "session_name": None, "entities": [], "project_name": "p",
+        }
+
+        def execute_one(sql, params=None):
+            if "SET enrichment_status = 'enriching'" in sql:
+                lapsed = state["status"] == "enriching" and (
+                    state["claim_age"] is None or state["claim_age"] > params[1]
+                )
+                if state["status"] != "pending" and not lapsed:
+                    return None
+                state.update(status="enriching", claim_age=0)
+            return {**memory, "enrichment_status": state["status"]}
+
+        def execute(sql, params=None):
+            if "enriched_at" in sql:
+                state["status"] = params[-2]
+            return []
+
+        store.db.execute_one.side_effect = execute_one
+        store.db.execute.side_effect = execute
+        extraction = MagicMock()
+        store._enrich_content = MagicMock(return_value=(extraction, {"memory_type": "fact"}, "complete"))
+        store._post_store_enrichment = MagicMock()
+        event = {
+            "event_type": "memory.created",
+            "payload": {"memory_id": 42, "project_id": 1, "enrich": True,
+                        "memory_type": "note", "deferred": True},
+        }
+        return MemoryEnrichmentListener(store), store, event, state, extraction
+
+    def test_redelivered_event_runs_phase2_once_with_extraction(self):
+        """A dispatcher timeout redelivers the event; only the first delivery enriches."""
+        listener, store, event, state, extraction = self._deferred_delivery()
+
+        listener.handle(event)
+        listener.handle(event)
+
+        store._enrich_content.assert_called_once()
+        store._post_store_enrichment.assert_called_once()
+        kwargs = store._post_store_enrichment.call_args.kwargs
+        assert kwargs["extraction_result"] is extraction
+        assert kwargs["final_type"] == "fact"
+        assert state["status"] == "complete"
+
+    def test_redelivery_during_live_claim_fails_for_retry(self):
+        listener, store, event, state, _ = self._deferred_delivery(status="enriching", claim_age=10)
+
+        with pytest.raises(RuntimeError, match="being enriched"):
+            listener.handle(event)
+
+        store._enrich_content.assert_not_called()
+        store._post_store_enrichment.assert_not_called()
+        assert state["status"] == "enriching"
+
+    def test_redelivery_takes_over_abandoned_claim(self):
+        """A claim left by a crashed or hung delivery lapses and is re-run in full."""
+        listener, store, event, state, extraction = self._deferred_delivery(
+            status="enriching", claim_age=ENRICHMENT_CLAIM_LEASE_SECONDS + 1,
+        )
+
+        listener.handle(event)
+
+        store._enrich_content.assert_called_once()
+        assert store._post_store_enrichment.call_args.kwargs["extraction_result"] is extraction
+        assert state["status"] == "complete"
+
+
 class TestMemoryEnrichmentListener:
     """Test the MemoryEnrichmentListener event handler."""
 
@@ -128,7 +380,10 @@ class TestMemoryEnrichmentListener:
 
         listener.register(bus)
 
-        bus.subscribe.assert_called_once_with("memory.*", "memory_enrichment", listener.handle)
+        bus.subscribe.assert_called_once_with(
+            "memory.*", "memory_enrichment", listener.handle,
+            timeout=MemoryEnrichmentListener.HANDLER_TIMEOUT,
+        )
 
     def test_handle_created_calls_post_store_enrichment(self):
         from cairn.listeners.memory_enrichment import MemoryEnrichmentListener
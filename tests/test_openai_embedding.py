@@ -22,7 +22,7 @@ def _make_config(**overrides):
 
 
 def _mock_response(data):
-    """Create a mock urllib response."""
+    """Create a mock pooled-client response."""
     body = json.dumps(data).encode()
     mock = MagicMock()
     mock.read.return_value = body
@@ -34,10 +34,10 @@ def _mock_response(data):
 # ── Request format ────────────────────────────────────────────
 
 
-@patch("cairn.embedding.openai_compat.urllib.request.urlopen")
-def test_embed_request_format(mock_urlopen):
+@patch("cairn.core.http_client.HTTPClient.open")
+def test_embed_request_format(mock_open):
     """embed() should POST to /v1/embeddings with correct payload."""
-    mock_urlopen.return_value = _mock_response({
+    mock_open.return_value = _mock_response({
         "data": [{"embedding": [0.1] * 384, "index": 0}],
     })
 
@@ -47,10 +47,10 @@ def test_embed_request_format(mock_urlopen):
 
     assert len(result) == 384
     # Verify the request was made
-    call_args = mock_urlopen.call_args
-    req = call_args[0][0]
-    assert "/v1/embeddings" in req.full_url
-    body = json.loads(req.data)
+    method, url, payload, _headers = mock_open.call_args.args
+    assert method == "POST"
+    assert url == "http://localhost:11434/v1/embeddings"
+    body = json.loads(payload)
     assert body["model"] == "nomic-embed-text"
     assert body["input"] == "hello world"
 
@@ -58,10 +58,10 @@ def test_embed_request_format(mock_urlopen):
 # ── Empty key = no Authorization header ───────────────────────
 
 
-@patch("cairn.embedding.openai_compat.urllib.request.urlopen")
-def test_no_auth_header_when_key_empty(mock_urlopen):
+@patch("cairn.core.http_client.HTTPClient.open")
+def test_no_auth_header_when_key_empty(mock_open):
     """When api_key is empty, no Authorization header should be sent."""
-    mock_urlopen.return_value = _mock_response({
+    mock_open.return_value = _mock_response({
         "data": [{"embedding": [0.1] * 384, "index": 0}],
     })
 
@@ -69,14 +69,14 @@ def test_no_auth_header_when_key_empty(mock_urlopen):
     engine = OpenAICompatibleEmbedding(cfg)
     engine.embed("test")
 
-    req = mock_urlopen.call_args[0][0]
-    assert "Authorization" not in req.headers
+    headers = mock_open.call_args.args[3]
+    assert "Authorization" not in headers
 
 
-@patch("cairn.embedding.openai_compat.urllib.request.urlopen")
-def test_auth_header_when_key_set(mock_urlopen):
+@patch("cairn.core.http_client.HTTPClient.open")
+def test_auth_header_when_key_set(mock_open):
     """When api_key is set, Authorization header should be present."""
-    mock_urlopen.return_value = _mock_response({
+    mock_open.return_value = _mock_response({
         "data": [{"embedding": [0.1] * 384, "index": 0}],
     })
 
@@ -84,18 +84,18 @@ def test_auth_header_when_key_set(mock_urlopen):
     engine = OpenAICompatibleEmbedding(cfg)
     engine.embed("test")
 
-    req = mock_urlopen.call_args[0][0]
-    assert req.headers.get("Authorization") == "Bearer sk-test-key"
+    headers = mock_open.call_args.args[3]
+    assert headers.get("Authorization") == "Bearer sk-test-key"
 
 
 # ── Batch support ─────────────────────────────────────────────
 
 
-@patch("cairn.embedding.openai_compat.urllib.request.urlopen")
-def test_embed_batch_sorts_by_index(mock_urlopen):
+@patch("cairn.core.http_client.HTTPClient.open")
+def test_embed_batch_sorts_by_index(mock_open):
     """embed_batch() should sort by index to match input order."""
     # Return out of order on purpose
-    mock_urlopen.return_value = _mock_response({
+    mock_open.return_value = _mock_response({
         "data": [
             {"embedding": [0.3] * 384, "index": 2},
             {"embedding": [0.1] * 384, "index": 0},
@@ -113,23 +113,23 @@ def test_embed_batch_sorts_by_index(mock_urlopen):
     assert results[2][0] == pytest.approx(0.3)
 
 
-@patch("cairn.embedding.openai_compat.urllib.request.urlopen")
-def test_embed_batch_empty_input(mock_urlopen):
+@patch("cairn.core.http_client.HTTPClient.open")
+def test_embed_batch_empty_input(mock_open):
     """embed_batch([]) should return [] without making a request."""
     cfg = _make_config()
     engine = OpenAICompatibleEmbedding(cfg)
     results = engine.embed_batch([])
 
     assert results == []
-    mock_urlopen.assert_not_called()
+    mock_open.assert_not_called()
 
 
 # ── Retry logic ───────────────────────────────────────────────
 
 
-@patch("cairn.embedding.openai_compat.time.sleep")
-@patch("cairn.embedding.openai_compat.urllib.request.urlopen")
-def test_retry_on_429(mock_urlopen, mock_sleep):
+@patch("cairn.core.http_client.time.sleep")
+@patch("cairn.core.http_client.HTTPClient.open")
+def test_retry_on_429(mock_open, mock_sleep):
     """Should retry on HTTP 429 with exponential backoff."""
     import urllib.error
 
@@ -137,7 +137,7 @@ def test_retry_on_429(mock_urlopen, mock_sleep):
     error_resp.read.return_value = b""
     error_resp.headers = {}
 
-    mock_urlopen.side_effect = [
+    mock_open.side_effect = [
         urllib.error.HTTPError("url", 429, "Rate limited", {}, error_resp),
         _mock_response({"data": [{"embedding": [0.1] * 384, "index": 0}]}),
     ]
@@ -147,13 +147,13 @@ def test_retry_on_429(mock_urlopen, mock_sleep):
     result = engine.embed("test")
 
     assert len(result) == 384
-    assert mock_urlopen.call_count == 2
+    assert mock_open.call_count == 2
     mock_sleep.assert_called_once_with(1)  # 2^0 = 1
 
 
-@patch("cairn.embedding.openai_compat.time.sleep")
-@patch("cairn.embedding.openai_compat.urllib.request.urlopen")
-def test_retry_exhaustion_raises(mock_urlopen, mock_sleep):
+@patch("cairn.core.http_client.time.sleep")
+@patch("cairn.core.http_client.HTTPClient.open")
+def test_retry_exhaustion_raises(mock_open, mock_sleep):
     """Should raise after 3 failed retries."""
     import urllib.error
 
@@ -161,7 +161,7 @@ def test_retry_exhaustion_raises(mock_urlopen, mock_sleep):
     error_resp.read.return_value = b""
     error_resp.headers = {}
 
-    mock_urlopen.side_effect = urllib.error.HTTPError(
+    mock_open.side_effect = urllib.error.HTTPError(
         "url", 500, "Server error", {}, error_resp,
     )
 
@@ -171,16 +171,16 @@ def test_retry_exhaustion_raises(mock_urlopen, mock_sleep):
     with pytest.raises(urllib.error.HTTPError):
         engine.embed("test")
 
-    assert mock_urlopen.call_count == 3
+    assert mock_open.call_count == 3
 
 
 # ── Stats recording ───────────────────────────────────────────
 
 
-@patch("cairn.embedding.openai_compat.urllib.request.urlopen")
-def test_stats_recorded_on_success(mock_urlopen):
+@patch("cairn.core.http_client.HTTPClient.open")
+def test_stats_recorded_on_success(mock_open):
     """Successful embed should call embedding_stats.record_call()."""
-    mock_urlopen.return_value = _mock_response({
+    mock_open.return_value = _mock_response({
         "data": [{"embedding": [0.1] * 384, "index": 0}],
     })
 
@@ -174,6 +174,41 @@ class TestStoreRoundTrip:
         assert "Internal error" in result["error"]
 
 
+
+class TestStoreMany:
+    """Test store_many tool validates every item, then delegates in one call."""
+
+    def test_store_many_delegates_once(self):
+        svc = _make_svc()
+        svc.memory_store.store_many.return_value = [{"id": 1}, {"id": 2}]
+        tools = _register_tools(svc)
+        memories = [{"content": "one", "project": "cairn"}, {"content": "two", "project": "cairn", "tags": ["x"]}]
+
+        result = asyncio.run(tools["store_many"](memories=memories, enrich=False))
+
+        assert result == {"stored": 2, "memories": [{"id": 1}, {"id": 2}]}
+        svc.memory_store.store_many.assert_called_once_with(memories, enrich=False)
+
+    def test_store_many_rejects_bad_item_by_index(self):
+        svc = _make_svc()
+        tools = _register_tools(svc)
+
+        result = asyncio.run(tools["store_many"](memories=[
+            {"content": "ok", "project": "cairn"},
+            {"content": "ok", "project": "cairn", "memory_type": "bogus"},
+        ]))
+
+        assert "memories[1]" in result["error"]
+        svc.memory_store.store_many.assert_not_called()
+
+    def test_store_many_rejects_unknown_fields(self):
+        svc = _make_svc()
+        tools = _register_tools(svc)
+
+        result = asyncio.run(tools["store_many"](memories=[{"content": "ok", "project": "cairn", "pinned": True}]))
+
+        assert "unknown fields pinned" in result["error"]
+
 # ---------------------------------------------------------------------------
 # search() tool tests
 # ---------------------------------------------------------------------------
@@ -300,24 +300,24 @@ class TestBudgetedDiscoverPatterns:
 
         assert result["status"] == "cached"
         assert result["cluster_count"] == 1
-        svc.cluster_engine.run_clustering.assert_not_called()
+        svc.cluster_engine.refresh.assert_not_called()
 
     def test_reclusters_when_stale(self):
         svc = _make_svc()
         svc.cluster_engine.is_stale.return_value = True
-        svc.cluster_engine.run_clustering.return_value = {}
+        svc.cluster_engine.refresh.return_value = {}
         svc.cluster_engine.get_clusters.return_value = []
         svc.cluster_engine.get_last_run.return_value = None
 
         result = budgeted_discover_patterns(svc)
 
         assert result["status"] == "reclustered"
-        svc.cluster_engine.run_clustering.assert_called_once()
+        svc.cluster_engine.refresh.assert_called_once()
 
     def test_includes_labeling_warning(self):
         svc = _make_svc()
         svc.cluster_engine.is_stale.return_value = True
-        svc.cluster_engine.run_clustering.return_value = {"labeling_error": "LLM timeout"}
+        svc.cluster_engine.refresh.return_value = {"labeling_error": "LLM timeout"}
         svc.cluster_engine.get_clusters.return_value = []
         svc.cluster_engine.get_last_run.return_value = None
 
@@ -0,0 +1,144 @@
+"""Tests for cairn.storage.vector — binary pgvector adaptation."""
+
+import struct
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import psycopg
+import pytest
+from psycopg.adapt import AdaptersMap, PyFormat
+
+from cairn.storage.vector import (
+    Vector,
+    VectorBinaryDumper,
+    VectorBinaryLoader,
+    VectorDumper,
+    VectorLoader,
+    register_vector,
+    stack_vectors,
+    to_vector,
+)
+
+
+class TestWireFormat:
+    def test_binary_round_trip(self):
+        vec = np.array([0.25, -1.5, 3.0], dtype=np.float32)
+        data = VectorBinaryDumper(np.ndarray).dump(vec)
+
+        # uint16 dim, uint16 unused, then big-endian float4 components
+        assert data[:4] == struct.pack(">HH", 3, 0)
+        assert struct.unpack(">3f", data[4:]) == (0.25, -1.5, 3.0)
+
+        loaded = VectorBinaryLoader(0).load(memoryview(data))
+        assert loaded.dtype == np.float32
+        np.testing.assert_array_equal(loaded, vec)
+
+    def test_text_round_trip(self):
+        vec = np.array([0.1, 0.2, -0.3], dtype=np.float32)
+        text = VectorDumper(np.ndarray).dump(vec)
+        assert text.startswith(b"[") and text.endswith(b"]")
+        np.testing.assert_array_equal(VectorLoader(0).load(text), vec)
+
+
+class TestToVector:
+    def test_accepts_all_forms(self):
+        expected = np.array([0.5, 1.0], dtype=np.float32)
+        for value in ([0.5, 1.0], np.array([0.5, 1.0]), expected, "[0.5,1.0]"):
+            result = to_vector(value)
+            assert result.dtype == np.float32
+            np.testing.assert_array_equal(result, expected)
+
+    def test_none_passes_through(self):
+        assert to_vector(None) is None
+
+    def test_float32_array_not_copied(self):
+        vec = np.zeros(4, dtype=np.float32)
+        result = to_vector(vec)
+        assert isinstance(result, Vector)
+        assert np.shares_memory(result, vec)
+        assert to_vector(result) is result
+
+    def test_stack_vectors(self):
+        matrix = stack_vectors(["[1,2]", [3, 4], np.array([5, 6], dtype=np.float32)])
+        assert matrix.shape == (3, 2)
+        assert matrix.dtype == np.float32
+        assert type(matrix) is np.ndarray
+
+    def test_stack_vectors_rejects_missing(self):
+        with pytest.raises(ValueError):
+            stack_vectors([[1, 2], None])
+
+
+class TestRegistration:
+    def test_missing_extension_registers_nothing(self):
+        conn = MagicMock()
+        with patch("cairn.storage.vector.TypeInfo.fetch", return_value=None):
+            assert register_vector(conn) is False
+        conn.adapters.register_dumper.assert_not_called()
+
+    def test_registers_binary_dumper_last(self):
+        conn = MagicMock()
+        info = MagicMock(oid=16400)
+        with patch("cairn.storage.vector.TypeInfo.fetch", return_value=info):
+            assert register_vector(conn) is True
+
+        dumpers = [c.args[1] for c in conn.adapters.register_dumper.call_args_list]
+        assert [d.oid for d in dumpers] == [16400, 16400]
+        assert issubclass(dumpers[-1], VectorBinaryDumper)
+        loader_oids = {c.args[0] for c in conn.adapters.register_loader.call_args_list}
+        assert loader_oids == {16400}
+
+    def test_plain_arrays_keep_default_adaptation(self):
+        """Only Vector binds as pgvector; other numpy arrays are not coerced."""
+        conn = MagicMock()
+        conn.adapters = AdaptersMap(psycopg.adapters)
+        info = MagicMock(oid=16400)
+        with patch("cairn.storage.vector.TypeInfo.fetch", return_value=info):
+            register_vector(conn)
+
+        assert conn.adapters.get_dumper(Vector, PyFormat.BINARY).oid == 16400
+        with pytest.raises(psycopg.ProgrammingError):
+            conn.adapters.get_dumper(np.ndarray, PyFormat.BINARY)
+
+
+class TestDatabaseIntegration:
+    def test_pool_configure_registers_adapters(self):
+        from cairn.storage.database import Database
+
+        db = Database(MagicMock())
+        conn = MagicMock()
+
+        with patch("cairn.storage.database.register_vector", return_value=True) as register:
+            db._configure(conn)
+
+        register.assert_called_once_with(conn)
+        conn.commit.assert_called_once()
+        assert db._vector_missing is False
+
+    def test_migrations_reopen_pool_when_extension_was_missing(self):
+        from cairn.storage.database import Database
+
+        db = Database(MagicMock())
+        db._pool = MagicMock()
+        with patch("cairn.storage.database.register_vector", return_value=False):
+            db._configure(MagicMock())
+
+        with patch.object(db, "execute", return_value=[]), patch.object(db, "commit"), \
+                patch("cairn.storage.database.MIGRATIONS_DIR") as migrations, \
+                patch.object(db, "close") as close, patch.object(db, "connect") as connect:
+            migrations.glob.return_value = []
+            db.run_migrations()
+
+        close.assert_called_once()
+        connect.assert_called_once()
+
+    def test_execute_binary_cursor(self):
+        from cairn.storage.database import Database
+
+        db = Database(MagicMock())
+        conn = MagicMock()
+        conn.closed = False
+        db._local.conn = conn
+
+        db.execute("SELECT embedding FROM memories", binary=True)
+        conn.cursor.assert_called_once_with(binary=True)